@@ -1,32 +1,62 @@
 #!/usr/bin/env python3
-"""Generate the agent-facing support matrix from registry/capabilities.json.
+"""Generate the support matrix, the client's route table and the MCP tool list from registry/capabilities.json.
 
 Usage:
-  python registry/build.py            # regenerate support-matrix.md
-  python registry/build.py --check    # exit 1 if the matrix on disk is stale
+  python registry/build.py            # regenerate support-matrix.md, endpoint_routes.py, mcp_tools.json
+  python registry/build.py --check    # exit 1 if any of them on disk is stale
+
+endpoint_routes.py is the precompiled request shape of every REST endpoint
+(path template, where --symbol goes, CLI flag -> API param renames, required
+params) that eodhd_client.py dispatches on with one dict lookup. mcp_tools.json
+is the same endpoints as MCP tool definitions (name, description from the
+endpoint doc, JSON-Schema input) for eodhd_mcp.py.
 
 Stdlib-only. Exit codes: 0 ok/up-to-date, 1 stale (--check), 2 registry error.
 """
 from __future__ import annotations
 
 import json
+import re
 import sys
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 REGISTRY = REPO_ROOT / "registry" / "capabilities.json"
 MATRIX = REPO_ROOT / "skills" / "eodhd-api" / "references" / "general" / "support-matrix.md"
+ROUTES = REPO_ROOT / "skills" / "eodhd-api" / "scripts" / "endpoint_routes.py"
+TOOLS = REPO_ROOT / "skills" / "eodhd-api" / "scripts" / "mcp_tools.json"
+SKILL_DIR = REPO_ROOT / "skills" / "eodhd-api"
 
 TIER_ORDER = ["validated", "fallback", "documented"]
 TIER_BLURB = {
     "validated": "In the Python client **and** covered by a passing e2e test. Prefer these.",
     "fallback": "In the Python client but not e2e-verified (often subscription-gated). "
                 "Works, but verify the response shape.",
-    "documented": "Documented only — call via `curl` per the endpoint doc. Not in the Python client.",
+    "documented": "Documented only — call via `curl` per the endpoint doc, or unvalidated through "
+                  "`eodhd_client.py --call ID --param KEY=VALUE`. Not an `--endpoint` of the Python client.",
 }
 BANNER = ("<!-- GENERATED by registry/build.py — do not edit by hand. "
           "Run `python registry/build.py`. -->")
 
+# eodhd_client.py flag (argparse dest) -> API query param, for every client endpoint
+# unless the entry's "request.params" renames it. Documented-only endpoints get
+# the subset whose API name they accept.
+CLI_PARAMS = {
+    "from_date": "from",
+    "to_date": "to",
+    "limit": "limit",
+    "offset": "offset",
+    "interval": "interval",
+    "function": "function",
+    "period": "period",
+    "indicator": "indicator",
+    "filter": "filter",
+}
+REQUEST_KEYS = {"symbol", "params", "convert", "excludes"}
+# API params typed as integers in MCP tool schemas; everything else is a string.
+INTEGER_PARAMS = {"limit", "offset", "page[limit]", "page[offset]", "period", "skip", "take",
+                  "year", "filter[year]"}
+
 
 def load_registry() -> list:
     try:
@@ -82,20 +112,119 @@ def render(registry: list) -> str:
     return "\n".join(lines).rstrip() + "\n"
 
 
+def compile_route(e: dict) -> dict:
+    """One endpoint's request shape, resolved so the client only does lookups."""
+    request = e.get("request") or {}
+    unknown = set(request) - REQUEST_KEYS
+    slots = re.findall(r"\{(\w+)\}", e["path"])
+    if unknown or len(slots) > 1:
+        print(f"Error: {e['id']}: " + (f"unknown request keys {sorted(unknown)}" if unknown
+                                        else "more than one path placeholder"), file=sys.stderr)
+        raise SystemExit(2)
+    slot = slots[0] if slots else None
+    if e.get("client_endpoint"):
+        params = {**CLI_PARAMS, **request.get("params", {})}
+    else:
+        accepted = set(e["required_params"]) | set(e["optional_params"])
+        params = {dest: name for dest, name in CLI_PARAMS.items() if name in accepted}
+    return {
+        "id": e["id"],
+        "path": e["path"],
+        "slot": slot,
+        "symbol": request.get("symbol", slot),
+        "params": params,
+        "required": [p for p in e["required_params"] if p != slot],
+        "convert": request.get("convert", {}),
+        "excludes": request.get("excludes", {}),
+        "family": e["response_family"],
+    }
+
+
+def render_routes(registry: list) -> str:
+    routes, aliases = {}, {}
+    for e in registry:
+        if e.get("transport") != "rest":
+            continue
+        name = e.get("client_endpoint") or e["id"]
+        routes[name] = compile_route(e)
+        if name != e["id"]:
+            aliases[e["id"]] = name
+    def fmt(table: dict) -> str:  # one entry per line, in registry order
+        return "{\n" + "".join(f"    {k!r}: {v!r},\n" for k, v in table.items()) + "}"
+
+    return (
+        '"""Request shapes for every REST endpoint in registry/capabilities.json.\n\n'
+        "GENERATED by registry/build.py — do not edit by hand. Run `python registry/build.py`.\n\n"
+        "ROUTES maps an endpoint name (the client's --endpoint value, or the registry id for\n"
+        "documented-only endpoints) to its path template, path placeholder (slot), the query\n"
+        "param --symbol fills, CLI flag -> API param renames, required params, value\n"
+        "converters and params dropped when another is present. ALIASES maps registry ids\n"
+        'to ROUTES keys where the two differ.\n"""\n\n'
+        f"ROUTES = {fmt(routes)}\n\n"
+        f"ALIASES = {fmt(aliases)}\n"
+    )
+
+
+def doc_summary(doc_path: str) -> str:
+    """First sentence of the doc's "## Purpose" section, else its title."""
+    try:
+        text = (SKILL_DIR / doc_path).read_text()
+    except OSError:
+        return ""
+    purpose = re.search(r"^## Purpose\n+(.+?)(?:\n\n|\n#|\Z)", text, re.M | re.S)
+    if purpose:
+        para = " ".join(purpose.group(1).split())
+        sentence = re.split(r"(?<=\.)\s", para, maxsplit=1)[0]
+        return sentence if sentence.endswith(".") else sentence + "."
+    title = re.search(r"^# (.+)$", text, re.M)
+    return title.group(1).strip() + "." if title else ""
+
+
+def compile_tool(e: dict) -> dict:
+    """One REST endpoint as an MCP tool; arguments use the API's own param names."""
+    slots = re.findall(r"\{(\w+)\}", e["path"])
+    required = slots + [p for p in e["required_params"] if p not in slots]
+    props = {}
+    for name in required + [p for p in e["optional_params"] if p not in required]:
+        props[name] = {"type": "integer" if name in INTEGER_PARAMS else "string"}
+    summary = doc_summary(e.get("doc_path", ""))
+    return {
+        "name": re.sub(r"[^A-Za-z0-9]+", "_", e["id"]),
+        "endpoint": e.get("client_endpoint") or e["id"],
+        "description": (f"{summary} " if summary else "") + f"GET {e['path']} "
+                       f"({e['support_tier']}, {e['response_family']}; doc: {e.get('doc_path', '')}).",
+        "inputSchema": {"type": "object", "properties": props, "required": required},
+    }
+
+
+def render_tools(registry: list) -> str:
+    tools = [compile_tool(e) for e in registry if e.get("transport") == "rest"]
+    names = [t["name"] for t in tools]
+    dupes = sorted({n for n in names if names.count(n) > 1})
+    if dupes:
+        print(f"Error: MCP tool names collide: {dupes}", file=sys.stderr)
+        raise SystemExit(2)
+    return "[\n" + ",\n".join("  " + json.dumps(t, ensure_ascii=False) for t in tools) + "\n]\n"
+
+
 def main() -> int:
     registry = load_registry()
-    content = render(registry)
+    outputs = [(MATRIX, render(registry)), (ROUTES, render_routes(registry)),
+               (TOOLS, render_tools(registry))]
     if "--check" in sys.argv[1:]:
-        existing = MATRIX.read_text() if MATRIX.exists() else ""
-        if existing != content:
-            print(f"Error: {MATRIX.relative_to(REPO_ROOT)} is stale. "
+        stale = [path for path, content in outputs
+                 if (path.read_text() if path.exists() else "") != content]
+        for path in stale:
+            print(f"Error: {path.relative_to(REPO_ROOT)} is stale. "
                   f"Run: python registry/build.py", file=sys.stderr)
+        if stale:
             return 1
-        print("support-matrix.md is up to date")
+        print("support-matrix.md, endpoint_routes.py and mcp_tools.json are up to date")
         return 0
-    MATRIX.parent.mkdir(parents=True, exist_ok=True)
-    MATRIX.write_text(content)
-    print(f"Wrote {MATRIX.relative_to(REPO_ROOT)} ({len(registry)} endpoints)")
+    for path, content in outputs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        print(f"Wrote {path.relative_to(REPO_ROOT)} ({len(registry)} endpoints)")
     return 0
 
 
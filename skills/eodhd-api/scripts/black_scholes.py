@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Black-Scholes(-Merton) prices, implied volatility and Greeks for whole option chains.
+
+Every function takes equal-length sequences (one entry per contract) and
+returns lists, so a chain of thousands of contracts is priced in one call.
+With NumPy installed the arithmetic runs on arrays; otherwise a stdlib loop
+computes the same values. The normal CDF uses ``math.erf`` in the stdlib
+path and a rational approximation (|error| < 1e-7) on arrays, since NumPy
+has no vectorized erf.
+
+Conventions (matching the EODHD options feed):
+  - ``t``      years to expiry (calendar days / 365)
+  - ``rate``   continuously compounded risk-free rate, ``div`` dividend yield
+  - ``vega``   per 1 volatility point (0.01), ``theta`` per calendar day
+  - ``is_call`` True for calls, False for puts
+
+Implied volatility is solved with a safeguarded Newton iteration (bisection
+whenever a Newton step leaves the current bracket), all contracts at once.
+Prices outside the no-arbitrage bounds give ``None``.
+
+Examples:
+  >>> import black_scholes as bs
+  >>> bs.implied_vol([10.45], [100], [100], [1.0], [True], rate=0.05)
+  [0.2...]
+"""
+
+from __future__ import annotations
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # stdlib fallback below
+    np = None
+
+SQRT_2PI = math.sqrt(2.0 * math.pi)
+VOL_LO, VOL_HI = 1e-4, 5.0
+IV_TOL = 1e-8
+IV_MAX_ITER = 50
+
+
+# --- stdlib scalar kernels ---------------------------------------------------
+
+def _cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def _pdf(x: float) -> float:
+    return math.exp(-0.5 * x * x) / SQRT_2PI
+
+
+def _d1d2(s, k, t, rate, div, vol):
+    sq = vol * math.sqrt(t)
+    d1 = (math.log(s / k) + (rate - div + 0.5 * vol * vol) * t) / sq
+    return d1, d1 - sq
+
+
+def _price1(s, k, t, rate, div, vol, call) -> float:
+    d1, d2 = _d1d2(s, k, t, rate, div, vol)
+    df, qf = math.exp(-rate * t), math.exp(-div * t)
+    if call:
+        return s * qf * _cdf(d1) - k * df * _cdf(d2)
+    return k * df * _cdf(-d2) - s * qf * _cdf(-d1)
+
+
+def _greeks1(s, k, t, rate, div, vol, call) -> dict:
+    d1, d2 = _d1d2(s, k, t, rate, div, vol)
+    df, qf = math.exp(-rate * t), math.exp(-div * t)
+    pdf = _pdf(d1)
+    sqt = math.sqrt(t)
+    common = -s * qf * pdf * vol / (2.0 * sqt)
+    if call:
+        delta = qf * _cdf(d1)
+        theta = common - rate * k * df * _cdf(d2) + div * s * qf * _cdf(d1)
+    else:
+        delta = -qf * _cdf(-d1)
+        theta = common + rate * k * df * _cdf(-d2) - div * s * qf * _cdf(-d1)
+    return {"delta": delta, "gamma": qf * pdf / (s * vol * sqt),
+            "vega": s * qf * pdf * sqt / 100.0, "theta": theta / 365.0}
+
+
+def _bounds1(s, k, t, rate, div, call) -> tuple[float, float]:
+    df, qf = math.exp(-rate * t), math.exp(-div * t)
+    if call:
+        return max(s * qf - k * df, 0.0), s * qf
+    return max(k * df - s * qf, 0.0), k * df
+
+
+def _iv1(price, s, k, t, rate, div, call) -> float | None:
+    if not (price and s and k and t and price > 0 and s > 0 and k > 0 and t > 0):
+        return None
+    lo_p, hi_p = _bounds1(s, k, t, rate, div, call)
+    if not lo_p < price < hi_p:
+        return None
+    lo, hi, vol = VOL_LO, VOL_HI, 0.3
+    for _ in range(IV_MAX_ITER):
+        diff = _price1(s, k, t, rate, div, vol, call) - price
+        if abs(diff) < IV_TOL:
+            return vol
+        if diff > 0:
+            hi = vol
+        else:
+            lo = vol
+        vega = _greeks1(s, k, t, rate, div, vol, call)["vega"] * 100.0
+        step = vol - diff / vega if vega > 1e-12 else None
+        vol = step if step is not None and lo < step < hi else 0.5 * (lo + hi)
+    return vol if hi - lo < 1e-6 else None
+
+
+# --- NumPy kernels -----------------------------------------------------------
+
+def _cdf_np(x):
+    # Zelen & Severo (Abramowitz-Stegun 26.2.17), |error| < 7.5e-8.
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.2316419 * z)
+    poly = t * (0.319381530 + t * (-0.356563782 + t * (1.781477937 + t * (-1.821255978 + t * 1.330274429))))
+    upper = np.exp(-0.5 * z * z) / SQRT_2PI * poly
+    return np.where(x >= 0, 1.0 - upper, upper)
+
+
+def _arrays(*cols):
+    return [np.asarray(c, dtype=float) for c in cols]
+
+
+def _price_np(s, k, t, rate, div, vol, call):
+    sq = vol * np.sqrt(t)
+    d1 = (np.log(s / k) + (rate - div + 0.5 * vol * vol) * t) / sq
+    d2 = d1 - sq
+    df, qf = np.exp(-rate * t), np.exp(-div * t)
+    c = s * qf * _cdf_np(d1) - k * df * _cdf_np(d2)
+    p = k * df * _cdf_np(-d2) - s * qf * _cdf_np(-d1)
+    return np.where(call, c, p), d1, d2
+
+
+def _greeks_np(s, k, t, rate, div, vol, call):
+    _, d1, d2 = _price_np(s, k, t, rate, div, vol, call)
+    df, qf = np.exp(-rate * t), np.exp(-div * t)
+    pdf = np.exp(-0.5 * d1 * d1) / SQRT_2PI
+    sqt = np.sqrt(t)
+    common = -s * qf * pdf * vol / (2.0 * sqt)
+    theta_c = common - rate * k * df * _cdf_np(d2) + div * s * qf * _cdf_np(d1)
+    theta_p = common + rate * k * df * _cdf_np(-d2) - div * s * qf * _cdf_np(-d1)
+    return {
+        "delta": np.where(call, qf * _cdf_np(d1), -qf * _cdf_np(-d1)),
+        "gamma": qf * pdf / (s * vol * sqt),
+        "vega": s * qf * pdf * sqt / 100.0,
+        "theta": np.where(call, theta_c, theta_p) / 365.0,
+    }
+
+
+def _iv_np(price, s, k, t, rate, div, call):
+    df, qf = np.exp(-rate * t), np.exp(-div * t)
+    lo_p = np.maximum(np.where(call, s * qf - k * df, k * df - s * qf), 0.0)
+    hi_p = np.where(call, s * qf, k * df)
+    ok = (price > lo_p) & (price < hi_p) & (s > 0) & (k > 0) & (t > 0)
+    # Solve only the valid contracts; the rest stay NaN.
+    p, s, k, t, call = price[ok], s[ok], k[ok], t[ok], call[ok]
+    lo, hi = np.full(p.shape, VOL_LO), np.full(p.shape, VOL_HI)
+    vol = np.full(p.shape, 0.3)
+    done = np.zeros(p.shape, dtype=bool)
+    for _ in range(IV_MAX_ITER):
+        model, d1, _ = _price_np(s, k, t, rate, div, vol, call)
+        diff = model - p
+        done |= np.abs(diff) < IV_TOL
+        if done.all():
+            break
+        hi = np.where(~done & (diff > 0), vol, hi)
+        lo = np.where(~done & (diff <= 0), vol, lo)
+        vega = s * np.exp(-div * t) * np.exp(-0.5 * d1 * d1) / SQRT_2PI * np.sqrt(t)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = vol - diff / vega
+        step = np.where((vega > 1e-12) & (step > lo) & (step < hi), step, 0.5 * (lo + hi))
+        vol = np.where(done, vol, step)
+    vol = np.where(done | (hi - lo < 1e-6), vol, np.nan)
+    out = np.full(ok.shape, np.nan)
+    out[ok] = vol
+    return out
+
+
+# --- public API --------------------------------------------------------------
+
+def _clean(values) -> list:
+    return [None if v is None or not math.isfinite(v) else float(v) for v in values]
+
+
+def _broadcast(n: int, value):
+    return list(value) if isinstance(value, (list, tuple)) else [value] * n
+
+
+def price(spot, strike, t, vol, is_call, rate: float = 0.0, div: float = 0.0,
+          use_numpy: bool | None = None) -> list:
+    """Model prices per contract."""
+    use_numpy = np is not None if use_numpy is None else use_numpy
+    if use_numpy:
+        s, k, tt, v = _arrays(spot, strike, t, vol)
+        with np.errstate(all="ignore"):
+            return _clean(_price_np(s, k, tt, rate, div, v, np.asarray(is_call, dtype=bool))[0])
+    return _clean(_price1(s, k, tt, rate, div, v, c) if tt > 0 and v > 0 else None
+                  for s, k, tt, v, c in zip(spot, strike, t, vol, is_call))
+
+
+def greeks(spot, strike, t, vol, is_call, rate: float = 0.0, div: float = 0.0,
+           use_numpy: bool | None = None) -> dict[str, list]:
+    """{"delta", "gamma", "vega", "theta"} lists per contract (None where vol is missing)."""
+    use_numpy = np is not None if use_numpy is None else use_numpy
+    if use_numpy:
+        s, k, tt = _arrays(spot, strike, t)
+        v = np.array([np.nan if x is None else x for x in vol], dtype=float)
+        with np.errstate(all="ignore"):
+            out = _greeks_np(s, k, tt, rate, div, v, np.asarray(is_call, dtype=bool))
+        return {name: _clean(values) for name, values in out.items()}
+    out: dict[str, list] = {"delta": [], "gamma": [], "vega": [], "theta": []}
+    for s, k, tt, v, c in zip(spot, strike, t, vol, is_call):
+        g = _greeks1(s, k, tt, rate, div, v, c) if v and tt > 0 and s > 0 and k > 0 else {}
+        for name in out:
+            out[name].append(g.get(name))
+    return out
+
+
+def implied_vol(option_price, spot, strike, t, is_call, rate: float = 0.0, div: float = 0.0,
+                use_numpy: bool | None = None) -> list:
+    """Implied volatility per contract (None for missing or out-of-bounds prices)."""
+    use_numpy = np is not None if use_numpy is None else use_numpy
+    n = len(option_price)
+    spot = _broadcast(n, spot)
+    if use_numpy:
+        p = np.array([np.nan if x is None else x for x in option_price], dtype=float)
+        s, k, tt = _arrays(spot, strike, t)
+        with np.errstate(all="ignore"):
+            return _clean(_iv_np(p, s, k, tt, rate, div, np.asarray(is_call, dtype=bool)))
+    return [_iv1(p, s, k, tt, rate, div, c) for p, s, k, tt, c in zip(option_price, spot, strike, t, is_call)]
+
+
+def chain_greeks(option_price, spot, strike, t, is_call, rate: float = 0.0, div: float = 0.0,
+                 use_numpy: bool | None = None) -> dict[str, list]:
+    """Implied volatility plus Greeks at that volatility: {"iv", "delta", "gamma", "vega", "theta"}."""
+    n = len(option_price)
+    spot = _broadcast(n, spot)
+    iv = implied_vol(option_price, spot, strike, t, is_call, rate, div, use_numpy)
+    out = greeks(spot, strike, t, iv, is_call, rate, div, use_numpy)
+    for name, values in out.items():
+        out[name] = [None if v is None else g for v, g in zip(iv, values)]
+    return {"iv": iv, **out}
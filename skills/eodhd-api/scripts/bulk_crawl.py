@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""Resumable, concurrent bulk-fundamentals crawler with a checkpoint journal.
+
+``bulk-fundamentals/{EXCHANGE}`` returns at most 500 companies per page and
+costs 100 API calls per page. A large exchange is 20+ pages, so losing the
+run halfway (quota, network, Ctrl-C) should not mean paying for the first
+half again. This script:
+
+  - keeps up to ``--workers`` pages in flight and stops scheduling new ones
+    once ``--max-calls`` would be exceeded (each page's cost is estimated
+    the way eodhd_client.call_cost does);
+  - writes each completed page to its own file (temp file + rename), so a
+    page on disk is always whole;
+  - appends one line per completed page to ``journal.ndjson`` (flushed and
+    fsynced), plus the page where the exchange ended. On a rerun with the
+    same arguments, every page the journal lists and the disk still holds
+    is skipped.
+
+The end of an exchange is the first page with fewer than ``--limit`` rows.
+Pages in flight past it are discarded (at most ``--workers - 1`` wasted
+requests), and a resumed crawl does not probe past a recorded end.
+``--symbols`` crawls a fixed list in chunks of ``--limit`` instead, so its
+pages are known up front. ``--version 1.2`` and ``--symbols`` runs get their
+own store directories. A job's journal records its arguments, and resuming
+with different ones is refused (``--restart`` starts over).
+
+If any page fails (HTTP 402/429, timeouts, ...), no new pages are started,
+the pages in flight are still saved, and the script exits 1. Run the same
+command later to continue. Companies can move between pages when the
+listing changes between runs, so ``export`` keeps one entry per ticker
+(from the latest page holding it).
+
+Stores live in EODHD_CACHE_DIR/bulk-fundamentals/<job>/ (page-00000.json, ...,
+journal.ndjson). When eodhd_daemon.py is running, pages also go through its
+per-minute rate limiter and daily budget.
+
+Requires:
+  EODHD_API_TOKEN environment variable (crawl only) and the Extended
+  Fundamentals plan.
+
+Examples:
+  # Crawl NASDAQ, 4 pages at a time, spending at most 1,500 API calls today
+  python bulk_crawl.py crawl --exchange NASDAQ --workers 4 --max-calls 1500
+
+  # Same command tomorrow resumes where the journal stops
+  python bulk_crawl.py crawl --exchange NASDAQ --workers 4 --max-calls 1500
+
+  # A fixed list, version 1.2 output
+  python bulk_crawl.py crawl --exchange US --symbols AAPL.US,MSFT.US,NVDA.US --version 1.2
+
+  # Progress, then one JSON entry per company
+  python bulk_crawl.py status --exchange NASDAQ
+  python bulk_crawl.py export --exchange NASDAQ > nasdaq-fundamentals.ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import eodhd_client
+
+STORE_DIR = os.path.join(eodhd_client.CACHE_DIR, "bulk-fundamentals")
+PAGE_SIZE = 500  # bulk-fundamentals maximum
+JOURNAL = "journal.ndjson"
+
+
+def job_name(exchange: str, version: str | None = None, symbols: list[str] | None = None) -> str:
+    """Store directory name: exchange, plus the version and a digest of the symbol list when given."""
+    name = exchange.upper()
+    if version:
+        name += f"-v{version}"
+    if symbols:
+        name += "-s" + hashlib.sha1(",".join(symbols).encode()).hexdigest()[:10]
+    return name
+
+
+def page_path(store: str, page: int) -> str:
+    return os.path.join(store, f"page-{page:05d}.json")
+
+
+def read_journal(store: str) -> dict:
+    """Replay the journal → {"job", "pages": {page: rows}, "end", "done", "calls"}.
+
+    ``calls`` is every API call spent, failed and discarded pages included.
+
+    A line cut short by a crash is ignored. A page counts as done only while
+    its file still exists, and pages past the recorded end are left out.
+    """
+    state: dict = {"job": None, "pages": {}, "end": None, "done": False, "calls": 0}
+    try:
+        fh = open(os.path.join(store, JOURNAL), encoding="utf-8")
+    except FileNotFoundError:
+        return state
+    with fh:
+        for line in fh:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if "job" in event:
+                state["job"] = event["job"]
+            if "page" in event and "rows" in event:
+                state["pages"][event["page"]] = event["rows"]
+            if "end" in event:
+                state["end"] = event["end"] if state["end"] is None else min(state["end"], event["end"])
+            state["calls"] += event.get("cost", 0)
+            state["done"] = state["done"] or bool(event.get("done"))
+    state["pages"] = {p: n for p, n in state["pages"].items() if os.path.exists(page_path(store, p))
+                      and (state["end"] is None or p <= state["end"])}
+    if state["done"] and state["end"] is not None and not all(p in state["pages"] for p in range(state["end"] + 1)):
+        state["done"] = False  # a page file was removed since
+    return state
+
+
+def _append(fh, event: dict) -> None:
+    fh.write(json.dumps({**event, "at": round(time.time(), 3)}, sort_keys=True) + "\n")
+    fh.flush()
+    os.fsync(fh.fileno())
+
+
+def _open_journal(store: str):
+    """The journal for appending, after closing any line cut short by a crash."""
+    path = os.path.join(store, JOURNAL)
+    if os.path.exists(path) and os.path.getsize(path):
+        with open(path, "rb+") as fh:
+            fh.seek(-1, os.SEEK_END)
+            if fh.read(1) != b"\n":
+                fh.write(b"\n")
+    return open(path, "a", encoding="utf-8")
+
+
+def _write_page(store: str, page: int, entries: list[dict]) -> None:
+    path = page_path(store, page)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(entries, fh, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _entries(payload) -> list[dict]:
+    """bulk-fundamentals returns {"0": {...}, "1": ...}; accept a list too."""
+    if isinstance(payload, dict):
+        if "error" in payload:
+            raise eodhd_client.ClientError(f"bulk-fundamentals API error: {payload['error']}")
+        return [v for _, v in sorted(payload.items(), key=lambda kv: int(kv[0]) if kv[0].isdigit() else 0)
+                if isinstance(v, dict)]
+    return [v for v in payload or [] if isinstance(v, dict)]
+
+
+def crawl(exchange: str, token: str, store: str | None = None, version: str | None = None,
+          symbols: list[str] | None = None, limit: int = PAGE_SIZE, workers: int = 4,
+          max_calls: int | None = None, restart: bool = False, **kwargs) -> dict:
+    """Fetch the pages the journal does not have yet → progress summary.
+
+    ``kwargs`` go to fetch_json (base_url, timeout, ...). Raises ClientError
+    when the store belongs to a job with other arguments. A failed page is
+    reported in the summary's ``error`` rather than raised.
+    """
+    if not 1 <= limit <= PAGE_SIZE:
+        raise eodhd_client.ClientError(f"--limit must be between 1 and {PAGE_SIZE}")
+    exchange = exchange.upper()
+    store = store or os.path.join(STORE_DIR, job_name(exchange, version, symbols))
+    job = {"exchange": exchange, "version": version, "limit": limit,
+           "symbols": len(symbols) if symbols else None,
+           "symbols_sha1": hashlib.sha1(",".join(symbols).encode()).hexdigest() if symbols else None}
+    os.makedirs(store, exist_ok=True)
+    if restart:
+        for name in os.listdir(store):
+            if name == JOURNAL or name.startswith("page-"):
+                os.remove(os.path.join(store, name))
+    state = read_journal(store)
+    if state["job"] is not None and state["job"] != job:
+        raise eodhd_client.ClientError(f"{store} holds a crawl started with {state['job']}; "
+                                       "rerun with those arguments or add --restart")
+    chunks = [symbols[i:i + limit] for i in range(0, len(symbols), limit)] if symbols else None
+    end = len(chunks) - 1 if chunks else state["end"]
+    done: dict[int, int] = dict(state["pages"])
+    summary = {"store": store, "fetched": 0, "calls": 0, "error": None, "budget_reached": False}
+
+    def request(page: int) -> dict:
+        if chunks:
+            params = {"symbols": ",".join(chunks[page])}
+        else:
+            params = {"offset": page * limit, "limit": limit}
+        if version:
+            params["version"] = version
+        return params
+
+    def cost(page: int) -> int:
+        return eodhd_client.call_cost(eodhd_client.api_url("bulk-fundamentals", token, exchange, request(page)))
+
+    with _open_journal(store) as journal, ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        if state["job"] is None:
+            _append(journal, {"job": job})
+            if chunks:
+                _append(journal, {"end": end})
+        in_flight: dict = {}
+        next_page = 0
+        stopping = False
+        while True:
+            while not stopping and len(in_flight) < max(1, workers):
+                while next_page in done:
+                    next_page += 1
+                if end is not None and next_page > end:
+                    break
+                price = cost(next_page)
+                if max_calls is not None and summary["calls"] + price > max_calls:
+                    summary["budget_reached"] = True
+                    break
+                summary["calls"] += price
+                future = pool.submit(eodhd_client.fetch_json, "bulk-fundamentals", token, exchange,
+                                     request(next_page), **kwargs)
+                in_flight[future] = (next_page, price)
+                next_page += 1
+            if not in_flight:
+                break
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in sorted(finished, key=lambda f: in_flight[f][0]):
+                page, price = in_flight.pop(future)
+                try:
+                    entries = _entries(future.result())
+                except eodhd_client.ClientError as exc:
+                    summary["error"] = summary["error"] or f"page {page}: {exc}"
+                    stopping = True
+                    _append(journal, {"page": page, "error": str(exc), "cost": price})
+                    continue
+                if end is not None and page > end:
+                    _append(journal, {"page": page, "discarded": True, "cost": price})
+                    continue  # past the end of the exchange
+                _write_page(store, page, entries)
+                done[page] = len(entries)
+                summary["fetched"] += 1
+                _append(journal, {"page": page, "rows": len(entries), "cost": price})
+                if not chunks and len(entries) < limit and (end is None or page < end):
+                    end = page
+                    _append(journal, {"end": page})
+        complete = end is not None and all(p in done for p in range(end + 1))
+        if complete and not state["done"]:
+            _append(journal, {"done": True, "pages": end + 1, "rows": sum(done[p] for p in range(end + 1))})
+    summary.update(pages=len([p for p in done if end is None or p <= end]), end=end, done=complete,
+                   rows=sum(n for p, n in done.items() if end is None or p <= end))
+    return summary
+
+
+def iter_entries(store: str):
+    """Every stored company once (the latest page holding a ticker wins), in page order."""
+    state = read_journal(store)
+    pages = sorted(state["pages"])
+    latest: dict[str, int] = {}
+    for page in pages:
+        with open(page_path(store, page), encoding="utf-8") as fh:
+            for entry in json.load(fh):
+                general = entry.get("General") or {}
+                latest[general.get("PrimaryTicker") or general.get("Code") or ""] = page
+    for page in pages:
+        with open(page_path(store, page), encoding="utf-8") as fh:
+            for entry in json.load(fh):
+                general = entry.get("General") or {}
+                key = general.get("PrimaryTicker") or general.get("Code") or ""
+                if latest.get(key) == page:
+                    latest.pop(key)
+                    yield entry
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Resumable concurrent bulk-fundamentals crawler (page files + checkpoint journal)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"Stores are kept in {STORE_DIR} (EODHD_CACHE_DIR/bulk-fundamentals).",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--exchange", required=True, help="Exchange code (e.g. NASDAQ, NYSE, LSE)")
+    common.add_argument("--version", help='bulk-fundamentals output version (e.g. "1.2")')
+    common.add_argument("--symbols", help="Comma-separated tickers to crawl instead of the whole exchange")
+    run = sub.add_parser("crawl", parents=[common], help="Fetch missing pages, resuming from the journal")
+    run.add_argument("--workers", type=int, default=4, help="Concurrent pages (default: 4)")
+    run.add_argument("--limit", type=int, default=PAGE_SIZE, help=f"Companies per page (default/max: {PAGE_SIZE})")
+    run.add_argument("--max-calls", type=int, help="Stop starting pages past this many API calls (100 per page)")
+    run.add_argument("--restart", action="store_true", help="Discard the journal and pages, start over")
+    run.add_argument("--timeout", type=int, default=180, help="HTTP timeout in seconds (default: 180)")
+    run.add_argument("--base-url", default=eodhd_client.BASE_URL, help="Override API base URL")
+    sub.add_parser("status", parents=[common], help="Show the journal's progress")
+    sub.add_parser("export", parents=[common], help="Print every stored company as NDJSON")
+    args = parser.parse_args()
+
+    symbols = [s.strip() for s in (args.symbols or "").split(",") if s.strip()] or None
+    store = os.path.join(STORE_DIR, job_name(args.exchange, args.version, symbols))
+    if args.command == "crawl":
+        token = os.getenv("EODHD_API_TOKEN")
+        if not token:
+            print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+            return 2
+        try:
+            summary = crawl(args.exchange, token, store, args.version, symbols, args.limit, args.workers,
+                            args.max_calls, args.restart, base_url=args.base_url, timeout=args.timeout)
+        except eodhd_client.ClientError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 2
+        print(json.dumps(summary, indent=2))
+        if summary["error"]:
+            print(f"Error: {summary['error']}; rerun the same command to resume", file=sys.stderr)
+            return 1
+        return 0
+
+    state = read_journal(store)
+    if state["job"] is None:
+        print(f"Error: no crawl in {store}; run: bulk_crawl.py crawl --exchange {args.exchange}", file=sys.stderr)
+        return 2
+    if args.command == "status":
+        print(json.dumps({"store": store, "job": state["job"], "pages": len(state["pages"]),
+                          "rows": sum(state["pages"].values()), "end": state["end"], "done": state["done"],
+                          "calls": state["calls"]}, indent=2))
+        return 0
+    for entry in iter_entries(store):
+        sys.stdout.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Composite company-brief fetch: every source for one ticker in one pass.
+
+The company-brief skill needs fundamentals, prices, a live quote, news,
+sentiment, insider trades, dividends and the earnings calendar for a single
+ticker. Run as separate CLI invocations that is nine interpreter start-ups and
+nine TLS handshakes in sequence; ``fetch_brief`` issues all of them at once on
+eodhd_client's keep-alive connection pool and returns one document:
+
+  {"symbol": "AAPL.US", "as_of": "2026-10-19",
+   "sources": {"fundamentals": {...}, "eod": [...], ...},
+   "errors": {"sentiment": "Request failed: timed out (...)"},
+   "timings_ms": {"fundamentals": 812, ...}}
+
+Each source has its own timeout, so a slow one (news, sentiment) fails on its
+own and lands in ``errors`` instead of holding back or sinking the brief.
+
+Requires:
+  EODHD_API_TOKEN environment variable.
+
+Examples:
+  python company_brief.py AAPL.US
+  python company_brief.py AAPL.US --only fundamentals,eod,real-time
+  python eodhd_client.py --brief --symbol AAPL.US     # same, via the client
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+import eodhd_client
+
+# name -> (endpoint, timeout seconds). Order is the order of the brief document.
+SOURCES = {
+    "fundamentals": ("fundamentals", 30),
+    "eod": ("eod", 20),
+    "real-time": ("real-time", 10),
+    "news": ("news", 20),
+    "sentiment": ("sentiment", 20),
+    "insider-transactions": ("insider-transactions", 20),
+    "dividends": ("dividends", 15),
+    "calendar/earnings": ("calendar/earnings", 15),
+    "calendar/trends": ("calendar/trends", 15),
+}
+
+
+def brief_calls(symbol: str, today: datetime.date, sources: list[str] | None = None,
+                timeouts: dict[str, int] | None = None) -> dict[str, dict]:
+    """fetch_json keyword arguments per source, with the brief's date windows."""
+    ago = lambda days: (today - datetime.timedelta(days=days)).isoformat()  # noqa: E731
+    params = {
+        "fundamentals": {},
+        "eod": {"from": ago(365)},  # a year, for the 52-week range
+        "real-time": {},
+        "news": {"s": symbol, "limit": 10},
+        "sentiment": {"s": symbol, "from": ago(30)},
+        "insider-transactions": {"code": symbol, "from": ago(90)},
+        "dividends": {"from": ago(5 * 365)},
+        "calendar/earnings": {"symbols": symbol},
+        "calendar/trends": {"symbols": symbol},
+    }
+    names = sources or list(SOURCES)
+    unknown = [n for n in names if n not in SOURCES]
+    if unknown:
+        raise eodhd_client.ClientError(f"Unknown brief source(s): {', '.join(unknown)} "
+                                       f"(choose from {', '.join(SOURCES)})")
+    calls = {}
+    for name in names:
+        endpoint, timeout = SOURCES[name]
+        calls[name] = {"endpoint": endpoint, "symbol": symbol, "params": params[name],
+                       "timeout": (timeouts or {}).get(name, timeout)}
+    return calls
+
+
+def fetch_brief(token: str, symbol: str, today: datetime.date | None = None,
+                sources: list[str] | None = None, timeouts: dict[str, int] | None = None,
+                **kwargs) -> dict:
+    """Fetch every brief source concurrently; failures are reported per source."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    today = today or datetime.date.today()
+    calls = brief_calls(symbol, today, sources, timeouts)
+
+    def one(call: dict):
+        started = time.monotonic()
+        try:
+            result = eodhd_client.fetch_json(token=token, **call, **kwargs)
+        except eodhd_client.ClientError as exc:
+            result = exc
+        return result, round((time.monotonic() - started) * 1000)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(calls) or 1) as pool:
+        results = dict(zip(calls, pool.map(one, calls.values())))
+    out: dict = {"symbol": symbol, "as_of": today.isoformat(), "sources": {}, "errors": {},
+                 "timings_ms": {name: ms for name, (_, ms) in results.items()}}
+    out["timings_ms"]["total"] = round((time.monotonic() - started) * 1000)
+    for name, (result, _) in results.items():
+        if isinstance(result, Exception):
+            out["errors"][name] = str(result)
+        elif isinstance(result, dict) and result and set(result) <= {"error", "code", "message"}:
+            out["errors"][name] = str(result.get("error") or result.get("message") or result)
+        else:
+            out["sources"][name] = result
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Fetch every company-brief source for one ticker concurrently",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("symbol", help="Ticker with exchange suffix (e.g. AAPL.US)")
+    parser.add_argument("--only", help=f"Comma-separated subset of sources ({', '.join(SOURCES)})")
+    parser.add_argument("--cache-ttl", type=int, default=int(os.getenv("EODHD_CACHE_TTL", "0")),
+                        help="Serve responses younger than N seconds from the disk cache (default: 0 = off)")
+    args = parser.parse_args()
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        return 2
+    only = [s.strip() for s in args.only.split(",") if s.strip()] if args.only else None
+    try:
+        brief = fetch_brief(token, args.symbol, sources=only, cache_ttl=args.cache_ttl)
+    except eodhd_client.ClientError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    print(json.dumps(brief, indent=2, sort_keys=True))
+    return 1 if not brief["sources"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Aligned multi-ticker price comparison for the eodhd-compare skill.
+
+Method:
+  1. Fetch /eod/{SYMBOL} for every ticker (and the --base, if not listed)
+     concurrently.
+  2. Join all series on one trading-date index in a single pass over an
+     epoch-day grid: ``outer`` (union of dates, for tickers on different
+     exchange calendars), ``inner`` (dates every ticker traded) or a ticker's
+     own calendar. Gaps are forward-filled (optionally at most --fill-limit
+     days in a row) and the table starts at the first date every ticker has a
+     price, which is where the rebased lines are anchored.
+  3. Compute rebased performance (100 = start), relative strength against the
+     base (ratio line, 100 = start) and rolling correlation of daily returns
+     with the base for the whole T x N matrix at once.
+
+The result is columnar: ``{"dates": [...], "columns": {"close": {SYM: [...]},
+"rebased": {...}, "rel_strength": {...}, "rolling_corr": {...}}, "summary":
+{...}}``; ``--csv`` flattens it to one ``field:SYMBOL`` column per series.
+NumPy is used when installed; otherwise a stdlib fallback computes the same
+numbers. Prices use adjusted_close (falls back to close).
+
+Requires:
+  EODHD_API_TOKEN environment variable.
+
+Examples:
+  # Three tickers on two exchanges, last 12 months, union calendar
+  python compare.py --symbols AAPL.US,MSFT.US,SAP.XETRA
+
+  # Trading days common to all, relative strength vs the S&P 500
+  python compare.py --symbols AAPL.US,MSFT.US --base GSPC.INDX --join inner
+
+  # Only the summary (returns, volatility, correlation, relative strength)
+  python compare.py --symbols AAPL.US,MSFT.US,GOOGL.US --summary-only
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import math
+import os
+import sys
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:  # stdlib fallback below
+    np = None
+
+import eodhd_client
+import epoch_dates
+from portfolio_risk import TRADING_DAYS, fetch_prices
+
+FIELDS = ("close", "rebased", "rel_strength", "rolling_corr")
+
+
+def join(
+    prices: dict[str, dict[str, float]],
+    symbols: list[str],
+    how: str = "outer",
+    fill: bool = True,
+    fill_limit: int | None = None,
+) -> tuple[list[str], list[list[float | None]]]:
+    """Join series on one date index in a single pass → (dates, columns).
+
+    ``how`` is ``"outer"``, ``"inner"`` or one of ``symbols`` (that ticker's
+    calendar). With ``fill`` a missing price repeats the ticker's last one,
+    for at most ``fill_limit`` consecutive dates when set. Rows before every
+    ticker has a price are dropped.
+
+    Dates are converted to epoch days once, so each price lands in a dense
+    day-offset grid and the join walks the offsets in order, with no string
+    comparisons or sorting.
+    """
+    if how not in ("outer", "inner") and how not in symbols:
+        raise ValueError(f"join must be outer, inner or one of the symbols, got {how!r}")
+    n = len(symbols)
+    anchor = symbols.index(how) if how in symbols else None
+    keyed = [epoch_dates.epoch_days(prices[s]) for s in symbols]
+    lo = min((min(days) for days in keyed if days), default=0)
+    span = max((max(days) for days in keyed if days), default=lo - 1) - lo + 1
+    grid: list[list[float | None]] = []
+    present = bytearray(span)
+    for days, symbol in zip(keyed, symbols):
+        col: list[float | None] = [None] * span
+        for day, price in zip(days, prices[symbol].values()):
+            col[day - lo] = price
+            present[day - lo] = 1
+        grid.append(col)
+    days_out: list[int] = []
+    columns: list[list[float | None]] = [[] for _ in symbols]
+    last: list[float | None] = [None] * n
+    age = [0] * n
+    started = False
+    for i in compress(range(span), present):
+        row = [col[i] for col in grid]
+        keep = (all(v is not None for v in row) if how == "inner"
+                else row[anchor] is not None if anchor is not None else True)
+        for j in range(n):
+            if row[j] is not None:
+                last[j], age[j] = row[j], 0
+            elif fill and last[j] is not None and (fill_limit is None or age[j] < fill_limit):
+                row[j] = last[j]
+                age[j] += 1
+        started = started or all(v is not None for v in row)
+        if keep and started:
+            days_out.append(lo + i)
+            for j in range(n):
+                columns[j].append(row[j])
+    return epoch_dates.iso_days(days_out), columns
+
+
+def _clean(x) -> float | None:
+    return None if x is None or not math.isfinite(x) else round(float(x), 6)
+
+
+def _metrics_numpy(columns, base: int, window: int) -> dict:
+    p = np.array([[np.nan if v is None else v for v in c] for c in columns], dtype=float).T  # T x N
+    t, n = p.shape
+    rebased = p / p[0] * 100.0
+    rel = rebased / rebased[:, [base]] * 100.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = p[1:] / p[:-1] - 1.0
+    r[~np.isfinite(r)] = np.nan
+    # Rolling correlation with the base from windowed sums (cumsum differences).
+    b = r[:, [base]]
+    valid = ~np.isnan(r) & ~np.isnan(b)
+    x = np.where(valid, r, 0.0)
+    y = np.where(valid, np.broadcast_to(b, r.shape), 0.0)
+
+    def win(a):
+        c = np.vstack([np.zeros((1, n)), np.cumsum(a, axis=0)])
+        return c[window:] - c[:-window]
+
+    corr = np.full((t, n), np.nan)
+    if t > window:
+        cnt, sx, sy = win(valid.astype(float)), win(x), win(y)
+        sxx, syy, sxy = win(x * x), win(y * y), win(x * y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = sxy - sx * sy / window
+            den = np.sqrt((sxx - sx * sx / window) * (syy - sy * sy / window))
+            rolled = np.where((cnt == window) & (den > 0), cov / den, np.nan)
+        corr[window:] = rolled
+    with np.errstate(invalid="ignore"):
+        vol = np.nanstd(r, axis=0, ddof=1) * math.sqrt(TRADING_DAYS) if t > 2 else np.full(n, np.nan)
+        full = [np.corrcoef(r[valid[:, j], j], r[valid[:, j], base])[0, 1] if valid[:, j].sum() > 2 else np.nan
+                for j in range(n)]
+    return {
+        "rebased": rebased.T.tolist(), "rel_strength": rel.T.tolist(), "rolling_corr": corr.T.tolist(),
+        "total_return": (p[-1] / p[0] - 1.0).tolist(), "volatility": list(vol), "correlation": full,
+    }
+
+
+def _corr(xs: list[float], ys: list[float]) -> float:
+    k = len(xs)
+    if k < 3:
+        return float("nan")
+    mx, my = sum(xs) / k, sum(ys) / k
+    sxy = sum((a - mx) * (b - my) for a, b in zip(xs, ys))
+    sxx = sum((a - mx) ** 2 for a in xs)
+    syy = sum((b - my) ** 2 for b in ys)
+    return sxy / math.sqrt(sxx * syy) if sxx > 0 and syy > 0 else float("nan")
+
+
+def _metrics_stdlib(columns, base: int, window: int) -> dict:
+    t = len(columns[base])
+    nan = float("nan")
+
+    def returns(col):
+        return [cur / prev - 1.0 if prev and cur is not None else None for prev, cur in zip(col, col[1:])]
+
+    rets = [returns(c) for c in columns]
+    rebased = [[v / c[0] * 100.0 if v is not None else nan for v in c] for c in columns]
+    out = {"rebased": rebased, "rel_strength": [], "rolling_corr": [], "total_return": [],
+           "volatility": [], "correlation": []}
+    for j, col in enumerate(columns):
+        out["rel_strength"].append([a / b * 100.0 if b else nan for a, b in zip(rebased[j], rebased[base])])
+        pairs = [(a, b) for a, b in zip(rets[j], rets[base]) if a is not None and b is not None]
+        rolling = [nan] * t
+        for i in range(window, t):
+            seg = list(zip(rets[j][i - window:i], rets[base][i - window:i]))
+            if all(a is not None and b is not None for a, b in seg):
+                rolling[i] = _corr([a for a, _ in seg], [b for _, b in seg])
+        out["rolling_corr"].append(rolling)
+        own = [a for a in rets[j] if a is not None]
+        if len(own) > 1:
+            m = sum(own) / len(own)
+            out["volatility"].append(math.sqrt(sum((a - m) ** 2 for a in own) / (len(own) - 1) * TRADING_DAYS))
+        else:
+            out["volatility"].append(nan)
+        out["correlation"].append(_corr([a for a, _ in pairs], [b for _, b in pairs]))
+        out["total_return"].append(col[-1] / col[0] - 1.0 if col[-1] is not None and col[0] else nan)
+    return out
+
+
+def compare(
+    prices: dict[str, dict[str, float]],
+    symbols: list[str],
+    base: str | None = None,
+    how: str = "outer",
+    fill: bool = True,
+    fill_limit: int | None = None,
+    window: int = 60,
+    use_numpy: bool | None = None,
+) -> dict:
+    """Join ``prices`` and compute the comparison → columnar result dict."""
+    base = base or symbols[0]
+    cols = symbols if base in symbols else symbols + [base]
+    dates, columns = join(prices, cols, how, fill, fill_limit)
+    if len(dates) < 2:
+        raise ValueError("fewer than two dates where every ticker has a price; widen the window or use --join outer")
+    if use_numpy is None:
+        use_numpy = np is not None
+    m = (_metrics_numpy if use_numpy else _metrics_stdlib)(columns, cols.index(base), window)
+    return {
+        "dates": dates,
+        "symbols": cols,
+        "base": base,
+        "join": how,
+        "window": window,
+        "engine": "numpy" if use_numpy else "stdlib",
+        "columns": {
+            "close": {s: [_clean(v) for v in c] for s, c in zip(cols, columns)},
+            **{f: {s: [_clean(v) for v in c] for s, c in zip(cols, m[f])}
+               for f in ("rebased", "rel_strength", "rolling_corr")},
+        },
+        "summary": {
+            s: {"total_return": _clean(m["total_return"][j]),
+                "annualized_volatility": _clean(m["volatility"][j]),
+                "correlation_to_base": _clean(m["correlation"][j]),
+                "rel_strength": _clean(m["rel_strength"][j][-1])}
+            for j, s in enumerate(cols)
+        },
+    }
+
+
+def render_csv(result: dict, fields: list[str]) -> str:
+    names = [(f, s) for f in fields for s in result["symbols"]]
+    lines = ["date," + ",".join(f"{f}:{s}" for f, s in names)]
+    for i, date in enumerate(result["dates"]):
+        values = (result["columns"][f][s][i] for f, s in names)
+        lines.append(date + "," + ",".join("" if v is None else repr(v) for v in values))
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Join several tickers' EOD prices and compare performance",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    today = datetime.date.today()
+    parser.add_argument("--symbols", required=True, help="Comma-separated tickers (e.g. AAPL.US,SAP.XETRA)")
+    parser.add_argument("--base", help="Ticker for relative strength / correlation (default: first symbol)")
+    parser.add_argument("--from-date", default=(today - datetime.timedelta(days=365)).isoformat(),
+                        help="Start date YYYY-MM-DD (default: one year ago)")
+    parser.add_argument("--to-date", default=today.isoformat(), help="End date YYYY-MM-DD (default: today)")
+    parser.add_argument("--join", default="outer",
+                        help="outer (union of dates), inner (common dates) or a ticker's calendar (default: outer)")
+    parser.add_argument("--no-fill", action="store_true", help="Leave gaps empty instead of forward-filling")
+    parser.add_argument("--fill-limit", type=int, help="Forward-fill at most N consecutive dates")
+    parser.add_argument("--window", type=int, default=60, help="Rolling correlation window in days (default: 60)")
+    parser.add_argument("--fields", default=",".join(FIELDS), help=f"Columns to emit (default: {','.join(FIELDS)})")
+    parser.add_argument("--summary-only", action="store_true", help="Print only the per-ticker summary")
+    parser.add_argument("--csv", action="store_true", help="Emit one field:SYMBOL column per series as CSV")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent requests (default: 8)")
+    parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds")
+    args = parser.parse_args()
+    if args.window < 2:
+        parser.error("--window must be at least 2 (a correlation needs two returns)")
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        return 2
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()]
+    if len(symbols) < 2 and not args.base:
+        print("Error: --symbols needs at least two tickers (or pass --base)", file=sys.stderr)
+        return 2
+    if any(f not in FIELDS for f in fields):
+        print(f"Error: --fields must be a subset of {','.join(FIELDS)}", file=sys.stderr)
+        return 2
+    wanted = symbols + ([args.base] if args.base and args.base not in symbols else [])
+    try:
+        prices = fetch_prices(wanted, token, args.from_date, args.to_date, args.workers, args.timeout)
+        result = compare(prices, symbols, args.base, args.join, not args.no_fill, args.fill_limit, args.window)
+    except (eodhd_client.ClientError, RuntimeError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    if args.csv:
+        sys.stdout.write(render_csv(result, fields))
+    elif args.summary_only:
+        print(json.dumps(result["summary"], indent=2))
+    else:
+        result["columns"] = {f: result["columns"][f] for f in fields}
+        print(json.dumps(result, separators=(",", ":")))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Incremental earnings-calendar watcher that emits only deltas as NDJSON.
+
+Keeps the last ``calendar/earnings`` (and optionally ``calendar/trends``)
+snapshot on disk and, on each poll, refetches only the date buckets that are
+due, diffing them against the snapshot. One JSON line is written per change:
+
+  {"op": "added" | "changed" | "removed", "source": "calendar/earnings",
+   "key": "AAPL.US|2026-09-30", "kinds": ["estimate_revised"],
+   "changes": {"estimate": [1.61, 1.65]}, "record": {...}}
+
+Buckets are fixed 7-day windows (Monday-aligned, so they stay stable as the
+watch window rolls forward), refreshed on a schedule that follows how often
+each part of the calendar changes:
+
+  - the days around today (reports landing)          every poll
+  - the next two weeks (dates confirmed, estimates)  hourly
+  - further ahead                                    every 6 hours
+  - settled past weeks                               daily
+
+An event that vanishes from a refreshed bucket is looked up once more by
+symbol, so a moved report date arrives as ``changed`` (``date_moved``) rather
+than ``removed`` + ``added``. Events that roll out of the window are dropped
+from the snapshot silently.
+
+Requires:
+  EODHD_API_TOKEN environment variable.
+
+Examples:
+  # One poll (cron-friendly); the first run seeds the snapshot and emits every event as "added"
+  python earnings_watch.py --ahead-days 30
+
+  # Seed silently, then poll every 5 minutes and append deltas to a file
+  python earnings_watch.py --seed
+  python earnings_watch.py --interval 300 >> earnings-deltas.ndjson
+
+  # Also watch EPS/revenue estimate trends for a watch list
+  python earnings_watch.py --symbols AAPL.US,MSFT.US --state ~/.cache/eodhd/earnings-watch/megacaps.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+import eodhd_client
+
+STATE_DIR = os.path.join(eodhd_client.CACHE_DIR, "earnings-watch")
+BUCKET_DAYS = 7
+EVENT_FIELDS = ("report_date", "before_after_market", "currency", "actual", "estimate",
+                "difference", "percent")
+TREND_FIELDS = ("earningsEstimateAvg", "earningsEstimateNumberOfAnalysts", "revenueEstimateAvg",
+                "epsTrendCurrent", "epsRevisionsUpLast7days", "epsRevisionsUpLast30days",
+                "epsRevisionsDownLast30days", "growth")
+# Refresh intervals (seconds) per bucket tier.
+HOT, WARM, COLD, SETTLED = 0, 3600, 6 * 3600, 86400
+TRENDS_INTERVAL = 3600
+
+
+def bucket_starts(start: datetime.date, end: datetime.date) -> list[datetime.date]:
+    """Monday-aligned bucket start dates covering ``start``..``end``."""
+    first = start - datetime.timedelta(days=start.weekday())
+    out = []
+    while first <= end:
+        out.append(first)
+        first += datetime.timedelta(days=BUCKET_DAYS)
+    return out
+
+
+def refresh_interval(bucket: datetime.date, today: datetime.date) -> int:
+    last = bucket + datetime.timedelta(days=BUCKET_DAYS - 1)
+    if last < today - datetime.timedelta(days=3):
+        return SETTLED
+    if bucket <= today + datetime.timedelta(days=1):
+        return HOT
+    if bucket <= today + datetime.timedelta(days=14):
+        return WARM
+    return COLD
+
+
+def event_key(record: dict) -> str:
+    """Earnings are identified by ticker + fiscal period, so a moved report date is a change."""
+    return f"{record.get('code')}|{record.get('date') or record.get('report_date')}"
+
+
+def trend_key(record: dict) -> str:
+    return f"{record.get('code')}|{record.get('period')}|{record.get('date')}"
+
+
+def _number(value):
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _kinds(changes: dict) -> list[str]:
+    kinds = []
+    if "report_date" in changes:
+        kinds.append("date_moved")
+    if "actual" in changes and changes["actual"][0] is None:
+        kinds.append("reported")
+    elif "actual" in changes:
+        kinds.append("actual_restated")
+    if "estimate" in changes or any(f.startswith(("earningsEstimate", "epsTrend", "revenueEstimate"))
+                                    for f in changes):
+        kinds.append("estimate_revised")
+    if "before_after_market" in changes:
+        kinds.append("timing_changed")
+    return kinds or ["updated"]
+
+
+def diff(old: dict, new: dict, fields: tuple, source: str) -> list[dict]:
+    """Deltas between two ``{key: record}`` maps, sorted by key."""
+    out = []
+    for key in sorted(old.keys() | new.keys()):
+        before, after = old.get(key), new.get(key)
+        if before is None:
+            out.append({"op": "added", "source": source, "key": key, "record": after})
+        elif after is None:
+            out.append({"op": "removed", "source": source, "key": key, "record": before})
+        else:
+            changes = {f: [before.get(f), after.get(f)] for f in fields
+                       if _number(before.get(f)) != _number(after.get(f))}
+            if changes:
+                out.append({"op": "changed", "source": source, "key": key,
+                            "kinds": _kinds(changes), "changes": changes, "record": after})
+    return out
+
+
+def _earnings(payload) -> list[dict]:
+    if isinstance(payload, dict):
+        if "earnings" not in payload and payload.get("error"):
+            raise eodhd_client.ClientError(f"calendar/earnings API error: {payload['error']}")
+        payload = payload.get("earnings")
+    return [r for r in payload or [] if isinstance(r, dict)]
+
+
+def _trends(payload) -> list[dict]:
+    if isinstance(payload, dict):
+        payload = payload.get("trends")
+    return [r for group in payload or [] if isinstance(group, list) for r in group if isinstance(r, dict)]
+
+
+def _bucket_id(record: dict) -> str | None:
+    try:
+        day = datetime.date.fromisoformat(record.get("report_date") or "")
+    except ValueError:
+        return None
+    return (day - datetime.timedelta(days=day.weekday())).isoformat()
+
+
+def load_state(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, json.JSONDecodeError):
+        return {"buckets": {}, "events": {}, "trends": {}, "trends_at": 0}
+
+
+def save_state(path: str, state: dict) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(state, fh, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def poll(state: dict, token: str, today: datetime.date, now: float, behind_days: int = 7,
+         ahead_days: int = 30, symbols: list[str] | None = None, workers: int = 8,
+         **kwargs) -> list[dict]:
+    """Refresh due buckets (and trends), update ``state`` in place, return the deltas.
+
+    Every request is made before a delta is recorded in ``state``, so after a
+    ClientError the next poll reports the same deltas.
+    """
+    trends = None
+    if symbols and now - state.get("trends_at", 0) >= TRENDS_INTERVAL:
+        trends = eodhd_client.fetch_json("calendar/trends", token,
+                                         params={"symbols": ",".join(symbols)}, **kwargs)
+    window = bucket_starts(today - datetime.timedelta(days=behind_days),
+                           today + datetime.timedelta(days=ahead_days))
+    window_ids = {b.isoformat() for b in window}
+    # Forget buckets (and their events) that rolled out of the window.
+    for bucket_id in list(state["buckets"]):
+        if bucket_id not in window_ids:
+            del state["buckets"][bucket_id]
+    events: dict[str, dict] = state["events"]
+    for key in [k for k, r in events.items() if _bucket_id(r) not in window_ids]:
+        del events[key]
+
+    due = [b for b in window
+           if now - state["buckets"].get(b.isoformat(), 0) >= refresh_interval(b, today)]
+    deltas: list[dict] = []
+    if due:
+        calls = [{"endpoint": "calendar/earnings",
+                  "params": {"from": b.isoformat(),
+                             "to": (b + datetime.timedelta(days=BUCKET_DAYS - 1)).isoformat()}}
+                 for b in due]
+        fresh: dict[str, dict] = {}
+        for payload in eodhd_client.fetch_many(calls, token, workers=workers, **kwargs):
+            for record in _earnings(payload):
+                fresh[event_key(record)] = record
+        due_ids = {b.isoformat() for b in due}
+        old = {k: r for k, r in events.items() if _bucket_id(r) in due_ids}
+        vanished = sorted({old[k].get("code") for k in old.keys() - fresh.keys() if old[k].get("code")})
+        if vanished:
+            # One symbols= lookup tells a moved report date apart from a cancelled one.
+            moved = eodhd_client.fetch_json("calendar/earnings", token,
+                                             params={"symbols": ",".join(vanished)}, **kwargs)
+            for record in _earnings(moved):
+                key = event_key(record)
+                if key in old and key not in fresh:
+                    fresh[key] = record
+        for key in old:
+            events.pop(key, None)
+        # An event that moved into a bucket refreshed this poll counts against its old copy.
+        old.update({k: events.pop(k) for k in fresh if k in events})
+        deltas.extend(diff(old, fresh, EVENT_FIELDS, "calendar/earnings"))
+        events.update({k: r for k, r in fresh.items() if _bucket_id(r) in window_ids})
+        for bucket_id in due_ids:
+            state["buckets"][bucket_id] = now
+
+    if trends is not None:
+        fresh_trends = {trend_key(r): r for r in _trends(trends)}
+        deltas.extend(diff(state["trends"], fresh_trends, TREND_FIELDS, "calendar/trends"))
+        state["trends"] = fresh_trends
+        state["trends_at"] = now
+    return deltas
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Poll calendar/earnings (and calendar/trends) and emit only deltas as NDJSON",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--state", default=os.path.join(STATE_DIR, "default.json"),
+                        help="Snapshot file (default: EODHD_CACHE_DIR/earnings-watch/default.json)")
+    parser.add_argument("--behind-days", type=int, default=7, help="Watch report dates from today - N (default: 7)")
+    parser.add_argument("--ahead-days", type=int, default=30, help="Watch report dates up to today + N (default: 30)")
+    parser.add_argument("--symbols", help="Comma-separated tickers whose calendar/trends estimates to watch")
+    parser.add_argument("--interval", type=int, help="Poll every N seconds until interrupted (default: poll once)")
+    parser.add_argument("--seed", action="store_true", help="Record the current snapshot without emitting deltas")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent bucket requests (default: 8)")
+    parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds")
+    args = parser.parse_args()
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        return 2
+    symbols = [s.strip() for s in (args.symbols or "").split(",") if s.strip()]
+    state = load_state(args.state)
+    try:
+        while True:
+            try:
+                deltas = poll(state, token, datetime.date.today(), time.time(), args.behind_days,
+                              args.ahead_days, symbols, args.workers, timeout=args.timeout)
+            except eodhd_client.ClientError as exc:
+                print(f"Error: {exc}", file=sys.stderr)
+                if args.interval is None:
+                    return 1
+            else:
+                save_state(args.state, state)
+                if not args.seed:
+                    for delta in deltas:
+                        sys.stdout.write(json.dumps(delta, sort_keys=True) + "\n")
+                    sys.stdout.flush()
+            if args.interval is None:
+                return 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
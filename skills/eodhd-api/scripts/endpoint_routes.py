@@ -0,0 +1,91 @@
+"""Request shapes for every REST endpoint in registry/capabilities.json.
+
+GENERATED by registry/build.py — do not edit by hand. Run `python registry/build.py`.
+
+ROUTES maps an endpoint name (the client's --endpoint value, or the registry id for
+documented-only endpoints) to its path template, path placeholder (slot), the query
+param --symbol fills, CLI flag -> API param renames, required params, value
+converters and params dropped when another is present. ALIASES maps registry ids
+to ROUTES keys where the two differ.
+"""
+
+ROUTES = {
+    'eod': {'id': 'eod', 'path': '/eod/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'time-series'},
+    'intraday': {'id': 'intraday', 'path': '/intraday/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {'from': 'unix', 'to': 'unix'}, 'excludes': {}, 'family': 'time-series'},
+    'real-time': {'id': 'real-time', 'path': '/real-time/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'quote'},
+    'eod-bulk-last-day': {'id': 'eod-bulk-last-day', 'path': '/eod-bulk-last-day/{exchange}', 'slot': 'exchange', 'symbol': 'exchange', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'time-series'},
+    'fundamentals': {'id': 'fundamentals', 'path': '/fundamentals/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'fundamentals'},
+    'bulk-fundamentals': {'id': 'bulk-fundamentals', 'path': '/bulk-fundamentals/{exchange}', 'slot': 'exchange', 'symbol': 'exchange', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter', 'symbols': 'symbols', 'version': 'version'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'fundamentals'},
+    'news': {'id': 'news', 'path': '/news', 'slot': None, 'symbol': 's', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': ['s'], 'convert': {}, 'excludes': {}, 'family': 'news'},
+    'sentiment': {'id': 'sentiment', 'path': '/sentiments', 'slot': None, 'symbol': 's', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': ['s'], 'convert': {}, 'excludes': {}, 'family': 'sentiment'},
+    'news-word-weights': {'id': 'news-word-weights', 'path': '/news-word-weights', 'slot': None, 'symbol': 's', 'params': {'from_date': 'filter[date_from]', 'to_date': 'filter[date_to]', 'limit': 'page[limit]', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': ['s'], 'convert': {}, 'excludes': {}, 'family': 'news'},
+    'insider-transactions': {'id': 'insider-transactions', 'path': '/insider-transactions', 'slot': None, 'symbol': 'code', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': ['code'], 'convert': {}, 'excludes': {}, 'family': 'fundamentals'},
+    'dividends': {'id': 'dividends', 'path': '/div/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'calendar'},
+    'splits': {'id': 'splits', 'path': '/splits/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'calendar'},
+    'technical': {'id': 'technical', 'path': '/technical/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': ['function'], 'convert': {}, 'excludes': {}, 'family': 'time-series'},
+    'macro-indicator': {'id': 'macro-indicator', 'path': '/macro-indicator/{country}', 'slot': 'country', 'symbol': 'country', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'macro'},
+    'economic-events': {'id': 'economic-events', 'path': '/economic-events', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter', 'country': 'country', 'comparison': 'comparison'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'macro'},
+    'calendar/earnings': {'id': 'calendar-earnings', 'path': '/calendar/earnings', 'slot': None, 'symbol': 'symbols', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {'symbols': ['from', 'to']}, 'family': 'calendar'},
+    'calendar/trends': {'id': 'calendar-trends', 'path': '/calendar/trends', 'slot': None, 'symbol': 'symbols', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': ['symbols'], 'convert': {}, 'excludes': {}, 'family': 'calendar'},
+    'calendar/ipos': {'id': 'calendar-ipos', 'path': '/calendar/ipos', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'calendar'},
+    'calendar/splits': {'id': 'calendar-splits', 'path': '/calendar/splits', 'slot': None, 'symbol': 'symbols', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'calendar'},
+    'calendar/dividends': {'id': 'calendar-dividends', 'path': '/calendar/dividends', 'slot': None, 'symbol': 'filter[symbol]', 'params': {'from_date': 'filter[date_from]', 'to_date': 'filter[date_to]', 'limit': 'page[limit]', 'offset': 'page[offset]', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'calendar'},
+    'exchange-symbol-list': {'id': 'exchange-symbol-list', 'path': '/exchange-symbol-list/{exchange}', 'slot': 'exchange', 'symbol': 'exchange', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'listing'},
+    'exchanges-list': {'id': 'exchanges-list', 'path': '/exchanges-list', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'listing'},
+    'exchanges-details': {'id': 'exchanges-details', 'path': '/exchanges/{exchange}', 'slot': 'exchange', 'symbol': 'exchange', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'listing'},
+    'index-components': {'id': 'index-components', 'path': '/fundamentals/{index}', 'slot': 'index', 'symbol': 'index', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'fundamentals'},
+    'screener': {'id': 'screener', 'path': '/screener', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter', 'filters': 'filters', 'sort': 'sort', 'signals': 'signals'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'listing'},
+    'us-quote-delayed': {'id': 'us-quote-delayed', 'path': '/us-quote-delayed', 'slot': None, 'symbol': 's', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'page[limit]', 'offset': 'page[offset]', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': ['s'], 'convert': {}, 'excludes': {}, 'family': 'quote'},
+    'user': {'id': 'user', 'path': '/user', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit', 'offset': 'offset', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'account'},
+    'ust/bill-rates': {'id': 'ust-bill-rates', 'path': '/ust/bill-rates', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'page[limit]', 'offset': 'page[offset]', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter', 'filter_year': 'filter[year]'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'rates'},
+    'ust/long-term-rates': {'id': 'ust-long-term-rates', 'path': '/ust/long-term-rates', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'page[limit]', 'offset': 'page[offset]', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter', 'filter_year': 'filter[year]'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'rates'},
+    'ust/yield-rates': {'id': 'ust-yield-rates', 'path': '/ust/yield-rates', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'page[limit]', 'offset': 'page[offset]', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter', 'filter_year': 'filter[year]'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'rates'},
+    'ust/real-yield-rates': {'id': 'ust-real-yield-rates', 'path': '/ust/real-yield-rates', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'page[limit]', 'offset': 'page[offset]', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter', 'filter_year': 'filter[year]'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'rates'},
+    'cboe-index-data': {'id': 'cboe-index-data', 'path': '/cboe/index', 'slot': None, 'symbol': None, 'params': {}, 'required': ['filter[index_code]', 'filter[feed_type]', 'filter[date]'], 'convert': {}, 'excludes': {}, 'family': 'time-series'},
+    'cboe-indices-list': {'id': 'cboe-indices-list', 'path': '/cboe/indices', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'listing'},
+    'historical-market-cap': {'id': 'historical-market-cap', 'path': '/historical-market-cap/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'time-series'},
+    'indices-list': {'id': 'indices-list', 'path': '/mp/unicornbay/spglobal/list', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'listing'},
+    'investverte-esg-list-companies': {'id': 'investverte-esg-list-companies', 'path': '/mp/investverte/companies', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'esg'},
+    'investverte-esg-list-countries': {'id': 'investverte-esg-list-countries', 'path': '/mp/investverte/countries', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'esg'},
+    'investverte-esg-list-sectors': {'id': 'investverte-esg-list-sectors', 'path': '/mp/investverte/sectors', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'esg'},
+    'investverte-esg-view-company': {'id': 'investverte-esg-view-company', 'path': '/mp/investverte/esg/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'esg'},
+    'investverte-esg-view-country': {'id': 'investverte-esg-view-country', 'path': '/mp/investverte/country/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'esg'},
+    'investverte-esg-view-sector': {'id': 'investverte-esg-view-sector', 'path': '/mp/investverte/sector/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'esg'},
+    'marketplace-tick-data': {'id': 'marketplace-tick-data', 'path': '/mp/unicornbay/tickdata/ticks', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit'}, 'required': ['s'], 'convert': {}, 'excludes': {}, 'family': 'time-series'},
+    'praams-bank-balance-sheet-by-isin': {'id': 'praams-bank-balance-sheet-by-isin', 'path': '/mp/praams/bank/balance_sheet/isin/{isin}', 'slot': 'isin', 'symbol': 'isin', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-bank-balance-sheet-by-ticker': {'id': 'praams-bank-balance-sheet-by-ticker', 'path': '/mp/praams/bank/balance_sheet/ticker/{ticker}', 'slot': 'ticker', 'symbol': 'ticker', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-bank-income-statement-by-isin': {'id': 'praams-bank-income-statement-by-isin', 'path': '/mp/praams/bank/income_statement/isin/{isin}', 'slot': 'isin', 'symbol': 'isin', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-bank-income-statement-by-ticker': {'id': 'praams-bank-income-statement-by-ticker', 'path': '/mp/praams/bank/income_statement/ticker/{ticker}', 'slot': 'ticker', 'symbol': 'ticker', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-bond-analyze-by-isin': {'id': 'praams-bond-analyze-by-isin', 'path': '/mp/praams/analyse/bond/{isin}', 'slot': 'isin', 'symbol': 'isin', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-report-bond-by-isin': {'id': 'praams-report-bond-by-isin', 'path': '/mp/praams/reports/bond/{isin}', 'slot': 'isin', 'symbol': 'isin', 'params': {}, 'required': ['email'], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-report-equity-by-isin': {'id': 'praams-report-equity-by-isin', 'path': '/mp/praams/reports/equity/isin/{isin}', 'slot': 'isin', 'symbol': 'isin', 'params': {}, 'required': ['email'], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-report-equity-by-ticker': {'id': 'praams-report-equity-by-ticker', 'path': '/mp/praams/reports/equity/ticker/{ticker}', 'slot': 'ticker', 'symbol': 'ticker', 'params': {}, 'required': ['email'], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-risk-scoring-by-isin': {'id': 'praams-risk-scoring-by-isin', 'path': '/mp/praams/analyse/equity/isin/{isin}', 'slot': 'isin', 'symbol': 'isin', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-risk-scoring-by-ticker': {'id': 'praams-risk-scoring-by-ticker', 'path': '/mp/praams/analyse/equity/ticker/{ticker}', 'slot': 'ticker', 'symbol': 'ticker', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-smart-investment-screener-bond': {'id': 'praams-smart-investment-screener-bond', 'path': '/mp/praams/explore/bond', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'praams-smart-investment-screener-equity': {'id': 'praams-smart-investment-screener-equity', 'path': '/mp/praams/explore/equity', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'risk-report'},
+    'stock-market-logos': {'id': 'stock-market-logos', 'path': '/logo/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'reference'},
+    'stock-market-logos-svg': {'id': 'stock-market-logos-svg', 'path': '/logo-svg/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'reference'},
+    'stocks-from-search': {'id': 'stocks-from-search', 'path': '/search/{query_string}', 'slot': 'query_string', 'symbol': 'query_string', 'params': {'limit': 'limit'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'listing'},
+    'symbol-change-history': {'id': 'symbol-change-history', 'path': '/symbol-change-history', 'slot': None, 'symbol': None, 'params': {'from_date': 'from', 'to_date': 'to'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'reference'},
+    'tradinghours-list-markets': {'id': 'tradinghours-list-markets', 'path': '/mp/tradinghours/markets', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'reference'},
+    'tradinghours-lookup-markets': {'id': 'tradinghours-lookup-markets', 'path': '/mp/tradinghours/markets/lookup', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'reference'},
+    'tradinghours-market-details': {'id': 'tradinghours-market-details', 'path': '/mp/tradinghours/markets/details', 'slot': None, 'symbol': None, 'params': {}, 'required': ['fin_id'], 'convert': {}, 'excludes': {}, 'family': 'reference'},
+    'tradinghours-market-status': {'id': 'tradinghours-market-status', 'path': '/mp/tradinghours/markets/status', 'slot': None, 'symbol': None, 'params': {}, 'required': ['fin_id'], 'convert': {}, 'excludes': {}, 'family': 'reference'},
+    'us-options-contracts': {'id': 'us-options-contracts', 'path': '/mp/unicornbay/options/contracts', 'slot': None, 'symbol': 'filter[underlying_symbol]', 'params': {'from_date': 'filter[exp_date_from]', 'to_date': 'filter[exp_date_to]', 'limit': 'page[limit]', 'offset': 'page[offset]', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {'filter[underlying_symbol]': 'underlying'}, 'excludes': {}, 'family': 'options'},
+    'us-options-eod': {'id': 'us-options-eod', 'path': '/mp/unicornbay/options/eod', 'slot': None, 'symbol': 'filter[underlying_symbol]', 'params': {'from_date': 'filter[exp_date_from]', 'to_date': 'filter[exp_date_to]', 'limit': 'page[limit]', 'offset': 'page[offset]', 'interval': 'interval', 'function': 'function', 'period': 'period', 'indicator': 'indicator', 'filter': 'filter'}, 'required': [], 'convert': {'filter[underlying_symbol]': 'underlying'}, 'excludes': {}, 'family': 'options'},
+    'us-options-underlyings': {'id': 'us-options-underlyings', 'path': '/mp/unicornbay/options/underlying-symbols', 'slot': None, 'symbol': None, 'params': {}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'options'},
+    'us-tick-data': {'id': 'us-tick-data', 'path': '/ticks/{symbol}', 'slot': 'symbol', 'symbol': 'symbol', 'params': {'from_date': 'from', 'to_date': 'to', 'limit': 'limit'}, 'required': [], 'convert': {}, 'excludes': {}, 'family': 'time-series'},
+}
+
+ALIASES = {
+    'calendar-earnings': 'calendar/earnings',
+    'calendar-trends': 'calendar/trends',
+    'calendar-ipos': 'calendar/ipos',
+    'calendar-splits': 'calendar/splits',
+    'calendar-dividends': 'calendar/dividends',
+    'ust-bill-rates': 'ust/bill-rates',
+    'ust-long-term-rates': 'ust/long-term-rates',
+    'ust-yield-rates': 'ust/yield-rates',
+    'ust-real-yield-rates': 'ust/real-yield-rates',
+}
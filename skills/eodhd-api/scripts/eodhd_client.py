@@ -35,6 +35,9 @@ Examples:
   # Technical indicators
   python eodhd_client.py --endpoint technical --symbol AAPL.US --function sma --period 50
 
+  # Technical indicators computed locally from (cached) EOD bars — no /technical call
+  python eodhd_client.py --endpoint technical --symbol AAPL.US --function rsi --period 14 --technical-mode local --cache-ttl 3600
+
   # Macro indicators
   python eodhd_client.py --endpoint macro-indicator --symbol USA --indicator inflation_consumer_prices_annual
 
@@ -51,6 +54,12 @@ Examples:
   # sort is field.direction e.g. market_capitalization.desc; add ["exchange","=","us"] to keep caps in USD)
   python eodhd_client.py --endpoint screener --filters '[["market_capitalization",">=",1000000000],["sector","=","Technology"],["exchange","=","us"]]' --sort market_capitalization.desc --limit 20
 
+  # Every match past the screener's offset ceiling (auto-split into market-cap bands, fetched concurrently)
+  python eodhd_client.py --endpoint screener --shard --filters '[["market_capitalization",">=",1000000000],["exchange","=","us"]]'
+
+  # Company brief: fundamentals, prices, quote, news, sentiment, insiders, dividends, calendar in one pass
+  python eodhd_client.py --brief --symbol AAPL.US
+
   # Sentiment data
   python eodhd_client.py --endpoint sentiment --symbol AAPL.US --from-date 2025-01-01 --to-date 2025-01-31
 
@@ -67,6 +76,12 @@ Examples:
   # Bulk fundamentals for specific symbols
   python eodhd_client.py --endpoint bulk-fundamentals --symbol NASDAQ --symbols AAPL.US,MSFT.US
 
+  # US options chain page (Marketplace): AAPL calls/puts expiring in a window
+  python eodhd_client.py --endpoint us-options-eod --symbol AAPL.US --from-date 2026-11-01 --to-date 2026-12-31 --limit 100
+
+  # Documented-only endpoints by registry id (path placeholders via --symbol or --param)
+  python eodhd_client.py --call tradinghours-market-status --param fin_id=us.nyse
+
   # User details (account info, API usage)
   python eodhd_client.py --endpoint user
 
@@ -85,17 +100,35 @@ Examples:
 
 from __future__ import annotations
 
-import argparse
-import datetime
-import json
+# Only cheap modules load at startup: agents run this script once per call, so
+# argparse, json, urllib, http.client/ssl, hashlib and datetime are imported in
+# the functions that need them (a cache hit never loads http.client or ssl).
+# tests/test_startup.py keeps it that way.
+import _thread
 import os
-import re
 import sys
-import urllib.error
-import urllib.parse
-import urllib.request
+import time
+
+# typing.TYPE_CHECKING without importing typing: type checkers see the import,
+# the interpreter never runs it.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import endpoint_routes
+except ImportError:  # loaded by file path without scripts/ on sys.path
+    import importlib.util
+
+    _spec = importlib.util.spec_from_file_location(
+        "endpoint_routes", os.path.join(os.path.dirname(os.path.abspath(__file__)), "endpoint_routes.py"))
+    endpoint_routes = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(endpoint_routes)
 
 BASE_URL = "https://eodhd.com/api"
+CACHE_DIR = os.getenv("EODHD_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "eodhd"
+)
 
 
 def _redact_token(url: str) -> str:
@@ -107,120 +140,104 @@ def _redact_token(url: str) -> str:
     and stops at the next ``&`` or ``#`` so it neither swallows a fragment nor
     matches a lookalike param such as ``backup_api_token=``.
     """
+    import re
+
     return re.sub(r"([?&]api_token=)[^&#]*", r"\1***", url)
 
 
-# Endpoints that don't require a symbol
-NO_SYMBOL_ENDPOINTS = {
-    "screener",
-    "exchanges-list",
-    "calendar/earnings",
-    "calendar/ipos",
-    "calendar/splits",
-    "calendar/dividends",
-    "economic-events",
-    "ust/bill-rates",
-    "ust/long-term-rates",
-    "ust/yield-rates",
-    "ust/real-yield-rates",
-    "us-quote-delayed",
-    "user",
-}
+class ClientError(RuntimeError):
+    """Raised when user input or API response is invalid."""
 
-# Endpoints where --symbol means exchange code, not ticker
-EXCHANGE_CODE_ENDPOINTS = {
-    "exchange-symbol-list",
-    "eod-bulk-last-day",
-    "bulk-fundamentals",
+
+def _unix_time(value):
+    """YYYY-MM-DD[ HH:MM:SS] -> UTC Unix timestamp (intraday wants timestamps); other values pass through."""
+    if isinstance(value, str) and "-" in value:
+        import epoch_dates
+
+        try:
+            return epoch_dates.unix_seconds(value)
+        except ValueError:
+            pass  # Leave unchanged; API will surface the error
+    return value
+
+
+# Value converters named by a route's "convert" map (registry "request.convert").
+CONVERTERS = {
+    "unix": _unix_time,
+    "underlying": lambda value: str(value).upper().removesuffix(".US"),
 }
 
 
-class ClientError(RuntimeError):
-    """Raised when user input or API response is invalid."""
+def resolve_endpoint(endpoint: str) -> tuple[str, dict]:
+    """(canonical name, route) for an --endpoint value or registry id (one dict lookup)."""
+    name = endpoint_routes.ALIASES.get(endpoint, endpoint)
+    route = endpoint_routes.ROUTES.get(name)
+    if route is None:
+        raise ClientError(f"Unsupported endpoint: {endpoint}")
+    return name, route
 
 
-def build_path(endpoint: str, symbol: str | None, function: str | None = None) -> str:
-    """Build the API path for the given endpoint."""
-
-    # Endpoints that don't need a symbol
-    if endpoint in NO_SYMBOL_ENDPOINTS:
-        if endpoint == "exchanges-list":
-            return "/exchanges-list"
-        if endpoint == "calendar/earnings":
-            return "/calendar/earnings"
-        if endpoint == "calendar/ipos":
-            return "/calendar/ipos"
-        if endpoint == "calendar/splits":
-            return "/calendar/splits"
-        if endpoint == "calendar/dividends":
-            return "/calendar/dividends"
-        if endpoint == "economic-events":
-            return "/economic-events"
-        if endpoint == "screener":
-            return "/screener"
-        if endpoint == "ust/bill-rates":
-            return "/ust/bill-rates"
-        if endpoint == "ust/long-term-rates":
-            return "/ust/long-term-rates"
-        if endpoint == "ust/yield-rates":
-            return "/ust/yield-rates"
-        if endpoint == "ust/real-yield-rates":
-            return "/ust/real-yield-rates"
-        if endpoint == "us-quote-delayed":
-            return "/us-quote-delayed"
-        if endpoint == "user":
-            return "/user"
-        return f"/{endpoint}"
-
-    # Require symbol for all other endpoints
-    if not symbol:
-        raise ClientError(f"--symbol is required for endpoint={endpoint}")
-
-    # Simple symbol-based endpoints
-    if endpoint == "eod":
-        return f"/eod/{symbol}"
-    if endpoint == "intraday":
-        return f"/intraday/{symbol}"
-    if endpoint == "fundamentals":
-        return f"/fundamentals/{symbol}"
-    if endpoint == "real-time":
-        return f"/real-time/{symbol}"
-    if endpoint == "dividends":
-        return f"/div/{symbol}"
-    if endpoint == "splits":
-        return f"/splits/{symbol}"
-    if endpoint == "news":
-        return f"/news"  # news uses 's' param, not path
-    if endpoint == "sentiment":
-        return "/sentiments"  # sentiments uses 's' param
-    if endpoint == "news-word-weights":
-        return "/news-word-weights"  # uses 's' param and special filter params
-    if endpoint == "insider-transactions":
-        return f"/insider-transactions"  # uses 'code' param
-    if endpoint == "calendar/trends":
-        return "/calendar/trends"  # uses 'symbols' param (comma-separated)
-    if endpoint == "technical":
-        if not function:
-            raise ClientError("--function is required for endpoint=technical (e.g., sma, ema, rsi)")
-        return f"/technical/{symbol}"
-    if endpoint == "macro-indicator":
-        return f"/macro-indicator/{symbol}"
-
-    # Exchange code endpoints
-    if endpoint == "exchange-symbol-list":
-        return f"/exchange-symbol-list/{symbol}"
-    if endpoint == "eod-bulk-last-day":
-        return f"/eod-bulk-last-day/{symbol}"
-    if endpoint == "bulk-fundamentals":
-        return f"/bulk-fundamentals/{symbol}"
-
-    # Index/exchange related
-    if endpoint == "exchanges-details":
-        return f"/exchanges/{symbol}"
-    if endpoint == "index-components":
-        return f"/fundamentals/{symbol}"  # index components via fundamentals
-
-    raise ClientError(f"Unsupported endpoint: {endpoint}")
+def _flag(route: dict, name: str) -> str:
+    """The CLI spelling of API param ``name`` for error messages."""
+    if name in (route["slot"], route["symbol"]):
+        return "--symbol"
+    for dest, api_name in route["params"].items():
+        if api_name == name:
+            return "--" + dest.replace("_", "-")
+    return f"--param {name}=VALUE"
+
+
+def build_request(endpoint: str, symbol: str | None = None,
+                  params: dict | None = None) -> tuple[str, dict]:
+    """Resolve an endpoint's API path and query params from its route.
+
+    The route (endpoint_routes.ROUTES, compiled from registry/capabilities.json
+    by registry/build.py) says whether ``symbol`` fills the path placeholder or
+    a query param (``s``, ``code``, ``symbols``, ``filter[symbol]``, ...).
+    A placeholder may also come from ``params`` under its own name, and a query
+    param the caller already set wins over ``symbol``. Raises ClientError for
+    an unknown endpoint or a missing required param.
+    """
+    import urllib.parse
+
+    _, route = resolve_endpoint(endpoint)
+    query = dict(params or {})
+    path = route["path"]
+    slot = route["slot"]
+    if slot:
+        value = symbol or query.pop(slot, None)
+        if not value:
+            raise ClientError(f"--symbol is required for endpoint={endpoint}")
+        path = path.replace("{" + slot + "}", urllib.parse.quote(str(value), safe=",^=:"))
+    elif symbol and route["symbol"] and route["symbol"] not in query:
+        query[route["symbol"]] = symbol
+    for name, converter in route["convert"].items():
+        if name in query:
+            query[name] = CONVERTERS[converter](query[name])
+    for name, dropped in route["excludes"].items():
+        if name in query:
+            for other in dropped:
+                query.pop(other, None)
+    for name in route["required"]:
+        if query.get(name) in (None, ""):
+            raise ClientError(f"{_flag(route, name)} is required for endpoint={endpoint}")
+    return path, query
+
+
+def cli_params(endpoint: str, args: argparse.Namespace) -> dict:
+    """API query params from the parsed CLI flags, renamed per the endpoint's route."""
+    _, route = resolve_endpoint(endpoint)
+    params: dict = {}
+    for dest, name in route["params"].items():
+        value = getattr(args, dest, None)
+        if value is not None and value != "":
+            params[name] = value
+    for pair in getattr(args, "param", None) or []:
+        key, sep, value = pair.partition("=")
+        if not sep or not key:
+            raise ClientError(f"--param expects KEY=VALUE, got {pair!r}")
+        params[key] = value
+    return params
 
 
 SUPPORTED_ENDPOINTS = [
@@ -258,6 +275,9 @@ SUPPORTED_ENDPOINTS = [
     "screener",
     # US extended quotes (Live v2)
     "us-quote-delayed",
+    # US options (Marketplace)
+    "us-options-contracts",
+    "us-options-eod",
     # Account
     "user",
     # US Treasury rates
@@ -268,341 +288,1089 @@ SUPPORTED_ENDPOINTS = [
 ]
 
 
-def _lowercase_keys(obj):
-    """Recursively lowercase all dict keys.
+def _lowercase_pairs(pairs: list[tuple]) -> dict:
+    """json object_pairs_hook: build each object with lowercase keys as it is parsed."""
+    return {str(k).lower(): v for k, v in pairs}
+
+
+def _unwrap_data(parsed):
+    """The bare ``data`` array of a {"meta", "data", "links"} envelope (error payloads pass through)."""
+    if isinstance(parsed, dict):
+        data = parsed.get("data")
+        if isinstance(data, list):
+            return data
+    return parsed
+
+
+def _unwrap_attributes(parsed):
+    """Like _unwrap_data, with each row replaced by its ``attributes`` dict (JSON:API rows)."""
+    if isinstance(parsed, dict):
+        data = parsed.get("data")
+        if isinstance(data, list):
+            return [row.get("attributes", row) if isinstance(row, dict) else row for row in data]
+    return parsed
+
+
+# Response normalizers (QA v0.4.2), keyed by endpoint name or by the registry's
+# response_family; an endpoint's own entry wins over its family's. Each is
+# (object_pairs_hook, unwrap): the hook shapes every object while json.loads
+# builds it, unwrap picks the rows out of the decoded top level, so neither
+# walks the tree a second time. Most endpoints (eod, news, screener, ...)
+# return a bare array with lowercase keys and need no entry.
+#   - BUG-05: UST endpoints ("rates") wrap rows in {"meta", "data", "links"},
+#     so naive ``data[-1]`` indexing raised KeyError; the us-options-*
+#     endpoints ("options") use the same envelope with rows under "attributes".
+#   - BUG-06: macro-indicator returns PascalCase keys (Date/Value/CountryCode)
+#     while every other endpoint uses lowercase, so ``d.get("date")`` returned None.
+# Add entries to normalize another endpoint or family.
+NORMALIZERS: dict[str, tuple] = {
+    "rates": (None, _unwrap_data),
+    "options": (None, _unwrap_attributes),
+    "macro-indicator": (_lowercase_pairs, None),
+}
+
+
+def normalizer(endpoint: str) -> tuple:
+    """(object_pairs_hook, unwrap) for an endpoint name or registry id; (None, None) if it needs none."""
+    entry = NORMALIZERS.get(endpoint)
+    if entry is None:
+        route = endpoint_routes.ROUTES.get(endpoint_routes.ALIASES.get(endpoint, endpoint))
+        entry = NORMALIZERS.get(route["family"]) if route is not None else None
+    return entry or (None, None)
 
-    Used to normalize endpoints that return PascalCase keys (e.g.
-    macro-indicator's Date/Value/CountryCode) so downstream consumers can rely
-    on the same lowercase keys every other endpoint uses.
+
+def parse_response(endpoint: str, payload: str):
+    """json.loads with the endpoint's normalizer applied while decoding.
+
+    Same result as normalize_response(endpoint, json.loads(payload)) with no
+    second pass over the tree. Use --raw (or fetch_json(normalize=False)) to
+    see the exact API payload. Raises json.JSONDecodeError like json.loads.
+    """
+    import json
+
+    hook, unwrap = normalizer(endpoint)
+    started = time.perf_counter()
+    parsed = json.loads(payload, object_pairs_hook=hook) if hook else json.loads(payload)
+    _phase("parse", started)
+    if unwrap is not None:
+        started = time.perf_counter()
+        parsed = unwrap(parsed)
+        _phase("normalize", started)
+    return parsed
+
+
+def normalize_response(endpoint: str, parsed):
+    """Apply the endpoint's normalizer to an already-decoded payload.
+
+    For payloads fetched with normalize=False; prefer parse_response, which
+    does the same while decoding. A pairs hook is replayed over the tree
+    here, so this costs the extra walk parse_response avoids.
     """
+    hook, unwrap = normalizer(endpoint)
+    if hook is not None:
+        parsed = _apply_pairs_hook(parsed, hook)
+    return unwrap(parsed) if unwrap is not None else parsed
+
+
+def _apply_pairs_hook(obj, hook):
     if isinstance(obj, dict):
-        return {str(k).lower(): _lowercase_keys(v) for k, v in obj.items()}
+        return hook([(k, _apply_pairs_hook(v, hook)) for k, v in obj.items()])
     if isinstance(obj, list):
-        return [_lowercase_keys(v) for v in obj]
+        return [_apply_pairs_hook(v, hook) for v in obj]
     return obj
 
 
-def normalize_response(endpoint: str, parsed):
-    """Smooth over per-endpoint response-shape inconsistencies (QA v0.4.2).
+def call_cost(url: str) -> int:
+    """Estimated API calls a request consumes (references/general/rate-limits.md)."""
+    import urllib.parse
+
+    parts = urllib.parse.urlsplit(url)
+    head = parts.path.removeprefix("/api").strip("/").split("/")[0]
+    query = dict(urllib.parse.parse_qsl(parts.query))
+
+    def tickers(key: str) -> int:
+        return len([t for t in query.get(key, "").split(",") if t])
+
+    if head in ("news", "sentiments", "news-word-weights"):
+        return 5 + 5 * tickers("s")
+    if head in ("technical", "intraday"):
+        return 5
+    if head in ("fundamentals", "mp"):
+        return 10
+    if head in ("eod-bulk-last-day", "bulk-fundamentals"):
+        return 100 + tickers("symbols")
+    if head == "real-time":
+        return 1 + tickers("s")
+    if head == "us-quote-delayed":
+        return max(1, tickers("s"))
+    return 1
+
+
+# Per-request metrics, off unless one of these is set: EODHD_METRICS=FILE
+# appends one JSON line per request, EODHD_METRICS_PROM=FILE rewrites a
+# Prometheus text file at exit, EODHD_STATS=1 prints per-endpoint latency
+# percentiles to stderr at exit (eodhd_metrics.py renders both). A request's
+# record lives in a threading.local (created with the first record, so runs
+# without metrics never import threading) while it runs, so fetch_many
+# workers and the phases timed deep in _live_get each land on the right one.
+METRICS_FILE = os.getenv("EODHD_METRICS") or None
+METRICS_PROM = os.getenv("EODHD_METRICS_PROM") or None
+METRICS_STATS = os.getenv("EODHD_STATS", "0") not in ("", "0")
+METRICS: list[dict] = []  # this process's records, for the exit summary
+_METRICS_LOCK = _thread.allocate_lock()
+_METRICS_LOCAL = None  # threading.local(), once a record exists
+_METRICS_AT_EXIT = False
+
+
+def set_metrics(path: str | None = None, prom: str | None = None, stats: bool | None = None) -> None:
+    """Turn metrics on or off (library form of the EODHD_METRICS* env vars); None keeps a setting."""
+    global METRICS_FILE, METRICS_PROM, METRICS_STATS
+    if path is not None:
+        METRICS_FILE = path or None
+    if prom is not None:
+        METRICS_PROM = prom or None
+    if stats is not None:
+        METRICS_STATS = stats
+
+
+def metric(key: str, value, add: bool = False) -> None:
+    """Set (or with ``add``, increase) a field of the request being measured on this thread, if any."""
+    record = getattr(_METRICS_LOCAL, "record", None)
+    if record is not None:
+        record[key] = record.get(key, 0) + value if add else value
+
+
+def _phase(name: str, started: float) -> None:
+    """Add the milliseconds since ``started`` (a perf_counter value) to phase ``name``."""
+    if getattr(_METRICS_LOCAL, "record", None) is not None:
+        metric(name + "_ms", round((time.perf_counter() - started) * 1000, 3), add=True)
+
+
+def _begin_request(endpoint: str, url: str) -> dict | None:
+    """Start this thread's record for one request; None (nothing to do) when metrics are off."""
+    global _METRICS_LOCAL
+    if not (METRICS_FILE or METRICS_PROM or METRICS_STATS):
+        return None
+    if _METRICS_LOCAL is None:
+        import threading
+
+        with _METRICS_LOCK:
+            if _METRICS_LOCAL is None:
+                _METRICS_LOCAL = threading.local()
+    record = {"ts": round(time.time(), 3), "endpoint": endpoint, "url": _redact_token(url),
+              "status": None, "cache": "off", "retries": 0, "cost": 0, "bytes": 0,
+              "_started": time.perf_counter()}
+    _METRICS_LOCAL.record = record
+    return record
+
+
+def _end_request(record: dict | None, status=None) -> None:
+    """Close a record from _begin_request: total time, then keep it and append its JSON line."""
+    global _METRICS_AT_EXIT
+    if record is None:
+        return
+    _METRICS_LOCAL.record = None
+    record["total_ms"] = round((time.perf_counter() - record.pop("_started")) * 1000, 3)
+    if status is not None and record["status"] is None:
+        record["status"] = status
+    import json
+
+    line = json.dumps(record, separators=(",", ":"))
+    with _METRICS_LOCK:
+        METRICS.append(record)
+        if METRICS_FILE:
+            try:
+                with open(METRICS_FILE, "a", encoding="utf-8") as fh:
+                    fh.write(line + "\n")
+            except OSError:
+                pass  # metrics must never fail the request
+        if not _METRICS_AT_EXIT:
+            import atexit
+
+            atexit.register(_flush_metrics)
+            _METRICS_AT_EXIT = True
+
+
+def _flush_metrics() -> None:
+    """At exit: rewrite the Prometheus file and print the --stats summary."""
+    try:
+        import eodhd_metrics
+    except ImportError:  # loaded by file path without scripts/ on sys.path
+        import importlib.util
+
+        spec = importlib.util.spec_from_file_location(
+            "eodhd_metrics", os.path.join(os.path.dirname(os.path.abspath(__file__)), "eodhd_metrics.py"))
+        eodhd_metrics = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(eodhd_metrics)
+    with _METRICS_LOCK:
+        records = list(METRICS)
+    if METRICS_PROM:
+        # Counters are cumulative: with a JSONL file, export everything it holds.
+        history = eodhd_metrics.load(METRICS_FILE) if METRICS_FILE else records
+        try:
+            eodhd_metrics.write_prometheus(METRICS_PROM, history)
+        except OSError as exc:
+            print(f"Warning: cannot write {METRICS_PROM}: {exc}", file=sys.stderr)
+    if METRICS_STATS and records:
+        print(eodhd_metrics.render_stats(records), file=sys.stderr)
+
 
-    Most list endpoints (eod, news, screener data, ...) return a bare array
-    with lowercase keys. Two endpoints diverge and broke downstream parsing:
+_POOL: dict[tuple[str, str], list] = {}
+_POOL_LOCK = _thread.allocate_lock()  # threading.Lock() without importing threading
+_POOL_MAX_IDLE = 16
+_REDIRECTS = {301, 302, 303, 307, 308}
+
+
+_TLS_CONTEXT = None
+
+
+def _tls_context():
+    """The SSL context of every pooled HTTPS connection (what http.client would build)."""
+    global _TLS_CONTEXT
+    if _TLS_CONTEXT is None:
+        import ssl
+
+        context = ssl.create_default_context()
+        context.set_alpn_protocols(["http/1.1"])
+        _TLS_CONTEXT = context
+    return _TLS_CONTEXT
+
+
+def _pooled_connection(scheme: str, host: str, timeout: int):
+    """An idle keep-alive connection to ``host`` (or a new one) and whether it was reused."""
+    with _POOL_LOCK:
+        idle = _POOL.get((scheme, host))
+        conn = idle.pop() if idle else None
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    import http.client
+
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, timeout=timeout, context=_tls_context()), False
+    return http.client.HTTPConnection(host, timeout=timeout), False
+
+
+def _release_connection(scheme: str, host: str, conn) -> None:
+    with _POOL_LOCK:
+        idle = _POOL.setdefault((scheme, host), [])
+        if len(idle) < _POOL_MAX_IDLE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _urlopen_get(url: str, timeout: int) -> str:
+    import urllib.request
+
+    request = urllib.request.Request(url, headers={"Accept": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read().decode("utf-8", errors="replace")
 
-    - BUG-05: UST endpoints wrap rows in {"meta", "data", "links"} instead of a
-      bare array, so naive `data[-1]` indexing raised KeyError. Unwrap to the
-      bare `data` array (error payloads, which lack a list `data`, pass through).
-    - BUG-06: macro-indicator returns PascalCase keys (Date/Value/CountryCode)
-      while every other endpoint uses lowercase, so `d.get("date")` returned
-      None. Lowercase the keys.
 
-    Use --raw to bypass normalization and see the exact API payload.
+def _timed_connect(conn) -> None:
+    """Open a new connection, timing DNS + TCP connect and the TLS handshake as separate phases.
+
+    Does what ``conn.connect()`` would (no proxy tunnel: proxied requests go
+    through urllib) with public calls only, so each step can be timed.
     """
-    if endpoint.startswith("ust/") and isinstance(parsed, dict):
-        data = parsed.get("data")
-        if isinstance(data, list):
-            return data
+    import socket
+
+    started = time.perf_counter()
+    sock = socket.create_connection((conn.host, conn.port), conn.timeout, conn.source_address)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    _phase("connect", started)
+    if type(conn).__name__ == "HTTPSConnection":
+        started = time.perf_counter()
+        try:
+            sock = _tls_context().wrap_socket(sock, server_hostname=conn.host)
+        except BaseException:
+            sock.close()
+            raise
+        _phase("tls", started)
+    conn.sock = sock
 
-    if endpoint == "macro-indicator":
-        return _lowercase_keys(parsed)
 
-    return parsed
+def _live_get(url: str, timeout: int = 30) -> str:
+    """GET a URL over the network and return the decoded body (raises urllib errors unchanged).
+
+    Requests reuse keep-alive connections from a small per-host pool, so a
+    burst of calls (fetch_many, the --brief fan-out) pays one TLS handshake
+    per worker instead of one per request. Redirects and proxied setups go
+    through urllib as before.
+    """
+    import http.client
+    import io
+    import urllib.error
+    import urllib.parse
+    import urllib.request
+
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or parts.scheme in urllib.request.getproxies():
+        return _urlopen_get(url, timeout)
+    target = parts.path + ("?" + parts.query if parts.query else "")
+    measured = getattr(_METRICS_LOCAL, "record", None) is not None
+    retry = True
+    while True:
+        conn, reused = _pooled_connection(parts.scheme, parts.netloc, timeout)
+        try:
+            if measured and not reused:
+                _timed_connect(conn)
+            started = time.perf_counter()
+            conn.request("GET", target, headers={"Accept": "application/json"})
+            response = conn.getresponse()
+            first_byte = time.perf_counter()
+            body = response.read()
+        except (http.client.HTTPException, OSError) as exc:
+            conn.close()
+            if reused and retry and not isinstance(exc, TimeoutError):
+                retry = False  # the server dropped an idle keep-alive connection; use a fresh one
+                metric("retries", 1, add=True)
+                continue
+            raise urllib.error.URLError(exc) from exc
+        break
+    if measured:
+        metric("ttfb_ms", round((first_byte - started) * 1000, 3))
+        _phase("download", first_byte)
+        metric("bytes", len(body))
+        metric("status", response.status)
+        metric("cost", call_cost(url))
+    if response.will_close:
+        conn.close()
+    else:
+        _release_connection(parts.scheme, parts.netloc, conn)
+    if response.status in _REDIRECTS:
+        return _urlopen_get(url, timeout)
+    if response.status >= 400:
+        raise urllib.error.HTTPError(url, response.status, response.reason,
+                                     response.headers, io.BytesIO(body))
+    return body.decode("utf-8", errors="replace")
+
+
+# Where http_get sends requests (env EODHD_TRANSPORT): "live" (the network),
+# "record" (the network, saving every response under CASSETTE_DIR) or "replay"
+# (saved responses only, no network; EODHD_REPLAY_LATENCY adds a delay in ms,
+# or "recorded" for each response's recorded latency).
+TRANSPORT = os.getenv("EODHD_TRANSPORT", "live")
+CASSETTE_DIR = os.getenv("EODHD_CASSETTE_DIR") or os.path.join(CACHE_DIR, "cassettes")
+REPLAY_LATENCY = os.getenv("EODHD_REPLAY_LATENCY", "0")
+
+
+def _cassette_key(url: str) -> str:
+    """The URL with its api_token made token-independent, so replays work with any token.
+
+    The EODHD_API_TOKEN value (or an empty one) becomes ``***``; any other
+    literal token (e.g. an invalid-token test) becomes a digest of itself.
+    """
+    import hashlib
+    import re
+    import urllib.parse
 
+    token = os.getenv("EODHD_API_TOKEN")
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description="Query EODHD API",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    def redact(match) -> str:
+        value = urllib.parse.unquote(match.group(2))
+        if not value or value == token:
+            return match.group(1) + "***"
+        return match.group(1) + "other-" + hashlib.sha256(value.encode()).hexdigest()[:12]
+
+    return re.sub(r"([?&]api_token=)([^&#]*)", redact, url)
+
+
+def cassette_path(url: str) -> str:
+    """File under CASSETTE_DIR holding the recorded response for ``url``."""
+    import hashlib
+    import re
+    import urllib.parse
+
+    key = _cassette_key(url)
+    path = urllib.parse.urlsplit(key).path.removeprefix("/api")
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_")[:60] or "root"
+    return os.path.join(CASSETTE_DIR, f"{slug}-{hashlib.sha256(key.encode()).hexdigest()[:16]}.json")
+
+
+def _redact_body(body: str, token: str) -> str:
+    """``body`` with api_token= values and every copy of ``token`` replaced by ``***``.
+
+    Plain and URL-encoded copies are replaced whatever the token's length.
+    """
+    import re
+    import urllib.parse
+
+    body = _redact_token(body)
+    if not token:
+        return body
+    forms = sorted({token, urllib.parse.quote(token, safe=""), urllib.parse.quote_plus(token)}, key=len, reverse=True)
+    # Bounded by non-alphanumerics, so a short token ("demo") does not mangle "demographics".
+    pattern = r"(?<![A-Za-z0-9])(?:" + "|".join(map(re.escape, forms)) + r")(?![A-Za-z0-9])"
+    return re.sub(pattern, "***", body)
+
+
+def _record_get(url: str, timeout: int = 30) -> str:
+    """_live_get, saving the token-redacted response (errors included) for replay."""
+    import io
+    import json
+    import urllib.error
+    import urllib.parse
+
+    started = time.perf_counter()
+    try:
+        body, status, reason, error = _live_get(url, timeout), 200, "OK", None
+    except urllib.error.HTTPError as exc:
+        raw = exc.read()
+        body, status, reason = raw.decode("utf-8", errors="replace"), exc.code, str(exc.reason)
+        error = urllib.error.HTTPError(url, exc.code, exc.reason, exc.headers, io.BytesIO(raw))
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    token = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query)).get("api_token", "")
+    entry = {"url": _cassette_key(url), "status": status, "reason": reason,
+             "elapsed_ms": elapsed_ms, "body": _redact_body(body, token)}
+    path = cassette_path(url)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{_thread.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(entry, fh, indent=2, ensure_ascii=False)
+        fh.write("\n")
+    os.replace(tmp, path)
+    if error is not None:
+        raise error
+    return body
+
+
+def _replay_get(url: str, timeout: int = 30) -> str:
+    """The response recorded for ``url``; URLError if there is none."""
+    import io
+    import json
+    import urllib.error
+
+    path = cassette_path(url)
+    try:
+        with open(path, encoding="utf-8") as fh:
+            entry = json.load(fh)
+    except FileNotFoundError:
+        raise urllib.error.URLError(f"no recorded response in {CASSETTE_DIR} for {_redact_token(url)}") from None
+    delay = entry["elapsed_ms"] if REPLAY_LATENCY == "recorded" else float(REPLAY_LATENCY or 0)
+    if delay > 0:
+        time.sleep(delay / 1000)
+    metric("status", entry["status"])
+    metric("bytes", len(entry["body"].encode("utf-8")))
+    metric("cost", call_cost(url))
+    if entry["status"] >= 400:
+        raise urllib.error.HTTPError(url, entry["status"], entry["reason"], None,
+                                     io.BytesIO(entry["body"].encode("utf-8")))
+    return entry["body"]
+
+
+# Transport name -> get(url, timeout) -> str. Add entries to plug in another one.
+TRANSPORTS = {"live": _live_get, "record": _record_get, "replay": _replay_get}
+
+
+def set_transport(mode: str, cassette_dir: str | None = None, latency: str | None = None) -> None:
+    """Switch http_get to another transport (library form of the EODHD_TRANSPORT env vars)."""
+    global TRANSPORT, CASSETTE_DIR, REPLAY_LATENCY
+    if mode not in TRANSPORTS:
+        raise ClientError(f"Unknown transport: {mode} (choose from {', '.join(TRANSPORTS)})")
+    TRANSPORT = mode
+    if cassette_dir is not None:
+        CASSETTE_DIR = cassette_dir
+    if latency is not None:
+        REPLAY_LATENCY = str(latency)
+
+
+def http_get(url: str, timeout: int = 30) -> str:
+    """GET a URL through the active transport (live network unless EODHD_TRANSPORT says otherwise).
+
+    Raises urllib's HTTPError/URLError in every mode, so callers cannot tell a
+    replayed response from a live one.
+    """
+    transport = TRANSPORTS.get(TRANSPORT)
+    if transport is None:
+        raise ClientError(f"Unknown EODHD_TRANSPORT: {TRANSPORT} (choose from {', '.join(TRANSPORTS)})")
+    return transport(url, timeout)
+
+
+def _cache_path(url: str) -> str:
+    """Cache file for a URL; keyed on the token-redacted URL so no secret is stored."""
+    import hashlib
+
+    key = hashlib.sha256(_redact_token(url).encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, key[:2], key + ".json")
+
+
+def cache_read(url: str, ttl: int) -> str | None:
+    """The disk-cached payload for ``url`` if younger than ``ttl`` seconds, else None."""
+    if ttl <= 0:
+        return None
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, encoding="utf-8") as fh:
+                return fh.read()
+    except OSError:
+        pass
+    return None
+
+
+def cache_write(url: str, payload: str) -> None:
+    """Store ``payload`` for ``url`` atomically (temp file + rename); errors are ignored."""
+    path = _cache_path(url)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{_thread.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(payload)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # A read-only or full cache dir must never fail the request.
+
+
+# EODHD_DAEMON=0 keeps this process off a running eodhd_daemon.py.
+USE_DAEMON = os.getenv("EODHD_DAEMON", "1") != "0"
+# Seconds the daemon may hold a request in its rate limiter before replying 429.
+DAEMON_WAIT = 10
+
+
+def daemon_socket() -> str:
+    """Unix socket of the eodhd_daemon.py server (``EODHD_DAEMON_SOCKET``, default in CACHE_DIR)."""
+    return os.getenv("EODHD_DAEMON_SOCKET") or os.path.join(CACHE_DIR, "daemon.sock")
+
+
+def _daemon_get(path: str, url: str, timeout: int, ttl: int) -> str | None:
+    """Forward one GET to the daemon; None if it is not reachable (stale socket file)."""
+    import json
+    import socket
+
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout + DAEMON_WAIT + 5)
+        sock.connect(path)
+    except OSError:
+        return None
+    with sock, sock.makefile("rwb") as stream:
+        request = {"op": "get", "url": url, "timeout": timeout, "ttl": ttl, "wait": DAEMON_WAIT}
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        reply = json.loads(stream.readline() or b"null")
+    if reply is None:
+        raise OSError("eodhd daemon closed the connection")
+    # The daemon did the caching and the network I/O: record what it reports.
+    metric("daemon", True)
+    metric("cache", reply.get("cache", "daemon"))
+    metric("bytes", reply.get("bytes", 0))
+    metric("cost", reply.get("cost", 0))
+    metric("status", reply["error"].get("code") if "error" in reply else 200)
+    return reply_payload(url, reply)
+
+
+def reply_payload(url: str, reply: dict) -> str:
+    """The body of an eodhd_daemon reply, or its error re-raised as urllib's HTTPError/URLError."""
+    if "body" in reply:
+        return reply["body"]
+    import io
+    import urllib.error
+
+    error = reply["error"]
+    if error.get("code"):
+        raise urllib.error.HTTPError(url, error["code"], error["reason"], None,
+                                     io.BytesIO(error.get("body", "").encode("utf-8")))
+    raise urllib.error.URLError(error["reason"])
+
+
+def cached_get(url: str, timeout: int = 30, ttl: int = 0) -> str:
+    """http_get with an on-disk response cache; ``ttl`` <= 0 disables it.
+
+    Entries younger than ``ttl`` seconds are served from ``CACHE_DIR``
+    (``EODHD_CACHE_DIR`` env, default ``~/.cache/eodhd``). Writes are atomic
+    (temp file + rename) so concurrent callers never read a partial entry.
+    When eodhd_daemon.py is running (its socket exists; ``EODHD_DAEMON=0`` or
+    a record/replay transport opts out), the request goes through it instead, sharing its connections,
+    memory cache and rate/quota accounting; errors are raised the same way.
+    """
+    if USE_DAEMON and TRANSPORT == "live":
+        path = daemon_socket()
+        if os.path.exists(path):
+            payload = _daemon_get(path, url, timeout, ttl)
+            if payload is not None:
+                return payload
+    payload = cache_read(url, ttl)
+    if payload is not None:
+        metric("cache", "hit")
+        return payload
+    if ttl > 0:
+        metric("cache", "miss")
+    payload = http_get(url, timeout)
+    if ttl > 0:
+        cache_write(url, payload)
+    return payload
+
+
+def api_url(
+    endpoint: str,
+    token: str,
+    symbol: str | None = None,
+    params: dict | None = None,
+    base_url: str = BASE_URL,
+) -> str:
+    """Build the full request URL for an endpoint.
+
+    ``params`` uses the API's own query names (``from``, ``filter[year]``,
+    ...), not the CLI flag names; ``api_token`` and ``fmt`` are added here.
+    ``endpoint`` is a client endpoint or any REST registry id.
+    """
+    import urllib.parse
+
+    path, params = build_request(endpoint, symbol, params)
+    query: dict = {"api_token": token, "fmt": "json"}
+    query.update(params)
+    return base_url.rstrip("/") + path + "?" + urllib.parse.urlencode(query)
+
+
+def fetch_json(
+    endpoint: str,
+    token: str,
+    symbol: str | None = None,
+    params: dict | None = None,
+    base_url: str = BASE_URL,
+    timeout: int = 30,
+    cache_ttl: int = 0,
+    normalize: bool = True,
+    get=None,
+    parse=None,
+):
+    """Fetch one endpoint and return its parsed, normalized JSON payload.
+
+    Library entry point for the sibling scripts (portfolio_risk.py, ...).
+    HTTP and network failures are re-raised as ClientError with the token
+    redacted from the URL. ``cache_ttl`` > 0 serves/stores via cached_get.
+    ``normalize=False`` returns the payload as the API sent it (e.g. the UST
+    ``meta``/``links`` envelope needed for pagination). ``get`` replaces
+    cached_get (same signature), e.g. an in-process eodhd_daemon.DaemonState.fetch.
+    ``parse`` replaces parse_response with a callable taking the payload
+    text, e.g. records.Bars.from_json to decode straight into columns.
+    """
+    import json
+
+    url = api_url(endpoint, token, symbol, params, base_url)
+    record = _begin_request(endpoint, url)
+    try:
+        try:
+            payload = (get or cached_get)(url, timeout, cache_ttl)
+        except OSError as exc:  # urllib's HTTPError/URLError included
+            import urllib.error
+
+            metric("status", getattr(exc, "code", None) or "error")
+            if isinstance(exc, urllib.error.HTTPError):
+                raise ClientError(f"HTTP Error {exc.code}: {exc.reason} ({_redact_token(url)})") from exc
+            if isinstance(exc, urllib.error.URLError):
+                raise ClientError(f"Request failed: {exc.reason} ({_redact_token(url)})") from exc
+            raise ClientError(f"Request failed: {exc} ({_redact_token(url)})") from exc
+        try:
+            if parse is not None:
+                started = time.perf_counter()
+                parsed = parse(payload)
+                _phase("parse", started)
+                return parsed
+            return parse_response(endpoint, payload) if normalize else json.loads(payload)
+        except json.JSONDecodeError as exc:
+            raise ClientError(f"Invalid JSON from {endpoint}: {exc}") from exc
+    finally:
+        _end_request(record)
+
+
+def fetch_many(calls: list[dict], token: str, workers: int = 8,
+               return_exceptions: bool = False, **kwargs) -> list:
+    """Run several fetch_json calls concurrently, returning results in order.
+
+    Each item of ``calls`` holds fetch_json keyword arguments (``endpoint``,
+    ``symbol``, ``params``); shared options such as ``base_url``/``timeout``
+    go in ``kwargs``. The first failure is raised once all calls finish, or,
+    with ``return_exceptions``, each failed call's ClientError takes its slot.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def one(call: dict):
+        return fetch_json(token=token, **call, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(calls) or 1))) as pool:
+        futures = [pool.submit(one, call) for call in calls]
+    if return_exceptions:
+        return [f.exception() if isinstance(f.exception(), ClientError) else f.result()
+                for f in futures]
+    return [f.result() for f in futures]
+
+
+def check_local_technical(args: argparse.Namespace) -> None:
+    """Raise ClientError if the --technical-mode local arguments are unusable."""
+    import indicators
+
+    if not args.symbol:
+        raise ClientError("--symbol is required for endpoint=technical")
+    if not args.function:
+        raise ClientError("--function is required for endpoint=technical (e.g., sma, ema, rsi)")
+    try:
+        indicators.check_args(args.function, args.period)
+    except ValueError as exc:
+        raise ClientError(str(exc)) from exc
+
+
+def run_local_technical(args: argparse.Namespace, token: str):
+    """Compute --endpoint technical from EOD bars instead of calling /technical.
+
+    Windowed indicators fetch just enough history before --from-date to warm
+    up; recursive ones (ema, rsi, macd, atr, adx) fetch full history so their
+    values converge the way the API's do. With --cache-ttl the EOD payload is
+    reused across functions/periods, so each extra indicator costs no call.
+    """
+    import epoch_dates
+    import indicators
+
+    check_local_technical(args)
+    params: dict = {}
+    lookback = indicators.lookback_bars(args.function, args.period)
+    if args.from_date and lookback is not None:
+        # ~5 trading days per 7 calendar days, plus a holiday cushion.
+        params["from"] = epoch_dates.iso_day(epoch_dates.epoch_day(args.from_date) - lookback * 7 // 5 - 10)
+    if args.to_date:
+        params["to"] = args.to_date
+    rows = fetch_json("eod", token, args.symbol, params, args.base_url,
+                      args.timeout, args.cache_ttl)
+    if isinstance(rows, dict):
+        return rows  # API error payload, print as-is like remote mode
+    try:
+        result = indicators.compute(args.function, indicators.bars_from_eod(rows), args.period)
+    except ValueError as exc:
+        raise ClientError(str(exc)) from exc
+    if args.from_date:
+        result = [r for r in result if r["date"] >= args.from_date]
+    if args.filter and args.filter.startswith("last_"):
+        field = args.filter[len("last_"):]
+        return result[-1].get(field) if result else None
+    return result
+
+
+def run_sharded_screener(args: argparse.Namespace, token: str) -> dict:
+    """Fetch every --filters match via screener_shards, returned as {count, data}.
+
+    --limit/--offset slice the merged, re-sorted rows instead of paging the API.
+    """
+    import json
+
+    import screener_shards
+
+    try:
+        filters = json.loads(args.filters) if args.filters else []
+    except json.JSONDecodeError as exc:
+        raise ClientError(f"--filters is not valid JSON: {exc}") from exc
+    if not isinstance(filters, list) or not all(isinstance(f, list) and len(f) == 3 for f in filters):
+        raise ClientError("--filters must be a JSON array of [field, operation, value] triples")
+    rows, truncated = screener_shards.fetch_all(
+        token, filters, args.sort, args.signals, workers=args.workers,
+        base_url=args.base_url, timeout=args.timeout, cache_ttl=args.cache_ttl)
+    for lo, hi in (band for band in truncated if band is not None):
+        print(f"Warning: market_capitalization band [{lo:.0f}, {hi:.0f}) still exceeds the "
+              "screener offset ceiling; results for it are truncated", file=sys.stderr)
+    start = args.offset or 0
+    end = start + args.limit if args.limit is not None else None
+    return {"count": len(rows), "data": rows[start:end]}
+
+
+def run_brief(args: argparse.Namespace, token: str) -> dict:
+    """Fetch the company-brief sources for --symbol via company_brief.fetch_brief.
+
+    Each source keeps its own timeout, capped at --timeout; failed sources are
+    listed under "errors" rather than failing the whole document.
+    """
+    import company_brief
+
+    if not args.symbol:
+        raise ClientError("--symbol is required for --brief")
+    timeouts = {name: min(timeout, args.timeout) for name, (_, timeout) in company_brief.SOURCES.items()}
+    return company_brief.fetch_brief(token, args.symbol, timeouts=timeouts,
+                                     base_url=args.base_url, cache_ttl=args.cache_ttl)
+
+
+EPILOG = """
 Supported endpoints:
   Market Data:    eod, intraday, real-time, eod-bulk-last-day
   Fundamentals:   fundamentals, bulk-fundamentals, news, sentiment, news-word-weights, insider-transactions
   Corporate:      dividends, splits
-  Technical:      technical (requires --function)
+  Technical:      technical (requires --function; --technical-mode local computes from EOD bars)
   Macro:          macro-indicator, economic-events
   Calendar:       calendar/earnings, calendar/trends, calendar/ipos, calendar/splits, calendar/dividends
   Exchange:       exchange-symbol-list, exchanges-list, exchanges-details
-  Screening:      screener
+  Screening:      screener (--shard fetches every match beyond the offset ceiling)
   US Quotes:      us-quote-delayed (Live v2 extended quotes)
+  US Options:     us-options-contracts, us-options-eod (Marketplace; --symbol = underlying,
+                  --from-date/--to-date = expiration range; options_chain.py pages whole chains)
   Account:        user
   US Treasury:    ust/bill-rates, ust/long-term-rates, ust/yield-rates, ust/real-yield-rates
 
 Note: news-word-weights may have longer response times due to AI processing.
 
+--call REGISTRY_ID reaches every other REST endpoint in registry/capabilities.json (PRAAMS,
+Investverte, tradinghours, CBOE, logos, ...) through the same route table, unvalidated:
+  --call stock-market-logos --symbol AAPL.US
+  --call praams-risk-scoring-by-isin --param isin=US0378331005
+
+--brief --symbol TICKER fetches the company-brief sources (fundamentals, eod, real-time, news,
+sentiment, insider-transactions, dividends, calendar/earnings, calendar/trends) concurrently.
+
+Offline runs: EODHD_TRANSPORT=record saves every response (token redacted) under
+EODHD_CASSETTE_DIR; EODHD_TRANSPORT=replay serves them from there without the network
+(EODHD_REPLAY_LATENCY=MS or "recorded" simulates latency).
+
+Metrics: --metrics FILE (env EODHD_METRICS) appends a JSON line per request with connect, TLS,
+time-to-first-byte, download, parse, normalize and serialize times, bytes, cache result,
+retries and API-call cost; --metrics-prom FILE writes them for Prometheus; --stats prints
+per-endpoint p50/p95/p99. Summarize a metrics file later: python eodhd_metrics.py FILE
+
+Profiling: --profile [FILE] runs under cProfile + tracemalloc, writes FILE (default
+eodhd_client.pstats) and prints time per network/parse/normalize/serialize, the top
+--profile-top functions and peak memory to stderr.
+
 Symbol format: {TICKER}.{EXCHANGE} (e.g., AAPL.US, MSFT.US, BMW.XETRA)
 For exchange-symbol-list and eod-bulk-last-day, use exchange code (e.g., US, LSE)
-        """,
-    )
-    parser.add_argument(
-        "--endpoint",
-        required=True,
-        choices=SUPPORTED_ENDPOINTS,
-        help="API endpoint to query",
-    )
-    parser.add_argument(
-        "--symbol",
-        help="Ticker with exchange suffix (e.g., AAPL.US) or exchange code for bulk endpoints",
-    )
-    parser.add_argument("--from-date", help="Start date YYYY-MM-DD")
-    parser.add_argument("--to-date", help="End date YYYY-MM-DD")
-    parser.add_argument("--interval", help="Intraday interval: 1m, 5m, 1h")
-    parser.add_argument("--limit", type=int, help="Limit results")
-    parser.add_argument("--offset", type=int, help="Offset for pagination")
-    parser.add_argument(
-        "--function",
-        help="Technical indicator function (sma, ema, wma, rsi, macd, stoch, cci, adx, atr, bbands)",
-    )
-    parser.add_argument("--period", type=int, help="Period for technical indicators")
-    parser.add_argument(
-        "--indicator",
-        help="Macro indicator code (e.g., inflation_consumer_prices_annual, gdp_current_usd)",
-    )
-    parser.add_argument(
-        "--filter",
-        help="Filter for specific fields (e.g., last_close, extended for earnings)",
-    )
-    parser.add_argument(
-        "--symbols",
-        help="Comma-separated symbols for bulk-fundamentals (e.g., AAPL.US,MSFT.US)",
-    )
-    parser.add_argument(
-        "--version",
-        help="API version for bulk-fundamentals (e.g., 1.2)",
-    )
-    parser.add_argument(
-        "--country",
-        help="ISO 3166-1 alpha-2 country code for economic-events (e.g., US, GB, DE)",
-    )
-    parser.add_argument(
-        "--comparison",
-        help="Comparison type for economic-events: mom, qoq, yoy",
-    )
-    parser.add_argument(
-        "--filters",
-        help='JSON filter array for screener (e.g., \'[["market_capitalization",">",1000000000]]\')',
-    )
-    parser.add_argument(
-        "--sort",
-        help="Sort for screener as field.direction (e.g., market_capitalization.desc, pe.asc)",
-    )
-    parser.add_argument(
-        "--signals",
-        help="Signal filter for screener (e.g., 200d_new_hi, bookvalue_neg)",
-    )
-    parser.add_argument(
-        "--filter-year",
-        type=int,
-        help="Filter by year for UST endpoints (e.g., 2023)",
-    )
-    parser.add_argument("--base-url", default=BASE_URL, help="Override base URL")
-    parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout seconds")
-    parser.add_argument(
-        "--raw",
-        action="store_true",
-        help="Output raw response without JSON formatting",
+"""
+
+
+def _options() -> list[tuple[str, dict]]:
+    """(flag, argparse keyword arguments) for every CLI option.
+
+    One table feeds both the argparse parser and the fast path in parse_args.
+    """
+    return [
+        ("--endpoint", {"choices": SUPPORTED_ENDPOINTS,
+                        "help": "API endpoint to query (required unless --brief)"}),
+        ("--call", {"metavar": "REGISTRY_ID",
+                    "help": "Call any REST endpoint of registry/capabilities.json by id, documented-only ones "
+                            "included (e.g. praams-risk-scoring-by-ticker); pass API params with --param"}),
+        ("--param", {"action": "append", "metavar": "KEY=VALUE",
+                     "help": "Extra API query param (repeatable); also fills path placeholders such as isin"}),
+        ("--brief", {"action": "store_true",
+                     "help": "Fetch every company-brief source for --symbol concurrently and print one "
+                             "combined document"}),
+        ("--symbol", {"help": "Ticker with exchange suffix (e.g., AAPL.US) or exchange code for bulk endpoints"}),
+        ("--from-date", {"help": "Start date YYYY-MM-DD"}),
+        ("--to-date", {"help": "End date YYYY-MM-DD"}),
+        ("--interval", {"help": "Intraday interval: 1m, 5m, 1h"}),
+        ("--limit", {"type": int, "help": "Limit results"}),
+        ("--offset", {"type": int, "help": "Offset for pagination"}),
+        ("--function", {"help": "Technical indicator function "
+                                "(sma, ema, wma, rsi, macd, stoch, cci, adx, atr, bbands)"}),
+        ("--period", {"type": int, "help": "Period for technical indicators"}),
+        ("--technical-mode", {"choices": ["remote", "local"], "default": "remote",
+                              "help": "technical: 'remote' calls /technical (5 API calls); "
+                                      "'local' computes from EOD bars"}),
+        ("--indicator", {"help": "Macro indicator code (e.g., inflation_consumer_prices_annual, gdp_current_usd)"}),
+        ("--filter", {"help": "Filter for specific fields (e.g., last_close, extended for earnings)"}),
+        ("--symbols", {"help": "Comma-separated symbols for bulk-fundamentals (e.g., AAPL.US,MSFT.US)"}),
+        ("--version", {"help": "API version for bulk-fundamentals (e.g., 1.2)"}),
+        ("--country", {"help": "ISO 3166-1 alpha-2 country code for economic-events (e.g., US, GB, DE)"}),
+        ("--comparison", {"help": "Comparison type for economic-events: mom, qoq, yoy"}),
+        ("--filters", {"help": 'JSON filter array for screener (e.g., \'[["market_capitalization",">",1000000000]]\')'}),
+        ("--sort", {"help": "Sort for screener as field.direction (e.g., market_capitalization.desc, pe.asc)"}),
+        ("--signals", {"help": "Signal filter for screener (e.g., 200d_new_hi, bookvalue_neg)"}),
+        ("--shard", {"action": "store_true",
+                     "help": "screener: split into market-cap bands until each fits under the offset ceiling, "
+                             "fetch them concurrently and merge (--limit/--offset then slice the merged rows)"}),
+        ("--workers", {"type": int, "default": 8,
+                       "help": "Concurrent requests for fan-out modes such as --shard (default: 8)"}),
+        ("--filter-year", {"type": int, "help": "Filter by year for UST endpoints (e.g., 2023)"}),
+        ("--base-url", {"default": BASE_URL, "help": "Override base URL"}),
+        ("--timeout", {"type": int, "default": 30, "help": "HTTP timeout seconds"}),
+        ("--cache-ttl", {"type": int, "default": int(os.getenv("EODHD_CACHE_TTL", "0")),
+                         "help": "Serve responses younger than N seconds from the disk cache "
+                                 "(EODHD_CACHE_DIR, default ~/.cache/eodhd). Default: 0 = off "
+                                 "(env EODHD_CACHE_TTL)"}),
+        ("--raw", {"action": "store_true", "help": "Output raw response without JSON formatting"}),
+        ("--metrics", {"metavar": "FILE",
+                       "help": "Append one JSON line of timings/size/cache/cost per request to FILE "
+                               "(env EODHD_METRICS)"}),
+        ("--metrics-prom", {"metavar": "FILE",
+                            "help": "Write request metrics as a Prometheus text file at exit "
+                                    "(env EODHD_METRICS_PROM)"}),
+        ("--stats", {"action": "store_true",
+                     "help": "Print per-endpoint latency percentiles (p50/p95/p99) to stderr at exit "
+                             "(env EODHD_STATS=1)"}),
+        ("--profile", {"nargs": "?", "const": "eodhd_client.pstats", "metavar": "FILE",
+                       "help": "Run under cProfile + tracemalloc: write a pstats file (default "
+                               "eodhd_client.pstats) and print the hotspots to stderr"}),
+        ("--profile-top", {"type": int, "default": 15, "metavar": "N",
+                           "help": "Functions listed in the --profile report (default: 15)"}),
+    ]
+
+
+def _parse_fast(argv: list[str], options: list[tuple[str, dict]]):
+    """Parse the plain ``--flag value`` form without building an argparse parser.
+
+    Returns None for anything else (help, ``--flag=value``, abbreviations,
+    unknown flags, bad values, missing --endpoint), so parse_args falls back
+    to argparse and its usual messages.
+    """
+    import types
+
+    spec = {flag: kw for flag, kw in options}
+    values = {flag[2:].replace("-", "_"): kw.get("default", False if kw.get("action") == "store_true" else None)
+              for flag, kw in options}
+    i = 0
+    while i < len(argv):
+        kw = spec.get(argv[i])
+        if kw is None:
+            return None
+        dest = argv[i][2:].replace("-", "_")
+        if kw.get("action") == "store_true":
+            values[dest] = True
+            i += 1
+            continue
+        if i + 1 == len(argv) or argv[i + 1].startswith("-"):
+            return None
+        value = argv[i + 1]
+        if "type" in kw:
+            try:
+                value = kw["type"](value)
+            except ValueError:
+                return None
+        if "choices" in kw and value not in kw["choices"]:
+            return None
+        if kw.get("action") == "append":
+            value = (values[dest] or []) + [value]
+        values[dest] = value
+        i += 2
+    if not (values["endpoint"] or values["brief"] or values["call"]) or (values["endpoint"] and values["call"]):
+        return None
+    return types.SimpleNamespace(**values)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    argv = sys.argv[1:] if argv is None else argv
+    options = _options()
+    fast = _parse_fast(argv, options)
+    if fast is not None:
+        return fast
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Query EODHD API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG,
     )
-    return parser.parse_args()
+    for flag, kw in options:
+        parser.add_argument(flag, **kw)
+    args = parser.parse_args(argv)
+    if not args.endpoint and not args.brief and not args.call:
+        parser.error("--endpoint is required (or use --brief --symbol TICKER, or --call REGISTRY_ID)")
+    if args.endpoint and args.call:
+        parser.error("--endpoint and --call are mutually exclusive")
+    return args
 
 
 def main() -> int:
     args = parse_args()
+    set_metrics(args.metrics, args.metrics_prom, args.stats or None)
+    if args.profile:
+        import eodhd_profile
+
+        return eodhd_profile.run(lambda: run_cli(args), args.profile, args.profile_top)
+    return run_cli(args)
+
+
+def run_cli(args: argparse.Namespace) -> int:
+    """The CLI after argument parsing; main() wraps it for --profile."""
     token = os.getenv("EODHD_API_TOKEN")
     if not token:
         print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
         print("Get your API token at https://eodhd.com/", file=sys.stderr)
         return 2
+    import json
+
+    if args.brief:
+        try:
+            parsed = run_brief(args, token)
+        except ClientError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 2
+        print(json.dumps(parsed, indent=2, sort_keys=True))
+        return 0 if parsed["sources"] else 1
+
+    if args.endpoint == "technical" and args.technical_mode == "local":
+        try:
+            check_local_technical(args)
+        except ClientError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 2
+        try:
+            parsed = run_local_technical(args, token)
+        except ClientError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        print(json.dumps(parsed, indent=2, sort_keys=True))
+        return 0
+
+    if args.endpoint == "screener" and args.shard:
+        try:
+            parsed = run_sharded_screener(args, token)
+        except ClientError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        print(json.dumps(parsed, indent=2, sort_keys=True))
+        return 0
 
     try:
-        path = build_path(args.endpoint, args.symbol, args.function)
+        endpoint, _ = resolve_endpoint(args.call or args.endpoint)
+        url = api_url(endpoint, token, args.symbol, cli_params(endpoint, args), args.base_url)
     except ClientError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 2
 
-    # Build query parameters
-    params: dict[str, str | int] = {
-        "api_token": token,
-        "fmt": "json",
-    }
-
-    # Date range
-    if args.from_date:
-        params["from"] = args.from_date
-    if args.to_date:
-        params["to"] = args.to_date
-
-    # Pagination
-    if args.limit is not None:
-        params["limit"] = args.limit
-    if args.offset is not None:
-        params["offset"] = args.offset
-
-    # Intraday interval
-    if args.interval:
-        params["interval"] = args.interval
-
-    # Intraday endpoint requires Unix timestamps for from/to (not YYYY-MM-DD)
-    if args.endpoint == "intraday":
-        for key in ("from", "to"):
-            value = params.get(key)
-            if isinstance(value, str) and "-" in value:
-                try:
-                    dt = datetime.datetime.strptime(value, "%Y-%m-%d")
-                    params[key] = int(dt.replace(tzinfo=datetime.timezone.utc).timestamp())
-                except ValueError:
-                    pass  # Leave unchanged; API will surface the error
-
-    # Technical indicators
-    if args.function:
-        params["function"] = args.function
-    if args.period is not None:
-        params["period"] = args.period
-
-    # Macro indicator
-    if args.indicator:
-        params["indicator"] = args.indicator
-
-    # Filter
-    if args.filter:
-        params["filter"] = args.filter
-
-    # Special handling for news endpoint (uses 's' parameter)
-    if args.endpoint == "news" and args.symbol:
-        params["s"] = args.symbol
-
-    # Special handling for sentiment endpoint
-    if args.endpoint == "sentiment" and args.symbol:
-        params["s"] = args.symbol
-
-    # Special handling for insider-transactions endpoint
-    if args.endpoint == "insider-transactions" and args.symbol:
-        params["code"] = args.symbol
-
-    # Special handling for news-word-weights endpoint (different param names)
-    if args.endpoint == "news-word-weights":
-        if args.symbol:
-            params["s"] = args.symbol
-        # news-word-weights uses filter[date_from], filter[date_to], page[limit]
-        if args.from_date:
-            params["filter[date_from]"] = params.pop("from", args.from_date)
-        if args.to_date:
-            params["filter[date_to]"] = params.pop("to", args.to_date)
-        if args.limit is not None:
-            params["page[limit]"] = params.pop("limit", args.limit)
-
-    # Special handling for calendar/dividends endpoint (uses filter parameters)
-    if args.endpoint == "calendar/dividends":
-        if args.symbol:
-            params["filter[symbol]"] = args.symbol
-        # calendar/dividends uses filter[date_from], filter[date_to], page[limit], page[offset]
-        if args.from_date:
-            params["filter[date_from]"] = params.pop("from", args.from_date)
-        if args.to_date:
-            params["filter[date_to]"] = params.pop("to", args.to_date)
-        if args.limit is not None:
-            params["page[limit]"] = params.pop("limit", args.limit)
-        if args.offset is not None:
-            params["page[offset]"] = params.pop("offset", args.offset)
-
-    # Special handling for economic-events endpoint (country, comparison)
-    if args.endpoint == "economic-events":
-        if args.country:
-            params["country"] = args.country
-        if args.comparison:
-            params["comparison"] = args.comparison
-
-    # Special handling for screener endpoint (filters, sort, signals)
-    if args.endpoint == "screener":
-        if args.filters:
-            params["filters"] = args.filters
-        if args.sort:
-            params["sort"] = args.sort
-        if args.signals:
-            params["signals"] = args.signals
-
-    # Special handling for calendar/trends endpoint (requires symbols parameter)
-    if args.endpoint == "calendar/trends":
-        if not args.symbol:
-            print("Error: --symbol is required for calendar/trends (comma-separated)", file=sys.stderr)
-            return 2
-        params["symbols"] = args.symbol
-
-    # Special handling for calendar/earnings endpoint (supports symbols parameter)
-    if args.endpoint == "calendar/earnings" and args.symbol:
-        params["symbols"] = args.symbol
-        # When symbols is provided, remove from/to parameters
-        params.pop("from", None)
-        params.pop("to", None)
-
-    # Special handling for calendar/splits endpoint (supports symbols parameter)
-    if args.endpoint == "calendar/splits" and args.symbol:
-        params["symbols"] = args.symbol
-
-    # Special handling for us-quote-delayed endpoint (uses 's' param, page[limit], page[offset])
-    if args.endpoint == "us-quote-delayed":
-        if not args.symbol:
-            print("Error: --symbol is required for us-quote-delayed (comma-separated for batch)", file=sys.stderr)
-            return 2
-        params["s"] = args.symbol
-        if args.limit is not None:
-            params["page[limit]"] = params.pop("limit", args.limit)
-        if args.offset is not None:
-            params["page[offset]"] = params.pop("offset", args.offset)
-
-    # Special handling for bulk-fundamentals endpoint (symbols, version params)
-    if args.endpoint == "bulk-fundamentals":
-        if args.symbols:
-            params["symbols"] = args.symbols
-        if args.version:
-            params["version"] = args.version
-
-    # Special handling for UST endpoints (filter[year], page[limit], page[offset])
-    if args.endpoint.startswith("ust/"):
-        if args.filter_year is not None:
-            params["filter[year]"] = args.filter_year
-        if args.limit is not None:
-            params["page[limit]"] = params.pop("limit", args.limit)
-        if args.offset is not None:
-            params["page[offset]"] = params.pop("offset", args.offset)
-
-    query = urllib.parse.urlencode(params)
-    url = args.base_url.rstrip("/") + path + "?" + query
-
-    request = urllib.request.Request(url, headers={"Accept": "application/json"})
+    record = _begin_request(endpoint, url)
     try:
-        with urllib.request.urlopen(request, timeout=args.timeout) as response:
-            payload = response.read().decode("utf-8", errors="replace")
-    except urllib.error.HTTPError as exc:
-        print(f"HTTP Error {exc.code}: {exc.reason}", file=sys.stderr)
-        print(f"URL: {_redact_token(url)}", file=sys.stderr)
-        try:
-            error_body = exc.read().decode("utf-8", errors="replace")
-            print(f"Response: {error_body}", file=sys.stderr)
-        except Exception:
-            pass
-        return 1
-    except urllib.error.URLError as exc:
-        print(f"Request failed: {exc.reason}", file=sys.stderr)
-        print(f"URL: {_redact_token(url)}", file=sys.stderr)
-        return 1
+        payload = cached_get(url, args.timeout, args.cache_ttl)
     except Exception as exc:
-        print(f"Request failed: {exc}", file=sys.stderr)
-        print(f"URL: {_redact_token(url)}", file=sys.stderr)
+        import urllib.error
+
+        metric("status", getattr(exc, "code", None) or "error")
+        _end_request(record)
+
+        if isinstance(exc, urllib.error.HTTPError):
+            print(f"HTTP Error {exc.code}: {exc.reason}", file=sys.stderr)
+            print(f"URL: {_redact_token(url)}", file=sys.stderr)
+            try:
+                error_body = exc.read().decode("utf-8", errors="replace")
+                print(f"Response: {error_body}", file=sys.stderr)
+            except Exception:
+                pass
+        elif isinstance(exc, urllib.error.URLError):
+            print(f"Request failed: {exc.reason}", file=sys.stderr)
+            print(f"URL: {_redact_token(url)}", file=sys.stderr)
+        else:
+            print(f"Request failed: {exc}", file=sys.stderr)
+            print(f"URL: {_redact_token(url)}", file=sys.stderr)
         return 1
 
     if args.raw:
         print(payload)
+        _end_request(record)
         return 0
 
     try:
-        parsed = json.loads(payload)
+        parsed = parse_response(endpoint, payload)
     except json.JSONDecodeError:
         # Not JSON, print raw
         print(payload)
+        _end_request(record)
         return 0
 
-    parsed = normalize_response(args.endpoint, parsed)
-    print(json.dumps(parsed, indent=2, sort_keys=True))
+    started = time.perf_counter()
+    text = json.dumps(parsed, indent=2, sort_keys=True)
+    _phase("serialize", started)
+    print(text)
+    _end_request(record)
     return 0
 
 
 if __name__ == "__main__":
+    # Sibling modules (company_brief, indicators, ...) ``import eodhd_client``:
+    # hand them this module so --metrics/--stats and the connection pool are shared.
+    sys.modules.setdefault("eodhd_client", sys.modules[__name__])
     raise SystemExit(main())
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""Long-lived local daemon that serves eodhd_client.py requests from warm state.
+
+Every CLI call used to start cold: new TLS connections, an empty in-memory
+cache and no idea how much of the rate limit or daily quota other calls had
+used. While this daemon runs, ``eodhd_client.cached_get`` (and with it the
+CLI, fetch_json/fetch_many and every sibling script) forwards each GET over a
+Unix socket instead, so all callers share:
+
+  - the keep-alive connection pool of one process;
+  - an in-memory LRU cache in front of the on-disk cache (same ``--cache-ttl``
+    semantics: only requests with a TTL are served from cache);
+  - one sliding-window limiter for the API's 1,000 requests/minute;
+  - one daily API-call counter, estimated from the per-endpoint costs in
+    references/general/rate-limits.md (failed requests and cache hits are
+    free), with an optional ``--daily-budget`` that refuses requests past it.
+
+Protocol: one JSON object per line over ``EODHD_DAEMON_SOCKET`` (default
+``EODHD_CACHE_DIR/daemon.sock``, mode 0600), ``{"op": "get", "url", "timeout",
+"ttl", "wait"?}`` -> ``{"body"}`` or ``{"error": {"code"?, "reason", "body"?}}`` with the
+request's ``cache``, ``bytes`` and ``cost`` (for the client's metrics), plus
+``status`` and ``stop``. Clients fall back to direct requests when the socket
+is stale; ``EODHD_DAEMON=0`` opts a process out. POSIX only (Unix sockets).
+
+Examples:
+  # Start in the background (logs to EODHD_CACHE_DIR/daemon.log)
+  python eodhd_daemon.py start --daily-budget 90000
+
+  # Any client call now goes through it
+  python eodhd_client.py --endpoint eod --symbol AAPL.US --cache-ttl 3600
+
+  # Requests, cache hits, API calls used today, pool size
+  python eodhd_daemon.py status
+
+  python eodhd_daemon.py stop
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import datetime
+import json
+import os
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+
+import eodhd_client
+
+RPM = 1000
+WINDOW = 60.0
+MEMORY_MB = 256
+
+
+call_cost = eodhd_client.call_cost  # estimated API calls per request (rate-limits.md)
+
+
+class RateLimiter:
+    """At most ``limit`` acquisitions per sliding ``window`` seconds; acquire() blocks."""
+
+    def __init__(self, limit: int = RPM, window: float = WINDOW):
+        self.limit = limit
+        self.window = window
+        self.sent: collections.deque[float] = collections.deque()
+        self.lock = threading.Lock()
+
+    def acquire(self, max_wait: float | None = None) -> float | None:
+        """Wait for a slot and take it; returns the seconds waited.
+
+        With ``max_wait``, returns None without taking a slot when none frees
+        up within that many seconds.
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                while self.sent and now - self.sent[0] >= self.window:
+                    self.sent.popleft()
+                if len(self.sent) < self.limit:
+                    self.sent.append(now)
+                    return waited
+                delay = self.window - (now - self.sent[0])
+            if max_wait is not None and waited + delay > max_wait:
+                return None
+            time.sleep(delay)
+            waited += delay
+
+
+class MemoryCache:
+    """LRU of URL -> (stored_at, payload), bounded by total payload size."""
+
+    def __init__(self, max_bytes: int = MEMORY_MB << 20):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: collections.OrderedDict[str, tuple[float, str]] = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, url: str, ttl: int) -> str | None:
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None or time.time() - entry[0] >= ttl:
+                return None
+            self.entries.move_to_end(url)
+            return entry[1]
+
+    def put(self, url: str, payload: str, stored_at: float | None = None) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(url, None)
+            if old is not None:
+                self.size -= len(old[1])
+            self.entries[url] = (time.time() if stored_at is None else stored_at, payload)
+            self.size += len(payload)
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+
+class DaemonState:
+    """The shared state behind the socket: cache, limiter and quota accounting."""
+
+    def __init__(self, rpm: int = RPM, daily_budget: int | None = None, memory_mb: int = MEMORY_MB,
+                 window: float = WINDOW, usage_path: str | None = None):
+        self.limiter = RateLimiter(rpm, window)
+        self.memory = MemoryCache(memory_mb << 20)
+        self.daily_budget = daily_budget
+        self.usage_path = usage_path
+        self.started = time.time()
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.day = self._today()
+        self.calls = 0
+        if usage_path:
+            try:
+                with open(usage_path, encoding="utf-8") as fh:
+                    saved = json.load(fh)
+                if saved.get("day") == self.day:
+                    self.calls = int(saved.get("calls", 0))
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+    def _reserve(self, cost: int) -> str | None:
+        """Count ``cost`` calls against today's budget; the refusal reason if it would overrun."""
+        with self.lock:
+            today = self._today()
+            if today != self.day:  # the API's daily counter resets at midnight GMT
+                self.day, self.calls = today, 0
+            if self.daily_budget is not None and self.calls + cost > self.daily_budget:
+                self.counts["refused"] += 1
+                return (f"eodhd daemon: daily budget of {self.daily_budget} API calls exhausted "
+                        f"({self.calls} used today, this request costs {cost})")
+            self.calls += cost
+            return None
+
+    def _count(self, name: str) -> None:
+        with self.lock:
+            self.counts[name] += 1
+
+    def _refund(self, cost: int) -> None:
+        with self.lock:
+            self.calls = max(0, self.calls - cost)
+
+    def get(self, url: str, timeout: int = 30, ttl: int = 0, max_wait: float | None = None) -> dict:
+        """Serve one GET → ``{"body"}`` or ``{"error"}``, plus the request's ``cache``
+        result, ``bytes`` downloaded and API-call ``cost`` for the caller's metrics.
+
+        ``max_wait`` bounds the rate-limiter wait: past it the reply is a 429
+        the caller can retry, instead of an answer after the caller gave up.
+        """
+        self._count("requests")
+        if ttl > 0:
+            payload = self.memory.get(url, ttl)
+            if payload is not None:
+                self._count("memory_hits")
+                eodhd_client.metric("cache", "memory")
+                return {"body": payload, "cache": "memory", "bytes": 0, "cost": 0}
+            payload = eodhd_client.cache_read(url, ttl)
+            if payload is not None:
+                self._count("disk_hits")
+                eodhd_client.metric("cache", "hit")
+                try:
+                    stored_at = os.path.getmtime(eodhd_client._cache_path(url))
+                except OSError:
+                    stored_at = None
+                self.memory.put(url, payload, stored_at)
+                return {"body": payload, "cache": "hit", "bytes": 0, "cost": 0}
+        cache = "miss" if ttl > 0 else "off"
+        if ttl > 0:
+            eodhd_client.metric("cache", "miss")
+        cost = call_cost(url)
+        refused = self._reserve(cost)
+        if refused:
+            return {"error": {"reason": refused}, "cache": cache, "bytes": 0, "cost": 0}
+        waited = self.limiter.acquire(max_wait)
+        if waited is None:
+            self._refund(cost)
+            self._count("rate_limited")
+            return {"error": {"code": 429, "reason": (
+                f"eodhd daemon: {self.limiter.limit} requests per {self.limiter.window:g}s "
+                f"in use; retry shortly")}, "cache": cache, "bytes": 0, "cost": 0}
+        if waited:
+            self._count("rate_limited")
+        self._count("network")
+        try:
+            payload = eodhd_client.http_get(url, timeout)
+        except urllib.error.HTTPError as exc:
+            self._refund(cost)  # failed requests are not charged
+            self._count("errors")
+            try:
+                body = exc.read().decode("utf-8", errors="replace")
+            except Exception:
+                body = ""
+            return {"error": {"code": exc.code, "reason": str(exc.reason), "body": body},
+                    "cache": cache, "bytes": len(body.encode("utf-8")), "cost": 0}
+        except Exception as exc:  # URLError, OSError, http.client.HTTPException, ...
+            self._refund(cost)
+            self._count("errors")
+            return {"error": {"reason": str(getattr(exc, "reason", exc))}, "cache": cache, "bytes": 0, "cost": 0}
+        if ttl > 0:
+            eodhd_client.cache_write(url, payload)
+            self.memory.put(url, payload)
+        return {"body": payload, "cache": cache, "bytes": len(payload.encode("utf-8")), "cost": cost}
+
+    def fetch(self, url: str, timeout: int = 30, ttl: int = 0) -> str:
+        """get() for in-process callers: the payload, or urllib's HTTPError/URLError."""
+        return eodhd_client.reply_payload(url, self.get(url, timeout, ttl))
+
+    def status(self) -> dict:
+        with self.lock:
+            usage = {"day": self.day, "calls": self.calls, "budget": self.daily_budget}
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started, 1),
+            "counts": dict(self.counts),
+            "usage": usage,
+            "rate_limit": {"requests": self.limiter.limit, "window_s": self.limiter.window,
+                           "in_window": len(self.limiter.sent)},
+            "memory_cache": {"entries": len(self.memory.entries), "bytes": self.memory.size},
+            "pooled_connections": sum(len(idle) for idle in eodhd_client._POOL.values()),
+        }
+
+    def save(self) -> None:
+        if not self.usage_path:
+            return
+        with self.lock:
+            usage = {"day": self.day, "calls": self.calls}
+        try:
+            with open(self.usage_path, "w", encoding="utf-8") as fh:
+                json.dump(usage, fh)
+        except OSError:
+            pass
+
+    def handle(self, request: dict) -> dict:
+        op = request.get("op")
+        if op == "get":
+            max_wait = request.get("wait")
+            return self.get(request["url"], int(request.get("timeout", 30)), int(request.get("ttl", 0)),
+                            None if max_wait is None else float(max_wait))
+        if op == "status":
+            return self.status()
+        if op == "stop":
+            return {"stopping": True}
+        return {"error": {"reason": f"unknown op {op!r}"}}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                reply = self.server.state.handle(request)
+            except (ValueError, KeyError, TypeError) as exc:
+                request, reply = {}, {"error": {"reason": f"bad request: {exc}"}}
+            except Exception as exc:  # never leave a caller without a reply
+                request, reply = {}, {"error": {"reason": f"eodhd daemon: {type(exc).__name__}: {exc}"}}
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if request.get("op") == "stop":
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def rpc(path: str, request: dict, timeout: float = 5.0) -> dict | None:
+    """Send one request to the daemon at ``path``; None if nothing is listening."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            with sock.makefile("rwb") as stream:
+                stream.write(json.dumps(request).encode("utf-8") + b"\n")
+                stream.flush()
+                line = stream.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+def make_server(path: str, state: DaemonState) -> _Server:
+    """Bind the daemon socket (owner-only); raises ClientError if one is already serving."""
+    if os.path.exists(path):
+        if rpc(path, {"op": "status"}) is not None:
+            raise eodhd_client.ClientError(f"a daemon is already listening on {path}")
+        os.unlink(path)  # stale socket from a crashed daemon
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    old_umask = os.umask(0o177)
+    try:
+        server = _Server(path, _Handler)
+    finally:
+        os.umask(old_umask)
+    server.state = state
+    return server
+
+
+def serve(path: str, state: DaemonState) -> None:
+    """Serve until ``stop`` or SIGTERM/SIGINT, then save usage and remove the socket."""
+    server = make_server(path, state)
+    stop = lambda *_: threading.Thread(target=server.shutdown, daemon=True).start()  # noqa: E731
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        state.save()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def start(path: str, argv: list[str], wait: float = 5.0) -> dict | None:
+    """Launch ``serve`` detached from this process; returns its status once it answers."""
+    with open(os.path.join(eodhd_client.CACHE_DIR, "daemon.log"), "ab") as log:
+        subprocess.Popen([sys.executable, os.path.abspath(__file__), "--socket", path, "serve", *argv],
+                         stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        status = rpc(path, {"op": "status"})
+        if status is not None:
+            return status
+        time.sleep(0.05)
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Local daemon sharing connections, cache and rate/quota state across eodhd_client.py calls",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--socket", default=eodhd_client.daemon_socket(),
+                        help="Unix socket path (default: EODHD_DAEMON_SOCKET or EODHD_CACHE_DIR/daemon.sock)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, text in (("start", "Start the daemon in the background"),
+                       ("serve", "Run the daemon in the foreground")):
+        cmd = sub.add_parser(name, help=text)
+        cmd.add_argument("--rpm", type=int, default=RPM, help=f"Requests per minute (default: {RPM})")
+        cmd.add_argument("--daily-budget", type=int,
+                         help="Refuse requests once this many API calls were used today (UTC)")
+        cmd.add_argument("--memory-mb", type=int, default=MEMORY_MB,
+                         help=f"In-memory cache size in MB (default: {MEMORY_MB})")
+    sub.add_parser("status", help="Print the running daemon's counters")
+    sub.add_parser("stop", help="Stop the running daemon")
+    args = parser.parse_args()
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: eodhd_daemon.py needs Unix domain sockets", file=sys.stderr)
+        return 2
+    if args.command in ("status", "stop"):
+        reply = rpc(args.socket, {"op": args.command})
+        if reply is None:
+            print(f"Error: no daemon listening on {args.socket}", file=sys.stderr)
+            return 1
+        print(json.dumps(reply, indent=2, sort_keys=True))
+        return 0
+    if args.command == "start":
+        if rpc(args.socket, {"op": "status"}) is not None:
+            print(f"Error: a daemon is already listening on {args.socket}", file=sys.stderr)
+            return 1
+        os.makedirs(eodhd_client.CACHE_DIR, exist_ok=True)
+        argv = ["--rpm", str(args.rpm), "--memory-mb", str(args.memory_mb)]
+        if args.daily_budget is not None:
+            argv += ["--daily-budget", str(args.daily_budget)]
+        status = start(args.socket, argv)
+        if status is None:
+            print("Error: daemon did not start; see EODHD_CACHE_DIR/daemon.log", file=sys.stderr)
+            return 1
+        print(json.dumps(status, indent=2, sort_keys=True))
+        return 0
+
+    state = DaemonState(args.rpm, args.daily_budget, args.memory_mb,
+                        usage_path=os.path.join(eodhd_client.CACHE_DIR, "daemon-usage.json"))
+    try:
+        serve(args.socket, state)
+    except eodhd_client.ClientError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
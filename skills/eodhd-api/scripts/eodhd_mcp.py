@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""Local MCP server (JSON-RPC 2.0 over stdio) backed by eodhd_client.py.
+
+The remote server at mcp.eodhd.com makes every ``tools/call`` a round trip to
+EODHD with nothing kept between calls. This server runs next to the agent and
+exposes every REST endpoint in registry/capabilities.json as a tool (the list
+is generated into mcp_tools.json by registry/build.py), answering through the
+same client the CLI uses:
+
+  - requests go through fetch_json, so responses are normalized exactly like
+    ``eodhd_client.py --endpoint`` output and share its on-disk cache
+    (``--cache-ttl``, env EODHD_CACHE_TTL);
+  - when eodhd_daemon.py is running, calls are forwarded to it and share its
+    connections, memory cache, rate limiter and daily API-call count with
+    every other client on the machine; otherwise this process keeps the same
+    state in-process (eodhd_daemon.DaemonState, --rpm / --daily-budget);
+  - ``tools/call`` requests run on a worker pool (``--workers``), so an agent
+    can keep several in flight; responses are written as each finishes.
+
+Tool arguments use the API's own param names (``from``, ``page[limit]``,
+``filter[year]``, ...) plus the path placeholder (``symbol``, ``exchange``,
+``isin``, ...). Failed API calls come back as tool results with ``isError``;
+unknown tools and missing required arguments are JSON-RPC errors.
+
+Requires:
+  EODHD_API_TOKEN environment variable.
+
+Examples:
+  # MCP client config (stdio): command + args
+  {"eodhd-local": {"command": "python3",
+                   "args": ["skills/eodhd-api/scripts/eodhd_mcp.py", "--cache-ttl", "3600"]}}
+
+  # Only a few tools, against a local stub
+  python eodhd_mcp.py --tools eod,fundamentals,news --base-url http://127.0.0.1:8080/api
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import eodhd_client
+import eodhd_daemon
+
+SERVER_NAME = "eodhd-local"
+SERVER_VERSION = "0.6.0"
+# Newest first; an unknown client version is answered with the newest.
+PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26", "2024-11-05")
+TOOLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_tools.json")
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+
+class RPCError(Exception):
+    """A JSON-RPC error response (code + message)."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def load_tools(path: str = TOOLS_PATH, only: list[str] | None = None) -> dict[str, dict]:
+    """Tool name -> definition from mcp_tools.json (registry order), optionally restricted to ``only``.
+
+    ``only`` entries may be tool names (``real_time``) or endpoint names /
+    registry ids (``real-time``). Raises ClientError for unknown entries.
+    """
+    with open(path, encoding="utf-8") as fh:
+        tools = {t["name"]: t for t in json.load(fh)}
+    if not only:
+        return tools
+    by_endpoint = {t["endpoint"]: name for name, t in tools.items()}
+    wanted = set()
+    for item in only:
+        name = item if item in tools else by_endpoint.get(eodhd_client.endpoint_routes.ALIASES.get(item, item))
+        if name is None:
+            raise eodhd_client.ClientError(f"Unknown tool: {item}")
+        wanted.add(name)
+    return {name: tool for name, tool in tools.items() if name in wanted}
+
+
+class MCPServer:
+    """Dispatches JSON-RPC messages; tools/call runs on a thread pool."""
+
+    def __init__(self, token: str, tools: dict[str, dict], out=None, get=None,
+                 base_url: str = eodhd_client.BASE_URL, timeout: int = 30,
+                 cache_ttl: int = 0, workers: int = 8):
+        self.token = token
+        self.tools = tools
+        self.out = out or sys.stdout
+        self.get = get
+        self.base_url = base_url
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.pool = ThreadPoolExecutor(max_workers=max(1, workers))
+        self.write_lock = threading.Lock()
+        self.call_lock = threading.Lock()
+        self.in_flight: set = set()
+        self.cancelled: set = set()
+
+    def send(self, message: dict) -> None:
+        line = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+        with self.write_lock:
+            self.out.write(line + "\n")
+            self.out.flush()
+
+    def reply(self, msg_id, result: dict | None = None, error: RPCError | None = None) -> None:
+        if error is not None:
+            self.send({"jsonrpc": "2.0", "id": msg_id,
+                       "error": {"code": error.code, "message": str(error)}})
+        else:
+            self.send({"jsonrpc": "2.0", "id": msg_id, "result": result})
+
+    def initialize(self, params: dict) -> dict:
+        requested = params.get("protocolVersion")
+        return {
+            "protocolVersion": requested if requested in PROTOCOL_VERSIONS else PROTOCOL_VERSIONS[0],
+            "capabilities": {"tools": {"listChanged": False}},
+            "serverInfo": {"name": SERVER_NAME, "version": SERVER_VERSION},
+        }
+
+    def list_tools(self, params: dict) -> dict:
+        return {"tools": [{k: t[k] for k in ("name", "description", "inputSchema")}
+                          for t in self.tools.values()]}
+
+    def check_call(self, params: dict) -> tuple[dict, dict]:
+        """(tool, arguments) of a tools/call, or RPCError for a malformed one."""
+        tool = self.tools.get(params.get("name"))
+        if tool is None:
+            raise RPCError(INVALID_PARAMS, f"Unknown tool: {params.get('name')}")
+        arguments = params.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            raise RPCError(INVALID_PARAMS, "arguments must be an object")
+        missing = [p for p in tool["inputSchema"]["required"] if arguments.get(p) in (None, "")]
+        if missing:
+            raise RPCError(INVALID_PARAMS, f"{tool['name']}: missing required argument(s): {', '.join(missing)}")
+        return tool, {k: v for k, v in arguments.items() if v is not None}
+
+    def call_tool(self, tool: dict, arguments: dict) -> dict:
+        try:
+            data = eodhd_client.fetch_json(tool["endpoint"], self.token, None, arguments,
+                                           base_url=self.base_url, timeout=self.timeout,
+                                           cache_ttl=self.cache_ttl, get=self.get)
+        except eodhd_client.ClientError as exc:
+            return {"content": [{"type": "text", "text": f"Error: {exc}"}], "isError": True}
+        return {"content": [{"type": "text", "text": json.dumps(data, ensure_ascii=False)}],
+                "isError": False}
+
+    def _run_call(self, msg_id, tool: dict, arguments: dict) -> None:
+        try:
+            result = self.call_tool(tool, arguments)
+        except Exception as exc:  # never let a worker die without answering
+            result = {"content": [{"type": "text", "text": f"Error: {exc}"}], "isError": True}
+        with self.call_lock:
+            self.in_flight.discard(msg_id)
+            if msg_id in self.cancelled:
+                self.cancelled.discard(msg_id)
+                return  # the client gave up on it; no response
+        self.reply(msg_id, result)
+
+    def handle(self, message) -> None:
+        """Process one decoded message; replies are sent from here or from a worker."""
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" or "method" not in message:
+            msg_id = message.get("id") if isinstance(message, dict) else None
+            self.reply(msg_id, error=RPCError(INVALID_REQUEST, "Invalid Request"))
+            return
+        method = message["method"]
+        params = message.get("params")
+        if params is None:
+            params = {}
+        if "id" not in message:  # notification
+            if method == "notifications/cancelled" and isinstance(params, dict):
+                with self.call_lock:
+                    if params.get("requestId") in self.in_flight:
+                        self.cancelled.add(params.get("requestId"))
+            return
+        msg_id = message["id"]
+        try:
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "params must be an object")
+            if method == "tools/call":
+                tool, arguments = self.check_call(params)
+                with self.call_lock:
+                    self.in_flight.add(msg_id)
+                self.pool.submit(self._run_call, msg_id, tool, arguments)
+                return
+            handlers = {"initialize": self.initialize, "tools/list": self.list_tools,
+                        "ping": lambda params: {}}
+            if method not in handlers:
+                raise RPCError(METHOD_NOT_FOUND, f"Method not found: {method}")
+            self.reply(msg_id, handlers[method](params))
+        except RPCError as exc:
+            self.reply(msg_id, error=exc)
+
+    def serve(self, stream) -> None:
+        """Read newline-delimited messages until EOF, then wait for in-flight calls."""
+        try:
+            for line in stream:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    self.reply(None, error=RPCError(PARSE_ERROR, f"Parse error: {exc}"))
+                    continue
+                for item in message if isinstance(message, list) else [message]:
+                    self.handle(item)
+        finally:
+            self.pool.shutdown(wait=True)
+
+
+def make_backend(rpm: int, daily_budget: int | None, memory_mb: int):
+    """(get, description): the running daemon if there is one, else in-process state."""
+    path = eodhd_client.daemon_socket()
+    if eodhd_client.USE_DAEMON and hasattr(socket, "AF_UNIX") and eodhd_daemon.rpc(path, {"op": "status"}):
+        return None, f"forwarding to eodhd_daemon.py at {path}"
+    state = eodhd_daemon.DaemonState(rpm, daily_budget, memory_mb)
+    return state.fetch, f"in-process cache and limits ({rpm} requests/min)"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Local MCP server (stdio) exposing the EODHD endpoints through eodhd_client.py",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--tools", help="Comma-separated tool or endpoint names to expose (default: all)")
+    parser.add_argument("--cache-ttl", type=int, default=int(os.getenv("EODHD_CACHE_TTL", "0")),
+                        help="Serve responses younger than N seconds from cache (env EODHD_CACHE_TTL)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent tools/call requests (default: 8)")
+    parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds (default: 30)")
+    parser.add_argument("--base-url", default=eodhd_client.BASE_URL, help="Override API base URL")
+    parser.add_argument("--rpm", type=int, default=eodhd_daemon.RPM,
+                        help=f"Requests per minute without a daemon (default: {eodhd_daemon.RPM})")
+    parser.add_argument("--daily-budget", type=int,
+                        help="Without a daemon, refuse requests past this many API calls today (UTC)")
+    parser.add_argument("--memory-mb", type=int, default=eodhd_daemon.MEMORY_MB,
+                        help=f"In-memory cache size in MB without a daemon (default: {eodhd_daemon.MEMORY_MB})")
+    args = parser.parse_args()
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        print("Get your API token at https://eodhd.com/", file=sys.stderr)
+        return 2
+    try:
+        tools = load_tools(only=args.tools.split(",") if args.tools else None)
+    except (OSError, ValueError, eodhd_client.ClientError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    get, backend = make_backend(args.rpm, args.daily_budget, args.memory_mb)
+    print(f"{SERVER_NAME}: {len(tools)} tools, {backend}", file=sys.stderr)
+    server = MCPServer(token, tools, get=get, base_url=args.base_url, timeout=args.timeout,
+                       cache_ttl=args.cache_ttl, workers=args.workers)
+    server.serve(sys.stdin)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Summaries and Prometheus export for eodhd_client.py request metrics.
+
+With ``--metrics FILE`` (env EODHD_METRICS) the client appends one JSON line
+per request: wall time split into phases (``connect_ms`` DNS + TCP connect,
+``tls_ms`` handshake, ``ttfb_ms`` request sent to first response byte,
+``download_ms`` body read, ``parse_ms`` json.loads including any parse-time
+normalizer, ``normalize_ms`` unwrapping rows from an envelope,
+``serialize_ms`` the CLI's json.dumps), ``bytes`` on the wire, ``cache``
+(off / hit / miss / memory), ``retries``, the estimated API-call ``cost``
+and ``total_ms``; ``daemon`` is true when eodhd_daemon.py served the request
+(its reply supplies cache, bytes and cost). Phases a request skipped (no
+new connection on a pooled one, no network on a cache hit) are absent;
+``total_ms`` also covers the time between them (on a process's first
+request, mostly importing http.client and ssl).
+
+This module turns such records into the ``--stats`` table (per-endpoint
+p50/p95/p99 of total_ms plus mean phase times) and a Prometheus text file
+(``--metrics-prom``, for node_exporter's textfile collector). The client
+imports it only at exit and only when metrics are on.
+
+Examples:
+  # Collect while running a batch, then summarize
+  EODHD_METRICS=/tmp/eodhd.jsonl python portfolio_risk.py --symbols AAPL.US,MSFT.US
+  python eodhd_metrics.py /tmp/eodhd.jsonl
+
+  # Last hour only, and refresh the Prometheus file from the same records
+  python eodhd_metrics.py /tmp/eodhd.jsonl --since 3600 --prom /var/lib/node_exporter/eodhd.prom
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+PHASES = ("connect", "tls", "ttfb", "download", "parse", "normalize", "serialize")
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def load(path: str | None, since: float | None = None) -> list[dict]:
+    """Records of a metrics JSONL file (none if it does not exist); ``since`` keeps ts >= since."""
+    if not path or not os.path.exists(path):
+        return []
+    records = []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short by a crash
+            if isinstance(record, dict) and (since is None or record.get("ts", 0) >= since):
+                records.append(record)
+    return records
+
+
+def percentile(values: list[float], q: float) -> float:
+    """The ``q`` quantile (0..1) of ``values``, linearly interpolated like numpy's default."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = q * (len(ordered) - 1)
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def failed(record: dict) -> bool:
+    status = record.get("status")
+    return status == "error" or (isinstance(status, int) and status >= 400)
+
+
+def summarize(records: list[dict]) -> dict[str, dict]:
+    """endpoint -> request count, cache hits, errors, bytes, cost, retries, quantiles and phase means."""
+    groups: dict[str, list[dict]] = {}
+    for record in records:
+        groups.setdefault(record.get("endpoint", "?"), []).append(record)
+    summary = {}
+    for endpoint in sorted(groups):
+        rows = groups[endpoint]
+        totals = [r.get("total_ms", 0.0) for r in rows]
+        summary[endpoint] = {
+            "requests": len(rows),
+            "cache_hits": sum(r.get("cache") in ("hit", "memory") for r in rows),
+            "errors": sum(failed(r) for r in rows),
+            "bytes": sum(r.get("bytes", 0) for r in rows),
+            "cost": sum(r.get("cost", 0) for r in rows),
+            "retries": sum(r.get("retries", 0) for r in rows),
+            "total_ms": sum(totals),
+            "quantiles": {q: percentile(totals, q) for q in QUANTILES},
+            "phases": {p: sum(r.get(p + "_ms", 0.0) for r in rows) / len(rows) for p in PHASES},
+        }
+    return summary
+
+
+def render_stats(records: list[dict]) -> str:
+    """The --stats table: one row per endpoint, then mean milliseconds per phase."""
+    summary = summarize(records)
+    width = max([len("endpoint")] + [len(e) for e in summary])
+    lines = [f"{'endpoint':<{width}} {'reqs':>5} {'hit%':>5} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} "
+             f"{'p99 ms':>9} {'KiB':>9} {'calls':>6}"]
+    for endpoint, s in summary.items():
+        q = s["quantiles"]
+        lines.append(f"{endpoint:<{width}} {s['requests']:>5} {100 * s['cache_hits'] / s['requests']:>4.0f}% "
+                     f"{s['errors']:>4} {q[0.5]:>9.1f} {q[0.95]:>9.1f} {q[0.99]:>9.1f} "
+                     f"{s['bytes'] / 1024:>9.1f} {s['cost']:>6}")
+    totals = [r.get("total_ms", 0.0) for r in records]
+    lines.append(f"{'all':<{width}} {len(records):>5} {'':>5} {sum(failed(r) for r in records):>4} "
+                 f"{percentile(totals, 0.5):>9.1f} {percentile(totals, 0.95):>9.1f} "
+                 f"{percentile(totals, 0.99):>9.1f} {sum(r.get('bytes', 0) for r in records) / 1024:>9.1f} "
+                 f"{sum(r.get('cost', 0) for r in records):>6}")
+    lines.append("")
+    lines.append(f"{'mean ms':<{width}} " + " ".join(f"{p:>9}" for p in PHASES))
+    for endpoint, s in summary.items():
+        lines.append(f"{endpoint:<{width}} " + " ".join(f"{s['phases'][p]:>9.2f}" for p in PHASES))
+    return "\n".join(lines)
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(records: list[dict]) -> str:
+    """Prometheus text exposition format: counters plus a latency summary per endpoint."""
+    summary = summarize(records)
+    out = []
+
+    def family(name: str, kind: str, help_text: str) -> None:
+        out.append(f"# HELP {name} {help_text}")
+        out.append(f"# TYPE {name} {kind}")
+
+    family("eodhd_requests_total", "counter", "Requests by endpoint, cache result and status.")
+    counts: dict[tuple, int] = {}
+    for r in records:
+        key = (r.get("endpoint", "?"), r.get("cache", "off"), r.get("status") or "none")
+        counts[key] = counts.get(key, 0) + 1
+    for (endpoint, cache, status), n in sorted(counts.items(), key=lambda kv: tuple(map(str, kv[0]))):
+        out.append(f'eodhd_requests_total{{endpoint="{_label(endpoint)}",cache="{_label(cache)}",'
+                   f'status="{_label(status)}"}} {n}')
+    for name, key, help_text in (
+        ("eodhd_response_bytes_total", "bytes", "Response bytes read from the network."),
+        ("eodhd_api_calls_total", "cost", "Estimated API calls consumed (rate-limits.md costs)."),
+        ("eodhd_retries_total", "retries", "Requests retried on a fresh connection."),
+    ):
+        family(name, "counter", help_text)
+        for endpoint, s in summary.items():
+            out.append(f'{name}{{endpoint="{_label(endpoint)}"}} {s[key]}')
+    family("eodhd_request_duration_seconds", "summary", "Wall time per request.")
+    for endpoint, s in summary.items():
+        label = f'endpoint="{_label(endpoint)}"'
+        for q, value in s["quantiles"].items():
+            out.append(f'eodhd_request_duration_seconds{{{label},quantile="{q}"}} {value / 1000:.6f}')
+        out.append(f"eodhd_request_duration_seconds_sum{{{label}}} {s['total_ms'] / 1000:.6f}")
+        out.append(f"eodhd_request_duration_seconds_count{{{label}}} {s['requests']}")
+    family("eodhd_request_phase_seconds_total", "counter", "Time spent per request phase.")
+    for endpoint, s in summary.items():
+        for phase in PHASES:
+            total = s["phases"][phase] * s["requests"] / 1000
+            out.append(f'eodhd_request_phase_seconds_total{{endpoint="{_label(endpoint)}",'
+                       f'phase="{phase}"}} {total:.6f}')
+    return "\n".join(out) + "\n"
+
+
+def write_prometheus(path: str, records: list[dict]) -> None:
+    """Write render_prometheus atomically (temp file + rename), as textfile collectors expect."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(render_prometheus(records))
+    os.replace(tmp, path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Summarize an eodhd_client.py --metrics file (per-endpoint p50/p95/p99)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("file", help="Metrics JSONL file (--metrics / EODHD_METRICS)")
+    parser.add_argument("--since", type=float, metavar="SECONDS", help="Only requests from the last N seconds")
+    parser.add_argument("--endpoint", action="append", help="Only this endpoint (repeatable)")
+    parser.add_argument("--prom", metavar="FILE", help="Also write the records as a Prometheus text file")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON instead of a table")
+    args = parser.parse_args()
+
+    records = load(args.file, time.time() - args.since if args.since else None)
+    if args.endpoint:
+        records = [r for r in records if r.get("endpoint") in args.endpoint]
+    if not records:
+        print(f"Error: no requests in {args.file}", file=sys.stderr)
+        return 1
+    if args.prom:
+        write_prometheus(args.prom, records)
+    if args.json:
+        summary = summarize(records)
+        for s in summary.values():
+            s["quantiles"] = {f"p{round(q * 100)}": v for q, v in s["quantiles"].items()}
+        print(json.dumps(summary, indent=2, sort_keys=True))
+    else:
+        print(render_stats(records))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
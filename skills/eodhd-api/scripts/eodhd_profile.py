@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""cProfile + tracemalloc wrapper behind the scripts' ``--profile`` flag.
+
+``eodhd_client.py --profile [FILE]`` and ``market_cap_series.py --profile
+[FILE]`` run their work under cProfile with tracemalloc on, write the
+pstats file (default ``<script>.pstats`` in the current directory) and
+print a short report to stderr:
+
+  - wall time and tracemalloc's peak traced memory for the run;
+  - time attributed to network, parse (json.loads), normalize (the
+    eodhd_client.NORMALIZERS functions) and serialize (json.dumps), from
+    the cumulative time of those functions;
+  - the top-N functions by own time, and the lines holding the most memory
+    still allocated at the end of the run.
+
+Both profilers slow the run down (tracemalloc roughly doubles the time of
+allocation-heavy code), so compare profiled runs with each other, not with
+--stats timings. Open the pstats file for the full picture:
+
+  python -m pstats eodhd_client.pstats    # then: sort cumtime / stats 30
+  python eodhd_profile.py eodhd_client.pstats --top 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+
+TOP = 15
+# (category, file suffix, function) — cumulative time of these functions is
+# reported per category. Nested calls (json.loads inside a network helper)
+# are not subtracted, so the shares can overlap slightly.
+CATEGORIES = (
+    ("network", "eodhd_client.py", "http_get"),
+    ("network", os.path.join("urllib", "request.py"), "urlopen"),
+    ("parse", os.path.join("json", "__init__.py"), "loads"),
+    ("normalize", "eodhd_client.py", "_lowercase_pairs"),
+    ("normalize", "eodhd_client.py", "_unwrap_data"),
+    ("normalize", "eodhd_client.py", "_unwrap_attributes"),
+    ("normalize", "eodhd_client.py", "normalize_response"),
+    ("serialize", os.path.join("json", "__init__.py"), "dumps"),
+)
+
+
+def _where(key: tuple) -> str:
+    filename, line, name = key
+    if filename == "~":
+        return name  # built-in, e.g. <built-in method builtins.sorted>
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def breakdown(stats: pstats.Stats) -> dict[str, float]:
+    """Seconds per CATEGORIES entry (cumulative time of the matching functions)."""
+    totals = {name: 0.0 for name, _, _ in CATEGORIES}
+    for (filename, _, func), (_, _, _, cumtime, _) in stats.stats.items():
+        for name, suffix, wanted in CATEGORIES:
+            if func == wanted and filename.endswith(suffix):
+                totals[name] += cumtime
+    return totals
+
+
+def report(stats: pstats.Stats, top: int = TOP, wall: float | None = None, peak: int | None = None,
+           snapshot: tracemalloc.Snapshot | None = None, path: str | None = None) -> str:
+    """The stderr report: totals, category breakdown, top functions by own time, top allocation sites."""
+    total = stats.total_tt or 1e-9
+    head = f"profile: {wall if wall is not None else total:.3f} s"
+    if peak is not None:
+        head += f", peak {peak / 2**20:.1f} MiB traced"
+    if path:
+        head += f" (pstats: {path})"
+    lines = [head]
+    for name, seconds in breakdown(stats).items():
+        lines.append(f"  {name:<10} {seconds:>8.3f} s {100 * seconds / total:>5.1f}%")
+    rows = sorted(stats.stats.items(), key=lambda kv: kv[1][2], reverse=True)[:top]
+    lines.append(f"  {'ncalls':>9} {'tottime':>8} {'cumtime':>8}  function")
+    for key, (_, calls, tottime, cumtime, _) in rows:
+        lines.append(f"  {calls:>9} {tottime:>8.3f} {cumtime:>8.3f}  {_where(key)}")
+    if snapshot is not None:
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        sites = snapshot.statistics("lineno")[:min(top, 5)]
+        if sites:
+            lines.append("  still allocated at exit:")
+        for stat in sites:
+            frame = stat.traceback[0]
+            lines.append(f"  {stat.size / 2**10:>9.1f} KiB {stat.count:>8} blocks  "
+                         f"{os.path.basename(frame.filename)}:{frame.lineno}")
+    return "\n".join(lines)
+
+
+def run(fn, path: str, top: int = TOP, out=None):
+    """Call ``fn()`` under cProfile + tracemalloc; write ``path`` and the report, return fn's result."""
+    out = out or sys.stderr
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    try:
+        return profiler.runcall(fn)
+    finally:
+        wall = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        profiler.dump_stats(path)
+        print(report(pstats.Stats(profiler), top, wall, peak, snapshot, path), file=out)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Print the --profile report for a saved pstats file")
+    parser.add_argument("file", help="pstats file written by --profile")
+    parser.add_argument("--top", type=int, default=TOP, help=f"Functions to list (default: {TOP})")
+    args = parser.parse_args()
+    try:
+        stats = pstats.Stats(args.file)
+    except (OSError, TypeError, ValueError) as exc:
+        print(f"Error: cannot read {args.file}: {exc}", file=sys.stderr)
+        return 1
+    print(report(stats, args.top, path=args.file))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
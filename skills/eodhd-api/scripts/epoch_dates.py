@@ -0,0 +1,131 @@
+"""Integer date encoding shared by the client, records and the join scripts.
+
+EODHD sends dates as ``YYYY-MM-DD`` strings and intraday times as
+``YYYY-MM-DD HH:MM:SS`` (UTC). Sorting, joining and range-filtering those
+strings compares them character by character. This module converts them once
+into integers:
+
+  - epoch days (days since 1970-01-01): ``epoch_day`` / ``epoch_days``. This
+    is the same integer NumPy stores for ``datetime64[D]``.
+  - Unix seconds (UTC): ``unix_seconds`` / ``unix_times``. A bare date means
+    midnight UTC, which is what ``intraday``'s ``from`` / ``to`` expect.
+
+The single-value functions parse through an LRU cache, since a panel repeats
+the same few thousand dates. The bulk functions give the whole list to
+NumPy's datetime64 parser when NumPy is installed (about 1.5x the cached
+parse for dates, 10x for timestamps). Without NumPy they fall back to the cached
+parse. NumPy is imported on the first bulk call only, so the client's single
+conversions do not load it. ``iso_day`` / ``iso_days`` convert back.
+
+Examples:
+  import epoch_dates
+  epoch_dates.epoch_day("2025-01-02")                  # 20090
+  epoch_dates.iso_day(20090)                           # "2025-01-02"
+  epoch_dates.unix_seconds("2025-01-02 14:30:00")      # 1735828200
+  days = epoch_dates.epoch_days(["2025-01-02", "2025-01-03"])   # array('q', [20090, 20091])
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import warnings
+from array import array
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+DAY_SECONDS = 86400
+_NUMPY: list = []
+
+
+def _numpy():
+    """The numpy module, or None when it is not installed (looked up once)."""
+    if not _NUMPY:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _NUMPY.append(numpy)
+    return _NUMPY[0]
+
+
+@functools.lru_cache(maxsize=65536)
+def epoch_day(value: str) -> int:
+    """Days since 1970-01-01 for ``YYYY-MM-DD`` (any time part is ignored); ValueError if malformed."""
+    return datetime.date.fromisoformat(value[:10]).toordinal() - EPOCH_ORDINAL
+
+
+@functools.lru_cache(maxsize=65536)
+def iso_day(day: int) -> str:
+    """``YYYY-MM-DD`` for an epoch-day integer."""
+    return datetime.date.fromordinal(day + EPOCH_ORDINAL).isoformat()
+
+
+def unix_seconds(value: str) -> int:
+    """UTC Unix seconds for ``YYYY-MM-DD[ HH:MM[:SS]]``; an explicit UTC offset is honoured."""
+    if len(value) == 10:
+        return epoch_day(value) * DAY_SECONDS
+    moment = datetime.datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return int(moment.timestamp())
+
+
+def _iso_shaped(np, values) -> bool:
+    """True if every value is a string starting ``YYYY-MM-DD`` (a time part after a space or ``T``).
+
+    NumPy also parses "2025" and "2025-01" and reads "20250102" as a year; the
+    stdlib path rejects or reads those differently, so they must not reach
+    NumPy. The check runs on the code points of one string array.
+    """
+    strings = np.asarray(values)
+    if strings.dtype.kind != "U" or strings.ndim != 1 or strings.dtype.itemsize < 40:
+        return False  # None, numbers, or every value shorter than 10 characters
+    chars = strings.view(np.uint32).reshape(len(strings), -1)
+    ok = (chars[:, 4] == ord("-")) & (chars[:, 7] == ord("-")) & (chars[:, 9] != 0)
+    if chars.shape[1] > 10:
+        ok &= (chars[:, 10] == 0) | (chars[:, 10] == ord(" ")) | (chars[:, 10] == ord("T"))
+    return bool(ok.all())
+
+
+def _bulk(values, unit: str):
+    """``values`` parsed by NumPy as int64 in ``unit`` ("D" or "s"), or None to fall back."""
+    np = _numpy()
+    if np is None or not values or not _iso_shaped(np, values):
+        return None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # NumPy only warns about UTC offsets
+            # Parsing the list is ~4x faster than casting the checked string array.
+            parsed = np.array(values, dtype=f"datetime64[{unit}]")
+    except (ValueError, TypeError, UserWarning):
+        return None  # offsets, odd formats: the stdlib path parses or reports them
+    if np.isnat(parsed).any():
+        return None  # let the stdlib path raise for it
+    return parsed.astype(np.int64)
+
+
+def epoch_days(values, use_numpy: bool | None = None) -> array:
+    """Epoch days for a sequence of date strings, as ``array('q')``.
+
+    Raises ValueError for a malformed date. ``use_numpy=False`` skips the
+    NumPy path (by default it is used when installed).
+    """
+    values = list(values)
+    parsed = _bulk(values, "D") if use_numpy is not False else None
+    if parsed is not None:
+        return array("q", parsed.tobytes())
+    return array("q", map(epoch_day, values))
+
+
+def unix_times(values, use_numpy: bool | None = None) -> array:
+    """UTC Unix seconds for a sequence of date or date-time strings, as ``array('q')``."""
+    values = list(values)
+    parsed = _bulk(values, "s") if use_numpy is not False else None
+    if parsed is not None:
+        return array("q", parsed.tobytes())
+    return array("q", map(unix_seconds, values))
+
+
+def iso_days(days) -> list[str]:
+    """``YYYY-MM-DD`` strings for a sequence of epoch days (cached; faster than NumPy's formatter)."""
+    return list(map(iso_day, days))
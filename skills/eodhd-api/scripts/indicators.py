@@ -0,0 +1,320 @@
+"""Local technical-indicator engine over EOD bars (stdlib-only).
+
+Computes the functions offered by ``eodhd_client.py --endpoint technical``
+from ``/eod`` rows the client already fetched (or cached), so per-holding
+RSI/Bollinger/ATR no longer cost 5 API calls each. Output rows match the
+``/technical`` response shape documented in
+``references/endpoints/technical-indicators.md``.
+
+Every function is a single streaming pass: running sums for SMA/WMA/Bollinger,
+Wilder smoothing for RSI/ATR/ADX, monotonic deques for the stochastic
+high/low window. CCI's mean deviation is the one O(n x period) step (there is
+no exact running form for a moving mean absolute deviation).
+
+Prices follow the API default (adjusted for splits and dividends): close is
+``adjusted_close`` and open/high/low are scaled by ``adjusted_close / close``.
+
+Examples:
+  # Via the client (fetches eod once, computes locally)
+  python eodhd_client.py --endpoint technical --symbol AAPL.US --function rsi --period 14 \\
+      --technical-mode local --from-date 2025-01-01
+
+  # As a library
+  bars = bars_from_eod(eod_rows)
+  compute("bbands", bars, period=20)
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+DEFAULT_PERIOD = 50
+
+
+def bars_from_eod(rows: list[dict]) -> dict[str, list]:
+    """Convert /eod rows into adjusted column lists (date/open/high/low/close)."""
+    out: dict[str, list] = {"date": [], "open": [], "high": [], "low": [], "close": []}
+    for row in rows:
+        close = row.get("close")
+        adj = row.get("adjusted_close")
+        if adj is None:
+            adj = close
+        if adj is None or "date" not in row:
+            continue
+        factor = adj / close if close else 1.0
+        out["date"].append(row["date"])
+        out["close"].append(float(adj))
+        for key in ("open", "high", "low"):
+            value = row.get(key)
+            out[key].append(float(adj) if value is None else value * factor)
+    return out
+
+
+def _rows(dates: list[str], start: int, **series: list) -> list[dict]:
+    """Zip value columns back into API-shaped rows from index ``start``."""
+    names = list(series)
+    return [
+        {"date": dates[i], **{name: series[name][i] for name in names}}
+        for i in range(start, len(dates))
+    ]
+
+
+def _sma(values: list[float], period: int) -> list[float | None]:
+    out: list[float | None] = [None] * len(values)
+    total = 0.0
+    for i, v in enumerate(values):
+        total += v
+        if i >= period:
+            total -= values[i - period]
+        if i >= period - 1:
+            out[i] = total / period
+    return out
+
+
+def _ema(values: list[float | None], period: int) -> list[float | None]:
+    """EMA seeded with the SMA of the first ``period`` non-missing values."""
+    out: list[float | None] = [None] * len(values)
+    k = 2.0 / (period + 1)
+    seed: list[float] = []
+    prev = None
+    for i, v in enumerate(values):
+        if v is None:
+            continue
+        if prev is None:
+            seed.append(v)
+            if len(seed) == period:
+                prev = sum(seed) / period
+                out[i] = prev
+            continue
+        prev = v * k + prev * (1.0 - k)
+        out[i] = prev
+    return out
+
+
+def _wilder(values: list[float], period: int, start: int = 0) -> list[float | None]:
+    """Wilder smoothing: simple mean seed, then (prev * (n - 1) + x) / n."""
+    out: list[float | None] = [None] * len(values)
+    if len(values) - start < period:
+        return out
+    avg = sum(values[start:start + period]) / period
+    out[start + period - 1] = avg
+    for i in range(start + period, len(values)):
+        avg = (avg * (period - 1) + values[i]) / period
+        out[i] = avg
+    return out
+
+
+def _first(series: list) -> int:
+    return next((i for i, v in enumerate(series) if v is not None), len(series))
+
+
+def sma(bars: dict, period: int = DEFAULT_PERIOD) -> list[dict]:
+    values = _sma(bars["close"], period)
+    return _rows(bars["date"], _first(values), sma=values)
+
+
+def ema(bars: dict, period: int = DEFAULT_PERIOD) -> list[dict]:
+    values = _ema(bars["close"], period)
+    return _rows(bars["date"], _first(values), ema=values)
+
+
+def wma(bars: dict, period: int = DEFAULT_PERIOD) -> list[dict]:
+    closes = bars["close"]
+    out: list[float | None] = [None] * len(closes)
+    denom = period * (period + 1) / 2.0
+    total = weighted = 0.0
+    for i, v in enumerate(closes):
+        if i < period:
+            total += v
+            weighted += v * (i + 1)
+        else:
+            # Shift the window: every weight drops by one, the new bar gets n.
+            weighted += period * v - total
+            total += v - closes[i - period]
+        if i >= period - 1:
+            out[i] = weighted / denom
+    return _rows(bars["date"], period - 1, wma=out)
+
+
+def rsi(bars: dict, period: int = DEFAULT_PERIOD) -> list[dict]:
+    closes = bars["close"]
+    gains = [0.0] + [max(b - a, 0.0) for a, b in zip(closes, closes[1:])]
+    losses = [0.0] + [max(a - b, 0.0) for a, b in zip(closes, closes[1:])]
+    avg_gain = _wilder(gains, period, start=1)
+    avg_loss = _wilder(losses, period, start=1)
+    out: list[float | None] = [None] * len(closes)
+    for i, (g, l) in enumerate(zip(avg_gain, avg_loss)):
+        if g is not None:
+            out[i] = 100.0 if l == 0 else 100.0 - 100.0 / (1.0 + g / l)
+    return _rows(bars["date"], _first(out), rsi=out)
+
+
+def macd(bars: dict, fast_period: int = 12, slow_period: int = 26,
+         signal_period: int = 9, **_) -> list[dict]:
+    fast = _ema(bars["close"], fast_period)
+    slow = _ema(bars["close"], slow_period)
+    line = [None if f is None or s is None else f - s for f, s in zip(fast, slow)]
+    signal = _ema(line, signal_period)
+    hist = [None if s is None else m - s for m, s in zip(line, signal)]
+    return _rows(bars["date"], _first(signal), macd=line, macd_signal=signal, macd_hist=hist)
+
+
+def _rolling_extreme(values: list[float], period: int, is_max: bool) -> list[float | None]:
+    """Rolling max/min in O(n) with a monotonic deque of indexes."""
+    out: list[float | None] = [None] * len(values)
+    window: deque[int] = deque()
+    for i, v in enumerate(values):
+        while window and (values[window[-1]] <= v if is_max else values[window[-1]] >= v):
+            window.pop()
+        window.append(i)
+        if window[0] <= i - period:
+            window.popleft()
+        if i >= period - 1:
+            out[i] = values[window[0]]
+    return out
+
+
+def stochastic(bars: dict, fast_kperiod: int = 14, slow_kperiod: int = 3,
+               slow_dperiod: int = 3, **_) -> list[dict]:
+    highest = _rolling_extreme(bars["high"], fast_kperiod, True)
+    lowest = _rolling_extreme(bars["low"], fast_kperiod, False)
+    fast_k = []
+    for c, hh, ll in zip(bars["close"], highest, lowest):
+        if hh is None:
+            fast_k.append(None)
+        else:
+            fast_k.append(50.0 if hh == ll else 100.0 * (c - ll) / (hh - ll))
+    start = _first(fast_k)
+    slow_k = [None] * start + _sma(fast_k[start:], slow_kperiod)
+    start = _first(slow_k)
+    slow_d = [None] * start + _sma(slow_k[start:], slow_dperiod)
+    return _rows(bars["date"], _first(slow_d), stochastic_k=slow_k, stochastic_d=slow_d)
+
+
+def cci(bars: dict, period: int = DEFAULT_PERIOD) -> list[dict]:
+    typical = [(h + l + c) / 3.0 for h, l, c in zip(bars["high"], bars["low"], bars["close"])]
+    mean = _sma(typical, period)
+    out: list[float | None] = [None] * len(typical)
+    for i in range(period - 1, len(typical)):
+        m = mean[i]
+        dev = sum(abs(x - m) for x in typical[i - period + 1:i + 1]) / period
+        out[i] = 0.0 if dev == 0 else (typical[i] - m) / (0.015 * dev)
+    return _rows(bars["date"], period - 1, cci=out)
+
+
+def _true_range(bars: dict) -> list[float]:
+    highs, lows, closes = bars["high"], bars["low"], bars["close"]
+    tr = [highs[0] - lows[0]] if highs else []
+    for i in range(1, len(highs)):
+        prev = closes[i - 1]
+        tr.append(max(highs[i] - lows[i], abs(highs[i] - prev), abs(lows[i] - prev)))
+    return tr
+
+
+def atr(bars: dict, period: int = DEFAULT_PERIOD) -> list[dict]:
+    values = _wilder(_true_range(bars), period)
+    return _rows(bars["date"], _first(values), atr=values)
+
+
+def adx(bars: dict, period: int = DEFAULT_PERIOD) -> list[dict]:
+    highs, lows = bars["high"], bars["low"]
+    plus_dm = [0.0]
+    minus_dm = [0.0]
+    for i in range(1, len(highs)):
+        up = highs[i] - highs[i - 1]
+        down = lows[i - 1] - lows[i]
+        plus_dm.append(up if up > down and up > 0 else 0.0)
+        minus_dm.append(down if down > up and down > 0 else 0.0)
+    tr = _wilder(_true_range(bars), period, start=1)
+    pdm = _wilder(plus_dm, period, start=1)
+    mdm = _wilder(minus_dm, period, start=1)
+    dx = [0.0] * len(highs)
+    start = _first(tr)
+    for i in range(start, len(highs)):
+        if not tr[i]:
+            continue
+        plus_di = 100.0 * pdm[i] / tr[i]
+        minus_di = 100.0 * mdm[i] / tr[i]
+        total = plus_di + minus_di
+        dx[i] = 0.0 if total == 0 else 100.0 * abs(plus_di - minus_di) / total
+    values = _wilder(dx, period, start=start) if start < len(highs) else [None] * len(highs)
+    return _rows(bars["date"], _first(values), adx=values)
+
+
+def bbands(bars: dict, period: int = DEFAULT_PERIOD, stddev: float = 2.0, **_) -> list[dict]:
+    closes = bars["close"]
+    upper: list[float | None] = [None] * len(closes)
+    middle: list[float | None] = [None] * len(closes)
+    lower: list[float | None] = [None] * len(closes)
+    total = squares = 0.0
+    for i, v in enumerate(closes):
+        total += v
+        squares += v * v
+        if i >= period:
+            old = closes[i - period]
+            total -= old
+            squares -= old * old
+        if i >= period - 1:
+            mean = total / period
+            sd = math.sqrt(max(squares / period - mean * mean, 0.0))
+            middle[i] = mean
+            upper[i] = mean + stddev * sd
+            lower[i] = mean - stddev * sd
+    return _rows(bars["date"], period - 1, bbands_upper=upper,
+                 bbands_middle=middle, bbands_lower=lower)
+
+
+FUNCTIONS = {
+    "sma": sma,
+    "ema": ema,
+    "wma": wma,
+    "rsi": rsi,
+    "macd": macd,
+    "stoch": stochastic,
+    "stochastic": stochastic,
+    "cci": cci,
+    "adx": adx,
+    "atr": atr,
+    "bbands": bbands,
+}
+
+# Recursive indicators whose early values depend on all prior history; the
+# client fetches full history for these so local values converge like the API.
+RECURSIVE = {"ema", "rsi", "macd", "adx", "atr"}
+
+
+def compute(function: str, bars: dict, period: int | None = None, **params) -> list[dict]:
+    """Compute ``function`` over ``bars`` → API-shaped rows, oldest first.
+
+    ``period`` is ignored by macd/stochastic, which take their own
+    ``fast_period``/``fast_kperiod``-style keyword parameters.
+    """
+    check_args(function, period)
+    fn = FUNCTIONS[function]
+    if fn in (macd, stochastic):
+        return fn(bars, **params)
+    if period is None:
+        period = DEFAULT_PERIOD
+    return fn(bars, period, **params) if fn is bbands else fn(bars, period)
+
+
+def check_args(function: str, period: int | None = None) -> None:
+    """Raise ValueError unless ``compute(function, bars, period)`` would accept them."""
+    fn = FUNCTIONS.get(function)
+    if fn is None:
+        raise ValueError(
+            f"function '{function}' has no local implementation "
+            f"(available: {', '.join(sorted(FUNCTIONS))})"
+        )
+    if fn not in (macd, stochastic) and period is not None and period < 2:
+        raise ValueError("period must be >= 2")
+
+
+def lookback_bars(function: str, period: int | None) -> int | None:
+    """Bars of history needed before the first output, or None for 'all'."""
+    if function in RECURSIVE:
+        return None
+    if function in ("stoch", "stochastic"):
+        return 14 + 3 + 3
+    return period or DEFAULT_PERIOD
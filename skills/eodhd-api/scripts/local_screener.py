@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""Local stock screener over a columnar bulk-fundamentals snapshot.
+
+The remote ``screener`` endpoint caps each page at 100 rows and costs a
+round trip (5 API calls) per filter tweak. This script builds one snapshot
+per exchange from ``bulk-fundamentals`` + ``eod-bulk-last-day`` and then
+evaluates the same ``--filters`` / ``--sort`` / ``--signals`` syntax locally:
+
+  - Columns are stored per field (one list per field, one slot per ticker).
+  - Numeric fields get a lazily built sorted index, so range filters are two
+    bisections and a ``--sort field.desc --limit k`` walks only k+offset
+    index entries instead of sorting the exchange.
+  - String ``=`` uses a value → rows hash index; ``match`` scans one column.
+
+Field names follow the screener reference (``market_capitalization``, ``pe``,
+``dividend_yield`` as a fraction, ...). Values come from the fundamentals
+snapshot, so ratios such as ``roe``/``roa`` are decimals, as in Highlights.
+
+Requires:
+  EODHD_API_TOKEN environment variable (build only). bulk-fundamentals needs
+  the Extended Fundamentals plan and costs 100 API calls per 500-ticker page.
+
+Examples:
+  # Build (or refresh) the NASDAQ snapshot
+  python local_screener.py build --exchange NASDAQ
+
+  # Query it — same filter/sort syntax as `eodhd_client.py --endpoint screener`
+  python local_screener.py query --exchange NASDAQ \\
+      --filters '[["market_capitalization",">=",1000000000],["sector","=","Technology"]]' \\
+      --sort market_capitalization.desc --limit 20
+
+  # Signals and no 100-row cap
+  python local_screener.py query --exchange NASDAQ --signals bookvalue_neg --limit 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import datetime
+import json
+import os
+import sys
+
+import eodhd_client
+
+SNAPSHOT_DIR = os.path.join(eodhd_client.CACHE_DIR, "screener")
+PAGE_SIZE = 500  # bulk-fundamentals maximum
+
+# screener field → (fundamentals section, key)
+FUNDAMENTAL_FIELDS = {
+    "name": ("General", "Name"),
+    "exchange": ("General", "Exchange"),
+    "currency_symbol": ("General", "CurrencyCode"),
+    "sector": ("General", "Sector"),
+    "industry": ("General", "Industry"),
+    "market_capitalization": ("Highlights", "MarketCapitalization"),
+    "earnings_share": ("Highlights", "EarningsShare"),
+    "dividend_yield": ("Highlights", "DividendYield"),
+    "pe": ("Highlights", "PERatio"),
+    "peg": ("Highlights", "PEGRatio"),
+    "revenue": ("Highlights", "RevenueTTM"),
+    "ebitda": ("Highlights", "EBITDA"),
+    "roe": ("Highlights", "ReturnOnEquityTTM"),
+    "roa": ("Highlights", "ReturnOnAssetsTTM"),
+    "book_value": ("Highlights", "BookValue"),
+    "wallstreet_target_price": ("Highlights", "WallStreetTargetPrice"),
+    "pb": ("Valuation", "PriceBookMRQ"),
+    "ps": ("Valuation", "PriceSalesTTM"),
+    "beta": ("Technicals", "Beta"),
+    "hi_52w": ("Technicals", "52WeekHigh"),
+    "lo_52w": ("Technicals", "52WeekLow"),
+}
+
+# eod-bulk-last-day field → screener field (extra numeric fields are kept as-is)
+LAST_DAY_FIELDS = {"close": "close", "adjusted_close": "adjusted_close",
+                   "volume": "volume", "change_p": "refund_1d_p"}
+
+OPS = {"=", "!=", ">", ">=", "<", "<=", "match"}
+
+
+def _signal_ge(field: str, ref: str):
+    return lambda s, i: _cmp_cols(s, i, field, ref, lambda a, b: a >= b)
+
+
+def _signal_le(field: str, ref: str):
+    return lambda s, i: _cmp_cols(s, i, field, ref, lambda a, b: a <= b)
+
+
+def _signal_sign(field: str, op):
+    return lambda s, i: _numeric(s.value(field, i)) and op(s.value(field, i), 0)
+
+
+def _numeric(value) -> bool:
+    """True for numbers; strings such as "NA" and nulls count as missing."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _cmp_cols(snapshot: "Snapshot", i: int, left: str, right: str, op) -> bool:
+    a = snapshot.value(left, i)
+    b = snapshot.value(right, i)
+    return _numeric(a) and _numeric(b) and op(a, b)
+
+
+# Local approximations of the API's signals, from snapshot columns.
+SIGNALS = {
+    "200d_new_hi": _signal_ge("close", "hi_52w"),
+    "200d_new_lo": _signal_le("close", "lo_52w"),
+    "bookvalue_neg": _signal_sign("book_value", lambda a, b: a < b),
+    "bookvalue_pos": _signal_sign("book_value", lambda a, b: a > b),
+    "wallstreet_hi": _signal_ge("close", "wallstreet_target_price"),
+    "wallstreet_lo": _signal_le("close", "wallstreet_target_price"),
+}
+
+
+def _number(value):
+    """Coerce API numerics (often strings like "12.5" or "NA") to float/None."""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class Snapshot:
+    """Columnar screener table: ``columns[field][row]`` plus lazy indexes."""
+
+    def __init__(self, exchange: str, columns: dict[str, list], built_at: str = ""):
+        self.exchange = exchange
+        self.columns = columns
+        self.built_at = built_at
+        self.size = len(columns.get("code", []))
+        self._sorted: dict[str, tuple[list, list[int]]] = {}
+        self._hashed: dict[str, dict] = {}
+
+    @classmethod
+    def from_payloads(cls, exchange: str, fundamentals: list[dict], last_day: list[dict]) -> "Snapshot":
+        """Join bulk-fundamentals entries with eod-bulk-last-day rows on ticker code."""
+        quotes = {row.get("code"): row for row in last_day if isinstance(row, dict)}
+        fields = ["code"] + list(FUNDAMENTAL_FIELDS)
+        extra = sorted({k for row in quotes.values() for k, v in row.items()
+                        if isinstance(v, (int, float)) and not isinstance(v, bool)}
+                       - set(LAST_DAY_FIELDS))
+        fields += list(LAST_DAY_FIELDS.values()) + extra
+        columns: dict[str, list] = {f: [] for f in fields}
+        for entry in fundamentals:
+            general = entry.get("General") or {}
+            code = general.get("Code")
+            if not code:
+                continue
+            columns["code"].append(code)
+            for field, (section, key) in FUNDAMENTAL_FIELDS.items():
+                value = (entry.get(section) or {}).get(key)
+                columns[field].append(value if field in ("name", "exchange", "currency_symbol",
+                                                         "sector", "industry") else _number(value))
+            quote = quotes.get(code, {})
+            for src, dst in LAST_DAY_FIELDS.items():
+                columns[dst].append(_number(quote.get(src)))
+            for field in extra:
+                columns[field].append(_number(quote.get(field)))
+        return cls(exchange, columns, datetime.datetime.now(datetime.timezone.utc).isoformat())
+
+    # --- persistence -------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"exchange": self.exchange, "built_at": self.built_at,
+                       "columns": self.columns}, fh, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Snapshot":
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        return cls(data["exchange"], data["columns"], data.get("built_at", ""))
+
+    # --- access / indexes --------------------------------------------------
+
+    def value(self, field: str, row: int):
+        column = self.columns.get(field)
+        return None if column is None else column[row]
+
+    def row(self, i: int) -> dict:
+        return {field: column[i] for field, column in self.columns.items()}
+
+    def sorted_index(self, field: str) -> tuple[list, list[int]]:
+        """(ascending numeric values, matching row ids); nulls excluded."""
+        if field not in self._sorted:
+            column = self.columns[field]
+            ids = [i for i, v in enumerate(column)
+                   if isinstance(v, (int, float)) and not isinstance(v, bool)]
+            ids.sort(key=column.__getitem__)
+            self._sorted[field] = ([column[i] for i in ids], ids)
+        return self._sorted[field]
+
+    def hash_index(self, field: str) -> dict:
+        """Lower-cased string value → set of row ids."""
+        if field not in self._hashed:
+            index: dict = {}
+            for i, v in enumerate(self.columns[field]):
+                index.setdefault(str(v).lower(), set()).add(i)
+            self._hashed[field] = index
+        return self._hashed[field]
+
+    def is_numeric(self, field: str) -> bool:
+        return bool(self.sorted_index(field)[1])
+
+    # --- query -------------------------------------------------------------
+
+    def _match_filter(self, field: str, op: str, value) -> set[int]:
+        if field not in self.columns:
+            raise ValueError(f"unknown filter field '{field}'")
+        if op not in OPS:
+            raise ValueError(f"unsupported filter operation '{op}' (use one of {sorted(OPS)})")
+        if field == "exchange" and op in ("=", "!=") and str(value).lower() == self.exchange.lower():
+            # ["exchange","=","us"] on the US snapshot means "every listing".
+            every = set(range(self.size))
+            return every if op == "=" else set()
+        if op == "match":
+            needle = str(value).lower()
+            return {i for i, v in enumerate(self.columns[field])
+                    if v is not None and needle in str(v).lower()}
+        if isinstance(value, (int, float)) and self.is_numeric(field):
+            values, ids = self.sorted_index(field)
+            if op == ">":
+                return set(ids[bisect.bisect_right(values, value):])
+            if op == ">=":
+                return set(ids[bisect.bisect_left(values, value):])
+            if op == "<":
+                return set(ids[:bisect.bisect_left(values, value)])
+            if op == "<=":
+                return set(ids[:bisect.bisect_right(values, value)])
+            lo, hi = bisect.bisect_left(values, value), bisect.bisect_right(values, value)
+            if op == "=":
+                return set(ids[lo:hi])
+            return set(ids[:lo]) | set(ids[hi:])
+        if op in ("=", "!="):
+            hits = self.hash_index(field).get(str(value).lower(), set())
+            return set(hits) if op == "=" else set(range(self.size)) - hits
+        raise ValueError(f"operation '{op}' needs a numeric value and numeric field '{field}'")
+
+    def query(self, filters: list | None = None, sort: str | None = None,
+              signals: str | None = None, limit: int = 50, offset: int = 0) -> dict:
+        """Evaluate a screener request → ``{"count": N, "data": [rows]}``."""
+        candidates: set[int] | None = None
+        for flt in filters or []:
+            if not isinstance(flt, (list, tuple)) or len(flt) != 3:
+                raise ValueError("each filter must be a [field, operation, value] triple")
+        # Index-backed filters first; the "match" ones scan the whole column, so
+        # they run last where an empty intersection can skip them.
+        for flt in sorted(filters or [], key=lambda f: f[1] == "match"):
+            hits = self._match_filter(*flt)
+            candidates = hits if candidates is None else candidates & hits
+            if not candidates:
+                break
+        if candidates is None:
+            candidates = set(range(self.size))
+        for name in filter(None, (signals or "").split(",")):
+            predicate = SIGNALS.get(name.strip())
+            if predicate is None:
+                raise ValueError(f"signal '{name}' has no local equivalent "
+                                 f"(available: {', '.join(sorted(SIGNALS))})")
+            candidates = {i for i in candidates if predicate(self, i)}
+
+        want = offset + limit
+        if sort:
+            field, _, direction = sort.rpartition(".")
+            if not field or direction not in ("asc", "desc"):
+                raise ValueError("sort must be field.direction, e.g. market_capitalization.desc")
+            if field not in self.columns:
+                raise ValueError(f"unknown sort field '{field}'")
+            if self.is_numeric(field):
+                _, ids = self.sorted_index(field)
+                walk = reversed(ids) if direction == "desc" else iter(ids)
+                ordered = []
+                for i in walk:
+                    if i in candidates:
+                        ordered.append(i)
+                        if len(ordered) >= want:
+                            break
+                if len(ordered) < want:  # rows with a null sort value go last
+                    ranked = set(ids)
+                    ordered += sorted(i for i in candidates if i not in ranked)[:want - len(ordered)]
+            else:
+                ordered = sorted(candidates, key=lambda i: str(self.columns[field][i] or ""),
+                                 reverse=direction == "desc")[:want]
+        else:
+            ordered = sorted(candidates)[:want]
+        return {"count": len(candidates), "data": [self.row(i) for i in ordered[offset:want]]}
+
+
+def snapshot_path(exchange: str) -> str:
+    return os.path.join(SNAPSHOT_DIR, f"{exchange.upper()}.json")
+
+
+def _entries(payload) -> list[dict]:
+    """bulk-fundamentals returns {"0": {...}, "1": ...}; accept a list too."""
+    if isinstance(payload, dict):
+        if "error" in payload:
+            raise RuntimeError(f"bulk-fundamentals API error: {payload['error']}")
+        return [v for _, v in sorted(payload.items(), key=lambda kv: int(kv[0]) if kv[0].isdigit() else 0)
+                if isinstance(v, dict)]
+    return [v for v in payload or [] if isinstance(v, dict)]
+
+
+def build_snapshot(exchange: str, token: str, workers: int = 4, timeout: int = 120,
+                   cache_ttl: int = 0) -> Snapshot:
+    """Page through bulk-fundamentals in concurrent waves and join last-day quotes.
+
+    The listing size is unknown up front, so pages past a short one are
+    wasted at 100 API calls each. Waves start at one page and double up to
+    ``workers``: an exchange that fits in one page costs one request, and a
+    large one wastes at most the tail of its last wave.
+    """
+    fundamentals: list[dict] = []
+    offset, wave = 0, 1
+    while True:
+        calls = [{"endpoint": "bulk-fundamentals", "symbol": exchange,
+                  "params": {"offset": offset + k * PAGE_SIZE, "limit": PAGE_SIZE}}
+                 for k in range(wave)]
+        pages = [_entries(p) for p in eodhd_client.fetch_many(
+            calls, token, workers=workers, timeout=timeout, cache_ttl=cache_ttl)]
+        for page in pages:
+            fundamentals.extend(page)
+        if any(len(page) < PAGE_SIZE for page in pages):
+            break
+        offset += wave * PAGE_SIZE
+        wave = min(wave * 2, max(workers, 1))
+    last_day = eodhd_client.fetch_json("eod-bulk-last-day", token, exchange,
+                                       timeout=timeout, cache_ttl=cache_ttl)
+    if isinstance(last_day, dict):
+        raise RuntimeError(f"eod-bulk-last-day API error: {last_day.get('error', last_day)}")
+    return Snapshot.from_payloads(exchange, fundamentals, last_day)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Local screener over a bulk-fundamentals snapshot",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"Snapshots are stored in {SNAPSHOT_DIR} (EODHD_CACHE_DIR/screener).",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Fetch bulk-fundamentals + eod-bulk-last-day into a snapshot")
+    build.add_argument("--exchange", required=True, help="Exchange code (e.g. US, NASDAQ, LSE)")
+    build.add_argument("--workers", type=int, default=4, help="Concurrent bulk pages (default: 4)")
+    build.add_argument("--timeout", type=int, default=120, help="HTTP timeout in seconds")
+    build.add_argument("--cache-ttl", type=int, default=0, help="Reuse cached pages younger than N seconds")
+    query = sub.add_parser("query", help="Run a screener query against a snapshot")
+    query.add_argument("--exchange", required=True, help="Snapshot exchange code")
+    query.add_argument("--filters", help='JSON filter array (e.g. \'[["pe","<",15]]\')')
+    query.add_argument("--sort", help="field.direction (e.g. market_capitalization.desc)")
+    query.add_argument("--signals", help="Comma-separated signals (e.g. 200d_new_hi,bookvalue_neg)")
+    query.add_argument("--limit", type=int, default=50, help="Rows to return (default: 50, no cap)")
+    query.add_argument("--offset", type=int, default=0, help="Rows to skip")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        token = os.getenv("EODHD_API_TOKEN")
+        if not token:
+            print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+            return 2
+        try:
+            snapshot = build_snapshot(args.exchange, token, args.workers, args.timeout, args.cache_ttl)
+        except RuntimeError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        path = snapshot_path(args.exchange)
+        snapshot.save(path)
+        print(json.dumps({"exchange": args.exchange, "rows": snapshot.size, "path": path}, indent=2))
+        return 0
+
+    path = snapshot_path(args.exchange)
+    if not os.path.exists(path):
+        print(f"Error: no snapshot for {args.exchange}; run: local_screener.py build --exchange {args.exchange}",
+              file=sys.stderr)
+        return 2
+    try:
+        filters = json.loads(args.filters) if args.filters else None
+        if filters is not None and not isinstance(filters, list):
+            raise ValueError("--filters must be a JSON array of [field, operation, value] triples")
+        result = Snapshot.load(path).query(filters, args.sort, args.signals, args.limit, args.offset)
+    except (ValueError, json.JSONDecodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Countries x indicators macro panel for the macro-dashboard skill.
+
+``macro-indicator`` returns one indicator for one country per request. This
+script fetches the whole grid concurrently (one call per cell), reuses cached
+responses (macro series change a few times a year), and aligns the cells into
+a single date x (country, indicator) table.
+
+Responses are parsed with ``eodhd_client.parse_response``, which lowercases
+the PascalCase keys (Date/Value/...) while decoding — no second pass.
+
+Requires:
+  EODHD_API_TOKEN environment variable.
+
+Examples:
+  # G7 inflation and unemployment since 2010, as JSON
+  python macro_panel.py --countries USA,GBR,DEU,FRA,ITA,JPN,CAN \\
+      --indicators inflation_consumer_prices_annual,unemployment_total_percent --from-date 2010-01-01
+
+  # Markdown table for a dashboard, latest 5 periods
+  python macro_panel.py --countries USA,CHN --indicators gdp_growth_annual,debt_percent_gdp --last 5 --markdown
+
+  # CSV
+  python macro_panel.py --countries USA,GBR --indicators real_interest_rate --csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+
+import eodhd_client
+
+DEFAULT_CACHE_TTL = 86400
+
+
+def column_name(country: str, indicator: str) -> str:
+    return f"{country}:{indicator}"
+
+
+def fetch_panel(token: str, countries: list[str], indicators: list[str], workers: int = 8,
+                **kwargs) -> tuple[dict[str, dict[str, float]], dict[str, str]]:
+    """Fetch every (country, indicator) cell → (``{column: {date: value}}``, ``{column: error}``).
+
+    A failing or empty cell is reported in the error map instead of aborting
+    the grid. ``kwargs`` go to fetch_many (``timeout``, ``cache_ttl``, ...).
+    """
+    cells = [(c, i) for c in countries for i in indicators]
+    calls = [{"endpoint": "macro-indicator", "symbol": c, "params": {"indicator": i}} for c, i in cells]
+    results = eodhd_client.fetch_many(calls, token, workers=workers, return_exceptions=True, **kwargs)
+    series: dict[str, dict[str, float]] = {}
+    errors: dict[str, str] = {}
+    for (country, indicator), payload in zip(cells, results):
+        name = column_name(country, indicator)
+        if isinstance(payload, Exception):
+            errors[name] = str(payload)
+            continue
+        if not isinstance(payload, list):
+            # e.g. {"error": "Indicator or Country are Not Found"} or a plain message
+            errors[name] = str(payload.get("error", payload) if isinstance(payload, dict) else payload)
+            continue
+        points = {row["date"]: row.get("value") for row in payload
+                  if isinstance(row, dict) and row.get("date")}
+        if not points:
+            errors[name] = "no data"
+            continue
+        # Unknown indicator codes can silently fall back to GDP; flag a mismatch.
+        returned = {row.get("indicator") for row in payload if isinstance(row, dict)} - {None}
+        if returned and indicator not in returned:
+            errors[name] = f"API returned {', '.join(sorted(returned))} instead of {indicator}"
+            continue
+        series[name] = points
+    return series, errors
+
+
+def align(series: dict[str, dict[str, float]], columns: list[str], from_date: str | None = None,
+          to_date: str | None = None, last: int | None = None) -> list[dict]:
+    """Union of dates (ascending) → rows ``{"date", <column>: value or None, ...}``."""
+    dates = sorted({d for points in series.values() for d in points})
+    if from_date:
+        dates = [d for d in dates if d >= from_date]
+    if to_date:
+        dates = [d for d in dates if d <= to_date]
+    if last:
+        dates = dates[-last:]
+    return [{"date": d, **{c: series.get(c, {}).get(d) for c in columns}} for d in dates]
+
+
+def render_csv(rows: list[dict], columns: list[str]) -> str:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=["date"] + columns, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+def _fmt(value) -> str:
+    if value is None:
+        return "—"
+    if isinstance(value, (int, float)) and abs(value) >= 1e6:
+        return f"{value:,.0f}"
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+
+def render_markdown(rows: list[dict], columns: list[str]) -> str:
+    lines = ["| Date | " + " | ".join(columns) + " |",
+             "|------|" + "|".join("---:" for _ in columns) + "|"]
+    for row in rows:
+        lines.append(f"| {row['date']} | " + " | ".join(_fmt(row[c]) for c in columns) + " |")
+    return "\n".join(lines)
+
+
+def _codes(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Fetch a countries x indicators macro panel from EODHD",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--countries", required=True, help="Comma-separated ISO alpha-3 codes (e.g. USA,GBR,DEU)")
+    parser.add_argument("--indicators", required=True,
+                        help="Comma-separated indicator codes (e.g. gdp_growth_annual,inflation_consumer_prices_annual)")
+    parser.add_argument("--from-date", help="Keep dates >= YYYY-MM-DD")
+    parser.add_argument("--to-date", help="Keep dates <= YYYY-MM-DD")
+    parser.add_argument("--last", type=int, help="Keep only the latest N dates")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent requests (default: 8)")
+    parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds")
+    parser.add_argument("--cache-ttl", type=int,
+                        default=int(os.getenv("EODHD_CACHE_TTL", str(DEFAULT_CACHE_TTL))),
+                        help=f"Reuse cached cells younger than N seconds (default: {DEFAULT_CACHE_TTL}; 0 = off)")
+    out = parser.add_mutually_exclusive_group()
+    out.add_argument("--csv", action="store_true", help="Output CSV instead of JSON")
+    out.add_argument("--markdown", action="store_true", help="Output a Markdown table")
+    args = parser.parse_args()
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        return 2
+    countries = [c.upper() for c in _codes(args.countries)]
+    indicators = _codes(args.indicators)
+    columns = [column_name(c, i) for c in countries for i in indicators]
+
+    series, errors = fetch_panel(token, countries, indicators, args.workers,
+                                 timeout=args.timeout, cache_ttl=args.cache_ttl)
+    for name, message in errors.items():
+        print(f"Warning: {name}: {message}", file=sys.stderr)
+    if not series:
+        print("Error: no panel cell returned data", file=sys.stderr)
+        return 1
+    rows = align(series, columns, args.from_date, args.to_date, args.last)
+
+    if args.csv:
+        sys.stdout.write(render_csv(rows, columns))
+    elif args.markdown:
+        print(render_markdown(rows, columns))
+    else:
+        print(json.dumps({"columns": columns, "data": rows, "errors": errors}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -26,6 +26,9 @@ Examples:
 
   # Output as CSV
   python market_cap_series.py --symbol AAPL.US --from-date 2025-01-01 --to-date 2025-03-31 --csv
+
+  # Where does a long run spend its time? (pstats file + hotspot table on stderr)
+  python market_cap_series.py --symbol AAPL.US --from-date 2000-01-01 --to-date 2025-03-31 --profile
 """
 
 from __future__ import annotations
@@ -38,6 +41,16 @@ import urllib.error
 import urllib.parse
 import urllib.request
 
+try:
+    import epoch_dates
+except ImportError:  # loaded by file path without scripts/ on sys.path
+    import importlib.util
+
+    _spec = importlib.util.spec_from_file_location(
+        "epoch_dates", os.path.join(os.path.dirname(os.path.abspath(__file__)), "epoch_dates.py"))
+    epoch_dates = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(epoch_dates)
+
 BASE_URL = "https://eodhd.com/api"
 
 
@@ -84,6 +97,13 @@ def get_shares_outstanding(symbol: str, token: str) -> float | None:
     return None
 
 
+def _epoch_day_or_none(value) -> int | None:
+    try:
+        return epoch_dates.epoch_day(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def get_historical_market_cap_api(symbol: str, token: str, from_date: str, to_date: str) -> list[dict]:
     """Fetch from the dedicated /historical-market-cap endpoint (US only, weekly)."""
     params = urllib.parse.urlencode({
@@ -97,14 +117,21 @@ def get_historical_market_cap_api(symbol: str, token: str, from_date: str, to_da
     if isinstance(data, dict) and "error" in data:
         raise RuntimeError(f"Historical Market Cap API error: {data['error']}")
     # Response is {"0": {"date": ..., "value": ...}, "1": ...}
-    if isinstance(data, dict):
-        rows = [v for _, v in sorted(data.items(), key=lambda x: int(x[0]) if x[0].isdigit() else 0)]
-    else:
-        rows = data
+    rows = list(data.values()) if isinstance(data, dict) else data
+    rows = [r for r in rows if isinstance(r, dict) and "date" in r and "value" in r]
+    # Order and clip by epoch day (integer comparisons), not by the object keys.
+    start, end = epoch_dates.epoch_day(from_date), epoch_dates.epoch_day(to_date)
+    try:
+        days = epoch_dates.epoch_days(r["date"] for r in rows)
+    except (ValueError, TypeError):
+        # A malformed or null date cannot be placed on the epoch-day axis: drop
+        # those rows rather than abort the whole series.
+        rows = [r for r in rows if _epoch_day_or_none(r["date"]) is not None]
+        days = epoch_dates.epoch_days(r["date"] for r in rows)
     return [
         {"date": r["date"], "market_cap": r["value"]}
-        for r in rows
-        if isinstance(r, dict) and "date" in r and "value" in r
+        for day, r in sorted(zip(days, rows), key=lambda pair: pair[0])
+        if start <= day <= end
     ]
 
 
@@ -176,8 +203,28 @@ def main() -> int:
     )
     parser.add_argument("--csv", action="store_true", help="Output as CSV instead of JSON")
     parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds")
+    parser.add_argument("--profile", nargs="?", const="market_cap_series.pstats", metavar="FILE",
+                        help="Run under cProfile + tracemalloc: write a pstats file (default "
+                             "market_cap_series.pstats) and print the hotspots to stderr")
+    parser.add_argument("--profile-top", type=int, default=15, metavar="N",
+                        help="Functions listed in the --profile report (default: 15)")
     args = parser.parse_args()
+    if args.profile:
+        import eodhd_profile
+
+        return eodhd_profile.run(lambda: run(args), args.profile, args.profile_top)
+    return run(args)
 
+
+def run(args: argparse.Namespace) -> int:
+    """Fetch, compute and print the series; main() wraps it for --profile."""
+    try:
+        if epoch_dates.epoch_day(args.from_date) > epoch_dates.epoch_day(args.to_date):
+            print("Error: --from-date is after --to-date", file=sys.stderr)
+            return 2
+    except ValueError as exc:
+        print(f"Error: dates must be YYYY-MM-DD: {exc}", file=sys.stderr)
+        return 2
     token = os.getenv("EODHD_API_TOKEN")
     if not token:
         print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Local inverted index and word weights over the news_store.py article store.
+
+Once ``news`` is cached by news_store.py, keyword, ticker and date queries can
+be answered without calling the API again. The index maps
+
+  stemmed token -> [doc, ...]
+  symbol        -> [doc, ...]
+  day           -> [doc, ...]
+
+where ``doc`` is a row in a small table of (article id, day, byte offset into
+articles.ndjson, token count). It is built incrementally: each run indexes
+only the lines appended since the last one and is saved next to the store as
+index.json; an index written in another FORMAT is rebuilt from scratch.
+
+``word-weights`` computes the same kind of answer as the ``news-word-weights``
+endpoint (each stem's share of all indexed tokens in the window) from the
+matched articles for the days news_store.py has complete coverage of for the
+symbol, and calls the slow, AI-backed endpoint only for the uncovered part of
+the window. Partial results are merged weighted by article count.
+
+Requires:
+  EODHD_API_TOKEN environment variable (word-weights over uncovered ranges only).
+
+Examples:
+  # Articles mentioning both words, newest first
+  python news_index.py search tariff china --symbol AAPL.US --from-date 2026-09-01
+
+  # Everything stored for a ticker on one day
+  python news_index.py search --symbol NVDA.US --from-date 2026-10-14 --to-date 2026-10-14
+
+  # Top words; local where ingested, API for the rest
+  python news_index.py word-weights --symbol AAPL.US --from-date 2026-09-01 --to-date 2026-10-14 --limit 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import re
+import sys
+from collections import Counter
+
+import eodhd_client
+from news_store import STORE_DIR, NewsStore
+
+FORMAT = 2  # 2: term postings are doc lists (1 interleaved per-doc term counts)
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset("""
+a about after again against all also am an and any are as at be because been before being between both
+but by can could did do does doing down during each few for from further had has have having he her here
+hers him his how i if in into is it its itself just more most my no nor not now of off on once only or
+other our ours out over own same she should so some such than that the their theirs them then there these
+they this those through to too under until up very was we were what when where which while who whom why
+will with would you your yours said says say new inc corp co ltd year years also per one two
+""".split())
+
+
+def stem(word: str) -> str:
+    """Light suffix stripping, close to the endpoint's stems ("companies" -> "compani", "apple" -> "appl")."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if word.endswith("ies"):
+        word = word[:-2]
+    elif word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("ing") and len(word) > 5:
+        word = word[:-3]
+    elif word.endswith("ed") and len(word) > 4:
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    if word.endswith("e") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    return [stem(t) for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def article_terms(article: dict) -> Counter:
+    """Stem -> count over an article's title and content."""
+    return Counter(tokenize(f"{article.get('title') or ''} {article.get('content') or ''}"))
+
+
+class NewsIndex:
+    """Incrementally maintained postings over a NewsStore's articles.ndjson."""
+
+    def __init__(self, store: NewsStore, path: str | None = None):
+        self.store = store
+        self.path = path or os.path.join(store.path, "index.json")
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        if data.get("format") != FORMAT:
+            data = {}
+        self.offset: int = data.get("offset", 0)
+        self.docs: list[list] = data.get("docs", [])  # [article id, day, byte offset, token count]
+        self.terms: dict[str, list[int]] = data.get("terms", {})
+        self.symbols: dict[str, list[int]] = data.get("symbols", {})
+        self.days: dict[str, list[int]] = data.get("days", {})
+
+    def update(self) -> int:
+        """Index lines appended to the store since the last update; returns how many."""
+        try:
+            size = os.path.getsize(self.store.articles_path)
+        except OSError:
+            size = 0
+        if size < self.offset:  # store rewritten: start over
+            self.offset, self.docs, self.terms, self.symbols, self.days = 0, [], {}, {}, {}
+        added = 0
+        if size == self.offset:
+            return added
+        with open(self.store.articles_path, "rb") as fh:
+            fh.seek(self.offset)
+            for raw in fh:
+                pos, self.offset = self.offset, self.offset + len(raw)
+                if not raw.strip():
+                    continue
+                article = json.loads(raw)
+                doc = len(self.docs)
+                day = (article.get("date") or "")[:10]
+                counts = article_terms(article)
+                self.docs.append([article["id"], day, pos, sum(counts.values())])
+                for term in counts:
+                    self.terms.setdefault(term, []).append(doc)
+                for symbol in article.get("symbols") or []:
+                    self.symbols.setdefault(symbol, []).append(doc)
+                self.days.setdefault(day, []).append(doc)
+                added += 1
+        return added
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"format": FORMAT, "offset": self.offset, "docs": self.docs, "terms": self.terms,
+                       "symbols": self.symbols, "days": self.days}, fh, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def _window(self, date_from: str | None, date_to: str | None) -> set[int] | None:
+        if not date_from and not date_to:
+            return None
+        lo, hi = date_from or "", date_to or "9999"
+        return {d for day, docs in self.days.items() if lo <= day <= hi for d in docs}
+
+    def match(self, words: list[str] | None = None, symbol: str | None = None,
+              date_from: str | None = None, date_to: str | None = None) -> set[int]:
+        """Doc numbers containing every word, tagged with ``symbol`` and dated within the window."""
+        sets = []
+        for term in {t for w in words or [] for t in tokenize(w)}:
+            sets.append(set(self.terms.get(term, ())))
+        if symbol:
+            sets.append(set(self.symbols.get(symbol, ())))
+        window = self._window(date_from, date_to)
+        if window is not None:
+            sets.append(window)
+        if not sets:
+            return set(range(len(self.docs)))
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def search(self, words: list[str] | None = None, symbol: str | None = None,
+               date_from: str | None = None, date_to: str | None = None, limit: int = 50) -> list[dict]:
+        """Matching articles, newest first, read back from the store by offset."""
+        docs = sorted(self.match(words, symbol, date_from, date_to),
+                      key=lambda d: (self.docs[d][1], d), reverse=True)[:limit]
+        return list(self.articles(docs))
+
+    def articles(self, docs):
+        """Yield the stored article of each doc, read back by byte offset."""
+        if not docs:
+            return
+        with open(self.store.articles_path, "rb") as fh:
+            for d in docs:
+                fh.seek(self.docs[d][2])
+                yield json.loads(fh.readline())
+
+    def term_counts(self, symbol: str, date_from: str, date_to: str) -> tuple[Counter, int, int]:
+        """(stem -> count, articles, total tokens) for ``symbol`` within the window.
+
+        Re-tokenizes only the matched articles (in file order) instead of
+        scanning every posting list, so the cost follows the window, not the
+        size of the index.
+        """
+        docs = self.match(None, symbol, date_from, date_to)
+        counts: Counter = Counter()
+        for article in self.articles(sorted(docs, key=lambda d: self.docs[d][2])):
+            counts.update(article_terms(article))
+        return counts, len(docs), sum(self.docs[d][3] for d in docs)
+
+
+def uncovered(date_from: str, date_to: str, coverage: tuple[str, str] | None) -> list[tuple[str, str]]:
+    """Sub-ranges of ``date_from``..``date_to`` outside the store's coverage for a symbol."""
+    if not coverage:
+        return [(date_from, date_to)]
+    since, checked = coverage
+    day = datetime.timedelta(days=1)
+    out = []
+    if date_from < since:
+        out.append((date_from, min(date_to, (datetime.date.fromisoformat(since) - day).isoformat())))
+    if date_to > checked:
+        out.append((max(date_from, (datetime.date.fromisoformat(checked) + day).isoformat()), date_to))
+    return [(a, b) for a, b in out if a <= b]
+
+
+def word_weights(index: NewsIndex, token: str, symbol: str, date_from: str, date_to: str,
+                 limit: int = 20, **kwargs) -> dict:
+    """``news-word-weights``-shaped result, computed locally where the store covers the window."""
+    coverage = index.store.coverage(symbol)
+    gaps = uncovered(date_from, date_to, coverage)
+    weighted: Counter = Counter()
+    processed = local_docs = 0
+    if coverage and max(date_from, coverage[0]) <= min(date_to, coverage[1]):
+        counts, local_docs, total = index.term_counts(symbol, max(date_from, coverage[0]),
+                                                      min(date_to, coverage[1]))
+        if total:
+            # Token shares scaled by article count, so they merge with the API's per-range weights.
+            weighted.update({t: n / total * local_docs for t, n in counts.items()})
+        processed += local_docs
+    if gaps:
+        calls = [{"endpoint": "news-word-weights", "normalize": False,
+                  "params": {"s": symbol, "filter[date_from]": a, "filter[date_to]": b,
+                             "page[limit]": max(limit * 5, 100)}} for a, b in gaps]
+        for (a, b), payload in zip(gaps, eodhd_client.fetch_many(calls, token, **kwargs)):
+            if not isinstance(payload, dict) or "data" not in payload:
+                raise eodhd_client.ClientError(f"news-word-weights API error for {a}..{b}: {payload}")
+            n = (payload.get("meta") or {}).get("news_processed") or 0
+            for word, weight in (payload.get("data") or {}).items():
+                weighted[stem(word)] += float(weight) * n
+            processed += n
+    data = {t: round(w / processed, 5) for t, w in weighted.most_common(limit)} if processed else {}
+    return {"data": data, "meta": {"news_processed": processed, "local_articles": local_docs,
+                                   "api_ranges": [list(g) for g in gaps]}}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Full-text search and word weights over the local news store",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--store", default=STORE_DIR, help="Store directory (default: EODHD_CACHE_DIR/news)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("update", help="Index articles appended since the last run")
+    search = sub.add_parser("search", help="Articles matching every word (and ticker / date filters)")
+    search.add_argument("words", nargs="*", help="Keywords (all must match)")
+    search.add_argument("--symbol", help="Only articles tagged with this ticker")
+    search.add_argument("--from-date", help="YYYY-MM-DD")
+    search.add_argument("--to-date", help="YYYY-MM-DD")
+    search.add_argument("--limit", type=int, default=20, help="Max articles (default: 20)")
+    search.add_argument("--full", action="store_true", help="Include article content")
+    ww = sub.add_parser("word-weights", help="Top weighted words for a ticker over a window")
+    ww.add_argument("--symbol", required=True)
+    ww.add_argument("--from-date", required=True, help="YYYY-MM-DD")
+    ww.add_argument("--to-date", default=datetime.date.today().isoformat(), help="YYYY-MM-DD (default: today)")
+    ww.add_argument("--limit", type=int, default=20, help="Number of words (default: 20)")
+    ww.add_argument("--timeout", type=int, default=120, help="HTTP timeout for the API fallback (default: 120)")
+    args = parser.parse_args()
+
+    index = NewsIndex(NewsStore(args.store))
+    token = os.getenv("EODHD_API_TOKEN")
+    if (args.command == "word-weights" and not token
+            and uncovered(args.from_date, args.to_date, index.store.coverage(args.symbol))):
+        print("Error: EODHD_API_TOKEN environment variable is not set "
+              "(needed for dates the news store does not cover)", file=sys.stderr)
+        return 2
+    added = index.update()
+    if added:
+        index.save()
+    try:
+        if args.command == "update":
+            result = {"indexed": added, "articles": len(index.docs), "terms": len(index.terms)}
+        elif args.command == "search":
+            result = index.search(args.words, args.symbol, args.from_date, args.to_date, args.limit)
+            if not args.full:
+                result = [{k: a.get(k) for k in ("date", "title", "link", "symbols")} for a in result]
+        else:
+            result = word_weights(index, token, args.symbol, args.from_date,
+                                  args.to_date, args.limit, timeout=args.timeout)
+    except eodhd_client.ClientError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Incremental news ingester with per-symbol high-water marks.
+
+Monitoring jobs used to re-download the same ``news`` pages every cycle.
+``ingest`` keeps, for each symbol, the timestamp of the newest article seen
+plus the link hashes published at that instant, and on the next run requests
+only ``from=<that day>``, paging until it reaches the mark. Articles are
+de-duplicated across symbols (one article is often tagged with many tickers)
+by a hash of their link and appended once to a compact NDJSON store:
+
+  <store>/articles.ndjson   one article per line, {"id": ..., "date": ..., ...}
+  <store>/state.json        {"marks": {symbol: {"date", "ids", "since", "checked"[, "resume"]}}}
+
+``since``/``checked`` record the date range each symbol's stream is complete
+for; news_index.py uses them to decide which windows it can answer locally.
+When a run stops at MAX_PAGES before reaching a symbol's mark, the mark
+stays put and ``resume`` records the gap: the next run pages only from the
+mark ``to`` the oldest article fetched, and the mark jumps to the newest one
+once the gap is closed.
+
+Requires:
+  EODHD_API_TOKEN environment variable (ingest only).
+
+Examples:
+  # First run backfills 30 days, later runs fetch only what is new
+  python news_store.py ingest --symbols AAPL.US,MSFT.US,NVDA.US --backfill-days 30
+
+  # Print the newly stored articles as NDJSON (for a downstream consumer)
+  python news_store.py ingest --symbols AAPL.US --emit
+
+  # Store summary
+  python news_store.py stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import sys
+
+import eodhd_client
+
+STORE_DIR = os.path.join(eodhd_client.CACHE_DIR, "news")
+PAGE_LIMIT = 100
+MAX_PAGES = 50  # per symbol per run; a backstop against a runaway backfill
+FIELDS = ("date", "title", "content", "link", "symbols", "tags", "sentiment")
+
+
+def article_id(article: dict) -> str:
+    """Stable 16-hex id from the article link (title + date when the link is missing)."""
+    basis = article.get("link") or f"{article.get('date')}|{article.get('title')}"
+    return hashlib.sha256(basis.encode("utf-8")).hexdigest()[:16]
+
+
+class NewsStore:
+    """Append-only article store plus per-symbol ingestion marks."""
+
+    def __init__(self, path: str = STORE_DIR):
+        self.path = path
+        self.articles_path = os.path.join(path, "articles.ndjson")
+        self.state_path = os.path.join(path, "state.json")
+        try:
+            with open(self.state_path, encoding="utf-8") as fh:
+                self.state = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            self.state = {"marks": {}}
+        self._ids: set[str] | None = None
+
+    @property
+    def ids(self) -> set[str]:
+        """Every stored article id (read lazily from the id prefix of each line)."""
+        if self._ids is None:
+            self._ids = {article_id_from_line(line) for line in self._lines()}
+        return self._ids
+
+    def _lines(self):
+        try:
+            with open(self.articles_path, encoding="utf-8") as fh:
+                yield from (line for line in fh if line.strip())
+        except FileNotFoundError:
+            return
+
+    def __iter__(self):
+        """Yield stored articles in ingestion order."""
+        for line in self._lines():
+            yield json.loads(line)
+
+    def append(self, articles: list[dict]) -> list[dict]:
+        """Store articles not seen before; returns the ones actually written."""
+        fresh = []
+        for article in articles:
+            aid = article_id(article)
+            if aid in self.ids:
+                continue
+            self.ids.add(aid)
+            fresh.append({"id": aid, **{k: article.get(k) for k in FIELDS if article.get(k) is not None}})
+        if fresh:
+            os.makedirs(self.path, exist_ok=True)
+            with open(self.articles_path, "a", encoding="utf-8") as fh:
+                for record in fresh:
+                    fh.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n")
+        return fresh
+
+    def save_state(self) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.state, fh, separators=(",", ":"))
+        os.replace(tmp, self.state_path)
+
+    def coverage(self, symbol: str) -> tuple[str, str] | None:
+        """(first, last) day the symbol's stream is complete for, or None."""
+        mark = self.state["marks"].get(symbol)
+        return (mark["since"], mark["checked"]) if mark else None
+
+
+def article_id_from_line(line: str) -> str:
+    # Lines are written as {"id":"<16 hex>",...}; avoid a full JSON parse per line.
+    if line.startswith('{"id":"') and line[23:24] == '"':
+        return line[7:23]
+    return json.loads(line)["id"]
+
+
+def _is_new(article: dict, mark: dict | None) -> bool:
+    if not mark:
+        return True
+    date = article.get("date") or ""
+    return date > mark["date"] or (date == mark["date"] and article_id(article) not in mark["ids"])
+
+
+def _advance(mark: dict, articles: list[dict]) -> dict:
+    """``mark`` moved to the newest of ``articles``, with the ids published at that instant."""
+    newest = max((a.get("date") or "" for a in articles), default="")
+    if newest > mark["date"]:
+        mark = dict(mark, date=newest, ids=[])
+    ids = {article_id(a) for a in articles if (a.get("date") or "") == mark["date"]}
+    return dict(mark, ids=sorted(set(mark["ids"]) | ids))
+
+
+def _call(symbol: str, since: str, offset: int, until: str | None = None) -> dict:
+    params = {"s": symbol, "from": since, "limit": PAGE_LIMIT, "offset": offset}
+    if until:
+        params["to"] = until
+    return {"endpoint": "news", "params": params}
+
+
+def ingest(store: NewsStore, token: str, symbols: list[str], backfill_days: int = 7,
+           today: datetime.date | None = None, workers: int = 8, **kwargs) -> dict:
+    """Fetch only articles newer than each symbol's mark and append the unseen ones.
+
+    Returns ``{"new": [stored articles], "fetched": n, "duplicates": n, "per_symbol": {...}}``.
+    """
+    today = today or datetime.date.today()
+    marks = store.state["marks"]
+    start = {s: ((marks[s]["date"][:10] or marks[s]["since"]) if s in marks
+                 else (today - datetime.timedelta(days=backfill_days)).isoformat()) for s in symbols}
+    until = {s: marks[s]["resume"]["to"][:10] if "resume" in marks.get(s, {}) else None for s in symbols}
+    found: dict[str, list[dict]] = {s: [] for s in symbols}
+    pending = {s: 0 for s in symbols}
+    pages = 0
+    while pending and pages < MAX_PAGES:
+        order = list(pending)
+        payloads = eodhd_client.fetch_many([_call(s, start[s], pending[s], until[s]) for s in order],
+                                           token, workers=workers, **kwargs)
+        pages += 1
+        nxt = {}
+        for symbol, payload in zip(order, payloads):
+            if isinstance(payload, dict):
+                raise eodhd_client.ClientError(f"news API error for {symbol}: {payload.get('error', payload)}")
+            page = [a for a in payload or [] if isinstance(a, dict)]
+            new = [a for a in page if _is_new(a, marks.get(symbol))]
+            found[symbol].extend(new)
+            # Newest-first: stop at a short page or once the page reaches the mark.
+            if len(page) == PAGE_LIMIT and len(new) == len(page):
+                nxt[symbol] = pending[symbol] + PAGE_LIMIT
+        pending = nxt
+
+    fetched = sum(len(v) for v in found.values())
+    merged = [a for s in symbols for a in found[s]]
+    stored = store.append(sorted(merged, key=lambda a: a.get("date") or ""))
+    per_symbol = {}
+    for symbol in symbols:
+        articles = found[symbol]
+        old = marks.get(symbol)
+        if old and symbol in pending:
+            # Cut short by MAX_PAGES between the mark and the oldest article fetched:
+            # keep the mark and coverage, and resume the gap next run.
+            resume = old.get("resume") or {"date": "", "ids": [], "checked": today.isoformat()}
+            oldest = min(a.get("date") or "" for a in articles)
+            mark = dict(old, resume=_advance(dict(resume, to=oldest), articles))
+        elif old and "resume" in old:
+            # Gap closed: the stream is complete up to the run that opened it, whose
+            # newest article becomes the mark.
+            resume = old["resume"]
+            mark = {k: v for k, v in old.items() if k != "resume"}
+            mark.update(date=resume["date"], ids=resume["ids"], checked=resume["checked"])
+            mark = _advance(mark, articles)
+        else:
+            mark = _advance(dict(old or {"date": "", "ids": [], "since": start[symbol]},
+                                 checked=today.isoformat()), articles)
+            if symbol in pending:
+                # Backfill cut short by MAX_PAGES: only claim coverage for what was fetched.
+                mark["since"] = min(a.get("date") or "" for a in articles)[:10] or mark["since"]
+        marks[symbol] = mark
+        per_symbol[symbol] = len(articles)
+    store.save_state()
+    return {"new": stored, "fetched": fetched, "duplicates": fetched - len(stored), "per_symbol": per_symbol}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Incremental news ingester with de-duplication",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--store", default=STORE_DIR, help="Store directory (default: EODHD_CACHE_DIR/news)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ing = sub.add_parser("ingest", help="Fetch and store articles newer than each symbol's mark")
+    ing.add_argument("--symbols", required=True, help="Comma-separated tickers (e.g. AAPL.US,MSFT.US)")
+    ing.add_argument("--backfill-days", type=int, default=7, help="History to fetch for a new symbol (default: 7)")
+    ing.add_argument("--emit", action="store_true", help="Print newly stored articles as NDJSON instead of a summary")
+    ing.add_argument("--workers", type=int, default=8, help="Concurrent requests (default: 8)")
+    ing.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds")
+    sub.add_parser("stats", help="Show store size and per-symbol marks")
+    args = parser.parse_args()
+
+    store = NewsStore(args.store)
+    if args.command == "stats":
+        print(json.dumps({"articles": len(store.ids), "path": store.path,
+                          "marks": store.state["marks"]}, indent=2))
+        return 0
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        return 2
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+    try:
+        result = ingest(store, token, symbols, args.backfill_days, workers=args.workers, timeout=args.timeout)
+    except eodhd_client.ClientError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    if args.emit:
+        for article in result["new"]:
+            sys.stdout.write(json.dumps(article, ensure_ascii=False) + "\n")
+    else:
+        print(json.dumps({k: v for k, v in result.items() if k != "new"} | {"stored": len(result["new"])},
+                         indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
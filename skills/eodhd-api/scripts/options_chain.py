@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Options-chain downloader and columnar chain analysis for the options-analyzer skill.
+
+``download`` walks every page of ``us-options-contracts`` (current chain) or
+``us-options-eod`` (one trading day, ``--tradetime``) for many underlyings at
+once. The first page of each underlying reports ``meta.total``; all remaining
+pages are then requested together in one concurrent wave. A chain too large
+for the API's 10,000-row offset ceiling is split into expiration-date windows
+(and, for a single crowded expiration, calls and puts) until each part fits.
+Each underlying is stored as one columnar file (``{field: [values...]}``)
+under ``EODHD_CACHE_DIR/options`` together with the underlying's spot price.
+
+``analyze`` loads a stored chain and runs black_scholes.py over all of its
+contracts at once — implied volatility from the bid/ask midpoint (last price
+when there is no two-sided quote), then delta, gamma, vega and theta — and
+reports the term structure (ATM IV, 25-delta skew, open interest and put/call
+ratio per expiration) or one expiration's full chain.
+
+Requires:
+  EODHD_API_TOKEN environment variable (download only).
+
+Examples:
+  # Whole current chains for three underlyings (expirations over the next year)
+  python options_chain.py download --underlyings AAPL,MSFT,NVDA --exp-to 2027-10-31
+
+  # One historical trading day from the EOD feed
+  python options_chain.py download --underlyings AAPL --endpoint us-options-eod --tradetime 2026-10-16
+
+  # Term structure and skew, then one expiration's chain with Greeks as CSV
+  python options_chain.py analyze --underlying AAPL --rate 0.04
+  python options_chain.py analyze --underlying AAPL --expiration 2026-11-20 --csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import math
+import os
+import sys
+
+import black_scholes
+import eodhd_client
+
+STORE_DIR = os.path.join(eodhd_client.CACHE_DIR, "options")
+ENDPOINTS = ("us-options-contracts", "us-options-eod")
+PAGE_LIMIT = 1000
+MAX_OFFSET = 10000
+FIELDS = ("contract", "underlying_symbol", "exp_date", "type", "strike", "bid", "ask", "last",
+          "volume", "open_interest", "tradetime")
+
+
+def _underlying(symbol: str) -> str:
+    return symbol.strip().upper().removesuffix(".US")
+
+
+def _params(shard: tuple, endpoint: str, tradetime: str | None, offset: int) -> dict:
+    underlying, lo, hi, kind = shard
+    params = {"filter[underlying_symbol]": underlying, "filter[exp_date_from]": lo,
+              "filter[exp_date_to]": hi, "page[limit]": PAGE_LIMIT, "page[offset]": offset,
+              "sort": "exp_date", f"fields[{endpoint[3:]}]": ",".join(FIELDS)}
+    if kind:
+        params["filter[type]"] = kind
+    if tradetime:
+        params["filter[tradetime_eq]"] = tradetime
+    if endpoint == "us-options-eod":
+        params["compact"] = 1
+    return params
+
+
+def _rows(payload) -> list[dict]:
+    """Rows of a page in either the attributes or the compact (array) layout."""
+    if not isinstance(payload, dict) or not isinstance(payload.get("data"), list):
+        message = payload.get("error") or payload.get("message") if isinstance(payload, dict) else payload
+        raise eodhd_client.ClientError(f"options API error: {message}")
+    fields = (payload.get("meta") or {}).get("fields") or []
+    out = []
+    for row in payload["data"]:
+        if isinstance(row, list):
+            out.append(dict(zip(fields, row)))
+        elif isinstance(row, dict):
+            out.append(row.get("attributes", row))
+    return out
+
+
+def _split(shard: tuple) -> list[tuple] | None:
+    """Halve a shard's expiration window; a single day splits into calls and puts."""
+    underlying, lo, hi, kind = shard
+    first, last = datetime.date.fromisoformat(lo), datetime.date.fromisoformat(hi)
+    if first < last:
+        mid = first + (last - first) // 2
+        return [(underlying, lo, mid.isoformat(), kind),
+                (underlying, (mid + datetime.timedelta(days=1)).isoformat(), hi, kind)]
+    if kind is None:
+        return [(underlying, lo, hi, "call"), (underlying, lo, hi, "put")]
+    return None
+
+
+def download(token: str, underlyings: list[str], endpoint: str = "us-options-contracts",
+             exp_from: str | None = None, exp_to: str | None = None, tradetime: str | None = None,
+             workers: int = 8, **kwargs) -> tuple[dict[str, list[dict]], dict[str, float | None], list]:
+    """Fetch every contract of each underlying's chain → (rows by underlying, spot, truncated shards)."""
+    today = datetime.date.today()
+    lo = exp_from or (datetime.date.fromisoformat(tradetime) if tradetime else today).isoformat()
+    hi = exp_to or (today + datetime.timedelta(days=3 * 366)).isoformat()
+    names = [_underlying(u) for u in underlyings]
+    # Spot: live quote for the current chain, that day's close for an EOD snapshot.
+    spot_calls = [{"endpoint": "eod", "symbol": f"{u}.US", "params": {"from": tradetime, "to": tradetime}}
+                  if tradetime else {"endpoint": "real-time", "symbol": f"{u}.US"} for u in names]
+    spots = eodhd_client.fetch_many(spot_calls, token, workers=workers, return_exceptions=True, **kwargs)
+    spot = {}
+    for name, quote in zip(names, spots):
+        if isinstance(quote, list):
+            quote = quote[-1] if quote else None
+        value = quote.get("close") if isinstance(quote, dict) else None
+        spot[name] = float(value) if isinstance(value, (int, float)) and value > 0 else None
+
+    rows: dict[str, dict[str, dict]] = {u: {} for u in names}
+    truncated: list[tuple] = []
+    queue = [((u, lo, hi, None), 0) for u in names]
+    while queue:
+        calls = [{"endpoint": endpoint, "params": _params(shard, endpoint, tradetime, offset), "normalize": False}
+                 for shard, offset in queue]
+        payloads = eodhd_client.fetch_many(calls, token, workers=workers, **kwargs)
+        nxt = []
+        for (shard, offset), payload in zip(queue, payloads):
+            page = _rows(payload)
+            for row in page:
+                key = f"{row.get('contract')}|{row.get('tradetime')}"
+                rows[shard[0]][key] = row
+            total = (payload.get("meta") or {}).get("total")
+            if offset == 0 and isinstance(total, int) and total > len(page):
+                if total > MAX_OFFSET + PAGE_LIMIT:
+                    parts = _split(shard)
+                    if parts:
+                        nxt.extend((part, 0) for part in parts)
+                        continue
+                    truncated.append(shard)
+                nxt.extend((shard, o) for o in range(PAGE_LIMIT, min(total, MAX_OFFSET + 1), PAGE_LIMIT))
+            elif total is None and len(page) == PAGE_LIMIT and offset + PAGE_LIMIT <= MAX_OFFSET:
+                nxt.append((shard, offset + PAGE_LIMIT))  # no meta.total: page until a short page
+        queue = nxt
+    return {u: list(r.values()) for u, r in rows.items()}, spot, truncated
+
+
+class Chain:
+    """One underlying's contracts as columns, plus the spot price at download time."""
+
+    def __init__(self, underlying: str, columns: dict[str, list], asof: str, spot: float | None = None):
+        self.underlying = underlying
+        self.columns = columns
+        self.asof = asof
+        self.spot = spot
+
+    @classmethod
+    def from_rows(cls, underlying: str, rows: list[dict], asof: str, spot: float | None = None) -> "Chain":
+        rows = sorted(rows, key=lambda r: (r.get("exp_date") or "", r.get("strike") or 0, r.get("type") or ""))
+        return cls(underlying, {f: [r.get(f) for r in rows] for f in FIELDS}, asof, spot)
+
+    def __len__(self) -> int:
+        return len(self.columns["contract"])
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"underlying": self.underlying, "asof": self.asof, "spot": self.spot,
+                       "columns": self.columns}, fh, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Chain":
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        return cls(data["underlying"], data["columns"], data["asof"], data.get("spot"))
+
+    def option_prices(self) -> list[float | None]:
+        """Bid/ask midpoint when both sides are quoted, else the last trade."""
+        out = []
+        for bid, ask, last in zip(self.columns["bid"], self.columns["ask"], self.columns["last"]):
+            if bid and ask and ask >= bid > 0:
+                out.append((bid + ask) / 2.0)
+            else:
+                out.append(last if last and last > 0 else None)
+        return out
+
+    def years_to_expiry(self) -> list[float]:
+        asof = datetime.date.fromisoformat(self.asof)
+        return [max((datetime.date.fromisoformat(e) - asof).days, 0) / 365.0 if e else 0.0
+                for e in self.columns["exp_date"]]
+
+    def add_greeks(self, rate: float = 0.0, div: float = 0.0, spot: float | None = None,
+                   use_numpy: bool | None = None) -> None:
+        """Add iv/delta/gamma/vega/theta columns for every contract in one vectorized pass.
+
+        ``spot`` overrides the stored price and becomes ``self.spot``, so
+        term_structure picks the ATM strike against the same price.
+        """
+        spot = spot or self.spot
+        if not spot:
+            raise ValueError(f"no spot price for {self.underlying}; pass --spot")
+        self.spot = spot
+        result = black_scholes.chain_greeks(
+            self.option_prices(), spot, [float(k or 0) for k in self.columns["strike"]],
+            self.years_to_expiry(), [t == "call" for t in self.columns["type"]], rate, div, use_numpy)
+        self.columns.update(result)
+
+    def expirations(self) -> list[str]:
+        return sorted({e for e in self.columns["exp_date"] if e})
+
+    def select(self, expiration: str) -> dict[str, list]:
+        rows = [i for i, e in enumerate(self.columns["exp_date"]) if e == expiration]
+        return {f: [c[i] for i in rows] for f, c in self.columns.items()}
+
+    def term_structure(self) -> list[dict]:
+        """Per expiration: ATM IV, 25-delta put/call IV and skew, OI and put/call ratio."""
+        if "iv" not in self.columns:
+            raise ValueError("call add_greeks() first")
+        asof = datetime.date.fromisoformat(self.asof)
+        out = []
+        for exp in self.expirations():
+            part = self.select(exp)
+            calls = [i for i, t in enumerate(part["type"]) if t == "call"]
+            puts = [i for i, t in enumerate(part["type"]) if t == "put"]
+            oi = lambda idx: sum(part["open_interest"][i] or 0 for i in idx)  # noqa: E731
+            with_iv = [i for i in range(len(part["iv"])) if part["iv"][i] is not None]
+            gap = min((abs(part["strike"][i] - self.spot) for i in with_iv), default=None)
+            atm = [part["iv"][i] for i in with_iv if abs(part["strike"][i] - self.spot) == gap]
+            call_oi, put_oi = oi(calls), oi(puts)
+            put25 = _nearest_delta(part, puts, -0.25)
+            call25 = _nearest_delta(part, calls, 0.25)
+            out.append({
+                "expiration": exp,
+                "dte": (datetime.date.fromisoformat(exp) - asof).days,
+                "atm_iv": _round(sum(atm) / len(atm)) if atm else None,
+                "put25_iv": _round(put25),
+                "call25_iv": _round(call25),
+                "skew_25d": _round(put25 - call25) if put25 is not None and call25 is not None else None,
+                "calls_oi": call_oi,
+                "puts_oi": put_oi,
+                "pc_ratio": _round(put_oi / call_oi) if call_oi else None,
+                "contracts": len(part["contract"]),
+            })
+        return out
+
+
+def _nearest_delta(part: dict, idx: list[int], target: float) -> float | None:
+    best = min((i for i in idx if part["delta"][i] is not None), key=lambda i: abs(part["delta"][i] - target),
+               default=None)
+    return None if best is None else part["iv"][best]
+
+
+def _round(x, places: int = 6):
+    return None if x is None or not math.isfinite(x) else round(x, places)
+
+
+def chain_path(store: str, underlying: str) -> str:
+    return os.path.join(store, f"{_underlying(underlying)}.json")
+
+
+def render_csv(columns: dict[str, list]) -> str:
+    fields = list(columns)
+    lines = [",".join(fields)]
+    for row in zip(*(columns[f] for f in fields)):
+        lines.append(",".join("" if v is None else (repr(round(v, 6)) if isinstance(v, float) else str(v))
+                              for v in row))
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Download whole US options chains and compute IV/Greeks locally",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--store", default=STORE_DIR, help="Chain directory (default: EODHD_CACHE_DIR/options)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    dl = sub.add_parser("download", help="Fetch every page of each underlying's chain")
+    dl.add_argument("--underlyings", required=True, help="Comma-separated underlyings (AAPL or AAPL.US)")
+    dl.add_argument("--endpoint", choices=ENDPOINTS, default="us-options-contracts",
+                    help="Current chain (contracts, default) or EOD snapshots (eod, use --tradetime)")
+    dl.add_argument("--exp-from", help="First expiration YYYY-MM-DD (default: today)")
+    dl.add_argument("--exp-to", help="Last expiration YYYY-MM-DD (default: three years out)")
+    dl.add_argument("--tradetime", help="us-options-eod: trading day YYYY-MM-DD")
+    dl.add_argument("--workers", type=int, default=8, help="Concurrent requests (default: 8)")
+    dl.add_argument("--timeout", type=int, default=60, help="HTTP timeout in seconds (default: 60)")
+    an = sub.add_parser("analyze", help="IV/Greeks for a stored chain: term structure or one expiration")
+    an.add_argument("--underlying", required=True)
+    an.add_argument("--expiration", help="Print this expiration's chain with Greeks instead of the term structure")
+    an.add_argument("--rate", type=float, default=0.04, help="Risk-free rate, continuous (default: 0.04)")
+    an.add_argument("--div", type=float, default=0.0, help="Dividend yield, continuous (default: 0)")
+    an.add_argument("--spot", type=float, help="Override the stored underlying price")
+    an.add_argument("--csv", action="store_true", help="CSV output")
+    args = parser.parse_args()
+
+    if args.command == "analyze":
+        try:
+            chain = Chain.load(chain_path(args.store, args.underlying))
+        except (OSError, json.JSONDecodeError, KeyError) as exc:
+            print(f"Error: no stored chain for {args.underlying} ({exc}); run download first", file=sys.stderr)
+            return 1
+        try:
+            chain.add_greeks(args.rate, args.div, args.spot)
+            result = chain.select(args.expiration) if args.expiration else chain.term_structure()
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        if args.csv:
+            columns = result if args.expiration else {k: [r[k] for r in result] for k in (result[0] if result else {})}
+            sys.stdout.write(render_csv(columns))
+        else:
+            print(json.dumps({"underlying": chain.underlying, "asof": chain.asof, "spot": args.spot or chain.spot,
+                              "data": result}, separators=(",", ":") if args.expiration else None,
+                             indent=None if args.expiration else 2))
+        return 0
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        return 2
+    underlyings = [u for u in args.underlyings.split(",") if u.strip()]
+    try:
+        rows, spot, truncated = download(token, underlyings, args.endpoint, args.exp_from, args.exp_to,
+                                         args.tradetime, args.workers, timeout=args.timeout)
+    except eodhd_client.ClientError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    for shard in truncated:
+        print(f"Warning: {shard[0]} {shard[3] or ''} expiring {shard[1]} exceeds the offset ceiling; truncated",
+              file=sys.stderr)
+    asof = args.tradetime or datetime.date.today().isoformat()
+    summary = {}
+    for name, chain_rows in rows.items():
+        chain = Chain.from_rows(name, chain_rows, asof, spot[name])
+        chain.save(chain_path(args.store, name))
+        summary[name] = {"contracts": len(chain), "expirations": len(chain.expirations()), "spot": chain.spot}
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
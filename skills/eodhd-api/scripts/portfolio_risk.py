@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""Portfolio risk metrics for the portfolio-risk skill.
+
+Method:
+  1. Fetch /eod/{SYMBOL} for every holding (and the benchmark) concurrently.
+  2. Align all series on the benchmark's trading-date index, forward-filling
+     gaps and starting at the first date every series has a price.
+  3. Compute daily returns for the whole T x N price matrix at once and derive
+     annualized return/volatility, max drawdown, beta, Sharpe and correlation
+     per holding and for the weighted (daily-rebalanced) portfolio.
+
+NumPy is used when installed; otherwise a stdlib fallback computes the same
+numbers column by column. Prices use adjusted_close (falls back to close).
+
+Requires:
+  EODHD_API_TOKEN environment variable.
+
+Examples:
+  # Equal-weighted portfolio vs the S&P 500, last 12 months
+  python portfolio_risk.py --symbols AAPL.US,MSFT.US,NVDA.US
+
+  # Custom weights and window, markdown tables for the skill report
+  python portfolio_risk.py --symbols AAPL.US,MSFT.US,JNJ.US --weights 0.5,0.3,0.2 \\
+      --from-date 2024-01-01 --to-date 2024-12-31 --markdown
+
+  # Include the full pairwise correlation matrix
+  python portfolio_risk.py --symbols AAPL.US,MSFT.US --correlation
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import math
+import os
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # stdlib fallback below
+    np = None
+
+import eodhd_client
+
+TRADING_DAYS = 252
+DEFAULT_BENCHMARK = "GSPC.INDX"
+
+
+def fetch_prices(
+    symbols: list[str],
+    token: str,
+    from_date: str,
+    to_date: str,
+    workers: int = 8,
+    timeout: int = 30,
+) -> dict[str, dict[str, float]]:
+    """Fetch EOD bars for all symbols concurrently → {symbol: {date: price}}."""
+    calls = [
+        {"endpoint": "eod", "symbol": s, "params": {"from": from_date, "to": to_date}}
+        for s in symbols
+    ]
+    results = eodhd_client.fetch_many(calls, token, workers=workers, timeout=timeout)
+    prices: dict[str, dict[str, float]] = {}
+    for symbol, rows in zip(symbols, results):
+        if isinstance(rows, dict) and "error" in rows:
+            raise RuntimeError(f"EOD API error for {symbol}: {rows['error']}")
+        series: dict[str, float] = {}
+        for row in rows or []:
+            # Explicit None check: adjusted_close of 0.0 is a real value.
+            price = row.get("adjusted_close")
+            if price is None:
+                price = row.get("close")
+            if price is not None and "date" in row:
+                series[row["date"]] = float(price)
+        if not series:
+            raise RuntimeError(f"No price data returned for {symbol} in {from_date}..{to_date}")
+        prices[symbol] = series
+    return prices
+
+
+def align_prices(
+    prices: dict[str, dict[str, float]],
+    symbols: list[str],
+    index_symbol: str | None = None,
+) -> tuple[list[str], list[list[float]]]:
+    """Align series onto one date index → (dates, rows of prices per symbol).
+
+    The index is ``index_symbol``'s dates (the benchmark) or the union of all
+    dates. Gaps are forward-filled and rows before every series has started
+    are dropped, so the returned matrix has no missing values.
+    """
+    if index_symbol is not None:
+        index = sorted(prices[index_symbol])
+    else:
+        index = sorted(set().union(*(prices[s] for s in symbols)))
+    columns = []
+    start = 0
+    for symbol in symbols:
+        series = prices[symbol]
+        column: list[float | None] = []
+        last = None
+        for date in index:
+            last = series.get(date, last)
+            column.append(last)
+        first = next((i for i, v in enumerate(column) if v is not None), len(column))
+        start = max(start, first)
+        columns.append(column)
+    dates = index[start:]
+    matrix = [list(row) for row in zip(*(c[start:] for c in columns))]
+    return dates, matrix
+
+
+def _summary(ann_return, ann_vol, max_dd, beta, sharpe) -> dict:
+    def r(x):
+        return None if x is None or not math.isfinite(x) else round(float(x), 6)
+
+    return {
+        "annualized_return": r(ann_return),
+        "annualized_volatility": r(ann_vol),
+        "max_drawdown": r(max_dd),
+        "beta": r(beta),
+        "sharpe_ratio": r(sharpe),
+    }
+
+
+def _risk_numpy(matrix, weights, bench_col, risk_free, want_corr) -> dict:
+    p = np.asarray(matrix, dtype=float)  # T x (N [+ benchmark])
+    prev = p[:-1]
+    # A zero price (suspended/delisted) yields a 0 return instead of inf.
+    r = np.divide(p[1:], prev, out=np.ones_like(prev), where=prev != 0) - 1.0
+    n = len(weights)
+    w = np.asarray(weights, dtype=float)
+    port = r[:, :n] @ w
+    cols = np.column_stack([r, port])  # holdings, [benchmark], portfolio
+    levels = np.vstack([np.ones(cols.shape[1]), np.cumprod(1.0 + cols, axis=0)])
+    t = cols.shape[0]
+
+    mean = cols.mean(axis=0)
+    std = cols.std(axis=0, ddof=1)
+    ann_vol = std * math.sqrt(TRADING_DAYS)
+    ann_ret = levels[-1] ** (TRADING_DAYS / t) - 1.0
+    dd = (levels / np.maximum.accumulate(levels, axis=0) - 1.0).min(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = (mean - risk_free / TRADING_DAYS) / std * math.sqrt(TRADING_DAYS)
+        if bench_col is not None:
+            b = cols[:, bench_col]
+            dev = cols - mean
+            beta = (dev * (b - b.mean())[:, None]).sum(axis=0) / (t - 1) / b.var(ddof=1)
+        else:
+            beta = np.full(cols.shape[1], np.nan)
+        z = (r[:, :n] - r[:, :n].mean(axis=0)) / r[:, :n].std(axis=0, ddof=1)
+    # Only holdings whose returns vary have a correlation (unit-variance z);
+    # pairs with a constant one are null in the matrix and left out here.
+    n_valid = int((std[:n] > 0).sum())
+    zsum = np.nan_to_num(z).sum(axis=1)
+    avg_corr = ((zsum @ zsum) / (t - 1) - n_valid) / (n_valid * (n_valid - 1)) if n_valid > 1 else None
+
+    out = {
+        "metrics": [_summary(*vals) for vals in zip(ann_ret, ann_vol, dd, beta, sharpe)],
+        "avg_pairwise_correlation": avg_corr,
+    }
+    if want_corr:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.round(np.corrcoef(r[:, :n], rowvar=False).reshape(n, n), 6)
+        # A constant-price holding has no correlation: NaN is not valid JSON.
+        out["correlation"] = [[v if math.isfinite(v) else None for v in row] for row in corr.tolist()]
+    return out
+
+
+def _mean_std(xs: list[float]) -> tuple[float, float]:
+    m = sum(xs) / len(xs)
+    var = sum((x - m) ** 2 for x in xs) / (len(xs) - 1)
+    return m, math.sqrt(var)
+
+
+def _risk_stdlib(matrix, weights, bench_col, risk_free, want_corr) -> dict:
+    n = len(weights)
+    t = len(matrix) - 1
+    returns = [
+        [cur[j] / prev[j] - 1.0 if prev[j] else 0.0 for j in range(len(cur))]
+        for prev, cur in zip(matrix, matrix[1:])
+    ]
+    cols = [list(c) for c in zip(*returns)]
+    port = [sum(w * x for w, x in zip(weights, row[:n])) for row in returns]
+    cols.append(port)
+
+    stats = [_mean_std(c) for c in cols]
+    bench = cols[bench_col] if bench_col is not None else None
+    if bench is not None:
+        bm, bs = stats[bench_col]
+    metrics = []
+    for col, (m, s) in zip(cols, stats):
+        level = peak = 1.0
+        max_dd = 0.0
+        for x in col:
+            level *= 1.0 + x
+            peak = max(peak, level)
+            max_dd = min(max_dd, level / peak - 1.0)
+        ann_ret = level ** (TRADING_DAYS / t) - 1.0
+        sharpe = (m - risk_free / TRADING_DAYS) / s * math.sqrt(TRADING_DAYS) if s else float("nan")
+        beta = None
+        if bench is not None and bs:
+            cov = sum((x - m) * (y - bm) for x, y in zip(col, bench)) / (t - 1)
+            beta = cov / (bs * bs)
+        metrics.append(_summary(ann_ret, s * math.sqrt(TRADING_DAYS), max_dd, beta, sharpe))
+
+    z_cols = [
+        [(x - m) / s for x in c] if s else [0.0] * t
+        for c, (m, s) in zip(cols[:n], stats[:n])
+    ]
+    # Constant holdings contribute zero z-scores and are not counted as pairs,
+    # matching the null entries of the correlation matrix.
+    n_valid = sum(1 for _, s in stats[:n] if s)
+    avg_corr = None
+    if n_valid > 1:
+        zsum = [sum(row) for row in zip(*z_cols)]
+        avg_corr = (sum(v * v for v in zsum) / (t - 1) - n_valid) / (n_valid * (n_valid - 1))
+    out = {"metrics": metrics, "avg_pairwise_correlation": avg_corr}
+    if want_corr:
+        out["correlation"] = [
+            [round(sum(a * b for a, b in zip(zi, zj)) / (t - 1), 6) if si and sj else None
+             for zj, (_, sj) in zip(z_cols, stats)]
+            for zi, (_, si) in zip(z_cols, stats)
+        ]
+    return out
+
+
+def compute_risk(
+    dates: list[str],
+    matrix: list[list[float]],
+    symbols: list[str],
+    weights: list[float],
+    benchmark: str | None = None,
+    risk_free: float = 0.0,
+    correlation: bool = False,
+    use_numpy: bool | None = None,
+) -> dict:
+    """Compute holding, benchmark and portfolio risk metrics.
+
+    ``matrix`` rows are aligned prices for ``symbols`` followed by the
+    benchmark column when ``benchmark`` is given. ``weights`` apply to the
+    holdings only and are normalized to sum to 1.
+    """
+    if len(matrix) < 3:
+        raise RuntimeError("Need at least 3 aligned price rows to compute risk metrics")
+    total = sum(weights)
+    if total <= 0:
+        raise RuntimeError("Weights must sum to a positive number")
+    weights = [w / total for w in weights]
+    n = len(symbols)
+    bench_col = n if benchmark else None
+    if use_numpy is None:
+        use_numpy = np is not None
+    engine = _risk_numpy if use_numpy else _risk_stdlib
+    res = engine(matrix, weights, bench_col, risk_free, correlation)
+
+    holdings = [
+        {"symbol": s, "weight": round(w, 6), **m}
+        for s, w, m in zip(symbols, weights, res["metrics"][:n])
+    ]
+    avg = res["avg_pairwise_correlation"]
+    result = {
+        "from": dates[0],
+        "to": dates[-1],
+        "data_points": len(dates),
+        "engine": "numpy" if use_numpy else "stdlib",
+        "portfolio": {
+            **res["metrics"][-1],
+            "avg_pairwise_correlation": None if avg is None else round(float(avg), 6),
+        },
+        "benchmark": {"symbol": benchmark, **res["metrics"][n]} if benchmark else None,
+        "holdings": holdings,
+    }
+    if correlation:
+        result["correlation"] = {"symbols": symbols, "matrix": res["correlation"]}
+    return result
+
+
+def _pct(x) -> str:
+    return "—" if x is None else f"{x * 100:.2f}%"
+
+
+def _num(x) -> str:
+    return "—" if x is None else f"{x:.2f}"
+
+
+def render_markdown(result: dict) -> str:
+    """Render the portfolio-risk skill's report tables."""
+    bench = result["benchmark"] or {}
+    port = result["portfolio"]
+    label = bench.get("symbol", "Benchmark")
+    lines = [
+        f"**Portfolio Composition** ({result['from']} → {result['to']}, {result['data_points']} days)",
+        "| Ticker | Weight |",
+        "|--------|--------|",
+    ]
+    lines += [f"| {h['symbol']} | {_pct(h['weight'])} |" for h in result["holdings"]]
+    lines += [
+        "",
+        "**Risk Metrics**",
+        f"| Metric | Portfolio | Benchmark ({label}) |",
+        "|--------|-----------|-----------------|",
+        f"| Annualized Return | {_pct(port['annualized_return'])} | {_pct(bench.get('annualized_return'))} |",
+        f"| Annualized Volatility | {_pct(port['annualized_volatility'])} | {_pct(bench.get('annualized_volatility'))} |",
+        f"| Max Drawdown | {_pct(port['max_drawdown'])} | {_pct(bench.get('max_drawdown'))} |",
+        f"| Beta | {_num(port['beta'])} | {_num(bench.get('beta'))} |",
+        f"| Sharpe Ratio | {_num(port['sharpe_ratio'])} | {_num(bench.get('sharpe_ratio'))} |",
+        f"| Avg Pairwise Correlation | {_num(port['avg_pairwise_correlation'])} | — |",
+        "",
+        "**Per-Holding Risk**",
+        "| Ticker | Weight | Ann. Return | Ann. Volatility | Max Drawdown | Beta | Sharpe |",
+        "|--------|--------|-------------|-----------------|--------------|------|--------|",
+    ]
+    for h in result["holdings"]:
+        lines.append(
+            f"| {h['symbol']} | {_pct(h['weight'])} | {_pct(h['annualized_return'])} "
+            f"| {_pct(h['annualized_volatility'])} | {_pct(h['max_drawdown'])} "
+            f"| {_num(h['beta'])} | {_num(h['sharpe_ratio'])} |"
+        )
+    corr = result.get("correlation")
+    if corr:
+        syms = corr["symbols"]
+        lines += ["", "**Correlation Matrix**", "| | " + " | ".join(syms) + " |",
+                  "|---" * (len(syms) + 1) + "|"]
+        for s, row in zip(syms, corr["matrix"]):
+            lines.append(f"| {s} | " + " | ".join(_num(v) for v in row) + " |")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    today = datetime.date.today()
+    parser = argparse.ArgumentParser(
+        description="Portfolio risk metrics (volatility, drawdown, beta, Sharpe, correlation) via EODHD API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Symbol format: {TICKER}.{EXCHANGE}  (e.g. AAPL.US, BMW.XETRA, VOD.LSE)",
+    )
+    parser.add_argument("--symbols", required=True, help="Comma-separated holdings (e.g. AAPL.US,MSFT.US)")
+    parser.add_argument("--weights", help="Comma-separated weights matching --symbols (default: equal)")
+    parser.add_argument("--benchmark", default=DEFAULT_BENCHMARK,
+                        help=f"Benchmark symbol, or 'none' (default: {DEFAULT_BENCHMARK})")
+    parser.add_argument("--from-date", default=(today - datetime.timedelta(days=365)).isoformat(),
+                        help="Start date YYYY-MM-DD (default: one year ago)")
+    parser.add_argument("--to-date", default=today.isoformat(), help="End date YYYY-MM-DD (default: today)")
+    parser.add_argument("--risk-free", type=float, default=0.0,
+                        help="Annual risk-free rate as a fraction for Sharpe (e.g. 0.04)")
+    parser.add_argument("--correlation", action="store_true", help="Include the full correlation matrix")
+    parser.add_argument("--markdown", action="store_true", help="Output the skill's markdown tables")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent EOD requests (default: 8)")
+    parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds")
+    args = parser.parse_args()
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        return 2
+
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+    if args.weights:
+        try:
+            weights = [float(w) for w in args.weights.split(",")]
+        except ValueError:
+            print("Error: --weights must be comma-separated numbers", file=sys.stderr)
+            return 2
+        if len(weights) != len(symbols):
+            print("Error: --weights must have one value per symbol", file=sys.stderr)
+            return 2
+    else:
+        weights = [1.0] * len(symbols)
+    benchmark = None if args.benchmark.lower() == "none" else args.benchmark
+
+    try:
+        to_fetch = symbols + ([benchmark] if benchmark and benchmark not in symbols else [])
+        prices = fetch_prices(to_fetch, token, args.from_date, args.to_date, args.workers, args.timeout)
+        columns = symbols + ([benchmark] if benchmark else [])
+        dates, matrix = align_prices(prices, columns, benchmark)
+        result = compute_risk(dates, matrix, symbols, weights, benchmark,
+                              args.risk_free, args.correlation)
+    except (RuntimeError, eodhd_client.ClientError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+    if args.markdown:
+        print(render_markdown(result))
+    else:
+        print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
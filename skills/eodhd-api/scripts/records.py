@@ -0,0 +1,271 @@
+"""Compact containers for EOD bars, quotes, dividends and splits (stdlib-only).
+
+``fetch_json`` returns a list of dicts: every ``/eod`` bar costs several
+hundred bytes, which rules out panels of millions of bars. This module keeps
+the same data in compact form for library users:
+
+  - ``Bars``: one column store per symbol, with dates as epoch-day integers
+    (see epoch_dates) in an ``array('q')`` and open/high/low/close/adjusted_close/volume as
+    ``array('d')`` (NaN where the API sent null). That is 56 bytes per bar.
+    ``Bars.from_json`` fills the columns from the decoder's object hook, so
+    no per-row dict outlives the parse.
+  - ``Quote``, ``Dividend``, ``Split``: ``__slots__`` records. Fields the API
+    adds later are kept in ``extra`` rather than dropped.
+
+Both behave like the dicts they replace. ``bars[i]`` is a read-only mapping
+view (``row["close"]``, ``row.get("date")``, ``dict(row)``), iterating
+``Bars`` yields those views, and records are mappings themselves. Code
+written against fetch_json rows, e.g. indicators.bars_from_eod, keeps
+working. ``Bars.to_numpy()`` wraps the columns without copying when NumPy
+is installed.
+
+Examples:
+  import records
+  bars = records.fetch_bars(token, "AAPL.US", {"from": "2000-01-01"})
+  bars.close[-1], bars[-1]["date"], len(bars), bars.nbytes
+  cols = bars.to_numpy()                        # {"date": datetime64[D], "close": float64, ...}
+  recent = bars.between("2024-01-01", "2024-12-31")
+  quotes = records.fetch_quotes(token, ["AAPL.US", "MSFT.US"])
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+from array import array
+from collections.abc import Mapping
+
+import eodhd_client
+from epoch_dates import epoch_day, epoch_days, iso_day, iso_days
+
+NAN = float("nan")
+
+
+def _value(number: float):
+    """A column value as the API would have sent it (None for NaN)."""
+    return None if number != number else number
+
+
+class BarView(Mapping):
+    """Read-only dict view of one bar; ``date`` comes back as ``YYYY-MM-DD``."""
+
+    __slots__ = ("_bars", "_i")
+
+    def __init__(self, bars: "Bars", i: int):
+        self._bars = bars
+        self._i = i
+
+    def __getitem__(self, key: str):
+        if key == "date":
+            return iso_day(self._bars.date[self._i])
+        if key == "volume":
+            volume = self._bars.volume[self._i]
+            return int(volume) if volume.is_integer() else _value(volume)
+        if key in Bars.COLUMNS:
+            return _value(getattr(self._bars, key)[self._i])
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(Bars.FIELDS)
+
+    def __len__(self) -> int:
+        return len(Bars.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"BarView({dict(self)!r})"
+
+
+class Bars:
+    """Columnar daily bars: ``date`` epoch days (array 'q') plus float columns (array 'd')."""
+
+    COLUMNS = ("open", "high", "low", "close", "adjusted_close", "volume")
+    FIELDS = ("date",) + COLUMNS
+    __slots__ = FIELDS
+
+    def __init__(self):
+        self.date = array("q")
+        for name in self.COLUMNS:
+            setattr(self, name, array("d"))
+
+    def append(self, row: Mapping) -> None:
+        """Add one bar from a dict-like row (``date`` as ``YYYY-MM-DD``)."""
+        self.date.append(epoch_day(row["date"]))
+        for name in self.COLUMNS:
+            value = row.get(name)
+            getattr(self, name).append(NAN if value is None else float(value))
+
+    @classmethod
+    def from_rows(cls, rows) -> "Bars":
+        """Bars from fetch_json-style rows; rows without a date are skipped."""
+        rows = [row for row in rows if isinstance(row, Mapping) and row.get("date") is not None]
+        bars = cls()
+        bars.date = epoch_days([row["date"] for row in rows])
+        for name in cls.COLUMNS:
+            getattr(bars, name).extend(NAN if row.get(name) is None else float(row[name]) for row in rows)
+        return bars
+
+    @classmethod
+    def from_json(cls, payload: str) -> "Bars":
+        """Decode an ``/eod`` payload straight into columns (a fetch_json ``parse`` callable).
+
+        Raises ClientError for an API error object and json.JSONDecodeError
+        for malformed JSON.
+        """
+        bars = cls()
+
+        def collect(pairs: list[tuple]):
+            row = dict(pairs)
+            if "date" not in row:
+                return row  # error payload or an unexpected nested object
+            bars.append(row)
+            return None
+
+        parsed = json.loads(payload, object_pairs_hook=collect)
+        if isinstance(parsed, dict):
+            raise eodhd_client.ClientError(f"eod error: {parsed.get('error') or parsed}")
+        return bars
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            out = Bars.__new__(Bars)
+            for name in self.FIELDS:
+                setattr(out, name, getattr(self, name)[index])
+            return out
+        if index < 0:
+            index += len(self.date)
+        if not 0 <= index < len(self.date):
+            raise IndexError("bar index out of range")
+        return BarView(self, index)
+
+    def __iter__(self):
+        return (BarView(self, i) for i in range(len(self.date)))
+
+    def __repr__(self) -> str:
+        if not self.date:
+            return "Bars(0 bars)"
+        return f"Bars({len(self)} bars, {iso_day(self.date[0])}..{iso_day(self.date[-1])})"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers."""
+        return sum(getattr(self, name).itemsize * len(getattr(self, name)) for name in self.FIELDS)
+
+    def dates(self) -> list[str]:
+        """The dates as ``YYYY-MM-DD`` strings."""
+        return iso_days(self.date)
+
+    def between(self, start: str | None = None, end: str | None = None) -> "Bars":
+        """Bars dated ``start``..``end`` inclusive (dates ascending, as the API returns them)."""
+        lo = bisect.bisect_left(self.date, epoch_day(start)) if start else 0
+        hi = bisect.bisect_right(self.date, epoch_day(end)) if end else len(self.date)
+        return self[lo:hi]
+
+    def to_dicts(self) -> list[dict]:
+        """Plain fetch_json-style rows."""
+        return [dict(view) for view in self]
+
+    def to_numpy(self) -> dict:
+        """Column name -> NumPy array sharing this object's buffers (``date`` as datetime64[D]).
+
+        Raises ImportError without NumPy. The arrays are views: while they are
+        alive, appending to these Bars raises BufferError.
+        """
+        import numpy as np
+
+        out = {"date": np.frombuffer(self.date, dtype=np.int64).view("datetime64[D]")}
+        for name in self.COLUMNS:
+            out[name] = np.frombuffer(getattr(self, name), dtype=np.float64)
+        return out
+
+
+class Record(Mapping):
+    """A ``__slots__`` row with the API's field names, usable wherever the dict was."""
+
+    __slots__ = ("extra",)
+    FIELDS: tuple = ()
+
+    def __init__(self, **values):
+        for name in self.FIELDS:
+            setattr(self, name, values.pop(name, None))
+        self.extra = values or None
+
+    @classmethod
+    def from_dict(cls, row: Mapping):
+        return cls(**row)
+
+    def __getitem__(self, key: str):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self.FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return len(self.FIELDS) + len(self.extra or ())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+
+class Quote(Record):
+    """One ``real-time`` quote."""
+
+    __slots__ = FIELDS = ("code", "timestamp", "gmtoffset", "open", "high", "low", "close",
+                          "volume", "previousClose", "change", "change_p")
+
+
+class Dividend(Record):
+    """One ``/div`` payment."""
+
+    __slots__ = FIELDS = ("date", "declarationDate", "recordDate", "paymentDate", "period",
+                          "value", "unadjustedValue", "currency")
+
+
+class Split(Record):
+    """One ``/splits`` event; ``split`` is the API's ``"new/old"`` string."""
+
+    __slots__ = FIELDS = ("date", "split")
+
+    @property
+    def ratio(self) -> float | None:
+        """New shares per old share (``"4.000000/1.000000"`` -> 4.0)."""
+        try:
+            new, old = str(self.split).split("/")
+            return float(new) / float(old)
+        except (ValueError, ZeroDivisionError):
+            return None
+
+
+def _records(cls, parsed, endpoint: str) -> list:
+    if isinstance(parsed, dict) and "error" in parsed:
+        raise eodhd_client.ClientError(f"{endpoint} error: {parsed['error']}")
+    rows = parsed if isinstance(parsed, list) else [parsed]
+    return [cls.from_dict(row) for row in rows if isinstance(row, dict)]
+
+
+def fetch_bars(token: str, symbol: str, params: dict | None = None, **kwargs) -> Bars:
+    """``/eod`` for one symbol as Bars; ``kwargs`` go to fetch_json (base_url, cache_ttl, ...)."""
+    return eodhd_client.fetch_json("eod", token, symbol, params, parse=Bars.from_json, **kwargs)
+
+
+def fetch_quotes(token: str, symbols: list[str], **kwargs) -> list[Quote]:
+    """``real-time`` quotes for one or more symbols (one request)."""
+    params = {"s": ",".join(symbols[1:])} if len(symbols) > 1 else None
+    parsed = eodhd_client.fetch_json("real-time", token, symbols[0], params, **kwargs)
+    return _records(Quote, parsed, "real-time")
+
+
+def fetch_dividends(token: str, symbol: str, params: dict | None = None, **kwargs) -> list[Dividend]:
+    return _records(Dividend, eodhd_client.fetch_json("dividends", token, symbol, params, **kwargs), "dividends")
+
+
+def fetch_splits(token: str, symbol: str, params: dict | None = None, **kwargs) -> list[Split]:
+    return _records(Split, eodhd_client.fetch_json("splits", token, symbol, params, **kwargs), "splits")
@@ -0,0 +1,188 @@
+"""Fetch every match of a screener query by sharding on market-cap bands.
+
+The ``screener`` endpoint returns at most ``PAGE_LIMIT`` rows per request and
+rejects offsets above ``MAX_OFFSET``, so a broad query ("all US stocks above
+$1B") silently stops after ~1,000 rows. ``fetch_all`` splits the query into
+disjoint ``market_capitalization`` bands until each band fits under the
+ceiling, fetches the bands concurrently, then merges, de-duplicates and
+re-sorts the rows.
+
+Each round fetches the first page of every pending shard concurrently:
+
+  1. A short first page means the shard is complete.
+  2. Otherwise the response ``count`` (or, when absent, a probe of the last
+     reachable page at offset 900) decides: past the ceiling → split the
+     band in two for the next round; within it → fetch the remaining pages
+     in one fan-out.
+
+Rows with a null ``market_capitalization`` fall outside every band; they are
+only returned when the unsplit query already fits.
+
+Examples:
+  python eodhd_client.py --endpoint screener --shard \\
+      --filters '[["market_capitalization",">=",1000000000],["exchange","=","us"]]' \\
+      --sort market_capitalization.desc
+
+  # As a library
+  rows, truncated = fetch_all(token, filters, sort="pe.asc")
+"""
+
+from __future__ import annotations
+
+import json
+import math
+
+import eodhd_client
+
+PAGE_LIMIT = 100
+MAX_OFFSET = 999
+LAST_PAGE = (MAX_OFFSET // PAGE_LIMIT) * PAGE_LIMIT  # 900: rows 900..999
+DEFAULT_SORT = "market_capitalization.desc"
+
+# Initial decade bands when the unsplit query overflows.
+BAND_EDGES = [0.0, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11, 1e12, math.inf]
+
+
+def _rows(payload) -> list[dict]:
+    """Screener pages are ``{"data": [...]}`` (``count`` optional) or a bare array."""
+    if isinstance(payload, dict):
+        if "data" not in payload and payload.get("error"):
+            raise eodhd_client.ClientError(f"screener API error: {payload['error']}")
+        payload = payload.get("data")
+    return [row for row in payload or [] if isinstance(row, dict)]
+
+
+def _bounds(filters: list) -> tuple[float, float]:
+    """Tightest market-cap range implied by the caller's own filters."""
+    lo, hi = 0.0, math.inf
+    for field, op, value in filters:
+        if field != "market_capitalization" or not isinstance(value, (int, float)):
+            continue
+        if op in (">", ">="):
+            lo = max(lo, float(value))
+        elif op in ("<", "<="):
+            hi = min(hi, float(value) + (1.0 if op == "<=" else 0.0))
+    return lo, hi
+
+
+def _initial_bands(filters: list) -> list[tuple[float, float]]:
+    lo, hi = _bounds(filters)
+    edges = [lo] + [e for e in BAND_EDGES if lo < e < hi] + [hi]
+    return list(zip(edges, edges[1:]))
+
+
+def _split(band: tuple[float, float]) -> list[tuple[float, float]] | None:
+    """Halve a band geometrically; None when it cannot usefully shrink."""
+    lo, hi = band
+    if math.isinf(hi):
+        mid = max(lo, 1e6) * 10
+    elif lo <= 0:
+        mid = hi / 10
+    else:
+        mid = math.sqrt(lo * hi)
+    mid = float(round(mid))
+    if not lo < mid < hi:
+        return None
+    return [(lo, mid), (mid, hi)]
+
+
+def _band_filters(filters: list, band: tuple[float, float] | None) -> list:
+    if band is None:
+        return list(filters)
+    lo, hi = band
+    extra = [["market_capitalization", ">=", lo]]
+    if not math.isinf(hi):
+        extra.append(["market_capitalization", "<", hi])
+    return list(filters) + extra
+
+
+def _call(filters: list, sort: str, signals: str | None, offset: int) -> dict:
+    params = {"filters": json.dumps(filters), "sort": sort,
+              "limit": PAGE_LIMIT, "offset": offset}
+    if signals:
+        params["signals"] = signals
+    return {"endpoint": "screener", "params": params}
+
+
+def _sort_key(field: str):
+    def key(row: dict):
+        value = row.get(field)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return (0, value, "")
+        return (1 if value is None else 0, 0, str(value or ""))
+    return key
+
+
+def merge(pages: list[list[dict]], sort: str = DEFAULT_SORT) -> list[dict]:
+    """Concatenate shard rows, drop duplicates (code + exchange), re-sort; nulls last."""
+    seen: set = set()
+    rows = []
+    for page in pages:
+        for row in page:
+            key = (row.get("code"), row.get("exchange"))
+            if key not in seen:
+                seen.add(key)
+                rows.append(row)
+    field, _, direction = sort.rpartition(".")
+    if not field:
+        field, direction = sort, "asc"
+    ranked = [r for r in rows if r.get(field) is not None]
+    ranked.sort(key=_sort_key(field), reverse=direction == "desc")
+    return ranked + [r for r in rows if r.get(field) is None]
+
+
+def fetch_all(token: str, filters: list | None = None, sort: str | None = None,
+              signals: str | None = None, workers: int = 8, **kwargs) -> tuple[list[dict], list]:
+    """Return ``(rows, truncated_bands)`` for every match of a screener query.
+
+    ``kwargs`` (``base_url``, ``timeout``, ``cache_ttl``) are passed through to
+    fetch_many. ``truncated_bands`` lists market-cap bands that still hit the
+    offset ceiling after splitting as far as possible (normally empty).
+    """
+    filters = list(filters or [])
+    sort = sort or DEFAULT_SORT
+
+    def wave(calls: list[dict]) -> list:
+        return eodhd_client.fetch_many(calls, token, workers=workers, **kwargs) if calls else []
+
+    def query(band, offset):
+        return _call(_band_filters(filters, band), sort, signals, offset)
+
+    pending: list[tuple[float, float] | None] = [None]  # None = the unsplit query
+    pages: list[list[dict]] = []
+    truncated: list = []
+    while pending:
+        next_round, fills, unknown = [], [], []
+
+        def overflow(band) -> bool:
+            children = _initial_bands(filters) if band is None else _split(band)
+            if children:
+                next_round.extend(children)
+                return True
+            truncated.append(band)
+            return False
+
+        for band, payload in zip(pending, wave([query(b, 0) for b in pending])):
+            first = _rows(payload)
+            if len(first) < PAGE_LIMIT:
+                pages.append(first)
+                continue
+            count = payload.get("count") if isinstance(payload, dict) else None
+            if not isinstance(count, int):
+                unknown.append((band, first))
+            elif count > MAX_OFFSET + 1 and overflow(band):
+                continue
+            else:
+                pages.append(first)
+                stop = min(count, MAX_OFFSET + 1)
+                fills.extend(query(band, offset) for offset in range(PAGE_LIMIT, stop, PAGE_LIMIT))
+        # No ``count`` in the response: probe the last reachable page instead.
+        for (band, first), payload in zip(unknown, wave([query(b, LAST_PAGE) for b, _ in unknown])):
+            last = _rows(payload)
+            if len(last) >= PAGE_LIMIT and overflow(band):
+                continue
+            pages.extend([first, last])
+            fills.extend(query(band, offset) for offset in range(PAGE_LIMIT, LAST_PAGE, PAGE_LIMIT))
+        pages.extend(_rows(payload) for payload in wave(fills))
+        pending = next_round
+    return merge(pages, sort), truncated
@@ -7,6 +7,10 @@ Requires EODHD_API_TOKEN environment variable with Investverte marketplace acces
 Usage:
   export EODHD_API_TOKEN="your_token_here"
   python test_investverte_list_sectors.py
+
+  # Record the responses once, then run offline against them
+  EODHD_TRANSPORT=record EODHD_CASSETTE_DIR=cassettes python test_investverte_list_sectors.py
+  EODHD_TRANSPORT=replay EODHD_CASSETTE_DIR=cassettes python test_investverte_list_sectors.py
 """
 
 from __future__ import annotations
@@ -14,8 +18,10 @@ from __future__ import annotations
 import json
 import os
 import unittest
+import urllib.error
 import urllib.parse
-import urllib.request
+
+import eodhd_client
 
 BASE_URL = "https://eodhd.com/api/mp/investverte"
 
@@ -44,9 +50,7 @@ def api_get(path: str, params: dict | None = None, timeout: int = 30) -> list |
     if params:
         query.update(params)
     url = BASE_URL + path + "?" + urllib.parse.urlencode(query)
-    req = urllib.request.Request(url, headers={"Accept": "application/json"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    return json.loads(eodhd_client.http_get(url, timeout))
 
 
 class TestListSectorsResponse(unittest.TestCase):
@@ -131,9 +135,8 @@ class TestListSectorsErrorHandling(unittest.TestCase):
         """Invalid API token should return 401 or 403."""
         query = {"api_token": "invalid_token_12345"}
         url = BASE_URL + "/sectors?" + urllib.parse.urlencode(query)
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
         with self.assertRaises(urllib.error.HTTPError) as ctx:
-            urllib.request.urlopen(req, timeout=15)
+            eodhd_client.http_get(url, timeout=15)
         self.assertIn(ctx.exception.code, (401, 403))
 
 
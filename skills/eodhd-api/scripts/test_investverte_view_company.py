@@ -7,6 +7,10 @@ Requires EODHD_API_TOKEN environment variable with Investverte marketplace acces
 Usage:
   export EODHD_API_TOKEN="your_token_here"
   python test_investverte_view_company.py
+
+  # Record the responses once, then run offline against them
+  EODHD_TRANSPORT=record EODHD_CASSETTE_DIR=cassettes python test_investverte_view_company.py
+  EODHD_TRANSPORT=replay EODHD_CASSETTE_DIR=cassettes python test_investverte_view_company.py
 """
 
 from __future__ import annotations
@@ -15,8 +19,10 @@ import json
 import os
 import sys
 import unittest
+import urllib.error
 import urllib.parse
-import urllib.request
+
+import eodhd_client
 
 BASE_URL = "https://eodhd.com/api/mp/investverte"
 VALID_FREQUENCIES = {"FY", "Q1", "Q2", "Q3", "Q4"}
@@ -36,9 +42,7 @@ def api_get(path: str, params: dict | None = None, timeout: int = 30) -> list |
     if params:
         query.update(params)
     url = BASE_URL + path + "?" + urllib.parse.urlencode(query)
-    req = urllib.request.Request(url, headers={"Accept": "application/json"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    return json.loads(eodhd_client.http_get(url, timeout))
 
 
 class TestViewCompanyFullTimeSeries(unittest.TestCase):
@@ -242,9 +246,8 @@ class TestViewCompanyErrorHandling(unittest.TestCase):
         """Invalid API token should return 401."""
         query = {"api_token": "invalid_token_12345"}
         url = BASE_URL + "/esg/AAPL?" + urllib.parse.urlencode(query)
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
         with self.assertRaises(urllib.error.HTTPError) as ctx:
-            urllib.request.urlopen(req, timeout=15)
+            eodhd_client.http_get(url, timeout=15)
         self.assertIn(ctx.exception.code, (401, 403))
 
 
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""Incremental exchange-symbol-list sync with rename detection.
+
+``exchange-symbol-list/{EXCHANGE}`` returns the whole exchange on every call
+(tens of thousands of tickers for US). This script keeps one local table per
+exchange and, on each ``sync``, diffs the fresh list against it. Downstream
+jobs then process only what changed:
+
+  {"op": "added" | "removed" | "renamed" | "changed", "exchange": "US",
+   "code": "STEL", "old_code": "CBTX", "via": "history", "effective": "2022-10-03",
+   "changes": {"Name": ["...", "..."]}, "record": {...}, "seq": 12}
+
+Renames come from ``symbol-change-history`` (US only, from 2022-07-22),
+fetched from the previous sync's date onward. Changes are applied in
+``effective`` order, so a chain A -> B -> C is one rename A -> C. A removed
+and an added ticker with the same ISIN also count as a rename (``"via":
+"isin"``), which catches renames on exchanges the history does not cover.
+Renames are kept in the table, so ``resolve`` / ``lookup`` map an old code
+to its current one.
+
+The table is stored column-wise and sorted by code
+(EODHD_CACHE_DIR/universe/{EXCHANGE}.json, written atomically). A code
+lookup is one bisection; the ISIN and name-prefix indexes are built on
+first use. The deltas of the last JOURNAL_SYNCS syncs are stored in the same
+file, each with its sync number (``seq``), so ``changes --since N`` replays
+what a job missed. The first sync's "added" deltas are not journalled (they
+would duplicate the table); a job that starts from scratch reads the table.
+
+Requires:
+  EODHD_API_TOKEN environment variable (sync only).
+
+Examples:
+  # First run stores the table (every ticker "added"; --seed stores it silently)
+  python universe_sync.py sync --exchange US --seed
+
+  # Daily: emit only the deltas as NDJSON
+  python universe_sync.py sync --exchange US >> us-universe-deltas.ndjson
+
+  # Indexed lookups against the local table (old codes resolve through renames)
+  python universe_sync.py lookup --exchange US AAPL CBTX
+  python universe_sync.py lookup --exchange US --isin US0378331005
+  python universe_sync.py lookup --exchange US --name "apple"
+
+  # Deltas since the sync a job last processed
+  python universe_sync.py changes --exchange US --since 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import datetime
+import json
+import os
+import sys
+
+import eodhd_client
+
+UNIVERSE_DIR = os.path.join(eodhd_client.CACHE_DIR, "universe")
+FIELDS = ("Code", "Name", "Country", "Exchange", "Currency", "Type", "Isin")
+JOURNAL_SYNCS = 50
+# symbol-change-history entries can be published a few days after they take effect.
+HISTORY_OVERLAP_DAYS = 7
+HISTORY_EXCHANGES = ("US",)
+
+
+class Universe:
+    """One exchange's tickers: ``columns[field][row]`` sorted by Code, plus renames and the delta journal."""
+
+    def __init__(self, exchange: str, columns: dict[str, list], synced_at: str = "", seq: int = 0,
+                 renames: dict[str, dict] | None = None, journal: list[dict] | None = None):
+        self.exchange = exchange
+        self.columns = columns
+        self.synced_at = synced_at
+        self.seq = seq
+        self.renames = renames or {}
+        self.journal = journal or []
+        self.codes = columns["Code"]
+        self._isin: dict[str, list[int]] | None = None
+        self._names: tuple[list[str], list[int]] | None = None
+
+    @classmethod
+    def from_rows(cls, exchange: str, rows: list[dict], **kwargs) -> "Universe":
+        """Table from exchange-symbol-list rows; rows without a Code are skipped, duplicates keep the last."""
+        by_code = {row["Code"]: row for row in rows if isinstance(row, dict) and row.get("Code")}
+        ordered = [by_code[code] for code in sorted(by_code)]
+        columns = {field: [row.get(field) for row in ordered] for field in FIELDS}
+        return cls(exchange, columns, **kwargs)
+
+    # --- persistence -------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"exchange": self.exchange, "synced_at": self.synced_at, "seq": self.seq,
+                       "columns": self.columns, "renames": self.renames, "journal": self.journal},
+                      fh, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Universe":
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        return cls(data["exchange"], data["columns"], data.get("synced_at", ""), data.get("seq", 0),
+                   data.get("renames"), data.get("journal"))
+
+    # --- access / indexes --------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def row(self, i: int) -> dict:
+        return {field: column[i] for field, column in self.columns.items()}
+
+    def rows(self) -> dict[str, dict]:
+        """Code -> row for the whole table."""
+        return {code: self.row(i) for i, code in enumerate(self.codes)}
+
+    def index(self, code: str) -> int | None:
+        """Row of ``code`` (exact match, bisection over the sorted Code column)."""
+        i = bisect.bisect_left(self.codes, code)
+        return i if i < len(self.codes) and self.codes[i] == code else None
+
+    def get(self, code: str) -> dict | None:
+        i = self.index(code)
+        return None if i is None else self.row(i)
+
+    def resolve(self, code: str) -> str:
+        """The current code for ``code``, following recorded renames (unchanged if none apply)."""
+        seen = {code}
+        while code in self.renames and self.index(code) is None:
+            code = self.renames[code]["to"]
+            if code in seen:
+                break
+            seen.add(code)
+        return code
+
+    def by_isin(self, isin: str) -> list[dict]:
+        if self._isin is None:
+            self._isin = {}
+            for i, value in enumerate(self.columns["Isin"]):
+                if value:
+                    self._isin.setdefault(value.upper(), []).append(i)
+        return [self.row(i) for i in self._isin.get(isin.upper(), [])]
+
+    def search(self, prefix: str, limit: int = 20) -> list[dict]:
+        """Rows whose Name starts with ``prefix`` (case-insensitive), by name."""
+        if self._names is None:
+            order = sorted(range(len(self.codes)), key=lambda i: (self.columns["Name"][i] or "").lower())
+            self._names = ([(self.columns["Name"][i] or "").lower() for i in order], order)
+        names, order = self._names
+        prefix = prefix.lower()
+        out = []
+        for k in range(bisect.bisect_left(names, prefix), len(names)):
+            if not names[k].startswith(prefix) or len(out) >= limit:
+                break
+            out.append(self.row(order[k]))
+        return out
+
+    def changes_since(self, seq: int) -> list[dict]:
+        """Journalled deltas of syncs after ``seq``, oldest first."""
+        return [delta for entry in self.journal if entry["seq"] > seq for delta in entry["deltas"]]
+
+
+def universe_path(exchange: str) -> str:
+    return os.path.join(UNIVERSE_DIR, f"{exchange.upper()}.json")
+
+
+def _chains(changes: list[dict]) -> dict[str, tuple[str, str]]:
+    """old code -> (new code, effective date), later changes overriding earlier ones."""
+    forward: dict[str, tuple[str, str]] = {}
+    for change in sorted((c for c in changes if isinstance(c, dict)), key=lambda c: c.get("effective") or ""):
+        old, new = change.get("old_symbol"), change.get("new_symbol")
+        if old and new and old != new:
+            forward[old] = (new, change.get("effective") or "")
+    return forward
+
+
+def diff(exchange: str, old: dict[str, dict], new: dict[str, dict], changes: list[dict]) -> list[dict]:
+    """Deltas between two Code -> row maps; ``changes`` are symbol-change-history records."""
+    removed = old.keys() - new.keys()
+    added = new.keys() - old.keys()
+    renamed: list[dict] = []
+    forward = _chains(changes)
+    for code in sorted(removed):
+        current, effective, seen = code, "", {code}
+        while current in forward and forward[current][0] not in seen:
+            current, effective = forward[current]
+            seen.add(current)
+            if current in added:
+                renamed.append({"op": "renamed", "exchange": exchange, "code": current, "old_code": code,
+                                "via": "history", "effective": effective, "record": new[current]})
+                removed.discard(code)
+                added.discard(current)
+                break
+    by_isin: dict[str, list[str]] = {}
+    for code in added:
+        if new[code].get("Isin"):
+            by_isin.setdefault(new[code]["Isin"], []).append(code)
+    for code in sorted(removed):
+        candidates = by_isin.get(old[code].get("Isin") or "", [])
+        if len(candidates) == 1 and candidates[0] in added:
+            renamed.append({"op": "renamed", "exchange": exchange, "code": candidates[0], "old_code": code,
+                            "via": "isin", "record": new[candidates[0]]})
+            removed.discard(code)
+            added.discard(candidates[0])
+    out = renamed
+    for code in sorted(added):
+        out.append({"op": "added", "exchange": exchange, "code": code, "record": new[code]})
+    for code in sorted(removed):
+        out.append({"op": "removed", "exchange": exchange, "code": code, "record": old[code]})
+    for code in sorted(old.keys() & new.keys()):
+        before, after = old[code], new[code]
+        fields = {f: [before.get(f), after.get(f)] for f in FIELDS if before.get(f) != after.get(f)}
+        if fields:
+            out.append({"op": "changed", "exchange": exchange, "code": code, "changes": fields, "record": after})
+    return out
+
+
+def _listing(payload, exchange: str) -> list[dict]:
+    if isinstance(payload, dict):
+        raise eodhd_client.ClientError(f"exchange-symbol-list {exchange} API error: "
+                                       f"{payload.get('error') or payload}")
+    return [row for row in payload or [] if isinstance(row, dict)]
+
+
+def sync(exchange: str, token: str, previous: Universe | None = None, history: bool | None = None,
+         today: datetime.date | None = None, **kwargs) -> tuple[Universe, list[dict]]:
+    """Fetch the list (and symbol changes since the last sync) → (new table, deltas).
+
+    ``history`` defaults to on for HISTORY_EXCHANGES. ``kwargs`` go to
+    fetch_json (base_url, timeout, cache_ttl, ...).
+    """
+    today = today or datetime.date.today()
+    exchange = exchange.upper()
+    rows = _listing(eodhd_client.fetch_json("exchange-symbol-list", token, exchange, **kwargs), exchange)
+    if not rows:
+        raise eodhd_client.ClientError(f"exchange-symbol-list {exchange} returned no tickers")
+    seq = previous.seq + 1 if previous else 1
+    table = Universe.from_rows(exchange, rows, synced_at=today.isoformat(), seq=seq,
+                               renames=dict(previous.renames) if previous else {},
+                               journal=list(previous.journal) if previous else [])
+    if previous is None:
+        deltas = diff(exchange, {}, table.rows(), [])
+    else:
+        changes: list[dict] = []
+        if history is None:
+            history = exchange in HISTORY_EXCHANGES
+        if history:
+            since = datetime.date.fromisoformat(previous.synced_at or today.isoformat())
+            since -= datetime.timedelta(days=HISTORY_OVERLAP_DAYS)
+            payload = eodhd_client.fetch_json("symbol-change-history", token,
+                                              params={"from": since.isoformat()}, **kwargs)
+            if isinstance(payload, dict):
+                raise eodhd_client.ClientError(f"symbol-change-history API error: "
+                                               f"{payload.get('error') or payload}")
+            changes = [c for c in payload or [] if isinstance(c, dict)]
+        deltas = diff(exchange, previous.rows(), table.rows(), changes)
+    for delta in deltas:
+        delta["seq"] = seq
+        if delta["op"] == "renamed":
+            effective = delta.get("effective") or table.synced_at
+            table.renames[delta["old_code"]] = {"to": delta["code"], "effective": effective}
+    # The first sync "adds" the whole exchange, which the table already holds: journal the count only.
+    entry = {"seq": seq, "synced_at": table.synced_at, "deltas": deltas if previous else []}
+    if previous is None:
+        entry["initial"] = len(deltas)
+    table.journal = (table.journal + [entry])[-JOURNAL_SYNCS:]
+    return table, deltas
+
+
+def _load(exchange: str) -> Universe | None:
+    path = universe_path(exchange)
+    return Universe.load(path) if os.path.exists(path) else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Sync exchange-symbol-list into a local table and emit added/removed/renamed tickers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"Tables are stored in {UNIVERSE_DIR} (EODHD_CACHE_DIR/universe).",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("sync", help="Fetch the list, diff it against the table, print deltas as NDJSON")
+    run.add_argument("--exchange", required=True, help="Exchange code (e.g. US, LSE, XETRA)")
+    run.add_argument("--seed", action="store_true", help="Store the table without printing deltas")
+    run.add_argument("--history", action=argparse.BooleanOptionalAction, default=None,
+                     help="Apply symbol-change-history (default: on for US, the only exchange it covers)")
+    run.add_argument("--timeout", type=int, default=60, help="HTTP timeout in seconds")
+    run.add_argument("--base-url", default=eodhd_client.BASE_URL, help="Override API base URL")
+    lookup = sub.add_parser("lookup", help="Look tickers up in the local table")
+    lookup.add_argument("--exchange", required=True, help="Table exchange code")
+    lookup.add_argument("codes", nargs="*", help="Ticker codes (old codes resolve through renames)")
+    lookup.add_argument("--isin", help="Rows with this ISIN")
+    lookup.add_argument("--name", help="Rows whose name starts with this prefix")
+    lookup.add_argument("--limit", type=int, default=20, help="Rows for --name (default: 20)")
+    changes = sub.add_parser("changes", help="Print journalled deltas as NDJSON")
+    changes.add_argument("--exchange", required=True, help="Table exchange code")
+    changes.add_argument("--since", type=int, default=0, help="Only syncs after this seq (default: all kept)")
+    args = parser.parse_args()
+
+    if args.command == "sync":
+        token = os.getenv("EODHD_API_TOKEN")
+        if not token:
+            print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+            return 2
+        try:
+            table, deltas = sync(args.exchange, token, _load(args.exchange), args.history,
+                                 base_url=args.base_url, timeout=args.timeout)
+        except eodhd_client.ClientError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        table.save(universe_path(args.exchange))
+        if not args.seed:
+            for delta in deltas:
+                sys.stdout.write(json.dumps(delta, sort_keys=True) + "\n")
+        counts = {op: sum(d["op"] == op for d in deltas) for op in ("added", "removed", "renamed", "changed")}
+        print(json.dumps({"exchange": table.exchange, "seq": table.seq, "tickers": len(table), **counts}),
+              file=sys.stderr)
+        return 0
+
+    table = _load(args.exchange)
+    if table is None:
+        print(f"Error: no table for {args.exchange}; run: universe_sync.py sync --exchange {args.exchange}",
+              file=sys.stderr)
+        return 2
+    if args.command == "changes":
+        if table.journal and args.since and args.since < table.journal[0]["seq"] - 1:
+            print(f"Error: syncs after {args.since} are no longer journalled (oldest kept: "
+                  f"{table.journal[0]['seq']}); resync from the full table", file=sys.stderr)
+            return 1
+        for delta in table.changes_since(args.since):
+            sys.stdout.write(json.dumps(delta, sort_keys=True) + "\n")
+        return 0
+
+    if not (args.codes or args.isin or args.name):
+        print("Error: give ticker codes, --isin or --name", file=sys.stderr)
+        return 2
+    result: dict = {}
+    if args.codes:
+        found = {}
+        for code in args.codes:
+            current = table.resolve(code)
+            row = table.get(current)
+            found[code] = row if current == code or row is None else {**row, "renamed_from": code}
+        result["codes"] = found
+    if args.isin:
+        result["isin"] = table.by_isin(args.isin)
+    if args.name:
+        result["name"] = table.search(args.name, args.limit)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
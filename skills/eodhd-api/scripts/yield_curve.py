@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""US Treasury yield-curve engine over the four ``ust/*`` endpoints.
+
+Each ``ust/*`` request returns one calendar year (``filter[year]``), one row
+per (date, tenor). This module fetches every requested year of every series
+concurrently, pivots the rows into a date-indexed tenor matrix and answers
+curve, spread and percentile queries locally:
+
+  - par  → ust/yield-rates       (nominal par curve, 1M..30Y, ``rate``)
+  - real → ust/real-yield-rates  (TIPS par curve, 5Y..30Y, ``rate``)
+  - bill → ust/bill-rates        (4WK..52WK, coupon-equivalent ``coupon``)
+  - long → ust/long-term-rates   (BC_20year / Over_10_Years / Real_Rate, ``rate``)
+
+Completed years never change, so they are cached for ``HISTORY_TTL``; only the
+current year honours the shorter ``--cache-ttl``. Decades of curves therefore
+cost one request per series after the first run.
+
+Requires:
+  EODHD_API_TOKEN environment variable.
+
+Examples:
+  # Latest par curve plus interpolated 4Y and 15Y points
+  python yield_curve.py curve --maturities 4,15
+
+  # 10Y-2Y spread since 1990: latest value, historical percentile, inverted days
+  python yield_curve.py spread --long 10Y --short 2Y --from-year 1990
+
+  # 10Y breakeven inflation (par 10Y minus real 10Y) over the last 5 years
+  python yield_curve.py spread --long par:10Y --short real:10Y --from-year 2021 --last 20
+
+  # Full date x tenor matrix as CSV
+  python yield_curve.py matrix --series par --from-year 2000 --csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import csv
+import datetime
+import io
+import json
+import os
+import re
+import sys
+
+import eodhd_client
+
+# series → (endpoint, column key, value key)
+SERIES = {
+    "par": ("ust/yield-rates", "tenor", "rate"),
+    "real": ("ust/real-yield-rates", "tenor", "rate"),
+    "bill": ("ust/bill-rates", "tenor", "coupon"),
+    "long": ("ust/long-term-rates", "rate_type", "rate"),
+}
+# First year the Treasury publishes each series; earlier years would be empty requests.
+FIRST_YEAR = {"par": 1990, "real": 2003, "bill": 2002, "long": 2000}
+PAGE_LIMIT = 1000
+HISTORY_TTL = 30 * 86400
+DEFAULT_CACHE_TTL = 3600
+
+_TENOR = re.compile(r"^(?:BC_)?(\d+(?:\.\d+)?)\s*(WK|M|Y|year)s?$", re.IGNORECASE)
+_UNIT_YEARS = {"wk": 1 / 52, "m": 1 / 12, "y": 1.0, "year": 1.0}
+
+
+def tenor_years(tenor: str) -> float | None:
+    """"3M" → 0.25, "13WK" → 0.25, "10Y"/"BC_10year" → 10.0; None for non-maturity labels."""
+    match = _TENOR.match(tenor.strip())
+    if not match:
+        return None
+    return float(match.group(1)) * _UNIT_YEARS[match.group(2).lower()]
+
+
+class TenorMatrix:
+    """Date-indexed rates: ``values[i][j]`` is ``columns[j]`` on ``dates[i]`` (None if missing).
+
+    Columns are named ``series:tenor`` and ordered by series, then maturity.
+    """
+
+    def __init__(self, dates: list[str], columns: list[str], values: list[list[float | None]]):
+        self.dates = dates
+        self.columns = columns
+        self.values = values
+        self._col = {c: j for j, c in enumerate(columns)}
+        self._sorted: dict[str, list[float]] = {}
+
+    @classmethod
+    def from_rows(cls, rows_by_series: dict[str, list[dict]]) -> "TenorMatrix":
+        """Pivot raw API rows (``date``, tenor key, value key) into a matrix."""
+        cells: dict[tuple[str, str], float] = {}
+        columns: dict[str, float] = {}
+        for series, rows in rows_by_series.items():
+            _, key, value_key = SERIES[series]
+            for row in rows:
+                date, tenor, value = row.get("date"), row.get(key), row.get(value_key)
+                if not date or tenor is None or not isinstance(value, (int, float)):
+                    continue
+                name = f"{series}:{tenor}"
+                cells[(date, name)] = float(value)
+                if name not in columns:
+                    years = tenor_years(str(tenor))
+                    columns[name] = float("inf") if years is None else years
+        order = list(SERIES)
+        names = sorted(columns, key=lambda c: (order.index(c.split(":", 1)[0]), columns[c], c))
+        dates = sorted({d for d, _ in cells})
+        values = [[cells.get((d, c)) for c in names] for d in dates]
+        return cls(dates, names, values)
+
+    def column(self, name: str) -> str:
+        """Resolve "10Y" → "par:10Y"; fully qualified names pass through."""
+        if name in self._col:
+            return name
+        qualified = name if ":" in name else f"par:{name}"
+        if qualified not in self._col:
+            raise ValueError(f"unknown tenor '{name}' (available: {', '.join(self.columns)})")
+        return qualified
+
+    def row_index(self, date: str | None = None) -> int:
+        """Index of ``date``, or of the last observation on or before it; latest if None."""
+        if not self.dates:
+            raise ValueError("matrix is empty")
+        if date is None:
+            return len(self.dates) - 1
+        i = bisect.bisect_right(self.dates, date) - 1
+        if i < 0:
+            raise ValueError(f"no observation on or before {date}")
+        return i
+
+    def series(self, name: str) -> list[tuple[str, float]]:
+        j = self._col[self.column(name)]
+        return [(d, row[j]) for d, row in zip(self.dates, self.values) if row[j] is not None]
+
+    def curve(self, date: str | None = None, series: str = "par") -> dict:
+        """``{"date", "points": {tenor: rate}}`` for one series on (or just before) ``date``."""
+        i = self.row_index(date)
+        prefix = f"{series}:"
+        points = {c[len(prefix):]: v for c, v in zip(self.columns, self.values[i])
+                  if c.startswith(prefix) and v is not None}
+        return {"date": self.dates[i], "points": points}
+
+    def interpolate(self, maturity: float, date: str | None = None, series: str = "par") -> float | None:
+        """Linear interpolation in maturity (years) along one date's curve; flat beyond the ends."""
+        i = self.row_index(date)
+        prefix = f"{series}:"
+        knots = sorted((tenor_years(c[len(prefix):]), v) for c, v in zip(self.columns, self.values[i])
+                       if c.startswith(prefix) and v is not None and tenor_years(c[len(prefix):]) is not None)
+        if not knots:
+            return None
+        xs = [k[0] for k in knots]
+        k = bisect.bisect_left(xs, maturity)
+        if k == 0:
+            return knots[0][1]
+        if k == len(knots):
+            return knots[-1][1]
+        (x0, y0), (x1, y1) = knots[k - 1], knots[k]
+        return y0 + (y1 - y0) * (maturity - x0) / (x1 - x0)
+
+    def spread(self, long: str, short: str) -> list[tuple[str, float]]:
+        """Daily ``long - short`` in basis points where both tenors are quoted."""
+        a, b = self._col[self.column(long)], self._col[self.column(short)]
+        return [(d, round((row[a] - row[b]) * 100, 2)) for d, row in zip(self.dates, self.values)
+                if row[a] is not None and row[b] is not None]
+
+    def percentile(self, name: str, value: float) -> float | None:
+        """Share (0-100) of a column's history at or below ``value``."""
+        column = self.column(name)
+        if column not in self._sorted:
+            self._sorted[column] = sorted(v for _, v in self.series(column))
+        return _percentile_of(self._sorted[column], value)
+
+    def to_csv(self) -> str:
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(["date"] + self.columns)
+        for d, row in zip(self.dates, self.values):
+            writer.writerow([d] + ["" if v is None else v for v in row])
+        return buf.getvalue()
+
+
+def _percentile_of(ordered: list[float], value: float) -> float | None:
+    """Share (0-100) of the sorted ``ordered`` at or below ``value``; None if empty."""
+    return 100.0 * bisect.bisect_right(ordered, value) / len(ordered) if ordered else None
+
+
+def _page_call(series: str, year: int, offset: int, ttl: int) -> dict:
+    params = {"filter[year]": year, "page[limit]": PAGE_LIMIT, "page[offset]": offset}
+    return {"endpoint": SERIES[series][0], "params": params, "cache_ttl": ttl, "normalize": False}
+
+
+def _rows(payload) -> list[dict]:
+    if isinstance(payload, dict):
+        if "data" not in payload and payload.get("error"):
+            raise eodhd_client.ClientError(f"UST API error: {payload['error']}")
+        payload = payload.get("data")
+    return [r for r in payload or [] if isinstance(r, dict)]
+
+
+def fetch_matrix(token: str, series: list[str], from_year: int, to_year: int | None = None,
+                 workers: int = 8, cache_ttl: int = DEFAULT_CACHE_TTL, **kwargs) -> TenorMatrix:
+    """Fetch ``series`` x years concurrently (plus any extra pages) → TenorMatrix.
+
+    ``cache_ttl`` applies to the current year; completed years use
+    ``HISTORY_TTL`` unless caching is off (``cache_ttl`` <= 0).
+    """
+    this_year = datetime.date.today().year
+    to_year = to_year or this_year
+    jobs = [(s, y) for s in series for y in range(max(from_year, FIRST_YEAR[s]), to_year + 1)]
+
+    def ttl(year: int) -> int:
+        return cache_ttl if cache_ttl <= 0 or year >= this_year else max(cache_ttl, HISTORY_TTL)
+
+    first = eodhd_client.fetch_many([_page_call(s, y, 0, ttl(y)) for s, y in jobs],
+                                    token, workers=workers, **kwargs)
+    rows: dict[str, list[dict]] = {s: [] for s in series}
+    more, more_jobs = [], []
+    for (s, y), payload in zip(jobs, first):
+        page = _rows(payload)
+        rows[s].extend(page)
+        total = (payload.get("meta") or {}).get("total") if isinstance(payload, dict) else None
+        if page and isinstance(total, int) and total > len(page):
+            for offset in range(len(page), total, len(page)):
+                more.append(_page_call(s, y, offset, ttl(y)))
+                more_jobs.append(s)
+    if more:
+        for s, payload in zip(more_jobs, eodhd_client.fetch_many(more, token, workers=workers, **kwargs)):
+            rows[s].extend(_rows(payload))
+    return TenorMatrix.from_rows(rows)
+
+
+def spread_summary(matrix: TenorMatrix, long: str, short: str, last: int | None = None) -> dict:
+    points = matrix.spread(long, short)
+    if not points:
+        raise ValueError(f"no dates quote both {long} and {short}")
+    history = [v for _, v in points]
+    date, latest = points[-1]
+    out = {
+        "long": matrix.column(long),
+        "short": matrix.column(short),
+        "date": date,
+        "spread_bps": latest,
+        "percentile": _percentile_of(sorted(history), latest),
+        "min_bps": min(history),
+        "max_bps": max(history),
+        "inverted_days": sum(1 for v in history if v < 0),
+        "observations": len(history),
+        "since": points[0][0],
+    }
+    if last:
+        out["data"] = [{"date": d, "spread_bps": v} for d, v in points[-last:]]
+    return out
+
+
+def curve_summary(matrix: TenorMatrix, date: str | None, series: list[str],
+                  maturities: list[float]) -> dict:
+    out: dict = {}
+    for s in series:
+        curve = matrix.curve(date, s)
+        curve["percentiles"] = {t: matrix.percentile(f"{s}:{t}", v) for t, v in curve["points"].items()}
+        if maturities and s in ("par", "real"):
+            curve["interpolated"] = {f"{m:g}Y": matrix.interpolate(m, date, s) for m in maturities}
+        out[s] = curve
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="US Treasury yield-curve engine over ust/* endpoints",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--series", default="par,real", help="Comma-separated: par, real, bill, long (default: par,real)")
+    common.add_argument("--from-year", type=int, default=datetime.date.today().year - 10,
+                        help="First year to load (default: 10 years ago)")
+    common.add_argument("--to-year", type=int, help="Last year to load (default: current year)")
+    common.add_argument("--workers", type=int, default=8, help="Concurrent requests (default: 8)")
+    common.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds")
+    common.add_argument("--cache-ttl", type=int,
+                        default=int(os.getenv("EODHD_CACHE_TTL", str(DEFAULT_CACHE_TTL))),
+                        help=f"Cache TTL for the current year (default: {DEFAULT_CACHE_TTL}; "
+                             "completed years are cached 30 days; 0 = off)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    curve = sub.add_parser("curve", parents=[common], help="Curve on a date with percentiles and interpolation")
+    curve.add_argument("--date", help="YYYY-MM-DD (default: latest; earlier dates use the prior observation)")
+    curve.add_argument("--maturities", default="", help="Comma-separated maturities in years to interpolate")
+    spread = sub.add_parser("spread", parents=[common], help="Spread between two tenors in bps")
+    spread.add_argument("--long", default="10Y", help="Tenor, optionally series-qualified (e.g. 10Y, real:10Y)")
+    spread.add_argument("--short", default="2Y", help="Tenor, optionally series-qualified (e.g. 2Y, 3M)")
+    spread.add_argument("--last", type=int, help="Include the latest N daily spreads")
+    matrix = sub.add_parser("matrix", parents=[common], help="Date x tenor matrix")
+    matrix.add_argument("--csv", action="store_true", help="Output CSV instead of JSON")
+    args = parser.parse_args()
+
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("Error: EODHD_API_TOKEN environment variable is not set", file=sys.stderr)
+        return 2
+    series = [s.strip() for s in args.series.split(",") if s.strip()]
+    if args.command == "spread":
+        series += [t.split(":", 1)[0] for t in (args.long, args.short) if ":" in t]
+        series = list(dict.fromkeys(series))
+    unknown = [s for s in series if s not in SERIES]
+    if unknown:
+        print(f"Error: unknown series {', '.join(unknown)} (use {', '.join(SERIES)})", file=sys.stderr)
+        return 2
+
+    try:
+        tm = fetch_matrix(token, series, args.from_year, args.to_year, args.workers,
+                          args.cache_ttl, timeout=args.timeout)
+        if args.command == "curve":
+            maturities = [float(m) for m in args.maturities.split(",") if m.strip()]
+            result = curve_summary(tm, args.date, series, maturities)
+        elif args.command == "spread":
+            result = spread_summary(tm, args.long, args.short, args.last)
+        elif args.csv:
+            sys.stdout.write(tm.to_csv())
+            return 0
+        else:
+            result = {"columns": tm.columns,
+                      "data": [{"date": d, **dict(zip(tm.columns, row))} for d, row in zip(tm.dates, tm.values)]}
+    except eodhd_client.ClientError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
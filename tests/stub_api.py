@@ -0,0 +1,51 @@
+"""Local stand-in for the EODHD API, shared by the offline tests/ suites.
+
+A suite subclasses StubHandler, implements ``do_GET`` with ``self.reply``,
+and runs it for the duration of a block:
+
+    class StubAPI(stub_api.StubHandler):
+        def do_GET(self):
+            self.reply(200, [{"close": 1}])
+
+    with stub_api.serve(StubAPI) as base_url:   # "http://127.0.0.1:<port>/api"
+        eodhd_client.fetch_json("eod", "tok", "AAPL.US", base_url=base_url)
+
+Keep-alive (HTTP/1.1) like the real API, one thread per connection, no
+request logging.
+"""
+from __future__ import annotations
+
+import contextlib
+import http.server
+import json
+import threading
+from collections.abc import Iterator
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def reply(self, status: int, body, content_type: str | None = None) -> None:
+        """Send ``body`` (bytes as-is, anything else as JSON) with a Content-Length."""
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serve(handler: type[StubHandler]) -> Iterator[str]:
+    """Serve ``handler`` on a free local port; yields the API base URL."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/api"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/bulk_crawl.py (resumable bulk-fundamentals crawl).
+
+Stdlib-only, no network: a local HTTP server stands in for EODHD. Exit 0 if
+clean, 1 on any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - A crawl runs pages concurrently, stores every page and finds the end of
+    the exchange, wasting at most workers - 1 requests past it.
+  - A failed page stops the crawl; the rerun fetches only the pages the
+    journal lacks. A cut-short journal line and a deleted page file are
+    handled on resume.
+  - --max-calls stops scheduling pages at the budget.
+  - A store refuses a job with other arguments; --restart starts over.
+  - --symbols chunks a fixed list (its own store) and passes --version through.
+  - export yields each ticker once; the CLI's crawl / status / export.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import bulk_crawl  # noqa: E402
+import eodhd_client  # noqa: E402
+import stub_api  # noqa: E402
+
+FAILURES: list[str] = []
+COMPANIES = [{"General": {"Code": f"C{i:02d}", "PrimaryTicker": f"C{i:02d}.US"}, "Highlights": {"PERatio": i}}
+             for i in range(23)]
+REQUESTS: list[dict] = []
+FAIL_OFFSETS: set[int] = set()
+LOCK = threading.Lock()
+ACTIVE = [0, 0]  # in flight, peak
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class StubAPI(stub_api.StubHandler):
+    """bulk-fundamentals pages as {"0": {...}, ...}; offsets in FAIL_OFFSETS answer 429 once."""
+
+    def do_GET(self):
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query))
+        with LOCK:
+            REQUESTS.append(query)
+            ACTIVE[0] += 1
+            ACTIVE[1] = max(ACTIVE)
+        time.sleep(0.02)
+        offset = int(query.get("offset", 0))
+        if offset in FAIL_OFFSETS:
+            FAIL_OFFSETS.discard(offset)
+            status, body = 429, {"error": "Too Many Requests"}
+        elif "symbols" in query:
+            wanted = query["symbols"].split(",")
+            status = 200
+            body = {str(k): c for k, c in enumerate(c for c in COMPANIES if c["General"]["PrimaryTicker"] in wanted)}
+        else:
+            page = COMPANIES[offset:offset + int(query.get("limit", 500))]
+            status, body = 200, {str(k): c for k, c in enumerate(page)}
+        with LOCK:
+            ACTIVE[0] -= 1
+        self.reply(status, body)
+
+
+def reset() -> None:
+    REQUESTS.clear()
+    ACTIVE[:] = [0, 0]
+
+
+def offsets() -> list[int]:
+    return sorted(int(q["offset"]) for q in REQUESTS if "offset" in q)
+
+
+def test_crawl(base_url: str, tmp: str) -> None:
+    store = os.path.join(tmp, "full")
+    reset()
+    summary = bulk_crawl.crawl("nasdaq", "tok", store, limit=5, workers=3, base_url=base_url)
+    entries = list(bulk_crawl.iter_entries(store))
+    check(summary["done"] and summary["end"] == 4 and summary["rows"] == 23 and summary["pages"] == 5
+          and [e["General"]["Code"] for e in entries] == [c["General"]["Code"] for c in COMPANIES],
+          "every page stored, end of exchange found")
+    check(ACTIVE[1] > 1 and len(REQUESTS) <= 5 + 2 and summary["calls"] == 100 * len(REQUESTS),
+          f"pages fetched concurrently, {len(REQUESTS) - 5} wasted past the end")
+    rerun = bulk_crawl.crawl("NASDAQ", "tok", store, limit=5, workers=3, base_url=base_url)
+    check(rerun["fetched"] == 0 and rerun["calls"] == 0 and len(REQUESTS) == summary["calls"] // 100,
+          "a finished crawl fetches nothing")
+    journal = Path(store, bulk_crawl.JOURNAL).read_text().splitlines()
+    check(sum('"done": true' in line for line in journal) == 1 and not any(f.endswith(".tmp") for f in os.listdir(store)),
+          "one done line, no temp files left")
+
+
+def test_resume(base_url: str, tmp: str) -> None:
+    store = os.path.join(tmp, "resume")
+    reset()
+    FAIL_OFFSETS.add(10)
+    first = bulk_crawl.crawl("NYSE", "tok", store, limit=5, workers=1, base_url=base_url)
+    check(first["error"] and "429" in first["error"] and not first["done"] and offsets() == [0, 5, 10],
+          "a failed page stops scheduling")
+    with open(os.path.join(store, bulk_crawl.JOURNAL), "a", encoding="utf-8") as fh:
+        fh.write('{"page": 7, "rows"')  # killed mid-write
+    reset()
+    second = bulk_crawl.crawl("NYSE", "tok", store, limit=5, workers=2, base_url=base_url)
+    check(second["done"] and second["rows"] == 23 and offsets()[:3] == [10, 15, 20] and 0 not in offsets(),
+          "resume fetches only the missing pages")
+    os.remove(bulk_crawl.page_path(store, 1))
+    check(not bulk_crawl.read_journal(store)["done"], "a deleted page file reopens the crawl")
+    reset()
+    third = bulk_crawl.crawl("NYSE", "tok", store, limit=5, workers=2, base_url=base_url)
+    check(third["done"] and offsets() == [5], "only the deleted page is refetched, nothing past the end")
+
+    reset()
+    budget = bulk_crawl.crawl("AMEX", "tok", os.path.join(tmp, "budget"), limit=5, workers=4, max_calls=250,
+                              base_url=base_url)
+    check(budget["budget_reached"] and budget["calls"] == 200 and offsets() == [0, 5],
+          "--max-calls stops scheduling at the budget")
+    try:
+        bulk_crawl.crawl("AMEX", "tok", os.path.join(tmp, "budget"), limit=10, base_url=base_url)
+        check(False, "a store refuses other arguments")
+    except eodhd_client.ClientError as exc:
+        check("--restart" in str(exc), "a store refuses other arguments")
+    restarted = bulk_crawl.crawl("AMEX", "tok", os.path.join(tmp, "budget"), limit=10, restart=True,
+                                 base_url=base_url)
+    check(restarted["done"] and restarted["pages"] == 3, "--restart starts over")
+
+
+def test_symbols(base_url: str, tmp: str) -> None:
+    wanted = [f"C{i:02d}.US" for i in (1, 3, 5, 7, 9, 11, 13)]
+    reset()
+    summary = bulk_crawl.crawl("US", "tok", None, version="1.2", symbols=wanted, limit=3, workers=3,
+                               base_url=base_url)
+    check(summary["done"] and summary["pages"] == 3 and summary["rows"] == 7 and len(REQUESTS) == 3
+          and all(q["version"] == "1.2" and "offset" not in q for q in REQUESTS)
+          and summary["calls"] == 3 * 100 + 7, "--symbols chunks the list, --version passed through")
+    check(os.path.basename(summary["store"]).startswith("US-v1.2-s")
+          and bulk_crawl.job_name("US", "1.2", wanted) != bulk_crawl.job_name("US", "1.2", wanted[:3]),
+          "symbol subsets get their own store")
+
+    store = os.path.join(tmp, "dupes")
+    bulk_crawl.crawl("LSE", "tok", store, limit=5, base_url=base_url)
+    # The listing shifted between runs: page 1 now also holds C02, last seen on page 0.
+    page = json.loads(Path(bulk_crawl.page_path(store, 1)).read_text())
+    Path(bulk_crawl.page_path(store, 1)).write_text(json.dumps([COMPANIES[2]] + page))
+    codes = [e["General"]["Code"] for e in bulk_crawl.iter_entries(store)]
+    check(len(codes) == 23 and len(set(codes)) == 23 and codes.index("C02") > codes.index("C04"),
+          "export keeps each ticker once, from its latest page")
+
+
+def test_cli(base_url: str, tmp: str) -> None:
+    env = {**os.environ, "EODHD_API_TOKEN": "tok", "EODHD_CACHE_DIR": tmp, "EODHD_DAEMON": "0"}
+    script = [sys.executable, str(SCRIPTS / "bulk_crawl.py")]
+
+    def run(*args):
+        return subprocess.run(script + list(args), capture_output=True, text=True, env=env)
+
+    missing = run("status", "--exchange", "XETRA")
+    FAIL_OFFSETS.add(500)
+    COMPANIES.extend({"General": {"Code": f"D{i:03d}"}} for i in range(600))
+    try:
+        failed = run("crawl", "--exchange", "XETRA", "--workers", "1", "--base-url", base_url)
+        resumed = run("crawl", "--exchange", "XETRA", "--workers", "1", "--base-url", base_url)
+        status = json.loads(run("status", "--exchange", "XETRA").stdout)
+        exported = run("export", "--exchange", "XETRA").stdout.splitlines()
+    finally:
+        del COMPANIES[23:]
+    check(missing.returncode == 2 and failed.returncode == 1 and "rerun the same command" in failed.stderr,
+          "status before a crawl exits 2; a failed page exits 1")
+    check(resumed.returncode == 0 and json.loads(resumed.stdout)["fetched"] == 1
+          and status["done"] and status["rows"] == 623 and status["calls"] == 300 and len(exported) == 623,
+          "resume, status (calls include the failed page) and export through the CLI")
+
+
+def main() -> int:
+    eodhd_client.USE_DAEMON = False
+    with stub_api.serve(StubAPI) as base_url, tempfile.TemporaryDirectory() as tmp:
+        bulk_crawl.STORE_DIR = os.path.join(tmp, "stores")
+        for fn in (test_crawl, test_resume, test_symbols, test_cli):
+            print(f"\n{fn.__name__}:")
+            fn(base_url, tmp)
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All bulk_crawl tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/company_brief.py and the pooled http_get.
+
+Stdlib-only, no network: fetch_json is replaced by a fake with per-endpoint
+latencies, and the connection pool is exercised against a local keep-alive
+HTTP server. Exit 0 if clean, 1 on any failure — matches the convention of
+the other tests/ suites.
+
+Covers:
+  - Every source is requested with its own params and timeout, concurrently.
+  - A failing source and an API error payload land in "errors" without
+    affecting the rest.
+  - http_get reuses keep-alive connections and still raises HTTPError on 4xx.
+"""
+from __future__ import annotations
+
+import datetime
+import sys
+import time
+import urllib.error
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import company_brief as cb  # noqa: E402
+import eodhd_client  # noqa: E402
+import stub_api  # noqa: E402
+
+FAILURES: list[str] = []
+TODAY = datetime.date(2026, 10, 19)
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class FakeAPI:
+    def __init__(self):
+        self.calls: dict[str, dict] = {}
+
+    def fetch_json(self, endpoint, token, symbol=None, params=None, timeout=30, **kwargs):
+        self.calls[endpoint] = {"symbol": symbol, "params": params, "timeout": timeout}
+        time.sleep(0.2)
+        if endpoint == "sentiment":
+            raise eodhd_client.ClientError("Request failed: timed out")
+        if endpoint == "insider-transactions":
+            return {"error": "Forbidden", "code": 403}
+        return [{"endpoint": endpoint}]
+
+
+def test_fetch_brief() -> None:
+    fake = FakeAPI()
+    cb.eodhd_client.fetch_json = fake.fetch_json
+    started = time.monotonic()
+    brief = cb.fetch_brief("tok", "AAPL.US", today=TODAY, timeouts={"news": 5})
+    elapsed = time.monotonic() - started
+    check(set(fake.calls) == {ep for ep, _ in cb.SOURCES.values()}, "every source requested")
+    check(elapsed < 0.2 * len(cb.SOURCES) / 2, f"sources fetched concurrently ({elapsed:.2f}s)")
+    check(fake.calls["news"]["timeout"] == 5 and fake.calls["real-time"]["timeout"] == 10,
+          "per-source timeouts, overridable")
+    check(fake.calls["news"]["params"] == {"s": "AAPL.US", "limit": 10}
+          and fake.calls["insider-transactions"]["params"]["code"] == "AAPL.US"
+          and fake.calls["eod"]["params"]["from"] == "2025-10-19", "per-source params and windows")
+    check(set(brief["errors"]) == {"sentiment", "insider-transactions"}
+          and "timed out" in brief["errors"]["sentiment"] and brief["errors"]["insider-transactions"] == "Forbidden",
+          "failures and API error payloads reported per source")
+    check(len(brief["sources"]) == len(cb.SOURCES) - 2 and "total" in brief["timings_ms"],
+          "remaining sources present, with timings")
+    only = cb.fetch_brief("tok", "AAPL.US", today=TODAY, sources=["eod", "real-time"])
+    check(set(only["sources"]) == {"eod", "real-time"}, "source subset")
+    try:
+        cb.brief_calls("AAPL.US", TODAY, ["bogus"])
+        check(False, "unknown source raises ClientError")
+    except eodhd_client.ClientError:
+        check(True, "unknown source raises ClientError")
+
+
+class Handler(stub_api.StubHandler):
+    connections: set = set()
+
+    def do_GET(self):
+        Handler.connections.add(self.client_address)
+        status, body = (404, b'{"error":"not found"}') if "missing" in self.path else (200, b'[{"ok":1}]')
+        self.reply(status, body)
+
+
+def test_pooled_http_get() -> None:
+    with stub_api.serve(Handler) as base:
+        results = [eodhd_client.http_get(eodhd_client.api_url("eod", "t", "AAPL.US", base_url=base))
+                   for _ in range(5)]
+        check(results == ['[{"ok":1}]'] * 5 and len(Handler.connections) == 1,
+              "sequential requests share one keep-alive connection")
+        try:
+            eodhd_client.http_get(base + "/missing")
+            check(False, "4xx raises urllib HTTPError")
+        except urllib.error.HTTPError as exc:
+            check(exc.code == 404 and b"not found" in exc.read(), "4xx raises urllib HTTPError with body")
+
+
+def main() -> int:
+    for fn in (
+        test_fetch_brief,
+        test_pooled_http_get,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All company_brief tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
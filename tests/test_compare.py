@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/compare.py.
+
+Stdlib-only, no network: the join and metrics run on synthetic price series
+for two exchange calendars. Exit 0 if clean, 1 on any failure — matches the
+convention of the other tests/ suites.
+
+Covers:
+  - outer / inner / calendar joins, forward-fill and --fill-limit, and the
+    common start date.
+  - Rebased lines, relative strength and full-period correlation by hand.
+  - Rolling correlation equals a direct per-window computation.
+  - The NumPy and stdlib engines agree (when NumPy is installed).
+  - --window below 2 is a usage error (exit 2).
+"""
+from __future__ import annotations
+
+import math
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import compare as cmp  # noqa: E402
+
+FAILURES: list[str] = []
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def close(a, b, tol: float = 1e-6) -> bool:
+    if a is None or b is None:
+        return a is b
+    return abs(a - b) <= tol
+
+
+PRICES = {
+    "US": {"2026-01-02": 10.0, "2026-01-05": 11.0, "2026-01-06": 12.0, "2026-01-08": 12.0},
+    "DE": {"2026-01-01": 50.0, "2026-01-02": 50.0, "2026-01-05": 55.0, "2026-01-07": 60.0, "2026-01-08": 66.0},
+}
+
+
+def test_join() -> None:
+    dates, cols = cmp.join(PRICES, ["US", "DE"], "outer")
+    check(dates == ["2026-01-02", "2026-01-05", "2026-01-06", "2026-01-07", "2026-01-08"],
+          "outer: union of dates from the first date both have a price")
+    check(cols[0] == [10.0, 11.0, 12.0, 12.0, 12.0] and cols[1] == [50.0, 55.0, 55.0, 60.0, 66.0],
+          "outer: gaps forward-filled from each ticker's own last price")
+    dates, cols = cmp.join(PRICES, ["US", "DE"], "inner")
+    check(dates == ["2026-01-02", "2026-01-05", "2026-01-08"], "inner: only dates both traded")
+    dates, cols = cmp.join(PRICES, ["US", "DE"], "US")
+    check(dates == ["2026-01-02", "2026-01-05", "2026-01-06", "2026-01-08"] and cols[1][-1] == 66.0,
+          "calendar join: the named ticker's dates")
+    _, cols = cmp.join(PRICES, ["US", "DE"], "outer", fill=False)
+    check(cols[0][3] is None and cols[1][2] is None, "no fill leaves gaps empty")
+    sparse = {"A": {f"2026-01-0{d}": float(d) for d in range(1, 7)}, "B": {"2026-01-01": 1.0}}
+    _, cols = cmp.join(sparse, ["A", "B"], "outer", fill_limit=2)
+    check(cols[1] == [1.0, 1.0, 1.0, None, None, None], "fill limit caps consecutive forward-fills")
+    try:
+        cmp.join(PRICES, ["US", "DE"], "XX")
+        check(False, "unknown join raises ValueError")
+    except ValueError:
+        check(True, "unknown join raises ValueError")
+
+
+def series(n: int, seed: int, drift: float) -> dict[str, float]:
+    rng = random.Random(seed)
+    price, out = 100.0, {}
+    for i in range(n):
+        price *= 1 + drift + rng.gauss(0, 0.01)
+        out[f"2025-{1 + i // 28:02d}-{1 + i % 28:02d}"] = price
+    return out
+
+
+def rolling_direct(x, y, window):
+    out = [None] * (len(x) + 1)
+    for i in range(window, len(x) + 1):
+        out[i] = cmp._corr(x[i - window:i], y[i - window:i])
+    return out
+
+
+def test_metrics() -> None:
+    prices = {"A": series(120, 1, 0.001), "B": series(120, 2, 0.0)}
+    prices["C"] = {d: 0.5 * p + 0.5 * prices["A"][d] for d, p in series(120, 3, 0.0).items()}
+    engines = [False] + ([True] if cmp.np is not None else [])
+    results = {}
+    for use_numpy in engines:
+        res = cmp.compare(prices, ["A", "B", "C"], window=20, use_numpy=use_numpy)
+        results[use_numpy] = res
+        a, c = res["columns"]["close"]["A"], res["columns"]["close"]["C"]
+        label = "numpy" if use_numpy else "stdlib"
+        check(res["columns"]["rebased"]["C"][0] == 100.0
+              and close(res["columns"]["rebased"]["C"][-1], c[-1] / c[0] * 100, 1e-4), f"{label}: rebased")
+        check(close(res["columns"]["rel_strength"]["C"][-1], (c[-1] / c[0]) / (a[-1] / a[0]) * 100, 1e-4),
+              f"{label}: relative strength vs base")
+        ra = [y / x - 1 for x, y in zip(a, a[1:])]
+        rc = [y / x - 1 for x, y in zip(c, c[1:])]
+        direct = rolling_direct(rc, ra, 20)
+        got = res["columns"]["rolling_corr"]["C"]
+        check(got[:20] == [None] * 20 and all(close(g, round(d, 6), 1e-5) for g, d in zip(got[20:], direct[20:])),
+              f"{label}: rolling correlation matches a per-window computation")
+        check(res["summary"]["A"]["correlation_to_base"] == 1.0
+              and 0.3 < res["summary"]["C"]["correlation_to_base"] < 1.0, f"{label}: full-period correlation")
+    if len(results) == 2:
+        same = all(close(x, y, 1e-6) for f in ("rebased", "rel_strength", "rolling_corr") for s in "ABC"
+                   for x, y in zip(results[True]["columns"][f][s], results[False]["columns"][f][s]))
+        check(same and results[True]["summary"] == results[False]["summary"], "numpy and stdlib engines agree")
+    csv = cmp.render_csv(results[False], ["close", "rebased"]).splitlines()
+    check(csv[0] == "date,close:A,close:B,close:C,rebased:A,rebased:B,rebased:C" and len(csv) == 121,
+          "CSV has one field:SYMBOL column per series")
+    check(math.isclose(results[False]["summary"]["A"]["rel_strength"], 100.0), "base's relative strength is 100")
+
+
+def test_cli_window() -> None:
+    for window in ("1", "0"):
+        proc = subprocess.run([sys.executable, str(SCRIPTS / "compare.py"), "--symbols", "A.US,B.US",
+                               "--window", window], capture_output=True, text=True)
+        check(proc.returncode == 2 and "--window" in proc.stderr, f"--window {window} is a usage error")
+
+
+def main() -> int:
+    for fn in (
+        test_join,
+        test_metrics,
+        test_cli_window,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All compare tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/eodhd_daemon.py.
+
+Stdlib-only, no network: a local HTTP server stands in for EODHD and the
+daemon serves on a temporary Unix socket in a thread of this process, with
+eodhd_client pointed at it through EODHD_DAEMON_SOCKET. Exit 0 if clean, 1
+on any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - Client calls are forwarded transparently; TTL requests are answered from
+    the daemon's memory cache, TTL-less ones always reach the API.
+  - HTTP errors come back as the same ClientError/HTTPError as without it.
+  - API-call accounting per rate-limits.md costs, refunds for failed
+    requests, and --daily-budget refusals.
+  - The sliding-window limiter blocks the request past the limit, and a
+    request that would wait past the caller's deadline gets a 429 instead.
+  - Unexpected errors (http.client, handler bugs) are replied to and refunded.
+  - Client metrics of a daemon-served request carry the daemon's cache
+    result, bytes and cost.
+  - A stale socket file falls back to direct requests.
+"""
+from __future__ import annotations
+
+import http.client
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client  # noqa: E402
+import eodhd_daemon as ed  # noqa: E402
+import eodhd_metrics  # noqa: E402
+import stub_api  # noqa: E402
+
+FAILURES: list[str] = []
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class StubAPI(stub_api.StubHandler):
+    hits: list[str] = []
+
+    def do_GET(self):
+        StubAPI.hits.append(self.path)
+        status, body = (404, b'{"error":"not found"}') if "MISSING" in self.path else (200, b'[{"close":1}]')
+        self.reply(status, body)
+
+
+def test_call_cost() -> None:
+    base = "https://eodhd.com/api"
+    check(ed.call_cost(f"{base}/eod/AAPL.US?api_token=x") == 1
+          and ed.call_cost(f"{base}/fundamentals/AAPL.US") == 10
+          and ed.call_cost(f"{base}/intraday/AAPL.US") == 5, "flat per-endpoint costs")
+    check(ed.call_cost(f"{base}/news?s=AAPL.US,MSFT.US") == 15
+          and ed.call_cost(f"{base}/real-time/AAPL.US?s=MSFT.US,TSLA.US") == 3
+          and ed.call_cost(f"{base}/eod-bulk-last-day/US?symbols=A,B,C") == 103
+          and ed.call_cost(f"{base}/mp/praams/analyse/equity/ticker/AAPL") == 10, "per-ticker and bulk costs")
+
+
+def test_rate_limiter() -> None:
+    limiter = ed.RateLimiter(3, window=0.3)
+    started = time.monotonic()
+    waits = [limiter.acquire() for _ in range(4)]
+    elapsed = time.monotonic() - started
+    check(waits[:3] == [0.0] * 3 and waits[3] > 0 and 0.25 < elapsed < 1.0,
+          f"fourth request waits for the window ({elapsed:.2f}s)")
+    limiter = ed.RateLimiter(1, window=5)
+    limiter.acquire()
+    started = time.monotonic()
+    check(limiter.acquire(max_wait=0.05) is None and time.monotonic() - started < 0.1
+          and len(limiter.sent) == 1, "past max_wait: no slot taken and no sleep")
+
+
+def test_deadline_and_failures() -> None:
+    state = ed.DaemonState(rpm=1, window=30)
+    state.limiter.acquire()
+    reply = state.get("https://eodhd.com/api/eod/AAPL.US?api_token=x", max_wait=0.1)
+    check(reply["error"]["code"] == 429 and state.calls == 0,
+          "a request that would wait past the caller's deadline gets a refunded 429")
+    check(eodhd_client.DAEMON_WAIT < state.limiter.window, "the client asks for a bounded limiter wait")
+
+    def broken(url, timeout=30):
+        raise http.client.RemoteDisconnected("Remote end closed connection without response")
+
+    real, eodhd_client.http_get = eodhd_client.http_get, broken
+    state = ed.DaemonState(rpm=100)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "d.sock")
+        server = ed.make_server(path, state)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            reply = ed.rpc(path, {"op": "get", "url": "https://eodhd.com/api/eod/AAPL.US", "wait": 1})
+            check("error" in reply and "Remote end closed" in reply["error"]["reason"] and state.calls == 0,
+                  "http.client errors are replied to and refunded")
+            state.handle = lambda request: 1 / 0
+            reply = ed.rpc(path, {"op": "status"})
+            check(reply is not None and "ZeroDivisionError" in reply["error"]["reason"],
+                  "any handler failure still gets a reply")
+        finally:
+            eodhd_client.http_get = real
+            server.shutdown()
+            server.server_close()
+
+
+def test_forwarding() -> None:
+    with stub_api.serve(StubAPI) as base, tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "d.sock")
+        os.environ["EODHD_DAEMON_SOCKET"] = path
+        eodhd_client.CACHE_DIR = tmp
+        state = ed.DaemonState(rpm=100, daily_budget=20)
+        server = ed.make_server(path, state)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            check(oct(os.stat(path).st_mode & 0o777) == "0o600", "socket is owner-only")
+            fetch = lambda ep, sym, ttl=0: eodhd_client.fetch_json(ep, "tok", sym, base_url=base,  # noqa: E731
+                                                                     cache_ttl=ttl)
+            rows = [fetch("eod", "AAPL.US", 60) for _ in range(3)]
+            check(rows == [[{"close": 1}]] * 3 and len(StubAPI.hits) == 1, "TTL requests: one API hit, then memory")
+            check(state.counts["memory_hits"] == 2 and state.calls == 1, "cache hits are not charged")
+            fetch("eod", "AAPL.US")
+            fetch("eod", "AAPL.US")
+            check(len(StubAPI.hits) == 3, "requests without a TTL always reach the API")
+            try:
+                fetch("eod", "MISSING.US")
+                check(False, "HTTP errors surface as ClientError")
+            except eodhd_client.ClientError as exc:
+                check(str(exc).startswith("HTTP Error 404"), "HTTP errors surface as ClientError")
+            check(state.calls == 3, "failed requests are refunded")
+            fetch("fundamentals", "AAPL.US")
+            try:
+                fetch("fundamentals", "MSFT.US")
+                check(False, "daily budget refuses the request that would overrun it")
+            except eodhd_client.ClientError as exc:
+                check("daily budget of 20" in str(exc) and state.calls == 13,
+                      "daily budget refuses the request that would overrun it")
+            status = ed.rpc(path, {"op": "status"})
+            check(status["counts"]["network"] == 5 and status["counts"]["refused"] == 1 and status["usage"]["calls"] == 13
+                  and status["pooled_connections"] >= 1, "status reports counts, usage and the pool")
+            eodhd_client.set_metrics(os.path.join(tmp, "metrics.jsonl"))
+            try:
+                fetch("eod", "NVDA.US", 60)
+                fetch("eod", "NVDA.US", 60)
+            finally:
+                eodhd_client.set_metrics("")
+            records = [{k: r.get(k) for k in ("daemon", "cache", "bytes", "cost")} for r in eodhd_client.METRICS[-2:]]
+            check(records == [{"daemon": True, "cache": "miss", "bytes": len(b'[{"close":1}]'), "cost": 1},
+                              {"daemon": True, "cache": "memory", "bytes": 0, "cost": 0}],
+                  "metrics record the daemon's cache result, bytes and cost")
+            summary = eodhd_metrics.summarize(eodhd_client.METRICS[-2:])["eod"]
+            check(summary["cache_hits"] == 1 and summary["cost"] == 1, "summaries count daemon-served requests")
+            try:
+                ed.make_server(path, state)
+                check(False, "a second daemon on the same socket is refused")
+            except eodhd_client.ClientError:
+                check(True, "a second daemon on the same socket is refused")
+        finally:
+            server.shutdown()
+            server.server_close()
+        # The socket file outlives the server: clients must fall back to direct requests.
+        with socket.socket(socket.AF_UNIX) as stale:
+            os.unlink(path)
+            stale.bind(path)
+        before = len(StubAPI.hits)
+        check(fetch("eod", "MSFT.US") == [{"close": 1}] and len(StubAPI.hits) == before + 1,
+              "stale socket falls back to a direct request")
+        del os.environ["EODHD_DAEMON_SOCKET"]
+
+
+def main() -> int:
+    for fn in (
+        test_call_cost,
+        test_rate_limiter,
+        test_deadline_and_failures,
+        test_forwarding,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All eodhd_daemon tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
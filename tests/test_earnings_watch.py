@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/earnings_watch.py.
+
+Stdlib-only, no network: fetch_many/fetch_json are replaced by a fake
+calendar that answers date-window and symbols= queries from a mutable list.
+Exit 0 if clean, 1 on any failure — matches the convention of the other
+tests/ suites.
+
+Covers:
+  - Monday-aligned buckets and the refresh tiers.
+  - The first poll reports every event as added; an unchanged re-poll is empty.
+  - Estimate revisions, reported actuals, removals and date moves (across
+    buckets, detected via one symbols= lookup) arrive as typed deltas.
+  - Only due buckets are refetched; trends deltas for a watch list.
+  - A failing calendar/trends fetch records nothing, so no delta is lost.
+"""
+from __future__ import annotations
+
+import copy
+import datetime
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import earnings_watch as ew  # noqa: E402
+
+FAILURES: list[str] = []
+TODAY = datetime.date(2026, 10, 14)  # a Wednesday
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def day(offset: int) -> str:
+    return (TODAY + datetime.timedelta(days=offset)).isoformat()
+
+
+class FakeCalendar:
+    def __init__(self):
+        self.events = [
+            {"code": "AAPL.US", "date": "2026-09-30", "report_date": day(1), "actual": None, "estimate": 1.6},
+            {"code": "MSFT.US", "date": "2026-09-30", "report_date": day(9), "actual": None, "estimate": 3.1},
+            {"code": "SAP.XETRA", "date": "2026-09-30", "report_date": day(-2), "actual": 1.2, "estimate": 1.1},
+            {"code": "NKE.US", "date": "2026-08-31", "report_date": day(20), "actual": None, "estimate": 0.5},
+        ]
+        self.trends = [[{"code": "AAPL.US", "period": "0q", "date": "2026-12-31", "epsTrendCurrent": "2.10"}]]
+        self.windows = []
+        self.lookups = []
+
+    def query(self, endpoint, params):
+        if endpoint == "calendar/trends":
+            return {"type": "Trends", "trends": copy.deepcopy(self.trends)}
+        if "symbols" in params:
+            self.lookups.append(params["symbols"])
+            codes = params["symbols"].split(",")
+            rows = [e for e in self.events if e["code"] in codes]
+        else:
+            self.windows.append(params["from"])
+            rows = [e for e in self.events if params["from"] <= e["report_date"] <= params["to"]]
+        return {"type": "Earnings", "earnings": copy.deepcopy(rows)}
+
+    def fetch_many(self, calls, token, workers=8, **kwargs):
+        return [self.query(c["endpoint"], c["params"]) for c in calls]
+
+    def fetch_json(self, endpoint, token, symbol=None, params=None, **kwargs):
+        return self.query(endpoint, params or {})
+
+
+def install(cal: FakeCalendar) -> None:
+    ew.eodhd_client.fetch_many = cal.fetch_many
+    ew.eodhd_client.fetch_json = cal.fetch_json
+
+
+def ops(deltas) -> dict:
+    return {d["key"]: (d["op"], tuple(d.get("kinds", ()))) for d in deltas}
+
+
+def test_buckets_and_tiers() -> None:
+    starts = ew.bucket_starts(TODAY - datetime.timedelta(days=7), TODAY + datetime.timedelta(days=30))
+    check(all(b.weekday() == 0 for b in starts) and starts[0] <= TODAY - datetime.timedelta(days=7),
+          "buckets are Monday-aligned and cover the window")
+    monday = TODAY - datetime.timedelta(days=TODAY.weekday())
+    check(ew.refresh_interval(monday, TODAY) == ew.HOT, "current week refreshed every poll")
+    check(ew.refresh_interval(monday + datetime.timedelta(days=7), TODAY) == ew.WARM, "next weeks hourly")
+    check(ew.refresh_interval(monday + datetime.timedelta(days=28), TODAY) == ew.COLD, "far weeks every 6h")
+    check(ew.refresh_interval(monday - datetime.timedelta(days=14), TODAY) == ew.SETTLED, "past weeks daily")
+
+
+def test_deltas() -> None:
+    cal = FakeCalendar()
+    install(cal)
+    state = ew.load_state("/nonexistent/state.json")
+    now = 1_000_000.0
+    first = ew.poll(state, "tok", TODAY, now, symbols=["AAPL.US"])
+    check(len([d for d in first if d["op"] == "added"]) == 5, "first poll: every event and trend added")
+    window = ew.bucket_starts(TODAY - datetime.timedelta(days=7), TODAY + datetime.timedelta(days=30))
+    hot = [b for b in window if ew.refresh_interval(b, TODAY) == ew.HOT]
+    cal.windows.clear()
+    check(ew.poll(state, "tok", TODAY, now + 10) == [], "unchanged re-poll emits nothing")
+    check(sorted(cal.windows) == [b.isoformat() for b in hot] and len(hot) < len(window),
+          "re-poll 10s later refetches only the HOT buckets")
+
+    cal.events[0]["estimate"] = 1.65
+    cal.events[0]["actual"] = 1.7
+    cal.events[1]["report_date"] = day(2)  # MSFT moves into this week's bucket
+    cal.events[3]["report_date"] = day(27)  # NKE moves between two COLD buckets
+    del cal.events[2]  # SAP disappears
+    cal.trends[0][0]["epsTrendCurrent"] = "2.15"
+    cal.lookups.clear()
+    deltas = ops(ew.poll(state, "tok", TODAY, now + 4000, symbols=["AAPL.US"]))
+    check(deltas["AAPL.US|2026-09-30"] == ("changed", ("reported", "estimate_revised")),
+          "reported actual + estimate revision")
+    check(deltas["MSFT.US|2026-09-30"] == ("changed", ("date_moved",)), "date move into a refreshed bucket")
+    check(deltas["SAP.XETRA|2026-09-30"][0] == "removed" and cal.lookups == ["SAP.XETRA"],
+          "vanished event confirmed by one symbols= lookup, then removed")
+    check(deltas["AAPL.US|0q|2026-12-31"] == ("changed", ("estimate_revised",)), "trend revision")
+    check("NKE.US|2026-08-31" not in deltas, "COLD buckets not yet due are not refetched")
+
+    later = ops(ew.poll(state, "tok", TODAY, now + 4000 + ew.COLD))
+    check(later == {"NKE.US|2026-08-31": ("changed", ("date_moved",))},
+          "move out of a refreshed bucket found via symbols= lookup is a change, not removed+added")
+    check(state["events"]["NKE.US|2026-08-31"]["report_date"] == day(27), "snapshot follows the move")
+
+
+def test_window_roll() -> None:
+    cal = FakeCalendar()
+    install(cal)
+    state = ew.load_state("/nonexistent/state.json")
+    ew.poll(state, "tok", TODAY, 0.0)
+    rolled = ew.poll(state, "tok", TODAY + datetime.timedelta(days=21), 10.0 ** 6)
+    check(all(d["op"] != "removed" for d in rolled), "events rolling out of the window are not 'removed'")
+    check("SAP.XETRA|2026-09-30" not in state["events"], "rolled-out events dropped from the snapshot")
+
+
+def test_trends_failure_keeps_deltas() -> None:
+    cal = FakeCalendar()
+    install(cal)
+    state = ew.load_state("/nonexistent/state.json")
+
+    def failing(endpoint, token, symbol=None, params=None, **kwargs):
+        if endpoint == "calendar/trends":
+            raise ew.eodhd_client.ClientError("HTTP 429")
+        return cal.query(endpoint, params or {})
+
+    ew.eodhd_client.fetch_json = failing
+    try:
+        ew.poll(state, "tok", TODAY, 1_000_000.0, symbols=["AAPL.US"])
+        check(False, "a failing trends fetch raises ClientError")
+    except ew.eodhd_client.ClientError:
+        check(state["events"] == {} and state["buckets"] == {}, "a failing trends fetch records no deltas")
+    install(cal)
+    retry = ew.poll(state, "tok", TODAY, 1_000_010.0, symbols=["AAPL.US"])
+    check(len([d for d in retry if d["op"] == "added"]) == 5, "the next poll still reports every event")
+
+
+def main() -> int:
+    for fn in (
+        test_buckets_and_tiers,
+        test_deltas,
+        test_window_roll,
+        test_trends_failure_keeps_deltas,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All earnings_watch tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
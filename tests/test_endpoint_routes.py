@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Offline tests for the registry-compiled request dispatch in eodhd_client.py.
+
+Stdlib-only, no network: builds request URLs and CLI params from the
+generated endpoint_routes table. Exit 0 if clean, 1 on any failure — matches
+the convention of the other tests/ suites.
+
+Covers:
+  - Every client endpoint has a route; every converter a route names exists.
+  - --symbol lands in the path or the endpoint's query param (s, code,
+    symbols, filter[symbol], filter[underlying_symbol]); a param the caller
+    already set wins, so library calls may pass ``s`` without a symbol.
+  - CLI flags are renamed per endpoint (filter[date_from], page[limit], ...),
+    intraday dates become Unix timestamps, symbols= drops from/to.
+  - Missing required params and unknown endpoints raise ClientError.
+  - Documented-only endpoints resolve by registry id, with --param filling
+    path placeholders and query params.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import urllib.parse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import endpoint_routes  # noqa: E402
+import eodhd_client  # noqa: E402
+
+FAILURES: list[str] = []
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def raises(fn, *args) -> str | None:
+    try:
+        fn(*args)
+    except eodhd_client.ClientError as exc:
+        return str(exc)
+    return None
+
+
+def url(endpoint: str, symbol: str | None = None, params: dict | None = None) -> tuple[str, dict]:
+    parts = urllib.parse.urlsplit(eodhd_client.api_url(endpoint, "tok", symbol, params, "https://x/api"))
+    query = dict(urllib.parse.parse_qsl(parts.query))
+    del query["api_token"], query["fmt"]
+    return parts.path.removeprefix("/api"), query
+
+
+def cli(endpoint: str, **flags) -> dict:
+    return eodhd_client.cli_params(endpoint, argparse.Namespace(**flags))
+
+
+def test_table() -> None:
+    routes = endpoint_routes.ROUTES
+    check(set(eodhd_client.SUPPORTED_ENDPOINTS) <= set(routes), "every client endpoint has a route")
+    names = {c for r in routes.values() for c in r["convert"].values()}
+    check(names <= set(eodhd_client.CONVERTERS), "every converter named by a route exists")
+    check(len(routes) > len(eodhd_client.SUPPORTED_ENDPOINTS) + 30, "documented-only endpoints are routed too")
+
+
+def test_paths() -> None:
+    check(url("eod", "AAPL.US", {"from": "2025-01-01"}) == ("/eod/AAPL.US", {"from": "2025-01-01"}),
+          "symbol in the path")
+    check(url("dividends", "AAPL.US")[0] == "/div/AAPL.US" and url("exchanges-details", "US")[0] == "/exchanges/US"
+          and url("index-components", "GSPC.INDX")[0] == "/fundamentals/GSPC.INDX", "path templates differ from names")
+    check(url("news", "AAPL.US") == ("/news", {"s": "AAPL.US"}), "news: --symbol is the s param")
+    check(url("insider-transactions", "AAPL.US")[1] == {"code": "AAPL.US"}
+          and url("calendar/dividends", "AAPL.US")[1] == {"filter[symbol]": "AAPL.US"}, "per-endpoint symbol params")
+    check(url("news", None, {"s": "MSFT.US", "limit": 5}) == ("/news", {"s": "MSFT.US", "limit": "5"}),
+          "library call passing s without a symbol")
+    check(url("calendar/earnings", "AAPL.US", {"from": "2025-01-01", "to": "2025-02-01"})[1] == {"symbols": "AAPL.US"},
+          "calendar/earnings: symbols= drops from/to")
+    check(url("intraday", "AAPL.US", {"from": "2025-01-02"})[1] == {"from": "1735776000"},
+          "intraday: dates become Unix timestamps")
+    check(url("us-options-eod", "aapl.us")[1] == {"filter[underlying_symbol]": "AAPL"}, "options: underlying ticker")
+    check(url("screener", "IGNORED")[1] == {}, "endpoints without a symbol slot ignore --symbol")
+    check(raises(url, "eod") == "--symbol is required for endpoint=eod"
+          and raises(url, "calendar/trends") == "--symbol is required for endpoint=calendar/trends",
+          "missing symbol")
+    check(raises(url, "technical", "AAPL.US") == "--function is required for endpoint=technical",
+          "missing required flag named by its CLI spelling")
+    check(raises(url, "nope") == "Unsupported endpoint: nope", "unknown endpoint")
+
+
+def test_cli_params() -> None:
+    check(cli("eod", from_date="2025-01-01", limit=5, country="US") == {"from": "2025-01-01", "limit": 5},
+          "generic flags pass through; other endpoints' flags are ignored")
+    check(cli("news-word-weights", from_date="a", to_date="b", limit=3, offset=None)
+          == {"filter[date_from]": "a", "filter[date_to]": "b", "page[limit]": 3}, "news-word-weights renames")
+    check(cli("ust/yield-rates", filter_year=2023, limit=10) == {"filter[year]": 2023, "page[limit]": 10},
+          "UST renames")
+    check(cli("economic-events", country="US", comparison="yoy") == {"country": "US", "comparison": "yoy"},
+          "endpoint-specific flags")
+    check(cli("cboe-index-data", param=["filter[index_code]=BDE30P", "filter[date]=2025-01-02"])
+          == {"filter[index_code]": "BDE30P", "filter[date]": "2025-01-02"}, "--param KEY=VALUE")
+    check(raises(lambda: cli("user", param=["oops"])) == "--param expects KEY=VALUE, got 'oops'",
+          "--param without = is rejected")
+
+
+def test_documented() -> None:
+    check(url("praams-risk-scoring-by-isin", None, {"isin": "US0378331005"})
+          == ("/mp/praams/analyse/equity/isin/US0378331005", {}), "placeholder filled from params")
+    check(url("stock-market-logos", "AAPL.US")[0] == "/logo/AAPL.US", "placeholder filled from symbol")
+    check(url("stocks-from-search", "apple inc")[0] == "/search/apple%20inc", "path values are quoted")
+    check(raises(url, "praams-report-equity-by-isin", "US0378331005") == "--param email=VALUE is required "
+          "for endpoint=praams-report-equity-by-isin", "documented required params")
+    check(eodhd_client.resolve_endpoint("ust-bill-rates")[0] == "ust/bill-rates", "registry ids alias client names")
+    check(raises(eodhd_client.resolve_endpoint, "websockets-realtime") is not None, "websocket endpoints not routed")
+
+
+def main() -> int:
+    for fn in (
+        test_table,
+        test_paths,
+        test_cli_params,
+        test_documented,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All endpoint_routes tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
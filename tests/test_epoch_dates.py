@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/epoch_dates.py (integer date encoding).
+
+Stdlib-only (the NumPy path is compared when NumPy is installed), no network.
+Exit 0 if clean, 1 on any failure — matches the convention of the other
+tests/ suites.
+
+Covers:
+  - epoch_day / iso_day round-trips and agree with NumPy's datetime64[D].
+  - unix_seconds: bare dates are midnight UTC, naive times are UTC, explicit
+    offsets are honoured; the client's intraday converter uses it.
+  - Bulk epoch_days / unix_times give the same array('q') on the NumPy and
+    stdlib paths, and malformed or partial dates ("2025", "20250102") are
+    rejected or read the same way on both.
+  - Single conversions never import NumPy.
+  - compare.join over the epoch-day grid matches a string-keyed reference.
+"""
+from __future__ import annotations
+
+import datetime
+import random
+import sys
+from array import array
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import compare  # noqa: E402
+import eodhd_client  # noqa: E402
+import epoch_dates  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FAILURES: list[str] = []
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def test_single() -> None:
+    check(epoch_dates.epoch_day("1970-01-01") == 0 and epoch_dates.epoch_day("2025-01-02") == 20090
+          and epoch_dates.epoch_day("1969-12-31") == -1 and epoch_dates.iso_day(20090) == "2025-01-02",
+          "epoch days (negative before 1970) and back")
+    check(epoch_dates.epoch_day("2025-01-02 14:30:00") == 20090, "epoch_day ignores a time part")
+    check(epoch_dates.unix_seconds("2025-01-02") == 1735776000
+          and epoch_dates.unix_seconds("2025-01-02 14:30:00") == 1735828200
+          and epoch_dates.unix_seconds("2025-01-02T16:30:00+02:00") == 1735828200,
+          "unix_seconds: midnight UTC, naive UTC, explicit offset")
+    check(eodhd_client._unix_time("2025-01-02") == 1735776000
+          and eodhd_client._unix_time("2025-01-02 14:30") == 1735828200
+          and eodhd_client._unix_time("1735776000") == "1735776000"
+          and eodhd_client._unix_time("not-a-date") == "not-a-date", "intraday converter")
+    check(epoch_dates._NUMPY == [], "single conversions do not import NumPy")
+    try:
+        epoch_dates.epoch_day("2025-02-30")
+        check(False, "impossible date raises ValueError")
+    except ValueError:
+        check(True, "impossible date raises ValueError")
+
+
+def test_bulk() -> None:
+    start = datetime.date(1990, 1, 1)
+    dates = [(start + datetime.timedelta(days=random.randrange(20000))).isoformat() for _ in range(5000)]
+    times = [f"{d} {random.randrange(24):02d}:{random.randrange(60):02d}:00" for d in dates]
+    stdlib = epoch_dates.epoch_days(dates, use_numpy=False)
+    expected = array("q", ((datetime.date.fromisoformat(d) - datetime.date(1970, 1, 1)).days for d in dates))
+    check(stdlib == expected and epoch_dates.iso_days(stdlib) == dates, "stdlib bulk path round-trips")
+    check(epoch_dates.epoch_days([]) == array("q"), "empty input")
+    mixed = ["2025-01-02", "2025-01-02 14:30:00", "2025-01-02T16:30:00+02:00"]
+    check(list(epoch_dates.unix_times(mixed)) == [1735776000, 1735828200, 1735828200],
+          "unix_times accepts dates, times and offsets")
+    if np is None:
+        print("  skip: NumPy path (NumPy not installed)")
+        return
+    check(epoch_dates.epoch_days(dates) == stdlib
+          and list(stdlib) == np.array(dates, dtype="datetime64[D]").astype(np.int64).tolist(),
+          "NumPy path matches the stdlib path and datetime64[D]")
+    check(epoch_dates.unix_times(times) == epoch_dates.unix_times(times, use_numpy=False),
+          "unix_times: NumPy and stdlib paths agree")
+    for odd in ("2025", "2025-01", "20250102", "2025-01-02x", "2025-01-02T10:00"):
+        results = []
+        for use_numpy in (None, False):
+            try:
+                results.append(list(epoch_dates.epoch_days(["2025-01-03", odd], use_numpy=use_numpy)))
+            except ValueError:
+                results.append("ValueError")
+        check(results[0] == results[1], f"{odd!r}: NumPy and stdlib paths agree ({results[1]})")
+    for odd in ("2025", "2025-01"):
+        try:
+            epoch_dates.unix_times(["2025-01-02 14:30", odd])
+            check(False, f"unix_times: {odd!r} raises like the stdlib path")
+        except ValueError:
+            check(True, f"unix_times: {odd!r} raises like the stdlib path")
+    for bad in (["2025-01-02", ""], ["2025-01-02", "NaT"], ["2025-01-02", None]):
+        try:
+            epoch_dates.epoch_days(bad)
+            check(False, f"{bad[1]!r} raises on the bulk path")
+        except (ValueError, TypeError):
+            check(True, f"{bad[1]!r} raises on the bulk path")
+
+
+def _reference_join(prices, symbols, how, fill_limit):
+    """The previous string-keyed join, kept to check the grid version against."""
+    anchor = symbols.index(how) if how in symbols else None
+    index = sorted(set().union(*(prices[s] for s in symbols)))
+    dates, columns = [], [[] for _ in symbols]
+    last, age, started = [None] * len(symbols), [0] * len(symbols), False
+    for date in index:
+        row = [prices[s].get(date) for s in symbols]
+        keep = (all(v is not None for v in row) if how == "inner"
+                else row[anchor] is not None if anchor is not None else True)
+        for j in range(len(symbols)):
+            if row[j] is not None:
+                last[j], age[j] = row[j], 0
+            elif last[j] is not None and (fill_limit is None or age[j] < fill_limit):
+                row[j], age[j] = last[j], age[j] + 1
+        started = started or all(v is not None for v in row)
+        if keep and started:
+            dates.append(date)
+            for j in range(len(symbols)):
+                columns[j].append(row[j])
+    return dates, columns
+
+
+def test_join() -> None:
+    days = [(datetime.date(2020, 1, 1) + datetime.timedelta(days=d)).isoformat() for d in range(400)]
+    prices = {s: {d: random.random() for d in random.sample(days, 300)} for s in ("A", "B", "C")}
+    symbols = ["A", "B", "C"]
+    same = all(compare.join(prices, symbols, how, True, limit) == _reference_join(prices, symbols, how, limit)
+               for how in ("outer", "inner", "B") for limit in (None, 1))
+    check(same, "compare.join on epoch days matches the string-keyed join")
+
+
+def main() -> int:
+    random.seed(7)
+    for fn in (test_single, test_bulk, test_join):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All epoch_dates tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Offline tests for the local technical-indicator engine (indicators.py) and
+``eodhd_client.py --technical-mode local``.
+
+Stdlib-only, no network. Exit 0 if clean, 1 on any failure — matches the
+convention of the other tests/ suites.
+
+Covers:
+  - Each streaming indicator matches a naive O(n x period) reference
+    definition on synthetic OHLC bars.
+  - Cross-check against recorded API output: for each RECORDED_SYMBOLS
+    ticker, the ``eod`` bars and the ``/technical`` responses replayed from
+    tests/cassettes/technical agree within 0.5% over the last year. Missing
+    cassettes are a failure, not a skip.
+  - The client's local mode warms up before --from-date, trims to it, and
+    honours ``--filter last_<field>``; a missing or unknown --function or a
+    period below 2 is a usage error (exit 2) raised before any fetch.
+
+Record the cassettes through the client's record transport (needs
+EODHD_API_TOKEN, about 50 API calls per symbol), then commit them:
+  python tests/test_indicators.py --record
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import math
+import os
+import random
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+CASSETTES = REPO_ROOT / "tests" / "cassettes" / "technical"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client as client  # noqa: E402
+import indicators  # noqa: E402
+
+FAILURES: list[str] = []
+
+# Recorded tickers and (function, period) pairs; periods follow the "standard
+# practice" column of the technical-indicators reference. The window is fixed
+# so the request URLs, and with them the cassette names, never change; five
+# years of bars let the recursive indicators converge.
+RECORDED_SYMBOLS = ("AAPL.US",)
+RECORDED = [("sma", 20), ("ema", 20), ("wma", 20), ("rsi", 14), ("macd", None),
+            ("stochastic", None), ("cci", 20), ("adx", 14), ("atr", 14), ("bbands", 20)]
+RECORDED_WINDOW = {"from": "2020-01-01", "to": "2024-12-31"}
+REPLAY_TOKEN = "replay-token"
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def synthetic_eod(n: int = 300, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    rows, price = [], 100.0
+    for i in range(n):
+        o = price
+        c = max(1.0, o * (1 + rng.gauss(0, 0.02)))
+        h = max(o, c) * (1 + abs(rng.gauss(0, 0.01)))
+        lo = min(o, c) * (1 - abs(rng.gauss(0, 0.01)))
+        day = datetime.date(2020, 1, 1) + datetime.timedelta(days=i)
+        rows.append({"date": day.isoformat(), "open": o, "high": h, "low": lo,
+                     "close": c, "adjusted_close": c / 2})
+        price = c
+    return rows
+
+
+def agree(local: list[dict], reference: list[dict], fields: list[str], rel: float = 1e-9) -> bool:
+    ref = {r["date"]: r for r in reference}
+    common = [r for r in local if r["date"] in ref]
+    if not common:
+        return False
+    for row in common:
+        for f in fields:
+            a, b = row.get(f), ref[row["date"]].get(f)
+            if b is None or a is None or abs(a - b) > rel * max(1.0, abs(b)):
+                return False
+    return True
+
+
+# --- naive reference definitions -------------------------------------------------
+
+def ref_sma(c, p):
+    return [sum(c[i - p + 1:i + 1]) / p if i >= p - 1 else None for i in range(len(c))]
+
+
+def ref_wma(c, p):
+    w = p * (p + 1) / 2
+    return [sum(c[i - p + 1 + k] * (k + 1) for k in range(p)) / w if i >= p - 1 else None
+            for i in range(len(c))]
+
+
+def ref_bbands(c, p):
+    out = []
+    for i in range(len(c)):
+        if i < p - 1:
+            out.append(None)
+            continue
+        win = c[i - p + 1:i + 1]
+        m = sum(win) / p
+        sd = math.sqrt(sum((x - m) ** 2 for x in win) / p)
+        out.append((m + 2 * sd, m, m - 2 * sd))
+    return out
+
+
+def ref_stoch_fast_k(b, p):
+    out = []
+    for i in range(len(b["close"])):
+        if i < p - 1:
+            out.append(None)
+            continue
+        hh = max(b["high"][i - p + 1:i + 1])
+        ll = min(b["low"][i - p + 1:i + 1])
+        out.append(100 * (b["close"][i] - ll) / (hh - ll))
+    return out
+
+
+def as_rows(dates, values, name):
+    return [{"date": d, name: v} for d, v in zip(dates, values) if v is not None]
+
+
+def test_against_reference_definitions() -> None:
+    bars = indicators.bars_from_eod(synthetic_eod())
+    c, d = bars["close"], bars["date"]
+    check(abs(bars["high"][0] - synthetic_eod()[0]["high"] / 2) < 1e-12,
+          "bars_from_eod scales OHLC by adjusted_close/close")
+    check(agree(indicators.compute("sma", bars, 20), as_rows(d, ref_sma(c, 20), "sma"), ["sma"]),
+          "sma == naive window mean")
+    check(agree(indicators.compute("wma", bars, 20), as_rows(d, ref_wma(c, 20), "wma"), ["wma"]),
+          "wma (O(n) running form) == naive weighted mean")
+    bb = ref_bbands(c, 20)
+    ref_rows = [{"date": dt, "bbands_upper": v[0], "bbands_middle": v[1], "bbands_lower": v[2]}
+                for dt, v in zip(d, bb) if v is not None]
+    check(agree(indicators.compute("bbands", bars, 20), ref_rows,
+                ["bbands_upper", "bbands_middle", "bbands_lower"], 1e-7),
+          "bbands == naive mean +/- 2 population sd")
+    fast_k = ref_stoch_fast_k(bars, 14)
+    slow_k = [None] * 13 + ref_sma(fast_k[13:], 3)
+    slow_d = [None] * 15 + ref_sma(slow_k[15:], 3)
+    stoch_ref = [{"date": dt, "stochastic_k": k, "stochastic_d": dd}
+                 for dt, k, dd in zip(d, slow_k, slow_d) if dd is not None]
+    check(agree(indicators.compute("stoch", bars), stoch_ref, ["stochastic_k", "stochastic_d"]),
+          "stochastic 14/3/3 (deque window) == naive high/low scan")
+    ema = indicators.compute("ema", bars, 10)
+    k = 2 / 11
+    e = sum(c[:10]) / 10
+    for x in c[10:]:
+        e = x * k + e * (1 - k)
+    check(ema[0]["date"] == d[9] and abs(ema[-1]["ema"] - e) < 1e-9,
+          "ema seeded with SMA, k = 2/(n+1)")
+    macd = indicators.compute("macd", bars)
+    check(all(abs(r["macd_hist"] - (r["macd"] - r["macd_signal"])) < 1e-12 for r in macd)
+          and macd[0]["date"] == d[25 + 8], "macd hist = line - signal; first value after 26+9-1 bars")
+    rsi = indicators.compute("rsi", bars, 14)
+    check(rsi[0]["date"] == d[14] and all(0 <= r["rsi"] <= 100 for r in rsi),
+          "rsi starts after 14 changes and stays in [0, 100]")
+    atr = indicators.compute("atr", bars, 14)
+    check(atr[0]["date"] == d[13] and all(r["atr"] > 0 for r in atr), "atr Wilder-smoothed, positive")
+    adx = indicators.compute("adx", bars, 14)
+    check(adx[0]["date"] == d[27] and all(0 <= r["adx"] <= 100 for r in adx),
+          "adx starts after 2 x period bars and stays in [0, 100]")
+    cci = indicators.compute("cci", bars, 20)
+    check(len(cci) == len(c) - 19, "cci emits one row per full window")
+    try:
+        indicators.compute("sar", bars)
+        check(False, "unknown function raises ValueError")
+    except ValueError:
+        check(True, "unknown function raises ValueError")
+
+
+def recorded_responses(token: str, symbol: str) -> tuple[list[dict], dict[str, list[dict]]]:
+    """``eod`` rows and function -> ``/technical`` rows for ``symbol`` over RECORDED_WINDOW."""
+    eod = client.fetch_json("eod", token, symbol, dict(RECORDED_WINDOW))
+    technical = {}
+    for function, period in RECORDED:
+        params = dict(RECORDED_WINDOW, function=function)
+        if period:
+            params["period"] = period
+        technical[function] = client.fetch_json("technical", token, symbol, params)
+    return eod, technical
+
+
+def test_recorded_api_output() -> None:
+    # Replay matches any token, as long as it is the EODHD_API_TOKEN in effect.
+    token = os.environ.setdefault("EODHD_API_TOKEN", REPLAY_TOKEN)
+    client.set_transport("replay", str(CASSETTES))
+    try:
+        for symbol in RECORDED_SYMBOLS:
+            try:
+                eod, technical = recorded_responses(token, symbol)
+            except client.ClientError as exc:
+                check(False, f"{symbol}: recorded responses in {CASSETTES.relative_to(REPO_ROOT)} "
+                             f"(run --record with a token): {exc}")
+                continue
+            bars = indicators.bars_from_eod(eod)
+            for function, period in RECORDED:
+                # Compare the most recent year only: recursive indicators have converged by then.
+                remote = technical[function][-250:]
+                fields = [k for k in (remote[0] if remote else {}) if k != "date"]
+                check(agree(indicators.compute(function, bars, period), remote, fields, 5e-3),
+                      f"{symbol}: local {function} within 0.5% of the recorded /technical output")
+    finally:
+        client.set_transport("live")
+
+
+def record() -> int:
+    """Record RECORDED_SYMBOLS' responses into CASSETTES through the record transport."""
+    token = os.getenv("EODHD_API_TOKEN")
+    if not token:
+        print("ERROR: EODHD_API_TOKEN env var not set", file=sys.stderr)
+        return 2
+    client.set_transport("record", str(CASSETTES))
+    for symbol in RECORDED_SYMBOLS:
+        recorded_responses(token, symbol)
+        print(f"recorded {symbol} into {CASSETTES.relative_to(REPO_ROOT)}")
+    return 0
+
+
+def test_client_local_mode() -> None:
+    rows = synthetic_eod(120)
+    calls = []
+
+    def fake_fetch_json(endpoint, token, symbol=None, params=None, base_url=None,
+                        timeout=30, cache_ttl=0):
+        calls.append((endpoint, symbol, dict(params or {})))
+        return rows
+
+    client.fetch_json = fake_fetch_json
+    base = dict(symbol="X.US", function="sma", period=10, from_date=rows[50]["date"],
+                to_date=None, filter=None, base_url=client.BASE_URL, timeout=30, cache_ttl=0)
+    out = client.run_local_technical(argparse.Namespace(**base), "tok")
+    check(calls[-1][0] == "eod" and "from" in calls[-1][2], "windowed function fetches eod with warm-up")
+    check(out[0]["date"] == rows[50]["date"], "output trimmed to --from-date")
+    client.run_local_technical(argparse.Namespace(**dict(base, function="ema")), "tok")
+    check("from" not in calls[-1][2], "recursive function fetches full history")
+    last = client.run_local_technical(argparse.Namespace(**dict(base, filter="last_sma")), "tok")
+    check(last == out[-1]["sma"], "--filter last_sma returns the scalar like the API")
+
+    os.environ["EODHD_API_TOKEN"] = "tok"
+    fetched = len(calls)
+    cli = dict(base, brief=False, endpoint="technical", technical_mode="local")
+    for bad, label in ((dict(function=None), "missing --function"), (dict(function="sar"), "unknown --function"),
+                       (dict(period=1), "--period 1")):
+        code = client.run_cli(argparse.Namespace(**dict(cli, **bad)))
+        check(code == 2, f"{label} is a usage error (exit 2, got {code})")
+    check(len(calls) == fetched, "usage errors are reported before fetching bars")
+
+
+def main() -> int:
+    if "--record" in sys.argv:
+        return record()
+    for fn in (
+        test_against_reference_definitions,
+        test_recorded_api_output,
+        test_client_local_mode,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All indicator tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
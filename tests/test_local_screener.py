@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/local_screener.py.
+
+Stdlib-only, no network (fetch_many/fetch_json are monkeypatched). Exit 0 if
+clean, 1 on any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - Snapshot.from_payloads joins bulk-fundamentals with eod-bulk-last-day and
+    maps fields to the screener's names.
+  - Every filter operation agrees with a brute-force row scan on a random
+    snapshot, alone and combined, with and without sort/limit/offset.
+  - Signals (non-numeric cells count as missing), the exchange-code alias,
+    unknown-field and malformed-filter errors.
+  - build_snapshot pages bulk-fundamentals in waves growing from one page
+    until a short page; save/load round trip.
+"""
+from __future__ import annotations
+
+import operator
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import local_screener as ls  # noqa: E402
+
+FAILURES: list[str] = []
+
+SECTORS = ["Technology", "Healthcare", "Energy", "Utilities", None]
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def fundamentals_entry(code: str, rng: random.Random) -> dict:
+    return {
+        "General": {"Code": code, "Name": f"{code} Corp", "Exchange": rng.choice(["NYSE", "NASDAQ"]),
+                    "CurrencyCode": "USD", "Sector": rng.choice(SECTORS), "Industry": "Misc"},
+        "Highlights": {"MarketCapitalization": rng.choice([None, rng.randint(1, 500) * 1e8]),
+                       "PERatio": rng.choice([None, "NA", round(rng.uniform(-5, 60), 1)]),
+                       "DividendYield": round(rng.uniform(0, 0.08), 3),
+                       "BookValue": round(rng.uniform(-10, 50), 2),
+                       "WallStreetTargetPrice": round(rng.uniform(10, 200), 2)},
+        "Valuation": {"PriceBookMRQ": str(round(rng.uniform(0.1, 20), 2))},
+        "Technicals": {"Beta": round(rng.uniform(0, 2), 2), "52WeekHigh": 150.0, "52WeekLow": 20.0},
+    }
+
+
+def make_snapshot(n: int = 400, seed: int = 3) -> ls.Snapshot:
+    rng = random.Random(seed)
+    codes = [f"T{i:04d}" for i in range(n)]
+    fundamentals = [fundamentals_entry(c, rng) for c in codes]
+    last_day = [{"code": c, "exchange_short_name": "US", "close": round(rng.uniform(10, 200), 2),
+                 "adjusted_close": 1.0, "volume": rng.randint(0, 10 ** 6), "change_p": rng.uniform(-5, 5)}
+                for c in codes if rng.random() > 0.05]
+    return ls.Snapshot.from_payloads("US", fundamentals, last_day)
+
+
+PY_OPS = {"=": operator.eq, "!=": operator.ne, ">": operator.gt, ">=": operator.ge,
+          "<": operator.lt, "<=": operator.le}
+
+
+def brute_force(snap: ls.Snapshot, filters: list) -> set[int]:
+    out = set()
+    for i in range(snap.size):
+        ok = True
+        for field, op, value in filters:
+            v = snap.columns[field][i]
+            if op == "match":
+                ok = v is not None and str(value).lower() in str(v).lower()
+            elif isinstance(value, (int, float)):
+                ok = isinstance(v, (int, float)) and PY_OPS[op](v, value)
+            else:
+                ok = PY_OPS[op](str(v).lower(), str(value).lower())
+            if not ok:
+                break
+        if ok:
+            out.add(i)
+    return out
+
+
+def codes(snap: ls.Snapshot, rows: set[int]) -> set[str]:
+    return {snap.columns["code"][i] for i in rows}
+
+
+def test_from_payloads() -> None:
+    snap = make_snapshot(20)
+    row = snap.row(0)
+    check(snap.size == 20 and row["code"] == "T0000", "one row per bulk-fundamentals entry")
+    check(isinstance(row["pb"], float), "numeric strings coerced (Valuation.PriceBookMRQ → pb)")
+    check(all(v is None or isinstance(v, (int, float)) or v == "NA" for v in snap.columns["pe"]),
+          "pe column holds numbers, null or the API's 'NA'")
+    check("refund_1d_p" in row and "close" in row, "eod-bulk-last-day joined (change_p → refund_1d_p)")
+
+
+def test_filters_match_brute_force() -> None:
+    snap = make_snapshot()
+    cases = [
+        [["market_capitalization", ">=", 2e10]],
+        [["market_capitalization", ">", 2e10], ["pe", "<", 15]],
+        [["pe", "<=", 20], ["pe", ">", 0], ["sector", "=", "technology"]],
+        [["dividend_yield", "=", 0.03]],
+        [["beta", "!=", 1.0]],
+        [["sector", "!=", "Energy"], ["pb", "<", 3]],
+        [["name", "match", "t01"]],
+    ]
+    for filters in cases:
+        got = snap.query(filters, limit=10 ** 6)
+        want = brute_force(snap, filters)
+        check(got["count"] == len(want) and {r["code"] for r in got["data"]} == codes(snap, want),
+              f"{filters} == brute-force scan ({len(want)} rows)")
+
+
+def test_sort_limit_offset() -> None:
+    snap = make_snapshot()
+    filters = [["pe", ">", 0]]
+    want = sorted(brute_force(snap, filters),
+                  key=lambda i: snap.columns["market_capitalization"][i]
+                  if isinstance(snap.columns["market_capitalization"][i], float) else float("-inf"),
+                  reverse=True)
+    got = snap.query(filters, sort="market_capitalization.desc", limit=15, offset=5)
+    caps = [r["market_capitalization"] for r in got["data"]]
+    check(len(got["data"]) == 15 and caps == sorted(caps, reverse=True),
+          "top-k desc walk returns limit rows in order")
+    check([r["market_capitalization"] for r in got["data"]]
+          == [snap.columns["market_capitalization"][i] for i in want[5:20]], "offset skips the first rows")
+    tail = snap.query(filters, sort="market_capitalization.asc", limit=10 ** 6)["data"]
+    check(tail[-1]["market_capitalization"] is None, "rows with a null sort value sort last")
+    names = [r["name"] for r in snap.query(sort="name.desc", limit=3)["data"]]
+    check(names == sorted(names, reverse=True), "string fields sort lexically")
+
+
+def test_signals_and_errors() -> None:
+    snap = make_snapshot()
+    neg = snap.query(signals="bookvalue_neg", limit=10 ** 6)
+    check(neg["count"] > 0 and all(r["book_value"] < 0 for r in neg["data"]), "bookvalue_neg")
+    snap.columns["book_value"][0] = "NA"
+    snap.columns["book_value"][1] = None
+    for name in ("bookvalue_neg", "bookvalue_pos"):
+        hits = {r["code"] for r in snap.query(signals=name, limit=10 ** 6)["data"]}
+        check("T0000" not in hits and "T0001" not in hits, f"{name}: 'NA' and null book values are missing")
+    lo = snap.query(signals="wallstreet_lo", limit=10 ** 6)["data"]
+    check(all(r["close"] <= r["wallstreet_target_price"] for r in lo), "wallstreet_lo: close <= target")
+    every = snap.query([["exchange", "=", "us"]], limit=1)
+    check(every["count"] == snap.size, "exchange = snapshot code matches every listing")
+    for bad, what in (([["nope", ">", 1]], "unknown field"), ([["pe", "~", 1]], "unknown op")):
+        try:
+            snap.query(bad)
+            check(False, f"{what} raises ValueError")
+        except ValueError:
+            check(True, f"{what} raises ValueError")
+    for bad, what in (([5], "non-list filter"), ([["pe", ">"]], "short filter"),
+                      ([["pe", ">", 1], ("sector",)], "short filter after a valid one")):
+        try:
+            snap.query(bad)
+            check(False, f"{what} raises ValueError")
+        except ValueError:
+            check(True, f"{what} raises ValueError")
+    try:
+        snap.query(signals="50d_new_hi")
+        check(False, "signal without a local equivalent raises ValueError")
+    except ValueError:
+        check(True, "signal without a local equivalent raises ValueError")
+
+
+def test_build_and_round_trip() -> None:
+    rng = random.Random(1)
+    pages = []
+    listed = 1200
+
+    def fake_fetch_many(calls, token, workers=8, **kwargs):
+        pages.extend(c["params"]["offset"] for c in calls)
+        out = []
+        for c in calls:
+            start = c["params"]["offset"]
+            count = max(0, min(ls.PAGE_SIZE, listed - start))
+            out.append({str(k): fundamentals_entry(f"X{start + k}", rng) for k in range(count)})
+        return out
+
+    ls.eodhd_client.fetch_many = fake_fetch_many
+    ls.eodhd_client.fetch_json = lambda *a, **k: [{"code": "X0", "close": 5.0}]
+    snap = ls.build_snapshot("US", "tok", workers=2)
+    check(snap.size == 1200 and pages == [0, 500, 1000], "pages in waves of 1, 2 until a short page")
+    check(snap.row(0)["close"] == 5.0 and snap.row(1)["close"] is None, "last-day quotes joined by code")
+    pages.clear()
+    listed = 4000
+    check(ls.build_snapshot("US", "tok", workers=4).size == 4000
+          and pages == [0, 500, 1000, 1500, 2000, 2500, 3000, 3500, 4000, 4500, 5000],
+          "waves double up to --workers; only the last wave overshoots")
+    pages.clear()
+    listed = 300
+    small = ls.build_snapshot("LSE", "tok", workers=4)
+    check(small.size == 300 and pages == [0], "an exchange that fits in one page costs one request")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "US.json")
+        snap.save(path)
+        again = ls.Snapshot.load(path)
+        check(again.columns == snap.columns and again.exchange == "US", "save/load round trip")
+
+
+def main() -> int:
+    for fn in (
+        test_from_payloads,
+        test_filters_match_brute_force,
+        test_sort_limit_offset,
+        test_signals_and_errors,
+        test_build_and_round_trip,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All local_screener tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/macro_panel.py and the
+parse-time key normalization in eodhd_client.parse_response.
+
+Stdlib-only, no network (http_get is monkeypatched). Exit 0 if clean, 1 on
+any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - parse_response lowercases macro-indicator keys while decoding and agrees
+    with the recursive normalize_response pass; NORMALIZERS entries apply by
+    endpoint or by registry response_family.
+  - fetch_panel issues one call per (country, indicator) cell and reports
+    failing / fallback cells without aborting the grid.
+  - align builds a date x column table over the union of dates.
+  - CSV and Markdown renderers.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import urllib.parse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client as client  # noqa: E402
+import macro_panel as mp  # noqa: E402
+
+FAILURES: list[str] = []
+
+PAYLOADS = {
+    ("USA", "gdp_growth_annual"): [
+        {"CountryCode": "USA", "Indicator": "gdp_growth_annual", "Date": "2023-12-31", "Value": 2.5},
+        {"CountryCode": "USA", "Indicator": "gdp_growth_annual", "Date": "2022-12-31", "Value": 1.9},
+    ],
+    ("GBR", "gdp_growth_annual"): [
+        {"CountryCode": "GBR", "Indicator": "gdp_growth_annual", "Date": "2023-12-31", "Value": 0.1},
+        {"CountryCode": "GBR", "Indicator": "gdp_growth_annual", "Date": "2021-12-31", "Value": 8.7},
+    ],
+    ("USA", "debt_percent_gdp"): [
+        {"CountryCode": "USA", "Indicator": "debt_percent_gdp", "Date": "2023-12-31", "Value": 112.0},
+    ],
+    # Unknown/unsupported code silently falls back to GDP.
+    ("GBR", "debt_percent_gdp"): [
+        {"CountryCode": "GBR", "Indicator": "gdp_current_usd", "Date": "2023-12-31", "Value": 3.3e12},
+    ],
+}
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def fake_http_get(url: str, timeout: int = 30) -> str:
+    parsed = urllib.parse.urlparse(url)
+    country = parsed.path.rsplit("/", 1)[-1]
+    indicator = urllib.parse.parse_qs(parsed.query)["indicator"][0]
+    return json.dumps(PAYLOADS.get((country, indicator), {"error": "Indicator or Country are Not Found"}))
+
+
+def test_parse_time_normalization() -> None:
+    raw = json.dumps({"CountryCode": "USA", "gdp_current_usd": [{"Date": "2023-12-31", "Value": 1}]})
+    parsed = client.parse_response("macro-indicator", raw)
+    check(parsed == client.normalize_response("macro-indicator", json.loads(raw)),
+          "object hook == recursive _lowercase_keys pass")
+    check(parsed["gdp_current_usd"][0]["date"] == "2023-12-31", "nested keys lowercased while parsing")
+    ust = json.dumps({"meta": {}, "data": [{"date": "2024-01-02"}]})
+    check(client.parse_response("ust/bill-rates", ust) == [{"date": "2024-01-02"}],
+          "ust/* unwrap to the bare data array")
+    options = json.dumps({"meta": {}, "data": [{"id": "1", "attributes": {"strike": 150}}]})
+    check(client.parse_response("us-options-underlyings", options) == [{"strike": 150}]
+          and client.parse_response("us-options-eod", options)
+          == client.normalize_response("us-options-eod", json.loads(options)),
+          "options family unwraps attributes, registry ids included")
+    check(client.normalizer("economic-events") == (None, None) and client.normalizer("eod") == (None, None)
+          and client.normalizer("ust-yield-rates") == client.NORMALIZERS["rates"],
+          "endpoint entries win over their family; ids resolve through aliases")
+    client.NORMALIZERS["news"] = (None, lambda rows: rows[:1])
+    try:
+        check(client.parse_response("sentiment", "[1, 2]") == [1, 2]
+              and client.parse_response("news-word-weights", "[1, 2]") == [1],
+              "a family entry covers every endpoint of that family")
+    finally:
+        del client.NORMALIZERS["news"]
+
+
+def test_fetch_panel() -> None:
+    client.http_get = fake_http_get
+    series, errors = mp.fetch_panel("tok", ["USA", "GBR", "XXX"], ["gdp_growth_annual", "debt_percent_gdp"])
+    check(set(series) == {"USA:gdp_growth_annual", "GBR:gdp_growth_annual", "USA:debt_percent_gdp"},
+          "one series per valid cell")
+    check(series["USA:gdp_growth_annual"] == {"2023-12-31": 2.5, "2022-12-31": 1.9},
+          "points keyed by lowercased date/value")
+    check("GBR:debt_percent_gdp" in errors and "instead of" in errors["GBR:debt_percent_gdp"],
+          "silent fallback to another indicator is reported")
+    check("XXX:gdp_growth_annual" in errors, "error payload reported, grid not aborted")
+
+
+def test_align_and_render() -> None:
+    client.http_get = fake_http_get
+    series, _ = mp.fetch_panel("tok", ["USA", "GBR"], ["gdp_growth_annual"])
+    columns = ["USA:gdp_growth_annual", "GBR:gdp_growth_annual"]
+    rows = mp.align(series, columns)
+    check([r["date"] for r in rows] == ["2021-12-31", "2022-12-31", "2023-12-31"],
+          "dates are the ascending union across cells")
+    check(rows[0] == {"date": "2021-12-31", "USA:gdp_growth_annual": None, "GBR:gdp_growth_annual": 8.7},
+          "missing cells are None")
+    check([r["date"] for r in mp.align(series, columns, last=1)] == ["2023-12-31"], "--last keeps latest dates")
+    check(mp.render_csv(rows, columns).splitlines()[0] == "date,USA:gdp_growth_annual,GBR:gdp_growth_annual",
+          "CSV header is date + columns")
+    md = mp.render_markdown(rows, columns)
+    check("| 2021-12-31 | — | 8.70 |" in md, "Markdown shows missing cells as —")
+
+
+def main() -> int:
+    for fn in (
+        test_parse_time_normalization,
+        test_fetch_panel,
+        test_align_and_render,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All macro_panel tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
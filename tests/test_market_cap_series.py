@@ -8,6 +8,9 @@ clean, 1 on any failure — matches the convention of the other tests/ suites.
 Covers:
   - BUG-1: get_historical_market_cap_api must skip rows missing "value"
            (previously KeyError).
+  - get_historical_market_cap_api orders rows by date and clips them to
+    the window, skipping rows whose date does not parse; malformed or
+    reversed --from-date/--to-date exit 2.
   - BUG-2: a zero opening market cap must not raise ZeroDivisionError
            (change_pct → None).
   - BUG-3: a legitimate close of 0.0 must be kept, not dropped by `a or b`.
@@ -19,7 +22,7 @@ import importlib.util
 import io
 import json
 import sys
-from contextlib import redirect_stdout
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -63,6 +66,39 @@ def test_historical_skips_missing_value() -> None:
     ], "get_historical_market_cap_api skips rows missing 'value'/'date'")
 
 
+def test_historical_sorted_and_clipped() -> None:
+    """Rows are ordered by date and clipped to the window, whatever the object keys say."""
+    payload = {
+        "0": {"date": "2020-01-15", "value": 200},
+        "1": {"date": "2020-01-01", "value": 100},
+        "2": {"date": "2020-03-04", "value": 400},
+        "x": {"date": "2020-01-08", "value": 150},
+    }
+    mcs.fetch_json = lambda url, timeout=30: payload
+    rows = mcs.get_historical_market_cap_api("AAPL.US", "tok", "2020-01-01", "2020-02-01")
+    check([r["date"] for r in rows] == ["2020-01-01", "2020-01-08", "2020-01-15"],
+          "historical rows sorted by date and clipped to from..to")
+    payload["y"] = {"date": "2020-01-3x", "value": 1}
+    payload["z"] = {"date": None, "value": 2}
+    rows = mcs.get_historical_market_cap_api("AAPL.US", "tok", "2020-01-01", "2020-02-01")
+    check([r["date"] for r in rows] == ["2020-01-01", "2020-01-08", "2020-01-15"],
+          "rows with an unparseable date are skipped")
+
+
+def test_bad_dates_exit_2() -> None:
+    """Malformed or reversed --from-date/--to-date is a usage error before any request."""
+    argv = sys.argv
+    codes = []
+    try:
+        for dates in (("2020-13-01", "2020-12-31"), ("2020-02-01", "2020-01-01")):
+            sys.argv = ["market_cap_series.py", "--symbol", "X.US", "--from-date", dates[0], "--to-date", dates[1]]
+            with redirect_stderr(io.StringIO()):
+                codes.append(mcs.main())
+    finally:
+        sys.argv = argv
+    check(codes == [2, 2], "invalid or reversed dates exit 2")
+
+
 def test_compute_keeps_zero_close() -> None:
     """BUG-3: a close of exactly 0.0 is kept (not treated as missing)."""
     mcs.get_eod_prices = lambda *a, **k: [
@@ -113,6 +149,8 @@ def test_redact_token() -> None:
 def main() -> int:
     for fn in (
         test_historical_skips_missing_value,
+        test_historical_sorted_and_clipped,
+        test_bad_dates_exit_2,
         test_compute_keeps_zero_close,
         test_change_pct_zero_open_no_crash,
         test_redact_token,
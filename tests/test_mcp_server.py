@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/eodhd_mcp.py (local stdio MCP server).
+
+Stdlib-only, no network: a local HTTP server stands in for EODHD and the MCP
+server runs as a subprocess speaking newline-delimited JSON-RPC on its stdin /
+stdout, the way an MCP client launches it. Exit 0 if clean, 1 on any failure —
+matches the convention of the other tests/ suites.
+
+Covers:
+  - mcp_tools.json lists every REST endpoint of registry/capabilities.json,
+    with the path placeholder and required params marked required.
+  - initialize / tools/list / ping handshake; unknown methods and tools,
+    missing arguments and non-object params are JSON-RPC errors and do not
+    stop the server; --tools restricts the list.
+  - tools/call builds the same request as the client (symbol in the path or
+    in ``s``, converters) and returns the payload as JSON text; API errors
+    are tool results with isError.
+  - Several tools/call requests in flight are served concurrently, answered
+    as each finishes, and repeats within --cache-ttl never reach the API.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+SERVER = SCRIPTS / "eodhd_mcp.py"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_mcp  # noqa: E402
+import stub_api  # noqa: E402
+
+FAILURES: list[str] = []
+DELAY = 0.4
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class StubAPI(stub_api.StubHandler):
+    """Echoes the request back; SLOW symbols answer after DELAY, MISSING ones are a 404."""
+
+    hits: list[str] = []
+
+    def do_GET(self):
+        StubAPI.hits.append(self.path)
+        parts = urllib.parse.urlsplit(self.path)
+        if "SLOW" in parts.path:
+            time.sleep(DELAY)
+        if "MISSING" in parts.path:
+            status, body = 404, {"error": "Ticker not found"}
+        else:
+            query = dict(urllib.parse.parse_qsl(parts.query))
+            query.pop("api_token", None)
+            status, body = 200, [{"path": parts.path, "query": query}]
+        self.reply(status, body, "application/json")
+
+
+class Session:
+    """The MCP server as a subprocess; responses are collected by a reader thread."""
+
+    def __init__(self, base_url: str, cache_dir: str, *extra: str):
+        env = {**os.environ, "EODHD_API_TOKEN": "test-token", "EODHD_CACHE_DIR": cache_dir,
+               "EODHD_DAEMON": "0"}
+        self.proc = subprocess.Popen([sys.executable, str(SERVER), "--base-url", base_url, *extra],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE, text=True, env=env)
+        self.replies: dict = {}
+        self.order: list = []
+        self.cond = threading.Condition()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.proc.stdout:
+            msg = json.loads(line)
+            with self.cond:
+                self.replies[msg.get("id")] = (msg, time.monotonic())
+                self.order.append(msg.get("id"))
+                self.cond.notify_all()
+
+    def send(self, msg_id, method: str, params: dict | None = None) -> None:
+        msg = {"jsonrpc": "2.0", "method": method, **({"id": msg_id} if msg_id is not None else {})}
+        if params is not None:
+            msg["params"] = params
+        self.proc.stdin.write(json.dumps(msg) + "\n")
+        self.proc.stdin.flush()
+
+    def wait(self, msg_id, timeout: float = 10.0) -> dict:
+        with self.cond:
+            self.cond.wait_for(lambda: msg_id in self.replies, timeout)
+            return self.replies.get(msg_id, ({}, 0))[0]
+
+    def request(self, msg_id, method: str, params: dict | None = None) -> dict:
+        self.send(msg_id, method, params)
+        return self.wait(msg_id)
+
+    def close(self) -> str:
+        self.proc.stdin.close()
+        self.proc.wait(timeout=10)
+        return self.proc.stderr.read()
+
+
+def call_payload(reply: dict):
+    return json.loads(reply["result"]["content"][0]["text"])
+
+
+def test_tool_list() -> None:
+    registry = json.loads((REPO_ROOT / "registry" / "capabilities.json").read_text())
+    tools = eodhd_mcp.load_tools()
+    rest = [e for e in registry if e["transport"] == "rest"]
+    check(len(tools) == len(rest) and {t["endpoint"] for t in tools.values()}
+          == {e["client_endpoint"] or e["id"] for e in rest}, "one tool per REST registry endpoint")
+    check(tools["eod"]["inputSchema"]["required"] == ["symbol"]
+          and tools["news"]["inputSchema"]["required"] == ["s"]
+          and tools["ust_bill_rates"]["inputSchema"]["properties"]["filter[year]"]["type"] == "integer",
+          "schemas: path placeholder / required params, integer params")
+    check(all(t["description"].endswith(".") and "GET /" in t["description"] for t in tools.values()),
+          "every tool has a description")
+    picked = eodhd_mcp.load_tools(only=["eod", "real-time", "calendar/earnings"])
+    check(list(picked) == ["eod", "real_time", "calendar_earnings"], "--tools accepts tool and endpoint names")
+
+
+def test_protocol(base_url: str, cache_dir: str) -> None:
+    session = Session(base_url, cache_dir, "--tools", "eod,news,intraday")
+    try:
+        init = session.request(1, "initialize", {"protocolVersion": "2025-03-26", "capabilities": {},
+                                                 "clientInfo": {"name": "test", "version": "1"}})
+        check(init["result"]["protocolVersion"] == "2025-03-26" and "tools" in init["result"]["capabilities"],
+              "initialize negotiates the protocol version")
+        session.send(None, "notifications/initialized")
+        listed = session.request(2, "tools/list", {})
+        check([t["name"] for t in listed["result"]["tools"]] == ["eod", "intraday", "news"]
+              and "endpoint" not in listed["result"]["tools"][0], "tools/list honours --tools")
+        check(session.request(3, "ping")["result"] == {}, "ping")
+        check(session.request(4, "resources/list")["error"]["code"] == eodhd_mcp.METHOD_NOT_FOUND,
+              "unknown method → -32601")
+        check(session.request(5, "tools/call", {"name": "fundamentals", "arguments": {"symbol": "X"}})
+              ["error"]["code"] == eodhd_mcp.INVALID_PARAMS, "tool outside --tools → -32602")
+        missing = session.request(6, "tools/call", {"name": "news", "arguments": {"limit": 5}})
+        check(missing["error"]["code"] == eodhd_mcp.INVALID_PARAMS and "s" in missing["error"]["message"],
+              "missing required argument → -32602")
+
+        eod = session.request(7, "tools/call", {"name": "eod", "arguments": {"symbol": "AAPL.US",
+                                                                             "from": "2025-01-02"}})
+        rows = call_payload(eod)
+        check(eod["result"]["isError"] is False and rows[0]["path"] == "/api/eod/AAPL.US"
+              and rows[0]["query"] == {"fmt": "json", "from": "2025-01-02"},
+              "symbol fills the path; payload returned as JSON text")
+        news = call_payload(session.request(8, "tools/call", {"name": "news", "arguments": {"s": "TSLA.US"}}))
+        intraday = call_payload(session.request(9, "tools/call", {"name": "intraday", "arguments": {
+            "symbol": "AAPL.US", "from": "2025-01-02"}}))
+        check(news[0]["query"]["s"] == "TSLA.US" and intraday[0]["query"]["from"] == "1735776000",
+              "query-param symbols and registry converters")
+        failed = session.request(10, "tools/call", {"name": "eod", "arguments": {"symbol": "MISSING.US"}})
+        text = failed["result"]["content"][0]["text"]
+        check(failed["result"]["isError"] is True and "HTTP Error 404" in text and "test-token" not in text,
+              "API errors are isError results with the token redacted")
+        check(session.request(11, "bogus")["error"]["code"] == eodhd_mcp.METHOD_NOT_FOUND
+              and session.wait(None, 0.1) == {}, "notifications get no reply")
+        session.send(None, "notifications/cancelled", [12])
+        check(all(session.request(msg_id, method, params).get("error", {}).get("code") == eodhd_mcp.INVALID_PARAMS
+                  for msg_id, method, params in ((12, "tools/call", ["eod", {"symbol": "X"}]),
+                                                 (13, "tools/list", "all"), (14, "ping", 1))),
+              "non-object params → -32602")
+        check(session.request(15, "ping").get("result") == {}, "server keeps serving after bad params")
+    finally:
+        stderr = session.close()
+    check("3 tools, in-process" in stderr, "startup line names the backend")
+
+
+def test_concurrency(base_url: str, cache_dir: str) -> None:
+    session = Session(base_url, cache_dir, "--cache-ttl", "600", "--workers", "4")
+    try:
+        session.request(1, "initialize", {"protocolVersion": "2025-06-18"})
+        started = time.monotonic()
+        session.send(2, "tools/call", {"name": "eod", "arguments": {"symbol": "SLOW1.US"}})
+        session.send(3, "tools/call", {"name": "eod", "arguments": {"symbol": "SLOW2.US"}})
+        session.send(4, "tools/call", {"name": "eod", "arguments": {"symbol": "SLOW3.US"}})
+        session.send(5, "tools/call", {"name": "real_time", "arguments": {"symbol": "FAST.US"}})
+        replies = [session.wait(i) for i in (2, 3, 4, 5)]
+        elapsed = max(session.replies[i][1] for i in (2, 3, 4, 5)) - started
+        check(all(r.get("result", {}).get("isError") is False for r in replies), "all in-flight calls answered")
+        check(elapsed < 2 * DELAY, f"slow calls overlap ({elapsed:.2f}s for 3 × {DELAY}s)")
+        check(session.order.index(5) < session.order.index(2), "a fast call is answered before slow ones")
+        hits = len(StubAPI.hits)
+        again = session.request(6, "tools/call", {"name": "eod", "arguments": {"symbol": "SLOW1.US"}})
+        check(call_payload(again) == call_payload(replies[0]) and len(StubAPI.hits) == hits,
+              "repeat within --cache-ttl served without an API request")
+    finally:
+        session.close()
+
+
+def main() -> int:
+    with stub_api.serve(StubAPI) as base_url:
+        print("\ntest_tool_list:")
+        test_tool_list()
+        for fn in (
+            test_protocol,
+            test_concurrency,
+        ):
+            print(f"\n{fn.__name__}:")
+            with tempfile.TemporaryDirectory() as cache_dir:
+                fn(base_url, cache_dir)
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All eodhd_mcp tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Offline tests for per-request metrics (eodhd_client.py --metrics / --stats, eodhd_metrics.py).
+
+Stdlib-only, no network: a local HTTP server stands in for EODHD. Exit 0 if
+clean, 1 on any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - Each fetch_json call yields one record: status, bytes, API-call cost,
+    cache result and its phases (connect on a new connection only, ttfb,
+    download, parse, normalize); the token is redacted from the URL.
+  - Concurrent fetch_many calls each get their own record.
+  - Nothing is recorded while metrics are off.
+  - Percentiles, the --stats table and the Prometheus text format.
+  - The CLI writes the JSONL and Prometheus files and prints --stats, and
+    eodhd_metrics.py summarizes a JSONL file.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+CLIENT = SCRIPTS / "eodhd_client.py"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client  # noqa: E402
+import eodhd_metrics  # noqa: E402
+import stub_api  # noqa: E402
+
+FAILURES: list[str] = []
+TOKEN = "metrics-secret-token"
+DELAY = 0.05
+BODY = json.dumps([{"date": "2025-01-02", "close": 243.85}] * 50).encode()
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class StubAPI(stub_api.StubHandler):
+    """eod rows after DELAY; MISSING symbols are a 404."""
+
+    def do_GET(self):
+        time.sleep(DELAY)
+        status, body = (404, b'{"error":"not found"}') if "MISSING" in self.path else (200, BODY)
+        self.reply(status, body)
+
+
+def test_percentiles() -> None:
+    values = [float(v) for v in range(1, 101)]
+    check(eodhd_metrics.percentile(values, 0.5) == 50.5 and eodhd_metrics.percentile(values, 0.99) == 99.01
+          and eodhd_metrics.percentile([7.0], 0.95) == 7.0 and eodhd_metrics.percentile([], 0.5) == 0.0,
+          "percentiles interpolate like numpy")
+
+
+def test_records(base_url: str, tmp: str) -> None:
+    path = os.path.join(tmp, "metrics.jsonl")
+    eodhd_client.CACHE_DIR = os.path.join(tmp, "cache")
+    eodhd_client.fetch_json("eod", TOKEN, "OFF.US", base_url=base_url)
+    check(eodhd_client.METRICS == [], "nothing recorded while metrics are off")
+
+    eodhd_client.set_metrics(path)
+    eodhd_client._POOL.clear()  # the next request opens a new connection
+    eodhd_client.fetch_json("eod", TOKEN, "AAPL.US", base_url=base_url, cache_ttl=60)
+    eodhd_client.fetch_json("eod", TOKEN, "AAPL.US", base_url=base_url, cache_ttl=60)
+    eodhd_client.fetch_json("fundamentals", TOKEN, "AAPL.US", base_url=base_url)
+    try:
+        eodhd_client.fetch_json("eod", TOKEN, "MISSING.US", base_url=base_url)
+    except eodhd_client.ClientError:
+        pass
+    miss, hit, pooled, missing = eodhd_client.METRICS[:4]
+    check(miss["status"] == 200 and miss["cache"] == "miss" and miss["bytes"] == len(BODY) and miss["cost"] == 1
+          and miss["retries"] == 0, "status, bytes, cache result, retries and cost")
+    check(all(miss.get(p + "_ms", 0) >= 0 for p in ("connect", "ttfb", "download", "parse", "normalize"))
+          and "connect_ms" in miss and "tls_ms" not in miss and miss["ttfb_ms"] >= DELAY * 1000 * 0.9
+          and miss["total_ms"] >= miss["ttfb_ms"], "phases of a request on a new connection")
+    check(hit["cache"] == "hit" and hit["bytes"] == 0 and hit["cost"] == 0 and "ttfb_ms" not in hit
+          and "parse_ms" in hit, "cache hits skip the network phases")
+    check("connect_ms" not in pooled and pooled["cost"] == 10, "a pooled connection has no connect phase")
+    check(missing["status"] == 404 and eodhd_metrics.failed(missing), "HTTP errors keep their status")
+    check(all(TOKEN not in r["url"] and "api_token=***" in r["url"] for r in eodhd_client.METRICS),
+          "token redacted from recorded URLs")
+
+    calls = [{"endpoint": "eod", "symbol": f"S{i}.US"} for i in range(6)]
+    eodhd_client.fetch_many(calls, TOKEN, workers=6, base_url=base_url)
+    batch = eodhd_client.METRICS[4:]
+    check(sorted(r["url"].split("/eod/")[1][:5] for r in batch) == [f"S{i}.US" for i in range(6)]
+          and all(r["ttfb_ms"] >= DELAY * 1000 * 0.9 and r["download_ms"] < r["ttfb_ms"] for r in batch),
+          "concurrent calls each get their own record")
+    lines = [json.loads(line) for line in Path(path).read_text().splitlines()]
+    check(lines == eodhd_client.METRICS, "one JSON line per request")
+    eodhd_client.set_metrics("")
+
+
+def test_rendering() -> None:
+    records = [{"endpoint": "eod", "status": 200, "cache": "miss", "bytes": 1000, "cost": 1,
+                "retries": 0, "total_ms": float(ms), "ttfb_ms": ms / 2} for ms in range(1, 101)]
+    records.append({"endpoint": 'odd"name', "status": "error", "cache": "off", "total_ms": 5.0})
+    table = eodhd_metrics.render_stats(records)
+    row = next(line for line in table.splitlines() if line.startswith("eod "))
+    check(row.split()[4:7] == ["50.5", "95.0", "99.0"] and "mean ms" in table, "--stats p50/p95/p99 per endpoint")
+    text = eodhd_metrics.render_prometheus(records)
+    sample = re.compile(r'^[a-z_]+(\{([a-z]+="([^"\\]|\\.)*",?)+\})? -?[0-9.e+]+$')
+    check(all(line.startswith("# ") or sample.match(line) for line in text.splitlines()),
+          "valid Prometheus text exposition lines")
+    check('eodhd_requests_total{endpoint="eod",cache="miss",status="200"} 100' in text
+          and 'eodhd_request_duration_seconds{endpoint="eod",quantile="0.95"} 0.095050' in text
+          and 'eodhd_request_duration_seconds_count{endpoint="eod"} 100' in text
+          and 'eodhd_api_calls_total{endpoint="eod"} 100' in text
+          and 'endpoint="odd\\"name"' in text, "counters, summary quantiles and escaped labels")
+
+
+def test_cli(base_url: str, tmp: str) -> None:
+    path, prom = os.path.join(tmp, "cli.jsonl"), os.path.join(tmp, "cli.prom")
+    env = {**os.environ, "EODHD_API_TOKEN": TOKEN, "EODHD_CACHE_DIR": os.path.join(tmp, "cli-cache"),
+           "EODHD_DAEMON": "0"}
+    base = [sys.executable, str(CLIENT), "--endpoint", "eod", "--symbol", "AAPL.US", "--base-url", base_url]
+    first = subprocess.run(base + ["--metrics", path, "--metrics-prom", prom, "--stats"],
+                           capture_output=True, text=True, env=env)
+    subprocess.run(base, capture_output=True, text=True, env={**env, "EODHD_METRICS": path})
+    plain = subprocess.run(base, capture_output=True, text=True, env=env)
+    records = eodhd_metrics.load(path)
+    check(first.returncode == 0 and json.loads(first.stdout) == json.loads(BODY)
+          and "p50 ms" in first.stderr and "p50 ms" not in plain.stderr, "--stats table on stderr")
+    check(len(records) == 2 and all("serialize_ms" in r for r in records), "CLI records the serialize phase")
+    check('eodhd_request_duration_seconds_count{endpoint="eod"} 1' in Path(prom).read_text(),
+          "--metrics-prom writes the Prometheus file at exit")
+    summary = subprocess.run([sys.executable, str(SCRIPTS / "eodhd_metrics.py"), path, "--json"],
+                             capture_output=True, text=True)
+    check(summary.returncode == 0 and json.loads(summary.stdout)["eod"]["requests"] == 2,
+          "eodhd_metrics.py summarizes a metrics file")
+
+
+def main() -> int:
+    eodhd_client.USE_DAEMON = False
+    with stub_api.serve(StubAPI) as base_url, tempfile.TemporaryDirectory() as tmp:
+        print("\ntest_percentiles:")
+        test_percentiles()
+        print("\ntest_records:")
+        test_records(base_url, tmp)
+        print("\ntest_rendering:")
+        test_rendering()
+        print("\ntest_cli:")
+        test_cli(base_url, tmp)
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All metrics tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
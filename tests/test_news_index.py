@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/news_index.py.
+
+Stdlib-only, no network: the store is filled by news_store.ingest against a
+fake feed, and the news-word-weights fallback is a fake fetch_many that
+records the ranges it was asked for. Exit 0 if clean, 1 on any failure —
+matches the convention of the other tests/ suites.
+
+Covers:
+  - Stemming/tokenizing matches the endpoint's stems for common cases.
+  - Keyword (AND), ticker and date-range queries; newest first.
+  - The index is incremental: a second update indexes only appended lines;
+    an index.json in an older format is rebuilt.
+  - word-weights is answered locally inside the store's coverage and calls
+    the API only for the uncovered part of the window, merging both.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import news_index as ni  # noqa: E402
+import news_store as ns  # noqa: E402
+
+FAILURES: list[str] = []
+TODAY = datetime.date(2026, 10, 14)
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def day(offset: int) -> str:
+    return (TODAY + datetime.timedelta(days=offset)).isoformat()
+
+
+ARTICLES = [
+    {"date": f"{day(-3)}T09:00:00+00:00", "title": "Apple faces new tariffs on China imports",
+     "content": "Tariffs could hit iPhone margins.", "link": "https://n.example/1", "symbols": ["AAPL.US"]},
+    {"date": f"{day(-2)}T09:00:00+00:00", "title": "Microsoft and Apple rally",
+     "content": "Tech companies led the market.", "link": "https://n.example/2", "symbols": ["AAPL.US", "MSFT.US"]},
+    {"date": f"{day(-1)}T09:00:00+00:00", "title": "China trade talks resume",
+     "content": "Tariff relief hopes lift Apple suppliers.", "link": "https://n.example/3", "symbols": ["AAPL.US"]},
+]
+
+
+class FakeAPI:
+    def __init__(self, articles):
+        self.articles = articles
+        self.weight_calls: list[dict] = []
+
+    def fetch_many(self, calls, token, workers=8, **kwargs):
+        out = []
+        for call in calls:
+            p = call["params"]
+            if call["endpoint"] == "news-word-weights":
+                self.weight_calls.append(p)
+                out.append({"data": {"tariff": 0.02, "earnings": 0.01}, "meta": {"news_processed": 3}})
+                continue
+            rows = [a for a in self.articles if p["s"] in a["symbols"] and a["date"][:10] >= p["from"]]
+            out.append(sorted(rows, key=lambda a: a["date"], reverse=True)[p["offset"]:p["offset"] + p["limit"]])
+        return out
+
+
+def test_tokenize() -> None:
+    check(ni.stem("companies") == "compani" and ni.stem("apple") == "appl", "endpoint-style stems")
+    check(ni.stem("tariffs") == ni.stem("tariff") and ni.stem("trading") == ni.stem("trade"),
+          "inflections collapse to one stem")
+    check(ni.tokenize("The iPhone and the Market") == ["iphon", "market"], "lowercased, stopwords dropped")
+
+
+def test_index_and_search() -> None:
+    api = FakeAPI(list(ARTICLES[:2]))
+    ns.eodhd_client.fetch_many = api.fetch_many
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ns.NewsStore(tmp)
+        ns.ingest(store, "tok", ["AAPL.US", "MSFT.US"], today=TODAY - datetime.timedelta(days=2))
+        index = ni.NewsIndex(store)
+        check(index.update() == 2 and index.update() == 0, "first update indexes the store, second is a no-op")
+        index.save()
+
+        api.articles.append(ARTICLES[2])
+        ns.ingest(store, "tok", ["AAPL.US"], today=TODAY)
+        index = ni.NewsIndex(ni.NewsStore(tmp))
+        check(len(index.docs) == 2 and index.update() == 1, "reloaded index picks up only the appended article")
+        index.save()
+        with open(index.path, encoding="utf-8") as fh:
+            saved = json.load(fh)
+        saved.pop("format")
+        with open(index.path, "w", encoding="utf-8") as fh:
+            json.dump(saved, fh)
+        index = ni.NewsIndex(ni.NewsStore(tmp))
+        check(index.docs == [] and index.update() == 3, "an index without the current format is rebuilt")
+
+        titles = [a["title"] for a in index.search(["tariffs"])]
+        check(titles == [ARTICLES[2]["title"], ARTICLES[0]["title"]], "keyword query, newest first")
+        check([a["title"] for a in index.search(["tariff", "china", "imports"])] == [ARTICLES[0]["title"]],
+              "multi-word query is an AND")
+        check([a["title"] for a in index.search(symbol="MSFT.US")] == [ARTICLES[1]["title"]], "ticker query")
+        check(len(index.search(symbol="AAPL.US", date_from=day(-2), date_to=day(-1))) == 2, "date-range query")
+        check(index.search(["nonexistentword"]) == [], "no match → empty")
+
+
+def test_word_weights() -> None:
+    api = FakeAPI(list(ARTICLES))
+    ns.eodhd_client.fetch_many = api.fetch_many
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ns.NewsStore(tmp)
+        ns.ingest(store, "tok", ["AAPL.US"], backfill_days=5, today=TODAY)
+        index = ni.NewsIndex(store)
+        index.update()
+
+        local = ni.word_weights(index, "tok", "AAPL.US", day(-5), day(0), limit=3)
+        check(api.weight_calls == [] and local["meta"]["local_articles"] == 3,
+              "covered window answered without calling news-word-weights")
+        check(next(iter(local["data"])) in ("tariff", "appl"), "top local words are the most frequent stems")
+        total = index.term_counts("AAPL.US", day(-5), day(0))[2]
+        check(abs(local["data"]["tariff"] - 3 / total) < 1e-5, "weight = share of tokens in the window")
+
+        mixed = ni.word_weights(index, "tok", "AAPL.US", day(-20), day(0), limit=50)
+        check([(p["filter[date_from]"], p["filter[date_to]"]) for p in api.weight_calls] == [(day(-20), day(-6))],
+              "API called only for the range before the store's coverage")
+        check(mixed["meta"]["news_processed"] == 6 and ni.stem("earnings") in mixed["data"],
+              "local and API weights merged by article count")
+        check(ni.uncovered(day(-3), day(2), (day(-5), day(0))) == [(day(1), day(2))], "gap after last check")
+
+
+def main() -> int:
+    for fn in (
+        test_tokenize,
+        test_index_and_search,
+        test_word_weights,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All news_index tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
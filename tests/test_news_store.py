@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/news_store.py.
+
+Stdlib-only, no network: fetch_many is replaced by a fake news feed that
+serves newest-first pages filtered by ``from``. Exit 0 if clean, 1 on any
+failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - First run backfills and pages until a short page.
+  - Articles tagged with several watched symbols are stored once.
+  - A second run requests from the high-water mark and stores only new
+    articles, including ones sharing the mark's exact timestamp.
+  - The compact store round-trips and ids are read without full parsing.
+  - A run cut short by MAX_PAGES keeps the mark and coverage; the next run
+    fills only the gap (bounded by ``to``) before the mark moves on.
+"""
+from __future__ import annotations
+
+import datetime
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import news_store as ns  # noqa: E402
+
+FAILURES: list[str] = []
+TODAY = datetime.date(2026, 10, 14)
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def article(n: int, when: str, symbols: list[str]) -> dict:
+    return {"date": when, "title": f"Story {n}", "content": f"Body {n}", "link": f"https://news.example/{n}",
+            "symbols": symbols, "tags": [], "sentiment": {"polarity": 0.1}}
+
+
+class FakeFeed:
+    def __init__(self):
+        self.articles: list[dict] = []
+        self.requests: list[dict] = []
+
+    def fetch_many(self, calls, token, workers=8, **kwargs):
+        out = []
+        for call in calls:
+            p = call["params"]
+            self.requests.append(dict(p))
+            rows = sorted((a for a in self.articles if p["s"] in a["symbols"] and a["date"][:10] >= p["from"]
+                           and a["date"][:10] <= p.get("to", "9999")), key=lambda a: a["date"], reverse=True)
+            out.append(rows[p["offset"]:p["offset"] + p["limit"]])
+        return out
+
+
+def stamp(day_offset: int, minute: int) -> str:
+    day = TODAY + datetime.timedelta(days=day_offset)
+    return f"{day.isoformat()}T10:{minute:02d}:00+00:00"
+
+
+def test_ingest_cycle() -> None:
+    feed = FakeFeed()
+    ns.eodhd_client.fetch_many = feed.fetch_many
+    # 150 AAPL stories over the last days (forces a second page), 5 shared with MSFT.
+    feed.articles = [article(i, stamp(-(i % 5), i % 60), ["AAPL.US"] + (["MSFT.US"] if i < 5 else []))
+                     for i in range(150)]
+    feed.articles.append(article(999, stamp(-20, 0), ["AAPL.US"]))  # older than the backfill
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ns.NewsStore(tmp)
+        res = ns.ingest(store, "tok", ["AAPL.US", "MSFT.US"], backfill_days=7, today=TODAY)
+        check(len(res["new"]) == 150 and res["duplicates"] == 5,
+              "first run stores 150 articles once; 5 cross-tagged duplicates skipped")
+        aapl_offsets = [r["offset"] for r in feed.requests if r["s"] == "AAPL.US"]
+        check(aapl_offsets == [0, 100], "pages until a short page")
+        check(all(r["from"] == (TODAY - datetime.timedelta(days=7)).isoformat() for r in feed.requests),
+              "new symbols backfill --backfill-days")
+        mark = store.state["marks"]["AAPL.US"]
+        check(mark["date"] == max(a["date"] for a in feed.articles) and mark["checked"] == TODAY.isoformat(),
+              "high-water mark is the newest article timestamp")
+
+        # Next cycle: two new stories, one at exactly the mark's timestamp.
+        feed.requests.clear()
+        feed.articles.append(article(500, mark["date"], ["AAPL.US"]))
+        feed.articles.append(article(501, stamp(0, 59), ["AAPL.US", "MSFT.US"]))
+        store2 = ns.NewsStore(tmp)
+        res2 = ns.ingest(store2, "tok", ["AAPL.US", "MSFT.US"], today=TODAY)
+        check(sorted(a["title"] for a in res2["new"]) == ["Story 500", "Story 501"],
+              "second run stores only the new articles (same-timestamp one included)")
+        check({r["from"] for r in feed.requests if r["s"] == "AAPL.US"} == {mark["date"][:10]}
+              and len(feed.requests) == 2, "second run requests one page per symbol from the mark's day")
+        check(ns.ingest(ns.NewsStore(tmp), "tok", ["AAPL.US"], today=TODAY)["new"] == [],
+              "third run with nothing new stores nothing")
+
+        stored = list(ns.NewsStore(tmp))
+        check(len(stored) == 152 and all("id" in a and "content" in a for a in stored), "store round-trips")
+        lines = Path(tmp, "articles.ndjson").read_text().splitlines()
+        check(ns.article_id_from_line(lines[0]) == stored[0]["id"], "id read from the line prefix")
+        check(store2.coverage("AAPL.US") == ((TODAY - datetime.timedelta(days=7)).isoformat(), TODAY.isoformat()),
+              "coverage = backfill start .. last check")
+
+
+
+def test_gap_after_max_pages() -> None:
+    feed = FakeFeed()
+    ns.eodhd_client.fetch_many = feed.fetch_many
+    feed.articles = [article(0, stamp(-10, 0), ["AAPL.US"])]
+    saved, ns.MAX_PAGES = ns.MAX_PAGES, 3
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ns.NewsStore(tmp)
+            ns.ingest(store, "tok", ["AAPL.US"], today=TODAY - datetime.timedelta(days=5))
+            first = dict(store.state["marks"]["AAPL.US"])
+            # 350 stories in the last four days: more than three pages.
+            begin = datetime.datetime(2026, 10, 10, tzinfo=datetime.timezone.utc)
+            burst = [article(i, (begin + datetime.timedelta(minutes=17 * i)).isoformat(), ["AAPL.US"])
+                     for i in range(1, 351)]
+            feed.articles += burst
+            res = ns.ingest(store, "tok", ["AAPL.US"], today=TODAY)
+            mark = store.state["marks"]["AAPL.US"]
+            check(len(res["new"]) == 300 and mark["date"] == first["date"]
+                  and store.coverage("AAPL.US") == (first["since"], first["checked"]),
+                  "cut short by MAX_PAGES: mark and coverage stay put")
+            resume = mark.get("resume", {})
+            check(resume.get("date") == burst[-1]["date"] and resume.get("to") == burst[50]["date"],
+                  "the gap between the mark and the oldest fetched article is recorded")
+
+            feed.requests.clear()
+            feed.articles.append(article(999, stamp(1, 0), ["AAPL.US"]))
+            res = ns.ingest(store, "tok", ["AAPL.US"], today=TODAY + datetime.timedelta(days=1))
+            mark = store.state["marks"]["AAPL.US"]
+            check(len(res["new"]) == 50 and {r.get("to") for r in feed.requests} == {burst[50]["date"][:10]},
+                  "next run fetches only the gap, up to its oldest article's day")
+            check("resume" not in mark and mark["date"] == burst[-1]["date"]
+                  and store.coverage("AAPL.US") == (first["since"], TODAY.isoformat()),
+                  "closed gap: mark and coverage advance to the run that opened it")
+            res = ns.ingest(store, "tok", ["AAPL.US"], today=TODAY + datetime.timedelta(days=1))
+            check([a["title"] for a in res["new"]] == ["Story 999"], "then the mark moves on to newer articles")
+            check(len(list(ns.NewsStore(tmp))) == 352, "every article stored once")
+    finally:
+        ns.MAX_PAGES = saved
+
+
+def main() -> int:
+    for fn in (
+        test_ingest_cycle,
+        test_gap_after_max_pages,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All news_store tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
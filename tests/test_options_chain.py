@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Offline tests for black_scholes.py and options_chain.py.
+
+Stdlib-only, no network: fetch_many is replaced by a fake options API that
+serves a synthetic chain priced with known volatilities, paged with
+meta.total and capped at the real offset ceiling. Exit 0 if clean, 1 on any
+failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - Black-Scholes price and Greeks against textbook values; put-call parity.
+  - Implied volatility recovers the input volatility; out-of-bounds prices
+    give None; the NumPy and stdlib engines agree.
+  - download pages every chain concurrently (one wave of first pages, one of
+    the rest) and splits chains past the offset ceiling by expiration.
+  - Chain round-trips through its columnar file; term structure and skew.
+"""
+from __future__ import annotations
+
+import datetime
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import black_scholes as bs  # noqa: E402
+import options_chain as oc  # noqa: E402
+
+FAILURES: list[str] = []
+ASOF = datetime.date(2026, 10, 16)
+SPOT = 100.0
+RATE = 0.04
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def close(a, b, tol: float) -> bool:
+    return a is not None and b is not None and abs(a - b) <= tol
+
+
+ENGINES = [False] + ([True] if bs.np is not None else [])
+
+
+def test_black_scholes() -> None:
+    for use_numpy in ENGINES:
+        label = "numpy" if use_numpy else "stdlib"
+        call = bs.price([100], [100], [1.0], [0.2], [True], rate=0.05, use_numpy=use_numpy)[0]
+        put = bs.price([100], [100], [1.0], [0.2], [False], rate=0.05, use_numpy=use_numpy)[0]
+        check(close(call, 10.4506, 1e-4) and close(put, 5.5735, 1e-4), f"{label}: textbook call/put prices")
+        check(close(call - put, 100 - 100 * 2.718281828 ** -0.05, 1e-6), f"{label}: put-call parity")
+        g = bs.greeks([100], [100], [1.0], [0.2], [True], rate=0.05, use_numpy=use_numpy)
+        check(close(g["delta"][0], 0.6368, 1e-4) and close(g["gamma"][0], 0.018762, 1e-6)
+              and close(g["vega"][0], 0.37524, 1e-5) and close(g["theta"][0], -6.414 / 365, 1e-5),
+              f"{label}: delta, gamma, vega (per vol point), theta (per day)")
+        iv = bs.implied_vol([call, put, 0.01, 150.0, None], [100] * 5, [100] * 5, [1.0] * 5,
+                            [True, False, True, True, True], rate=0.05, use_numpy=use_numpy)
+        check(close(iv[0], 0.2, 1e-5) and close(iv[1], 0.2, 1e-5), f"{label}: IV recovers the input volatility")
+        check(iv[2:] == [None, None, None], f"{label}: prices outside arbitrage bounds → None")
+
+
+def synthetic_chain(underlying: str, expirations: list[str], strikes: range) -> list[dict]:
+    rows = []
+    for exp in expirations:
+        t = (datetime.date.fromisoformat(exp) - ASOF).days / 365
+        for k in strikes:
+            for kind in ("call", "put"):
+                vol = 0.25 + 0.002 * (100 - k) * (1 if kind == "put" else 0.5)  # put skew
+                p = bs.price([SPOT], [k], [t], [vol], [kind == "call"], rate=RATE, use_numpy=False)[0]
+                rows.append({"contract": f"{underlying}{exp}{kind[0]}{k}", "underlying_symbol": underlying,
+                             "exp_date": exp, "type": kind, "strike": k, "bid": round(p - 0.005, 4),
+                             "ask": round(p + 0.005, 4), "last": p, "volume": 1,
+                             "open_interest": 100 if kind == "call" else 150, "tradetime": "2026-10-16"})
+    return rows
+
+
+class FakeOptions:
+    def __init__(self, chains: dict[str, list[dict]]):
+        self.chains = chains
+        self.waves: list[list[dict]] = []
+
+    def fetch_many(self, calls, token, workers=8, return_exceptions=False, **kwargs):
+        if calls and calls[0]["endpoint"] == "real-time":
+            return [{"code": c["symbol"], "close": SPOT} for c in calls]
+        self.waves.append(calls)
+        out = []
+        for call in calls:
+            p = call["params"]
+            rows = [r for r in self.chains[p["filter[underlying_symbol]"]]
+                    if p["filter[exp_date_from]"] <= r["exp_date"] <= p["filter[exp_date_to]"]
+                    and r["type"] == p.get("filter[type]", r["type"])]
+            offset, limit = p["page[offset]"], p["page[limit]"]
+            assert offset <= oc.MAX_OFFSET, "offset ceiling exceeded"
+            out.append({"meta": {"total": len(rows), "offset": offset, "limit": limit},
+                        "data": [{"id": r["contract"], "type": "options-contracts", "attributes": r}
+                                 for r in rows[offset:offset + limit]]})
+        return out
+
+
+def test_download() -> None:
+    exps = ["2026-11-20", "2026-12-18", "2027-01-15", "2027-06-18"]
+    fake = FakeOptions({"AAPL": synthetic_chain("AAPL", exps, range(50, 151)),
+                        "MSFT": synthetic_chain("MSFT", exps[:1], range(90, 111))})
+    oc.eodhd_client.fetch_many = fake.fetch_many
+    oc.PAGE_LIMIT, oc.MAX_OFFSET = 100, 300  # scale the API limits down to the synthetic chain
+    try:
+        rows, spot, truncated = oc.download("tok", ["AAPL.US", "msft"], exp_from="2026-10-16", exp_to="2027-12-31")
+    finally:
+        oc.PAGE_LIMIT, oc.MAX_OFFSET = 1000, 10000
+    check(len(rows["AAPL"]) == 808 and len(rows["MSFT"]) == 42 and not truncated,
+          "every contract of every chain downloaded")
+    check(len(fake.waves[0]) == 2 and all(c["params"]["page[offset]"] == 0 for c in fake.waves[0]),
+          "first wave: one first page per underlying")
+    windows = {(c["params"]["filter[exp_date_from]"], c["params"]["filter[exp_date_to]"])
+               for w in fake.waves for c in w if c["params"]["filter[underlying_symbol]"] == "AAPL"}
+    check(len(windows) > 1, "chain past the offset ceiling split into expiration windows")
+    check(spot == {"AAPL": SPOT, "MSFT": SPOT}, "spot from real-time quotes")
+
+
+def test_chain_analysis() -> None:
+    exps = ["2026-11-20", "2027-01-15"]
+    rows = synthetic_chain("AAPL", exps, range(60, 141))
+    chain = oc.Chain.from_rows("AAPL", rows, ASOF.isoformat(), SPOT)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = oc.chain_path(tmp, "AAPL.US")
+        chain.save(path)
+        chain = oc.Chain.load(path)
+    check(len(chain) == len(rows) and chain.expirations() == exps, "chain round-trips through its columnar file")
+    started = time.perf_counter()
+    chain.add_greeks(RATE)
+    elapsed = time.perf_counter() - started
+    atm = [i for i, k in enumerate(chain.columns["strike"]) if k == 100 and chain.columns["type"][i] == "call"]
+    check(close(chain.columns["iv"][atm[0]], 0.25, 1e-3), "IV from the midpoint recovers the ATM volatility")
+    check(0.4 < chain.columns["delta"][atm[0]] < 0.7 and chain.columns["theta"][atm[0]] < 0, "ATM call Greeks")
+    print(f"  info: {len(chain)} contracts in {elapsed * 1000:.1f} ms")
+    ts = chain.term_structure()
+    check([r["expiration"] for r in ts] == exps and close(ts[0]["atm_iv"], 0.25, 1e-3), "term structure ATM IV")
+    check(ts[0]["skew_25d"] > 0 and ts[0]["pc_ratio"] == 1.5, "put skew and put/call OI ratio")
+    part = chain.select(exps[0])
+    check(set(part["exp_date"]) == {exps[0]} and "vega" in part, "one expiration with Greek columns")
+    csv = oc.render_csv(part).splitlines()
+    check(csv[0].startswith("contract,") and len(csv) == len(part["contract"]) + 1, "chain CSV")
+
+
+def test_spot_override() -> None:
+    rows = synthetic_chain("AAPL", ["2026-11-20"], range(60, 141))
+    for stored, what in ((None, "no stored spot"), (60.0, "stale stored spot")):
+        chain = oc.Chain.from_rows("AAPL", rows, ASOF.isoformat(), stored)
+        chain.add_greeks(RATE, spot=SPOT)
+        ts = chain.term_structure()
+        check(chain.spot == SPOT and close(ts[0]["atm_iv"], 0.25, 1e-3), f"--spot override with {what}")
+
+
+def main() -> int:
+    for fn in (
+        test_black_scholes,
+        test_download,
+        test_chain_analysis,
+        test_spot_override,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All options_chain tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/portfolio_risk.py.
+
+Stdlib-only, no network (fetch_many is monkeypatched). Exit 0 if clean, 1 on
+any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - align_prices forward-fills gaps and starts where every series has data.
+  - compute_risk matches hand-computed volatility, drawdown, beta and Sharpe.
+  - The NumPy engine (when installed) agrees with the stdlib fallback; both
+    report a constant-price holding's correlations as null, not NaN, and
+    average only the pairs of holdings whose returns vary.
+  - fetch_prices issues one eod call per symbol and prefers adjusted_close.
+  - render_markdown emits the portfolio-risk skill's tables.
+"""
+from __future__ import annotations
+
+import json
+import math
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import portfolio_risk as pr  # noqa: E402
+
+FAILURES: list[str] = []
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def close(a, b, tol: float = 1e-6) -> bool:
+    return a is not None and b is not None and abs(a - b) <= tol
+
+
+PRICES = {
+    "A.US": {"2024-01-02": 100.0, "2024-01-03": 110.0, "2024-01-04": 99.0, "2024-01-05": 108.9},
+    "B.US": {"2024-01-02": 50.0, "2024-01-03": 50.0, "2024-01-05": 55.0},
+    "BENCH": {"2024-01-02": 10.0, "2024-01-03": 10.5, "2024-01-04": 10.0, "2024-01-05": 10.5},
+}
+
+
+def test_align_forward_fill() -> None:
+    dates, matrix = pr.align_prices(PRICES, ["A.US", "B.US", "BENCH"], "BENCH")
+    check(dates == ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"],
+          "index follows the benchmark's trading dates")
+    check([row[1] for row in matrix] == [50.0, 50.0, 50.0, 55.0],
+          "missing B.US bar on 2024-01-04 is forward-filled")
+    late = dict(PRICES, C={"2024-01-04": 1.0, "2024-01-05": 2.0})
+    dates, matrix = pr.align_prices(late, ["A.US", "C"], None)
+    check(dates[0] == "2024-01-04" and all(None not in row for row in matrix),
+          "rows before a late-starting series are dropped (no missing values)")
+
+
+def test_metrics_by_hand() -> None:
+    dates, matrix = pr.align_prices(PRICES, ["A.US", "B.US", "BENCH"], "BENCH")
+    res = pr.compute_risk(dates, matrix, ["A.US", "B.US"], [1, 1], "BENCH", use_numpy=False)
+    a = res["holdings"][0]
+    ra = [0.1, -0.1, 0.1]
+    m = sum(ra) / 3
+    sd = math.sqrt(sum((x - m) ** 2 for x in ra) / 2)
+    check(close(a["annualized_volatility"], sd * math.sqrt(252)), "A.US annualized volatility")
+    check(close(a["max_drawdown"], -0.1), "A.US max drawdown is -10%")
+    check(close(a["sharpe_ratio"], m / sd * math.sqrt(252)), "A.US Sharpe (rf=0)")
+    check(close(res["benchmark"]["beta"], 1.0), "benchmark beta is 1")
+    rb = [0.05, -0.047619047619, 0.05]
+    mb = sum(rb) / 3
+    cov = sum((x - m) * (y - mb) for x, y in zip(ra, rb)) / 2
+    var = sum((y - mb) ** 2 for y in rb) / 2
+    check(close(a["beta"], cov / var, 1e-5), "A.US beta vs benchmark")
+    check(res["holdings"][0]["weight"] == 0.5, "equal weights are normalized")
+    check(res["portfolio"]["avg_pairwise_correlation"] is not None,
+          "average pairwise correlation reported for N > 1")
+
+
+def test_engines_agree() -> None:
+    if pr.np is None:
+        print("  (skipped — NumPy not installed)")
+        return
+    dates, matrix = pr.align_prices(PRICES, ["A.US", "B.US", "BENCH"], "BENCH")
+    args = (dates, matrix, ["A.US", "B.US"], [0.3, 0.7], "BENCH", 0.02, True)
+    fast = pr.compute_risk(*args, use_numpy=True)
+    slow = pr.compute_risk(*args, use_numpy=False)
+    for key in ("portfolio", "benchmark"):
+        for metric, value in slow[key].items():
+            if isinstance(value, float):
+                check(close(fast[key][metric], value, 1e-5), f"numpy == stdlib for {key}.{metric}")
+    check(all(close(x, y, 1e-5)
+              for rx, ry in zip(fast["correlation"]["matrix"], slow["correlation"]["matrix"])
+              for x, y in zip(rx, ry)), "numpy == stdlib correlation matrix")
+
+
+def test_constant_price_correlation() -> None:
+    prices = dict(PRICES, **{"C.US": {d: 20.0 for d in PRICES["A.US"]}})
+    dates, matrix = pr.align_prices(prices, ["A.US", "C.US"])
+    engines = [False] + ([True] if pr.np is not None else [])
+    for use_numpy in engines:
+        res = pr.compute_risk(dates, matrix, ["A.US", "C.US"], [1, 1], correlation=True, use_numpy=use_numpy)
+        corr = res["correlation"]["matrix"]
+        check(corr[0][1] is None and corr[1][1] is None and close(corr[0][0], 1.0, 1e-6)
+              and "NaN" not in json.dumps(res),
+              f"constant-price correlation is null, not NaN (use_numpy={use_numpy})")
+        check(res["portfolio"]["avg_pairwise_correlation"] is None,
+              f"no pairwise average with one varying holding (use_numpy={use_numpy})")
+        symbols = ["A.US", "B.US", "C.US"]
+        res = pr.compute_risk(*pr.align_prices(prices, symbols), symbols, [1, 1, 1], correlation=True,
+                              use_numpy=use_numpy)
+        check(close(res["portfolio"]["avg_pairwise_correlation"], res["correlation"]["matrix"][0][1], 1e-5),
+              f"pairwise average skips the constant holding (use_numpy={use_numpy})")
+
+
+def test_fetch_prices() -> None:
+    seen = []
+
+    def fake_fetch_many(calls, token, workers=8, **kwargs):
+        seen.extend(calls)
+        return [[{"date": "2024-01-02", "close": 10.0, "adjusted_close": 9.5},
+                 {"date": "2024-01-03", "close": 11.0, "adjusted_close": 0.0}]
+                for _ in calls]
+
+    pr.eodhd_client.fetch_many = fake_fetch_many
+    prices = pr.fetch_prices(["X.US", "Y.US"], "tok", "2024-01-01", "2024-01-31")
+    check([c["symbol"] for c in seen] == ["X.US", "Y.US"]
+          and all(c["endpoint"] == "eod" for c in seen), "one eod call per symbol")
+    check(prices["X.US"] == {"2024-01-02": 9.5, "2024-01-03": 0.0},
+          "adjusted_close preferred, 0.0 kept (not replaced by close)")
+
+
+def test_markdown_tables() -> None:
+    dates, matrix = pr.align_prices(PRICES, ["A.US", "B.US", "BENCH"], "BENCH")
+    res = pr.compute_risk(dates, matrix, ["A.US", "B.US"], [1, 1], "BENCH", correlation=True)
+    md = pr.render_markdown(res)
+    for header in ("**Portfolio Composition**", "**Risk Metrics**", "**Per-Holding Risk**",
+                   "| Annualized Volatility |", "| Max Drawdown |", "| Beta |",
+                   "| Sharpe Ratio |", "**Correlation Matrix**"):
+        check(header in md, f"markdown contains {header}")
+
+
+def main() -> int:
+    for fn in (
+        test_align_forward_fill,
+        test_metrics_by_hand,
+        test_engines_agree,
+        test_constant_price_correlation,
+        test_fetch_prices,
+        test_markdown_tables,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All portfolio_risk tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
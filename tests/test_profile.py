@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Offline tests for --profile (skills/eodhd-api/scripts/eodhd_profile.py).
+
+Stdlib-only, no network: a local HTTP server stands in for EODHD. Exit 0 if
+clean, 1 on any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - breakdown() attributes time to parse / normalize / serialize.
+  - run() returns the wrapped result, writes a loadable pstats file and
+    reports peak memory and the top-N functions.
+  - eodhd_client.py --profile and market_cap_series.py --profile write the
+    pstats file and print the report on stderr, leaving stdout unchanged.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import pstats
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client  # noqa: E402
+import eodhd_profile  # noqa: E402
+import stub_api  # noqa: E402
+
+FAILURES: list[str] = []
+ROWS = [{"date": "2025-01-02", "close": 243.85 + i, "volume": 1000 + i} for i in range(20000)]
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class StubAPI(stub_api.StubHandler):
+
+    def do_GET(self):
+        self.reply(200, ROWS)
+
+
+def test_run(tmp: str) -> None:
+    payload = json.dumps([{"Date": r["date"], "Value": r["close"]} for r in ROWS])
+    path = os.path.join(tmp, "unit.pstats")
+    err = io.StringIO()
+
+    def work():
+        parsed = eodhd_client.parse_response("macro-indicator", payload)
+        return len(json.dumps(parsed, indent=2))
+
+    result = eodhd_profile.run(work, path, top=5, out=err)
+    report = err.getvalue()
+    split = eodhd_profile.breakdown(pstats.Stats(path))
+    check(result == len(json.dumps([{"date": r["date"], "value": r["close"]} for r in ROWS], indent=2)),
+          "run() returns the wrapped result")
+    check(split["parse"] > 0 and split["normalize"] > 0 and split["serialize"] > split["normalize"]
+          and split["network"] == 0, "time attributed to parse, normalize and serialize")
+    table = report.splitlines()
+    start = next(i for i, line in enumerate(table) if "ncalls" in line)
+    check(report.startswith("profile: ") and "MiB traced" in report and f"pstats: {path}" in report
+          and len([line for line in table[start + 1:] if "KiB" not in line
+                   and "still allocated" not in line]) == 5, "report: totals and top-N functions")
+
+
+def test_cli(base_url: str, tmp: str) -> None:
+    env = {**os.environ, "EODHD_API_TOKEN": "test-token", "EODHD_CACHE_DIR": os.path.join(tmp, "cache"),
+           "EODHD_DAEMON": "0"}
+    command = [sys.executable, str(SCRIPTS / "eodhd_client.py"), "--endpoint", "eod", "--symbol", "AAPL.US",
+               "--base-url", base_url]
+    plain = subprocess.run(command, capture_output=True, text=True, env=env, cwd=tmp)
+    profiled = subprocess.run(command + ["--profile"], capture_output=True, text=True, env=env, cwd=tmp)
+    saved = os.path.join(tmp, "eodhd_client.pstats")
+    check(profiled.returncode == 0 and profiled.stdout == plain.stdout and "profile: " not in plain.stderr,
+          "eodhd_client.py --profile leaves stdout unchanged")
+    check(os.path.exists(saved) and eodhd_profile.breakdown(pstats.Stats(saved))["serialize"] > 0
+          and "serialize" in profiled.stderr and "network" in profiled.stderr,
+          "default pstats file and report on stderr")
+    replay = subprocess.run([sys.executable, str(SCRIPTS / "eodhd_profile.py"), saved, "--top", "3"],
+                            capture_output=True, text=True)
+    check(replay.returncode == 0 and "ncalls" in replay.stdout, "eodhd_profile.py re-reads a pstats file")
+
+    custom = os.path.join(tmp, "mcs.pstats")
+    mcs = subprocess.run([sys.executable, str(SCRIPTS / "market_cap_series.py"), "--symbol", "AAPL.US",
+                          "--from-date", "2025-01-01", "--to-date", "2025-01-31", "--profile", custom],
+                         capture_output=True, text=True, env={**env, "EODHD_API_TOKEN": ""})
+    check(mcs.returncode == 2 and os.path.exists(custom) and f"pstats: {custom}" in mcs.stderr,
+          "market_cap_series.py --profile FILE writes the pstats file")
+
+
+def main() -> int:
+    with stub_api.serve(StubAPI) as base_url, tempfile.TemporaryDirectory() as tmp:
+        print("\ntest_run:")
+        test_run(tmp)
+        print("\ntest_cli:")
+        test_cli(base_url, tmp)
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All profile tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,20 +11,40 @@ Each test case calls eodhd_client.py with realistic args and checks:
 Subscription-gated endpoints (marketplace add-ons) that return 402/403
 are reported as SKIP, not FAIL.
 
+Cases run concurrently (``--jobs``, default 8) under one shared launch
+limit (``--rpm``); results print in CASES order with each case's latency,
+followed by the suite's wall time and its slowest cases.
+
+Offline: ``--record [DIR]`` runs against the live API and saves every
+response (token redacted) through the client's record transport;
+``--replay [DIR]`` serves them back without the network or a real token, so
+the suite runs deterministically in CI and its timings are a baseline
+(``--latency MS`` or ``--latency recorded`` adds simulated latency).
+DIR defaults to tests/cassettes/e2e.
+
 Exit code: 0 if no FAILs (SKIPs are OK), 1 otherwise.
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
-CLIENT = REPO_ROOT / "skills" / "eodhd-api" / "scripts" / "eodhd_client.py"
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+CLIENT = SCRIPTS / "eodhd_client.py"
+CASSETTES = REPO_ROOT / "tests" / "cassettes" / "e2e"
+REPLAY_TOKEN = "replay-token"
+SLOWEST = 5
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_daemon  # noqa: E402
 
 # Each case: (name, extra args). All cases use the same eodhd_client.py.
 CASES: list[tuple[str, list[str]]] = [
@@ -116,62 +136,118 @@ def shape_summary(data) -> str:
     return f"{type(data).__name__}"
 
 
-def run_case(name: str, args: list[str], timeout: int = 30) -> tuple[str, str]:
-    """Returns (status, detail). status in {pass, skip, fail}."""
+def run_case(name: str, args: list[str], timeout: int = 30,
+             env: dict | None = None) -> tuple[str, str, float]:
+    """Returns (status, detail, seconds). status in {pass, skip, fail}."""
     t0 = time.time()
     try:
         proc = subprocess.run(
             [sys.executable, str(CLIENT), *args],
-            capture_output=True, text=True, timeout=timeout,
+            capture_output=True, text=True, timeout=timeout, env=env,
         )
     except subprocess.TimeoutExpired:
-        return ("fail", f"timeout after {timeout}s")
+        return ("fail", f"timeout after {timeout}s", time.time() - t0)
 
     elapsed = time.time() - t0
     if proc.returncode != 0:
         kind = classify_stderr(proc.stderr)
         first_line = (proc.stderr.strip().splitlines() or [""])[0][:160]
-        return (kind, f"exit={proc.returncode} ({elapsed:.1f}s) — {first_line}")
+        return (kind, f"exit={proc.returncode} — {first_line}", elapsed)
 
     if not proc.stdout.strip():
-        return ("fail", f"empty stdout ({elapsed:.1f}s)")
+        return ("fail", "empty stdout", elapsed)
 
     try:
         data = json.loads(proc.stdout)
     except json.JSONDecodeError as exc:
-        return ("fail", f"invalid JSON ({elapsed:.1f}s): {exc}")
+        return ("fail", f"invalid JSON: {exc}", elapsed)
 
     # Detect API-level error in JSON body (some endpoints return 200 with error text)
     if isinstance(data, dict) and data.get("error"):
         kind = classify_stderr(str(data["error"]))
-        return (kind, f"api error ({elapsed:.1f}s): {str(data['error'])[:120]}")
+        return (kind, f"api error: {str(data['error'])[:120]}", elapsed)
+
+    return ("pass", shape_summary(data), elapsed)
+
+
+def run_cases(cases: list[tuple[str, list[str]]], env: dict, jobs: int, rpm: int,
+              timeout: int = 30):
+    """Run cases concurrently; yield (name, status, detail, seconds) in CASES order.
 
-    return ("pass", f"{shape_summary(data)} ({elapsed:.1f}s)")
+    At most ``jobs`` client processes run at once, and launches share one
+    sliding-window limit of ``rpm`` per minute (each case is one API request),
+    so raising --jobs never pushes the suite over the API's minute limit.
+    Results are yielded as soon as a case and every case before it finished.
+    """
+    limiter = eodhd_daemon.RateLimiter(rpm)
+
+    def one(case: tuple[str, list[str]]) -> tuple[str, str, float]:
+        limiter.acquire()
+        return run_case(*case, timeout=timeout, env=env)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(one, case) for case in cases]
+        for (name, _), future in zip(cases, futures):
+            yield (name, *future.result())
+
+
+def transport_env(opts: argparse.Namespace) -> dict:
+    """Environment for the client subprocesses: live, record or replay transport."""
+    env = dict(os.environ, EODHD_DAEMON="0")
+    if opts.record:
+        env.update(EODHD_TRANSPORT="record", EODHD_CASSETTE_DIR=opts.record)
+    elif opts.replay:
+        env.update(EODHD_TRANSPORT="replay", EODHD_CASSETTE_DIR=opts.replay,
+                   EODHD_REPLAY_LATENCY=opts.latency)
+        env.setdefault("EODHD_API_TOKEN", REPLAY_TOKEN)
+    return env
 
 
 def main() -> int:
-    if not os.getenv("EODHD_API_TOKEN"):
+    parser = argparse.ArgumentParser(description="End-to-end smoke tests for eodhd_client.py")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", nargs="?", const=str(CASSETTES), metavar="DIR",
+                      help=f"Save every live response under DIR (default: {CASSETTES.relative_to(REPO_ROOT)})")
+    mode.add_argument("--replay", nargs="?", const=str(CASSETTES), metavar="DIR",
+                      help="Serve recorded responses from DIR instead of the live API")
+    parser.add_argument("--latency", default="0",
+                        help='Simulated latency per replayed response: ms, or "recorded"')
+    parser.add_argument("--jobs", type=int, default=8, help="Cases run concurrently (default: 8)")
+    parser.add_argument("--rpm", type=int, default=eodhd_daemon.RPM,
+                        help=f"Shared limit on case launches per minute (default: {eodhd_daemon.RPM})")
+    parser.add_argument("--timeout", type=int, default=30, help="Per-case timeout in seconds (default: 30)")
+    opts = parser.parse_args()
+
+    env = transport_env(opts)
+    if not env.get("EODHD_API_TOKEN"):
         print("ERROR: EODHD_API_TOKEN env var not set", file=sys.stderr)
         return 2
 
     results: dict[str, list[tuple[str, str]]] = {"pass": [], "skip": [], "fail": []}
+    latencies: list[tuple[float, str]] = []
     width = max(len(n) for n, _ in CASES) + 2
 
-    print(f"\nRunning {len(CASES)} e2e cases against live EODHD API\n")
-    print(f"{'CASE':<{width}} STATUS  DETAIL")
+    source = f"responses replayed from {opts.replay}" if opts.replay else "live EODHD API"
+    print(f"\nRunning {len(CASES)} e2e cases against {source} ({opts.jobs} at a time)\n")
+    print(f"{'CASE':<{width}} STATUS   LATENCY  DETAIL")
     print("-" * 100)
-    for name, args in CASES:
-        status, detail = run_case(name, args)
+    started = time.time()
+    for name, status, detail, elapsed in run_cases(CASES, env, opts.jobs, opts.rpm, opts.timeout):
         results[status].append((name, detail))
+        latencies.append((elapsed, name))
         emoji = {"pass": "✓", "skip": "○", "fail": "✗"}[status]
-        print(f"{name:<{width}} {emoji} {status.upper():<5}  {detail}")
+        print(f"{name:<{width}} {emoji} {status.upper():<5} {elapsed * 1000:>7.0f}ms  {detail}", flush=True)
+    wall = time.time() - started
 
     print()
     print("=" * 100)
     print(f"Total: {len(CASES)} | "
           f"PASS: {len(results['pass'])} | "
           f"SKIP: {len(results['skip'])} (subscription) | "
-          f"FAIL: {len(results['fail'])}")
+          f"FAIL: {len(results['fail'])} | "
+          f"Wall: {wall:.2f}s (cases sum {sum(t for t, _ in latencies):.2f}s)")
+    slowest = sorted(latencies, reverse=True)[:SLOWEST]
+    print("Slowest: " + ", ".join(f"{n} {t * 1000:.0f}ms" for t, n in slowest))
 
     if results["fail"]:
         print("\nFAILURES:")
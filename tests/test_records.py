@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/records.py (compact bars and records).
+
+Stdlib-only (NumPy checks run when it is installed), no network: a local HTTP
+server stands in for EODHD. Exit 0 if clean, 1 on any failure — matches the
+convention of the other tests/ suites.
+
+Covers:
+  - Bars.from_json decodes straight into columns and matches fetch_json rows
+    through the dict views (nulls, whole-number volumes, negative indexes).
+  - Slicing, between() date ranges, nbytes, and memory well below lists of dicts.
+  - to_numpy() shares the column buffers.
+  - indicators.bars_from_eod accepts Bars unchanged.
+  - Quote / Dividend / Split records: mapping behaviour, unknown fields kept,
+    split ratio; fetch_* helpers and API error payloads.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import tracemalloc
+import urllib.parse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client  # noqa: E402
+import indicators  # noqa: E402
+import records  # noqa: E402
+import stub_api  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FAILURES: list[str] = []
+ROWS = [
+    {"date": "2025-01-02", "open": 248.93, "high": 249.1, "low": 241.82, "close": 243.85,
+     "adjusted_close": 243.26, "volume": 55740700},
+    {"date": "2025-01-03", "open": 243.36, "high": 244.18, "low": 241.89, "close": 243.36,
+     "adjusted_close": 242.77, "volume": 40244100},
+    {"date": "2025-01-06", "open": 244.31, "high": 247.33, "low": 243.2, "close": None,
+     "adjusted_close": 244.73, "volume": 45045600.5},
+]
+PAYLOADS = {
+    "/api/eod/AAPL.US": ROWS,
+    "/api/eod/MISSING.US": {"error": "Ticker not found"},
+    "/api/real-time/AAPL.US": {"code": "AAPL.US", "close": 243.85, "change_p": 1.2, "market": "open"},
+    "/api/div/AAPL.US": [{"date": "2024-11-08", "value": 0.25, "currency": "USD", "period": "Quarterly"}],
+    "/api/splits/AAPL.US": [{"date": "2020-08-31", "split": "4.000000/1.000000"}],
+}
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class StubAPI(stub_api.StubHandler):
+
+    def do_GET(self):
+        parts = urllib.parse.urlsplit(self.path)
+        body = PAYLOADS.get(parts.path, [])
+        if parts.path == "/api/real-time/AAPL.US" and "s=" in parts.query:
+            body = [body, {**body, "code": "MSFT.US"}]
+        self.reply(200, body)
+
+
+def test_bars() -> None:
+    bars = records.Bars.from_json(json.dumps(ROWS))
+    check(len(bars) == 3 and [dict(b) for b in bars] == ROWS and bars.to_dicts() == ROWS,
+          "dict views equal the API rows (null close, whole and fractional volumes)")
+    check(bars[-1]["date"] == "2025-01-06" and bars[0].get("close") == 243.85 and bars[0].get("x", 1) == 1
+          and isinstance(bars[0]["volume"], int), "mapping access, negative index")
+    check(records.Bars.from_rows(ROWS).to_dicts() == ROWS and bars.date[0] == 20090,
+          "from_rows; dates stored as epoch days")
+    check(bars[1:].dates() == ["2025-01-03", "2025-01-06"]
+          and bars.between("2025-01-03", "2025-01-05").dates() == ["2025-01-03"]
+          and len(bars.between(end="2024-12-31")) == 0, "slices and between() ranges")
+    try:
+        bars[3]
+        check(False, "out-of-range index raises IndexError")
+    except IndexError:
+        check(True, "out-of-range index raises IndexError")
+    try:
+        records.Bars.from_json('{"error": "Ticker not found"}')
+        check(False, "API error payload raises ClientError")
+    except eodhd_client.ClientError as exc:
+        check("Ticker not found" in str(exc), "API error payload raises ClientError")
+    adjusted = indicators.bars_from_eod(bars)
+    check(adjusted == indicators.bars_from_eod(ROWS), "indicators.bars_from_eod accepts Bars")
+
+
+def test_memory() -> None:
+    rows = [{"date": f"{1990 + i // 250:04d}-{i % 12 + 1:02d}-{i % 28 + 1:02d}", "open": 1.0 + i, "high": 2.0 + i,
+             "low": 0.5 + i, "close": 1.5 + i, "adjusted_close": 1.4 + i, "volume": 1000 + i}
+            for i in range(50000)]
+    payload = json.dumps(rows)
+    tracemalloc.start()
+    as_dicts = json.loads(payload)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del as_dicts
+    tracemalloc.start()
+    bars = records.Bars.from_json(payload)
+    bar_bytes, bar_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    check(bars.nbytes == 56 * len(rows) and bar_bytes * 4 < dict_bytes and bar_peak < dict_bytes / 2,
+          f"{bar_bytes / len(rows):.0f} bytes/bar vs {dict_bytes / len(rows):.0f} as dicts")
+    if np is None:
+        print("  skip: to_numpy (NumPy not installed)")
+        return
+    cols = bars.to_numpy()
+    check(str(cols["date"][0]) == rows[0]["date"] and cols["close"][-1] == rows[-1]["close"]
+          and np.shares_memory(cols["close"], np.frombuffer(bars.close, dtype=np.float64)),
+          "to_numpy wraps the columns without copying")
+
+
+def test_records(base_url: str) -> None:
+    quote = records.Quote.from_dict({"code": "AAPL.US", "close": 243.85, "market": "open"})
+    check(quote.close == 243.85 and quote["market"] == "open" and dict(quote)["previousClose"] is None
+          and not hasattr(quote, "__dict__"), "records: slots, mapping access, unknown fields kept")
+    split = records.Split(date="2020-08-31", split="4.000000/1.000000")
+    check(split.ratio == 4.0 and records.Split(split="bad").ratio is None, "split ratio")
+
+    kwargs = {"base_url": base_url}
+    bars = records.fetch_bars("tok", "AAPL.US", {"from": "2025-01-01"}, **kwargs)
+    quotes = records.fetch_quotes("tok", ["AAPL.US"], **kwargs)
+    both = records.fetch_quotes("tok", ["AAPL.US", "MSFT.US"], **kwargs)
+    dividends = records.fetch_dividends("tok", "AAPL.US", **kwargs)
+    splits = records.fetch_splits("tok", "AAPL.US", **kwargs)
+    check(bars.to_dicts() == ROWS and [q.code for q in quotes] == ["AAPL.US"]
+          and [q.code for q in both] == ["AAPL.US", "MSFT.US"], "fetch_bars / fetch_quotes")
+    check(dividends[0].value == 0.25 and dividends[0]["currency"] == "USD" and splits[0].ratio == 4.0,
+          "fetch_dividends / fetch_splits")
+    try:
+        records.fetch_bars("tok", "MISSING.US", **kwargs)
+        check(False, "fetch_bars raises ClientError for an error payload")
+    except eodhd_client.ClientError:
+        check(True, "fetch_bars raises ClientError for an error payload")
+
+
+def main() -> int:
+    eodhd_client.USE_DAEMON = False
+    with stub_api.serve(StubAPI) as base_url:
+        for fn, args in ((test_bars, ()), (test_memory, ()), (test_records, (base_url,))):
+            print(f"\n{fn.__name__}:")
+            fn(*args)
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All records tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
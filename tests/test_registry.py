@@ -131,7 +131,7 @@ def check_matrix_fresh(reg) -> list:
     result = subprocess.run([sys.executable, str(BUILD), "--check"],
                             capture_output=True, text=True)
     if result.returncode != 0:
-        return [(result.stderr or result.stdout).strip() or "support-matrix.md is stale"]
+        return [(result.stderr or result.stdout).strip() or "generated files are stale"]
     return []
 
 
@@ -142,7 +142,7 @@ def main() -> int:
         ("Client parity (SUPPORTED_ENDPOINTS)", check_client_parity),
         ("Doc parity (references/endpoints)", check_doc_parity),
         ("Tier earns its label", check_tiers),
-        ("Support matrix freshness", check_matrix_fresh),
+        ("Support matrix + route table freshness", check_matrix_fresh),
     ]
     all_fails = []
     for name, fn in sections:
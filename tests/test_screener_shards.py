@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/screener_shards.py and
+``eodhd_client.py --endpoint screener --shard``.
+
+Stdlib-only, no network: fetch_many is replaced by a fake screener that
+evaluates filters with local_screener.Snapshot and enforces the real API's
+100-row page and 999 offset ceiling. Exit 0 if clean, 1 on any failure —
+matches the convention of the other tests/ suites.
+
+Covers:
+  - A query that fits is fetched unsplit (null market caps included).
+  - An oversized query is split into market-cap bands and returns every
+    match exactly once, re-sorted, with and without a response ``count``.
+  - Bands that cannot shrink further are reported as truncated.
+  - The client's --shard mode slices the merged rows with --limit/--offset.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client as client  # noqa: E402
+import local_screener  # noqa: E402
+import screener_shards as shards  # noqa: E402
+
+FAILURES: list[str] = []
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def universe(n: int, seed: int = 5, same_cap: int = 0) -> local_screener.Snapshot:
+    rng = random.Random(seed)
+    caps = [None if rng.random() < 0.03 else float(int(10 ** rng.uniform(5, 12.5))) for _ in range(n)]
+    caps[:same_cap] = [5e9] * same_cap
+    columns = {
+        "code": [f"S{i:05d}" for i in range(n)],
+        "exchange": [rng.choice(["NYSE", "NASDAQ"]) for _ in range(n)],
+        "sector": [rng.choice(["Technology", "Energy"]) for _ in range(n)],
+        "market_capitalization": caps,
+        "pe": [round(rng.uniform(1, 40), 2) for _ in range(n)],
+    }
+    return local_screener.Snapshot("US", columns)
+
+
+class FakeScreener:
+    """fetch_many stand-in: one Snapshot.query per call, API limits enforced."""
+
+    def __init__(self, snapshot: local_screener.Snapshot, with_count: bool = True):
+        self.snapshot = snapshot
+        self.with_count = with_count
+        self.calls = 0
+        self.waves = 0
+
+    def __call__(self, calls, token, workers=8, **kwargs):
+        self.waves += 1
+        out = []
+        for call in calls:
+            self.calls += 1
+            p = call["params"]
+            if p["offset"] > shards.MAX_OFFSET or p["limit"] > shards.PAGE_LIMIT:
+                raise client.ClientError("HTTP Error 422: offset/limit out of range")
+            res = self.snapshot.query(json.loads(p["filters"]), p["sort"], p.get("signals"),
+                                      p["limit"], p["offset"])
+            out.append(res if self.with_count else {"data": res["data"]})
+        return out
+
+
+def expected(snapshot, filters, with_nulls=False) -> list[str]:
+    rows = snapshot.query(filters, limit=10 ** 6)["data"]
+    return sorted(r["code"] for r in rows if with_nulls or r["market_capitalization"] is not None)
+
+
+def test_fits_unsplit() -> None:
+    snap = universe(700)
+    fake = FakeScreener(snap)
+    shards.eodhd_client.fetch_many = fake
+    rows, truncated = shards.fetch_all("tok", [["sector", "=", "Energy"]])
+    check(sorted(r["code"] for r in rows) == expected(snap, [["sector", "=", "Energy"]], True),
+          "query under the ceiling returns every row, nulls included")
+    check(not truncated and fake.waves == 2, "one first-page wave plus one fill wave")
+
+
+def test_split_recovers_everything() -> None:
+    snap = universe(6000)
+    filters = [["market_capitalization", ">=", 1e6]]
+    for with_count in (True, False):
+        fake = FakeScreener(snap, with_count)
+        shards.eodhd_client.fetch_many = fake
+        rows, truncated = shards.fetch_all("tok", filters, "market_capitalization.desc")
+        codes = [r["code"] for r in rows]
+        label = "with count" if with_count else "without count (probe)"
+        check(sorted(codes) == expected(snap, filters) and len(codes) == len(set(codes)),
+              f"{label}: {len(codes)} rows = every match exactly once")
+        caps = [r["market_capitalization"] for r in rows]
+        check(caps == sorted(caps, reverse=True) and not truncated,
+              f"{label}: merged rows re-sorted, nothing truncated ({fake.calls} requests)")
+    rows, _ = shards.fetch_all("tok", [["sector", "=", "Technology"]], "pe.asc")
+    pes = [r["pe"] for r in rows]
+    check(pes == sorted(pes) and sorted(r["code"] for r in rows)
+          == expected(snap, [["sector", "=", "Technology"]]), "re-sort honours a non-band sort field")
+
+
+def test_truncated_band() -> None:
+    snap = universe(1500, same_cap=1200)
+    shards.eodhd_client.fetch_many = FakeScreener(snap)
+    rows, truncated = shards.fetch_all("tok", [])
+    check(any(b is not None and b[0] <= 5e9 < b[1] for b in truncated),
+          "a band of 1,200 identical caps is reported as truncated")
+    check(len(rows) >= shards.MAX_OFFSET + 1, "truncated band still returns its reachable rows")
+
+
+def test_band_helpers() -> None:
+    bands = shards._initial_bands([["market_capitalization", ">", 2e9], ["market_capitalization", "<", 5e11]])
+    check(bands[0][0] == 2e9 and bands[-1][1] == 5e11, "initial bands clamp to the caller's cap range")
+    check(all(a[1] == b[0] for a, b in zip(bands, bands[1:])), "bands are contiguous and disjoint")
+    check(shards._split((1e9, 1e10)) == [(1e9, 3162277660.0), (3162277660.0, 1e10)],
+          "bands split geometrically")
+    check(shards._split((5.0, 6.0)) is None, "a one-unit band cannot split")
+
+
+def test_client_shard_mode() -> None:
+    snap = universe(3000)
+    shards.eodhd_client.fetch_many = FakeScreener(snap)
+    base = dict(filters='[["market_capitalization",">",0]]', sort="market_capitalization.desc",
+                signals=None, workers=4, base_url=client.BASE_URL, timeout=30, cache_ttl=0,
+                limit=10, offset=5)
+    out = client.run_sharded_screener(argparse.Namespace(**base), "tok")
+    full = client.run_sharded_screener(argparse.Namespace(**dict(base, limit=None, offset=None)), "tok")
+    check(out["count"] == full["count"] == len(full["data"]), "count is the merged total")
+    check(out["data"] == full["data"][5:15], "--limit/--offset slice the merged rows")
+    try:
+        client.run_sharded_screener(argparse.Namespace(**dict(base, filters='{"pe": 1}')), "tok")
+        check(False, "non-array --filters raises ClientError")
+    except client.ClientError:
+        check(True, "non-array --filters raises ClientError")
+
+
+def main() -> int:
+    for fn in (
+        test_fits_unsplit,
+        test_split_recovers_everything,
+        test_truncated_band,
+        test_band_helpers,
+        test_client_shard_mode,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All screener_shards tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
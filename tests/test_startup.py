@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Startup-cost regression tests for skills/eodhd-api/scripts/eodhd_client.py.
+
+Stdlib-only, no network: the CLI is run as a subprocess (the way agents call
+it) with ``python -X importtime`` against a pre-filled response cache. Exit 0
+if clean, 1 on any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - A cache hit prints the cached payload without loading http.client, ssl,
+    email, argparse, urllib.request/error, threading or datetime.
+  - The missing-token error path loads no json/urllib at all.
+  - The plain ``--flag value`` form skips argparse; --help still uses it.
+  - Import time of a cache-hit run stays under IMPORT_BUDGET of what the
+    eager imports (http.client, urllib.request, argparse, json, hashlib)
+    cost on the same machine, measured as the best of several runs.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+CLIENT = SCRIPTS / "eodhd_client.py"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client  # noqa: E402
+
+FAILURES: list[str] = []
+RUNS = 5
+IMPORT_BUDGET = 0.6
+LAZY = ("http.client", "ssl", "email.parser", "argparse", "urllib.request", "urllib.error",
+        "threading", "datetime", "concurrent.futures")
+ROWS = [{"date": "2025-01-02", "close": 243.85}]
+ARGS = ["--endpoint", "eod", "--symbol", "AAPL.US", "--from-date", "2025-01-01", "--cache-ttl", "3600"]
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def run(argv: list[str], env: dict) -> tuple[subprocess.CompletedProcess, dict[str, int]]:
+    """Run python -X importtime with argv; returns the process and {module: self µs}."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", *argv], capture_output=True,
+                          text=True, env=env)
+    imports = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            self_us, _, name = line[len("import time:"):].split("|")
+            imports[name.strip()] = int(self_us)
+    return proc, imports
+
+
+def best_import_us(argv: list[str], env: dict) -> int:
+    return min(sum(run(argv, env)[1].values()) for _ in range(RUNS))
+
+
+def make_env(cache_dir: str, token: str | None = "test-token") -> dict:
+    env = {k: v for k, v in os.environ.items() if k != "EODHD_API_TOKEN"}
+    env["EODHD_CACHE_DIR"] = cache_dir
+    if token:
+        env["EODHD_API_TOKEN"] = token
+    return env
+
+
+def fill_cache(cache_dir: str) -> None:
+    eodhd_client.CACHE_DIR = cache_dir
+    url = eodhd_client.api_url("eod", "test-token", "AAPL.US", {"from": "2025-01-01"})
+    path = eodhd_client._cache_path(url)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(ROWS, fh)
+
+
+def test_lazy_imports(cache_dir: str) -> None:
+    proc, imports = run([str(CLIENT), *ARGS], make_env(cache_dir))
+    check(proc.returncode == 0 and json.loads(proc.stdout) == ROWS, "cache hit prints the cached rows")
+    loaded = [m for m in LAZY if m in imports]
+    check(not loaded, f"cache hit loads none of {', '.join(LAZY)}" + (f" (loaded: {loaded})" if loaded else ""))
+    proc, imports = run([str(CLIENT), *ARGS], make_env(cache_dir, token=None))
+    check(proc.returncode == 2 and not {"json", "urllib.parse"} & set(imports),
+          "missing token fails before json/urllib load")
+    proc, imports = run([str(CLIENT), "--help"], make_env(cache_dir))
+    check(proc.returncode == 0 and "argparse" in imports and "--call REGISTRY_ID" in proc.stdout,
+          "--help still goes through argparse")
+
+
+def test_import_budget(cache_dir: str) -> None:
+    env = make_env(cache_dir)
+    base = best_import_us(["-c", "pass"], env)
+    cli = best_import_us([str(CLIENT), *ARGS], env) - base
+    eager = best_import_us(["-c", "import http.client, urllib.request, argparse, json, hashlib"], env) - base
+    print(f"  info: cache-hit imports {cli / 1000:.1f} ms vs eager imports {eager / 1000:.1f} ms")
+    check(cli <= IMPORT_BUDGET * eager, f"cache-hit import time within {IMPORT_BUDGET:.0%} of the eager imports")
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        fill_cache(cache_dir)
+        for fn in (
+            test_lazy_imports,
+            test_import_budget,
+        ):
+            print(f"\n{fn.__name__}:")
+            fn(cache_dir)
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All startup tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Offline tests for the record/replay transport in eodhd_client.py.
+
+Stdlib-only, no network: a local HTTP server stands in for EODHD while
+responses are recorded, then is shut down before they are replayed. Exit 0
+if clean, 1 on any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - Record mode saves each response (HTTP errors included) with the token
+    redacted from both the URL and the body (plain or URL-encoded, any length).
+  - Replay mode serves them without the network, with any token, raising the
+    same ClientError for recorded HTTP errors; a request that was never
+    recorded fails with a clear error instead of going live.
+  - A literal non-EODHD_API_TOKEN token (invalid-token tests) gets its own
+    recording; simulated latency (fixed ms or as recorded).
+  - The CLI replays through EODHD_TRANSPORT / EODHD_CASSETTE_DIR.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+CLIENT = SCRIPTS / "eodhd_client.py"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client  # noqa: E402
+import stub_api  # noqa: E402
+
+FAILURES: list[str] = []
+TOKEN = "rec0rded-secret-token-1234"
+SLOW = 0.15
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class StubAPI(stub_api.StubHandler):
+    """eod rows that echo the token back (to test redaction); MISSING is a 404, bad tokens a 401."""
+
+    def do_GET(self):
+        if "SLOW" in self.path:
+            time.sleep(SLOW)
+        if "api_token=invalid" in self.path:
+            status, body = 401, {"error": "Unauthenticated"}
+        elif "MISSING" in self.path:
+            status, body = 404, {"error": "Ticker not found"}
+        else:
+            status, body = 200, [{"date": "2025-01-02", "close": 243.85, "note": f"token {TOKEN}"}]
+        self.reply(status, body)
+
+
+def fetch(base_url: str, symbol: str, token: str = TOKEN):
+    return eodhd_client.fetch_json("eod", token, symbol, {"from": "2025-01-01"}, base_url=base_url)
+
+
+def error_of(fn) -> str:
+    try:
+        fn()
+    except (eodhd_client.ClientError, urllib.error.URLError) as exc:
+        return str(exc)
+    return ""
+
+
+def test_record_replay(cassettes: str) -> None:
+    os.environ["EODHD_API_TOKEN"] = TOKEN
+    eodhd_client.set_transport("record", cassettes)
+    with stub_api.serve(StubAPI) as base_url:
+        live = fetch(base_url, "AAPL.US")
+        fetch(base_url, "SLOW.US")
+        live_404 = error_of(lambda: fetch(base_url, "MISSING.US"))
+        bad_url = base_url + "/eod/AAPL.US?api_token=invalid_token_12345"
+        live_401 = error_of(lambda: eodhd_client.http_get(bad_url))
+
+    files = sorted(os.listdir(cassettes))
+    text = "".join(Path(cassettes, f).read_text() for f in files)
+    check(len(files) == 4 and all(f.startswith("eod_") and f.endswith(".json") for f in files),
+          "one recording per request, named after the endpoint")
+    check(TOKEN not in text and "api_token=***" in text and "token ***" in text,
+          "token redacted from recorded URLs and bodies")
+    check(live_404.startswith("HTTP Error 404") and "401" in live_401, "record mode re-raises HTTP errors")
+
+    os.environ["EODHD_API_TOKEN"] = "another-token"
+    eodhd_client.set_transport("replay")
+    replayed = fetch(base_url, "AAPL.US", token="another-token")
+    check(replayed == [{**live[0], "note": "token ***"}], "replay serves the recording under any token")
+    check(error_of(lambda: fetch(base_url, "MISSING.US", token="another-token")) == live_404,
+          "recorded HTTP errors replay as the same ClientError")
+    check("401" in error_of(lambda: eodhd_client.http_get(bad_url)), "literal invalid token replays its own 401")
+    missing = error_of(lambda: fetch(base_url, "NEVER.US", token="another-token"))
+    check("no recorded response" in missing and "another-token" not in missing,
+          "unrecorded request fails without going live")
+
+    eodhd_client.set_transport("replay", latency="50")
+    started = time.perf_counter()
+    fetch(base_url, "AAPL.US", token="another-token")
+    fixed = time.perf_counter() - started
+    eodhd_client.set_transport("replay", latency="recorded")
+    started = time.perf_counter()
+    fetch(base_url, "SLOW.US", token="another-token")
+    recorded = time.perf_counter() - started
+    eodhd_client.set_transport("replay", latency="0")
+    started = time.perf_counter()
+    for _ in range(100):
+        fetch(base_url, "AAPL.US", token="another-token")
+    fast = (time.perf_counter() - started) / 100
+    check(0.05 <= fixed < 0.5 and SLOW <= recorded < SLOW + 0.5,
+          f"simulated latency: fixed {fixed * 1000:.0f} ms, recorded {recorded * 1000:.0f} ms")
+    print(f"  info: replayed fetch_json {fast * 1e6:.0f} µs per call")
+
+    env = {**os.environ, "EODHD_TRANSPORT": "replay", "EODHD_CASSETTE_DIR": cassettes,
+           "EODHD_API_TOKEN": "ci-token", "EODHD_CACHE_DIR": cassettes + "-cache"}
+    proc = subprocess.run([sys.executable, str(CLIENT), "--endpoint", "eod", "--symbol", "AAPL.US",
+                           "--from-date", "2025-01-01", "--base-url", base_url],
+                          capture_output=True, text=True, env=env)
+    check(proc.returncode == 0 and json.loads(proc.stdout) == replayed, "CLI replays from EODHD_CASSETTE_DIR")
+    proc = subprocess.run([sys.executable, str(CLIENT), "--endpoint", "user"], capture_output=True, text=True,
+                          env={**env, "EODHD_TRANSPORT": "tape"})
+    check(proc.returncode == 1 and "Unknown EODHD_TRANSPORT: tape" in proc.stderr, "unknown transport is an error")
+    eodhd_client.set_transport("live")
+    try:
+        eodhd_client.set_transport("tape")
+        check(False, "set_transport rejects unknown modes")
+    except eodhd_client.ClientError:
+        check(True, "set_transport rejects unknown modes")
+
+
+def test_redact_body() -> None:
+    secret = "a+b/c=d-5f3e2a1b"
+    body = ('{"url": "https://eodhd.com/api/eod/X?api_token=a%2Bb%2Fc%3Dd-5f3e2a1b&fmt=json", '
+            f'"note": "key {secret}", "form": "{urllib.parse.quote_plus(secret)}"}}')
+    saved = eodhd_client._redact_body(body, secret)
+    check(secret not in saved and "a%2Bb" not in saved and saved.count("***") == 3,
+          "plain and URL-encoded tokens scrubbed from bodies")
+    check(eodhd_client._redact_body("demo key: demo; demographics", "demo") == "*** key: ***; demographics",
+          "short tokens scrubbed too, without mangling longer words")
+
+
+def main() -> int:
+    saved = os.environ.get("EODHD_API_TOKEN")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            print("\ntest_redact_body:")
+            test_redact_body()
+            print("\ntest_record_replay:")
+            test_record_replay(os.path.join(tmp, "cassettes"))
+    finally:
+        eodhd_client.set_transport("live")
+        if saved is None:
+            os.environ.pop("EODHD_API_TOKEN", None)
+        else:
+            os.environ["EODHD_API_TOKEN"] = saved
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All transport tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
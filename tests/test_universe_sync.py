@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/universe_sync.py.
+
+Stdlib-only, no network: a local HTTP server stands in for EODHD. Exit 0 if
+clean, 1 on any failure — matches the convention of the other tests/ suites.
+
+Covers:
+  - The first sync stores the table (every ticker "added", seq 1).
+  - Later syncs emit added / removed / changed tickers and renames, from
+    symbol-change-history (chains collapse to one rename) or a shared ISIN.
+  - symbol-change-history is requested from the previous sync date minus
+    the overlap, and only for US unless --history.
+  - Lookups: bisection by code, old codes resolved through renames, ISIN and
+    name-prefix indexes; the journal replays deltas since a seq (the first
+    sync's "added" deltas only as a count) and is trimmed.
+  - The CLI: sync --seed, NDJSON deltas, lookup and changes.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import urllib.parse
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import eodhd_client  # noqa: E402
+import stub_api  # noqa: E402
+import universe_sync  # noqa: E402
+
+FAILURES: list[str] = []
+REQUESTS: list[str] = []
+STATE: dict = {}
+
+
+def ticker(code: str, name: str, isin: str | None = None) -> dict:
+    return {"Code": code, "Name": name, "Country": "USA", "Exchange": "NASDAQ", "Currency": "USD",
+            "Type": "Common Stock", "Isin": isin}
+
+
+BEFORE = [ticker("AAPL", "Apple Inc", "US0378331005"), ticker("CBTX", "CBTX Inc", "US12481V1044"),
+          ticker("OLD1", "Chain Corp"), ticker("GONE", "Delisted Co"), ticker("XPER", "Xperi Inc", "US98390M1036")]
+AFTER = [ticker("AAPL", "Apple Inc.", "US0378331005"), ticker("STEL", "Stellar Bancorp", "US12481V1044"),
+         ticker("NEW3", "Chain Corp"), ticker("ADEA", "Adeia Inc", "US98390M1036"), ticker("FRESH", "Fresh IPO")]
+CHANGES = [
+    {"exchange": "US", "old_symbol": "OLD2", "new_symbol": "NEW3", "effective": "2025-03-05"},
+    {"exchange": "US", "old_symbol": "CBTX", "new_symbol": "STEL", "effective": "2025-03-03"},
+    {"exchange": "US", "old_symbol": "OLD1", "new_symbol": "OLD2", "effective": "2025-03-01"},
+]
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+class StubAPI(stub_api.StubHandler):
+
+    def do_GET(self):
+        REQUESTS.append(self.path)
+        path = urllib.parse.urlsplit(self.path).path
+        if path.startswith("/api/exchange-symbol-list/"):
+            body = STATE.get(path.rsplit("/", 1)[1], {"error": "unknown exchange"})
+        else:
+            body = CHANGES
+        self.reply(200, body)
+
+
+def test_sync(base_url: str) -> None:
+    day = datetime.date(2025, 3, 2)
+    STATE["US"] = BEFORE
+    REQUESTS.clear()
+    first, deltas = universe_sync.sync("us", "tok", None, today=day, base_url=base_url)
+    check(first.seq == 1 and len(first) == 5 and [d["op"] for d in deltas] == ["added"] * 5
+          and len(REQUESTS) == 1, "first sync: every ticker added, no history request")
+
+    STATE["US"] = AFTER
+    REQUESTS.clear()
+    second, deltas = universe_sync.sync("US", "tok", first, today=day + datetime.timedelta(days=7),
+                                        base_url=base_url)
+    ops = {(d["op"], d.get("old_code"), d["code"], d.get("via")) for d in deltas}
+    check(("renamed", "CBTX", "STEL", "history") in ops and ("renamed", "OLD1", "NEW3", "history") in ops
+          and ("renamed", "XPER", "ADEA", "isin") in ops, "renames from history (chain collapsed) and ISIN")
+    check(("added", None, "FRESH", None) in ops and ("removed", None, "GONE", None) in ops and len(deltas) == 6,
+          "added and removed tickers")
+    changed = [d for d in deltas if d["op"] == "changed"]
+    check(changed and changed[0]["code"] == "AAPL" and changed[0]["changes"] == {"Name": ["Apple Inc", "Apple Inc."]},
+          "changed fields")
+    history = [r for r in REQUESTS if "symbol-change-history" in r]
+    check(len(history) == 1 and "from=2025-02-23" in history[0] and all(d["seq"] == 2 for d in deltas),
+          "history requested from the last sync minus the overlap")
+
+    check(second.get("STEL")["Name"] == "Stellar Bancorp" and second.get("CBTX") is None
+          and second.resolve("CBTX") == "STEL" and second.resolve("OLD1") == "NEW3" and second.resolve("ZZZ") == "ZZZ",
+          "bisection lookup and rename resolution")
+    check([r["Code"] for r in second.by_isin("us0378331005")] == ["AAPL"]
+          and [r["Code"] for r in second.search("ST")] == ["STEL"] and second.search("zz") == [],
+          "ISIN and name-prefix indexes")
+    check(len(second.changes_since(1)) == 6 and len(second.changes_since(0)) == 6 and second.changes_since(2) == [],
+          "journal replays deltas since a seq")
+    check(first.journal == [{"seq": 1, "synced_at": "2025-03-02", "deltas": [], "initial": 5}],
+          "the first sync journals a count, not every ticker")
+
+    STATE["LSE"] = [ticker("VOD", "Vodafone", "GB00BH4HKS39")]
+    REQUESTS.clear()
+    lse, _ = universe_sync.sync("LSE", "tok", None, base_url=base_url)
+    STATE["LSE"] = [ticker("VODL", "Vodafone", "GB00BH4HKS39")]
+    _, deltas = universe_sync.sync("LSE", "tok", lse, base_url=base_url)
+    check([(d["op"], d["via"]) for d in deltas] == [("renamed", "isin")]
+          and not any("symbol-change-history" in r for r in REQUESTS), "no history request outside US")
+
+    table = second
+    for i in range(universe_sync.JOURNAL_SYNCS + 3):
+        table, _ = universe_sync.sync("US", "tok", table, history=False, base_url=base_url)
+    check(len(table.journal) == universe_sync.JOURNAL_SYNCS and table.journal[-1]["seq"] == table.seq,
+          "journal keeps the last JOURNAL_SYNCS syncs")
+    try:
+        universe_sync.sync("NOPE", "tok", None, base_url=base_url)
+        check(False, "API error raises ClientError")
+    except eodhd_client.ClientError:
+        check(True, "API error raises ClientError")
+
+
+def test_cli(base_url: str, tmp: str) -> None:
+    env = {**os.environ, "EODHD_API_TOKEN": "tok", "EODHD_CACHE_DIR": tmp, "EODHD_DAEMON": "0"}
+    script = [sys.executable, str(SCRIPTS / "universe_sync.py")]
+
+    def run(*args):
+        return subprocess.run(script + list(args), capture_output=True, text=True, env=env)
+
+    missing = run("lookup", "--exchange", "US", "AAPL")
+    STATE["US"] = BEFORE
+    seed = run("sync", "--exchange", "US", "--seed", "--base-url", base_url)
+    STATE["US"] = AFTER
+    delta = run("sync", "--exchange", "US", "--base-url", base_url)
+    lines = [json.loads(line) for line in delta.stdout.splitlines()]
+    check(missing.returncode == 2 and "run: universe_sync.py sync" in missing.stderr, "lookup before any sync exits 2")
+    check(seed.returncode == 0 and seed.stdout == "" and '"seq": 1' in seed.stderr
+          and delta.returncode == 0 and len(lines) == 6 and '"renamed": 3' in delta.stderr,
+          "sync --seed stores silently, then deltas print as NDJSON")
+    found = json.loads(run("lookup", "--exchange", "US", "CBTX", "AAPL", "--name", "apple").stdout)
+    check(found["codes"]["CBTX"]["Code"] == "STEL" and found["codes"]["CBTX"]["renamed_from"] == "CBTX"
+          and found["codes"]["AAPL"]["Name"] == "Apple Inc." and [r["Code"] for r in found["name"]] == ["AAPL"],
+          "lookup resolves old codes and searches names")
+    replay = run("changes", "--exchange", "US", "--since", "1")
+    check(replay.returncode == 0 and [json.loads(x) for x in replay.stdout.splitlines()] == lines,
+          "changes --since replays the journal")
+
+
+def main() -> int:
+    eodhd_client.USE_DAEMON = False
+    with stub_api.serve(StubAPI) as base_url, tempfile.TemporaryDirectory() as tmp:
+        print("\ntest_sync:")
+        test_sync(base_url)
+        print("\ntest_cli:")
+        test_cli(base_url, tmp)
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All universe_sync tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Offline tests for skills/eodhd-api/scripts/yield_curve.py.
+
+Stdlib-only, no network (fetch_many is monkeypatched with a fake UST API
+that pages its rows). Exit 0 if clean, 1 on any failure — matches the
+convention of the other tests/ suites.
+
+Covers:
+  - tenor_years parses bill (WK), par (M/Y) and long-term (BC_20year) labels.
+  - fetch_matrix requests every series x year concurrently, follows
+    meta.total pagination and caches completed years for HISTORY_TTL.
+  - TenorMatrix curve lookup, interpolation, spreads and percentiles.
+"""
+from __future__ import annotations
+
+import datetime
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "skills" / "eodhd-api" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import yield_curve as yc  # noqa: E402
+
+FAILURES: list[str] = []
+THIS_YEAR = datetime.date.today().year
+PAGE = 4  # fake API page size, forces pagination
+
+
+def check(cond: bool, msg: str) -> None:
+    if cond:
+        print(f"  ok: {msg}")
+    else:
+        FAILURES.append(msg)
+        print(f"  FAIL: {msg}")
+
+
+def close(a, b, tol: float = 1e-9) -> bool:
+    return a is not None and b is not None and abs(a - b) <= tol
+
+
+def fake_rows(endpoint: str, year: int) -> list[dict]:
+    dates = [f"{year}-01-02", f"{year}-06-03"]
+    if endpoint == "ust/yield-rates":
+        # Inverted short end in the first observation of each year.
+        curve = {"3M": 5.0, "2Y": 4.5, "10Y": 4.0, "30Y": 4.2} if year % 2 else \
+                {"3M": 2.0, "2Y": 3.0, "10Y": 4.0, "30Y": 4.5}
+        return [{"date": d, "tenor": t, "rate": r + k * 0.1} for k, d in enumerate(dates) for t, r in curve.items()]
+    if endpoint == "ust/real-yield-rates":
+        return [{"date": d, "tenor": "10Y", "rate": 1.5} for d in dates]
+    if endpoint == "ust/bill-rates":
+        return [{"date": d, "tenor": "13WK", "discount": 4.9, "coupon": 5.05} for d in dates]
+    return [{"date": d, "rate_type": t, "rate": 4.8} for d in dates for t in ("BC_20year", "Real_Rate")]
+
+
+class FakeUST:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, calls, token, workers=8, **kwargs):
+        self.calls.append(calls)
+        out = []
+        for call in calls:
+            p = call["params"]
+            rows = fake_rows(call["endpoint"], p["filter[year]"])
+            offset = p["page[offset]"]
+            out.append({"meta": {"total": len(rows)}, "data": rows[offset:offset + PAGE],
+                        "links": {"next": None}})
+        return out
+
+
+def test_tenor_years() -> None:
+    check(close(yc.tenor_years("3M"), 0.25) and close(yc.tenor_years("13WK"), 0.25),
+          "3M and 13WK are a quarter year")
+    check(yc.tenor_years("1.5M") == 0.125 and yc.tenor_years("BC_20year") == 20.0, "1.5M and BC_20year")
+    check(yc.tenor_years("Over_10_Years") is None and yc.tenor_years("Real_Rate") is None,
+          "non-maturity labels → None")
+
+
+def test_fetch_matrix() -> None:
+    fake = FakeUST()
+    yc.eodhd_client.fetch_many = fake
+    tm = yc.fetch_matrix("tok", ["par", "real", "bill", "long"], THIS_YEAR - 2, cache_ttl=60)
+    first = fake.calls[0]
+    check(len(first) == 4 * 3 and all(c["params"]["page[offset]"] == 0 for c in first),
+          "one first-page call per series x year in a single wave")
+    check(len(fake.calls) == 2 and all(c["params"]["page[offset]"] > 0 for c in fake.calls[1]),
+          "remaining pages fetched in one follow-up wave (meta.total)")
+    ttls = {c["params"]["filter[year]"]: c["cache_ttl"] for c in first}
+    check(ttls[THIS_YEAR] == 60 and ttls[THIS_YEAR - 1] == yc.HISTORY_TTL,
+          "completed years cached for HISTORY_TTL, current year for --cache-ttl")
+    check(all(c["normalize"] is False for c in first), "envelope kept for pagination")
+    check(len(tm.dates) == 6 and tm.columns[:4] == ["par:3M", "par:2Y", "par:10Y", "par:30Y"],
+          "date index spans all years; columns ordered by maturity")
+    check("bill:13WK" in tm.columns and "long:BC_20year" in tm.columns, "bill/long series pivoted")
+    yc.eodhd_client.fetch_many = FakeUST()
+    off = yc.fetch_matrix("tok", ["par"], THIS_YEAR - 1, cache_ttl=0)
+    check(off.dates and all(c["cache_ttl"] == 0 for c in yc.eodhd_client.fetch_many.calls[0]),
+          "cache_ttl=0 disables caching for every year")
+    check(yc.fetch_matrix("tok", ["real"], 1990).dates[0].startswith("2003"),
+          "years before a series' first publication are not requested")
+
+
+def test_queries() -> None:
+    yc.eodhd_client.fetch_many = FakeUST()
+    tm = yc.fetch_matrix("tok", ["par", "real"], 2020, 2021)
+    curve = tm.curve("2021-03-01")
+    check(curve["date"] == "2021-01-02" and curve["points"]["10Y"] == 4.0,
+          "curve() uses the last observation on or before the date")
+    check(close(tm.interpolate(6.0, "2021-01-02"), 4.5 + (4.0 - 4.5) * 4 / 8),
+          "linear interpolation between 2Y and 10Y")
+    check(tm.interpolate(50, "2021-01-02") == 4.2 and tm.interpolate(0.01, "2021-01-02") == 5.0,
+          "flat extrapolation beyond the curve ends")
+    spreads = dict(tm.spread("10Y", "2Y"))
+    check(spreads["2021-01-02"] == -50.0 and spreads["2020-01-02"] == 100.0, "10Y-2Y spread in bps")
+    summary = yc.spread_summary(tm, "10Y", "2Y", last=2)
+    check(summary["inverted_days"] == 2 and summary["percentile"] == 50.0 and len(summary["data"]) == 2,
+          "spread summary: inverted days, percentile of latest, tail")
+    breakeven = dict(tm.spread("par:10Y", "real:10Y"))
+    check(breakeven["2020-01-02"] == 250.0, "cross-series spread (breakeven)")
+    check(tm.percentile("10Y", 4.0) == 50.0, "percentile = share of history at or below value")
+    try:
+        tm.column("7Y")
+        check(False, "unknown tenor raises ValueError")
+    except ValueError:
+        check(True, "unknown tenor raises ValueError")
+    check(tm.to_csv().splitlines()[0] == "date," + ",".join(tm.columns), "CSV header")
+
+
+def main() -> int:
+    for fn in (
+        test_tenor_years,
+        test_fetch_matrix,
+        test_queries,
+    ):
+        print(f"\n{fn.__name__}:")
+        fn()
+    print()
+    if FAILURES:
+        print(f"FAILED ({len(FAILURES)}): " + "; ".join(FAILURES))
+        return 1
+    print("All yield_curve tests passed ✓")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())